@@ -14,21 +14,20 @@ from pathlib import Path
 # Add current directory to path for config_compat
 sys.path.insert(0, str(Path(__file__).parent))
 
-try:
-    from lerobot.motors.feetech import FeetechMotorsBus
-    from lerobot.motors.motors_bus import Motor, MotorNormMode
-    FEETECH_AVAILABLE = True
-except ImportError:
-    FEETECH_AVAILABLE = False
-    print("Warning: Feetech library not available")
-
 # Import config compatibility layer
 from utils.config_compat import (
     get_arm_port, get_home_positions, get_home_velocity,
     set_home_positions, ensure_multi_arm_config
 )
+from utils.lazy_import import module_available
 from utils.logging_utils import log_exception
 
+# lerobot pulls in torch & friends; only check for it here and import it
+# when a bus is actually created.
+FEETECH_AVAILABLE = module_available("lerobot")
+if not FEETECH_AVAILABLE:
+    print("Warning: Feetech library not available")
+
 CONFIG_PATH = Path(__file__).parent / "config.json"
 
 # SO-100/SO-101 motor configuration
@@ -50,8 +49,17 @@ def write_config(cfg):
 
 def create_motor_bus(port):
     """Create and connect to motor bus"""
+    if isinstance(port, str) and port.startswith("sim://"):
+        # Simulated arm for benchmarks and hardware-free runs (see utils/sim_motor_bus.py)
+        from utils.sim_motor_bus import create_simulated_bus
+        return create_simulated_bus(port, MOTOR_NAMES)
     if not FEETECH_AVAILABLE:
         raise ImportError("Feetech library not installed. Run: pip install lerobot[feetech]")
+    try:
+        from lerobot.motors.feetech import FeetechMotorsBus
+        from lerobot.motors.motors_bus import Motor, MotorNormMode
+    except ImportError as exc:
+        raise ImportError("Feetech library not installed. Run: pip install lerobot[feetech]") from exc
     
     # Create motor configuration with proper Motor objects
     motors = {}
@@ -7,6 +7,11 @@ Touch-friendly interface for SO-100/101 robot control with action recording
 import sys
 from pathlib import Path
 
+from utils.startup_timing import startup_timer
+from utils.startup_profiler import finish_if_active, install_if_requested
+
+install_if_requested("app")
+
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -19,12 +24,13 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QSizePolicy,
 )
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QThread, QTimer
 from PySide6.QtGui import QShortcut, QKeySequence
 
 from utils.config_store import ConfigStore
-from utils.device_manager import DeviceManager
+from utils.device_manager import DeviceDiscoveryWorker, DeviceManager
 from utils.camera_hub import shutdown_camera_hub
+from utils import motor_events
 
 from app.config import (
     CONFIG_PATH,
@@ -36,6 +42,7 @@ from app.config import (
 from app.bootstrap import create_application, parse_args, should_use_fullscreen
 from app.instance_guard import SingleInstanceError, SingleInstanceGuard
 
+startup_timer.mark("modules_imported")
 
 # Paths
 ROOT = Path(__file__).parent
@@ -49,14 +56,18 @@ class MainWindow(QMainWindow):
         self.config_store = ConfigStore.instance()
         self.config = self.config_store.get_config()
         self.fullscreen_mode = fullscreen
+        motor_events.configure(self.config)
+        motor_events.start_drain()
         
         self.setWindowTitle("LeRobot Operator Console")
         self.setMinimumSize(1024, 600)
         
         # Create device manager (shared across all tabs)
-        self.device_manager = DeviceManager(self.config)
+        with startup_timer.phase("device_manager"):
+            self.device_manager = DeviceManager(self.config)
         
-        self.init_ui()
+        with startup_timer.phase("init_ui"):
+            self.init_ui()
         
         # Add Ctrl+Q shortcut to quit
         quit_shortcut = QShortcut(QKeySequence("Ctrl+Q"), self)
@@ -69,28 +80,44 @@ class MainWindow(QMainWindow):
             self.resize(1024, 600)
     
     def discover_devices_on_startup(self):
-        """Run device discovery on the GUI thread to keep Qt threading contracts."""
-        if getattr(self, "_discovery_running", False):
+        """Run device discovery on a worker thread so the UI stays responsive."""
+        if getattr(self, "_discovery_thread", None) is not None:
             return
 
-        self._discovery_running = True
-
-        def _run_discovery():
-            try:
-                result = self.device_manager.discover_all_devices()
-            except Exception as exc:  # pragma: no cover - defensive
-                self._on_discovery_error(str(exc))
-            else:
-                self._on_discovery_finished(result)
-            finally:
-                self._discovery_running = False
-
-        # Defer until the event loop is running to avoid blocking showEvent.
-        QTimer.singleShot(0, _run_discovery)
-
-    def _on_discovery_finished(self, result: dict) -> None:  # pragma: no cover - UI callback
-        # Nothing extra for now; hook available for future UI updates
-        _ = result
+        self._discovery_phase = startup_timer.begin("device_discovery")
+        worker = DeviceDiscoveryWorker(self.device_manager)
+        thread = QThread(self)
+        worker.moveToThread(thread)
+
+        thread.started.connect(worker.run)
+        worker.finished.connect(self._on_discovery_finished, Qt.QueuedConnection)
+        worker.failed.connect(self._on_discovery_error, Qt.QueuedConnection)
+        worker.finished.connect(thread.quit, Qt.QueuedConnection)
+        worker.failed.connect(thread.quit, Qt.QueuedConnection)
+        thread.finished.connect(self._on_discovery_thread_finished)
+
+        self._discovery_worker = worker
+        self._discovery_thread = thread
+        thread.start()
+
+    def _on_discovery_thread_finished(self) -> None:
+        startup_timer.end(self._discovery_phase)
+        if self._discovery_worker is not None:
+            self._discovery_worker.deleteLater()
+        if self._discovery_thread is not None:
+            self._discovery_thread.deleteLater()
+        self._discovery_worker = None
+        self._discovery_thread = None
+        if not startup_timer.reported:
+            startup_timer.report()
+
+    def _on_first_paint(self) -> None:
+        startup_timer.mark("first_paint")
+        finish_if_active("first_paint", on_exit=QApplication.exit)
+
+    def _on_discovery_finished(self, probe: dict) -> None:  # pragma: no cover - UI callback
+        # Queued from the worker: statuses and their signals are applied here, on the GUI thread
+        self.device_manager.apply_discovery(probe)
 
     def _on_discovery_error(self, message: str) -> None:  # pragma: no cover - UI callback
         QMessageBox.warning(self, "Device Discovery", f"Device discovery error: {message}")
@@ -101,8 +128,9 @@ class MainWindow(QMainWindow):
         # Run discovery only once after window is shown
         if not hasattr(self, '_discovery_run'):
             self._discovery_run = True
-            # Use QTimer to run discovery after event loop starts
-            from PySide6.QtCore import QTimer
+            startup_timer.mark("window_shown")
+            # First event-loop turn after show ~ first frame painted
+            QTimer.singleShot(0, self._on_first_paint)
             QTimer.singleShot(100, self.discover_devices_on_startup)
     
     def init_ui(self):
@@ -234,28 +262,24 @@ class MainWindow(QMainWindow):
         # Content area with stacked widget (takes remaining width)
         self.content_stack = QStackedWidget()
         
-        # Create tabs (imported lazily so QApplication is already constructed)
-        from tabs.dashboard_tab import DashboardTab
-        from tabs.record_tab import RecordTab
-        from tabs.sequence_tab import SequenceTab
-        from tabs.settings_tab import SettingsTab
-        from tabs.train_tab import TrainTab
-        
-        self.dashboard_tab = DashboardTab(self.config, self, self.device_manager)
-        self.sequence_tab = SequenceTab(self.config, self)
-        self.record_tab = RecordTab(self.config, self)
-        self.train_tab = TrainTab(self.config, self)
-        
-        # Connect sequence execution signal
-        self.sequence_tab.execute_sequence_signal.connect(self.dashboard_tab.run_sequence)
-        self.settings_tab = SettingsTab(self.config, self, self.device_manager)
-        
-        # Add tabs to stacked widget
+        # Only the dashboard is built up front; the other tabs (and their heavy
+        # imports: vision/palletize designers, teleop, training) are created the
+        # first time they are shown. Imports stay inside the factories so
+        # QApplication is already constructed.
+        with startup_timer.phase("tab:dashboard"):
+            from tabs.dashboard_tab import DashboardTab
+
+            self.dashboard_tab = DashboardTab(self.config, self, self.device_manager)
         self.content_stack.addWidget(self.dashboard_tab)
-        self.content_stack.addWidget(self.sequence_tab)
-        self.content_stack.addWidget(self.record_tab)
-        self.content_stack.addWidget(self.train_tab)
-        self.content_stack.addWidget(self.settings_tab)
+
+        self._tab_factories = {
+            1: ("sequence_tab", self._create_sequence_tab),
+            2: ("record_tab", self._create_record_tab),
+            3: ("train_tab", self._create_train_tab),
+            4: ("settings_tab", self._create_settings_tab),
+        }
+        for _index in sorted(self._tab_factories):
+            self.content_stack.addWidget(QWidget())  # placeholder until first shown
         
         # Set default tab
         self.content_stack.setCurrentIndex(0)
@@ -288,6 +312,50 @@ class MainWindow(QMainWindow):
         self.tab5_shortcut = QShortcut(QKeySequence("Ctrl+5"), self)
         self.tab5_shortcut.activated.connect(lambda: self.switch_tab(4))
     
+    def _create_sequence_tab(self):
+        from tabs.sequence_tab import SequenceTab
+
+        tab = SequenceTab(self.config, self)
+        # Connect sequence execution signal
+        tab.execute_sequence_signal.connect(self.dashboard_tab.run_sequence)
+        return tab
+
+    def _create_record_tab(self):
+        from tabs.record_tab import RecordTab
+
+        return RecordTab(self.config, self)
+
+    def _create_train_tab(self):
+        from tabs.train_tab import TrainTab
+
+        return TrainTab(self.config, self)
+
+    def _create_settings_tab(self):
+        from tabs.settings_tab import SettingsTab
+
+        tab = SettingsTab(self.config, self, self.device_manager)
+        # Status signals fired before the tab existed; replay the current state
+        tab.on_robot_status_changed(self.device_manager.get_robot_status())
+        for camera_name, status in self.device_manager.camera_statuses.items():
+            tab.on_camera_status_changed(camera_name, status)
+        return tab
+
+    def _ensure_tab(self, index: int):
+        """Build a lazily created tab and swap it in for its placeholder."""
+        entry = self._tab_factories.pop(index, None)
+        if entry is None:
+            return
+        attr, factory = entry
+        with startup_timer.phase(f"tab:{attr}") as phase:
+            tab = factory()
+        print(f"[STARTUP] Built {attr} in {phase.duration * 1000.0:.0f} ms")
+        setattr(self, attr, tab)
+
+        placeholder = self.content_stack.widget(index)
+        self.content_stack.insertWidget(index, tab)
+        self.content_stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+
     def switch_tab(self, index: int):
         """Switch to a different tab"""
         previous_index = self.content_stack.currentIndex()
@@ -295,6 +363,7 @@ class MainWindow(QMainWindow):
             self.dashboard_tab.close_camera_panel()
 
         if 0 <= index < self.content_stack.count():
+            self._ensure_tab(index)
             self.content_stack.setCurrentIndex(index)
         # Update button states
         button = self.tab_buttons.button(index)
@@ -396,15 +465,17 @@ class MainWindow(QMainWindow):
                 except Exception as e:
                     print(f"[WARNING] Error stopping worker: {e}")
             
-            if hasattr(self.record_tab, 'is_playing') and self.record_tab.is_playing:
+            record_tab = getattr(self, "record_tab", None)
+            if hasattr(record_tab, 'is_playing') and record_tab.is_playing:
                 try:
-                    self.record_tab.stop_playback()
+                    record_tab.stop_playback()
                 except Exception as e:
                     print(f"[WARNING] Error stopping playback: {e}")
             
-            if hasattr(self.sequence_tab, 'is_running') and self.sequence_tab.is_running:
+            sequence_tab = getattr(self, "sequence_tab", None)
+            if hasattr(sequence_tab, 'is_running') and sequence_tab.is_running:
                 try:
-                    self.sequence_tab.stop_sequence()
+                    sequence_tab.stop_sequence()
                 except Exception as e:
                     print(f"[WARNING] Error stopping sequence: {e}")
         except Exception as e:
@@ -415,6 +486,10 @@ class MainWindow(QMainWindow):
                 shutdown_camera_hub()
             except Exception:
                 pass
+            try:
+                motor_events.stop_drain()
+            except Exception:
+                pass
             event.accept()
 
 
@@ -477,7 +552,8 @@ def main():
 
     try:
         with SingleInstanceGuard():
-            app = create_application()
+            with startup_timer.phase("qt_application"):
+                app = create_application()
 
             if args.vision:
                 from vision_ui import VisionDesignerWindow, create_default_vision_config
@@ -486,7 +562,8 @@ def main():
                 window.show()
                 sys.exit(app.exec())
 
-            window = MainWindow(fullscreen=fullscreen)
+            with startup_timer.phase("main_window"):
+                window = MainWindow(fullscreen=fullscreen)
 
             screens = app.screens()
             if args.screen < len(screens):
@@ -34,6 +34,11 @@ def build_arg_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Launch only the vision designer interface",
     )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Write an import/constructor timing report (see utils.startup_profiler)",
+    )
     return parser
 
 
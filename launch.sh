@@ -14,5 +14,15 @@ echo "Starting NiceBot UI..." | tee $LOGFILE
 echo "Log file: $LOGFILE" | tee -a $LOGFILE
 echo "" | tee -a $LOGFILE
 
+# Stations that use vision triggers: set NICEBOT_VISION_DAEMON=1 to start the
+# vision daemon under its watchdog (restarts it on hangs and memory overruns).
+# Off by default - the daemon opens the camera the app previews from.
+if [ "$NICEBOT_VISION_DAEMON" = "1" ]; then
+    python3 -m vision_triggers.watchdog >> logs/vision_watchdog.log 2>&1 &
+    WATCHDOG_PID=$!
+    trap 'kill $WATCHDOG_PID 2>/dev/null; wait $WATCHDOG_PID 2>/dev/null' EXIT
+    echo "Vision watchdog started (PID: $WATCHDOG_PID)" | tee -a $LOGFILE
+fi
+
 # Run the app and log output
 python3 app.py 2>&1 | tee -a $LOGFILE
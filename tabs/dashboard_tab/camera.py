@@ -4,15 +4,16 @@ from __future__ import annotations
 
 from typing import Dict, List, Optional
 
-try:
-    import cv2  # type: ignore
-    import numpy as np  # type: ignore
-except ImportError:  # pragma: no cover - optional dependency
-    cv2 = None
-    np = None
+from utils.lazy_import import optional_module
+
+# Optional dependencies, imported on first use to keep start-up fast
+cv2 = optional_module("cv2")
+np = optional_module("numpy")
 
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtGui import QPixmap
+
+from utils.preview_renderer import PreviewRenderer
 
 from .constants import ROOT
 from .widgets import CameraDetailDialog
@@ -62,6 +63,8 @@ class DashboardCameraMixin:
         self.active_camera_name = self.camera_order[self.active_camera_index]
         self._last_preview_timestamp = 0.0
         self._refresh_active_camera_label()
+        if self.camera_view_active:
+            self._set_preview_subscription(self.active_camera_name)
         self.update_camera_previews(force=True)
 
     def on_camera_toggle(self, checked: bool) -> None:
@@ -96,6 +99,7 @@ class DashboardCameraMixin:
         self.normal_status_container.hide()
         self.status_summary_container.show()
         self.time_label.hide()
+        self.cycle_label.hide()
         self.run_label.hide()
 
         self._refresh_active_camera_label()
@@ -106,8 +110,7 @@ class DashboardCameraMixin:
             return
 
         self.camera_view_active = True
-        self.camera_preview_timer.start(300)
-        self.update_camera_previews(force=True)
+        self._resume_camera_preview()
 
     def exit_camera_mode(self) -> None:
         if not self.camera_view_active:
@@ -116,15 +119,39 @@ class DashboardCameraMixin:
         self.status_summary_container.hide()
         self.normal_status_container.show()
         self.time_label.show()
+        self.cycle_label.setVisible(bool(self.cycle_label.text()))
         self.run_label.show()
         self.camera_toggle_btn.setMinimumWidth(self._camera_toggle_default_width)
         self.camera_toggle_btn.setMaximumWidth(self._camera_toggle_default_width)
 
         self.camera_view_active = False
-        self.camera_preview_timer.stop()
+        self._suspend_camera_preview()
         self.camera_panel.setVisible(False)
         self.single_camera_preview.update_preview(None, "Preview closed.")
 
+    def _set_preview_subscription(self, camera_name: Optional[str]) -> None:
+        """Hold a hub preview subscription only for the camera on screen."""
+        current = getattr(self, "_subscribed_camera", None)
+        if current == camera_name:
+            return
+        if self.camera_hub and current:
+            self.camera_hub.unsubscribe(current, preview=True)
+        self._subscribed_camera = None
+        if self.camera_hub and camera_name and self.camera_hub.subscribe(camera_name, preview=True):
+            self._subscribed_camera = camera_name
+
+    def _resume_camera_preview(self) -> None:
+        if not self.camera_view_active or not self.isVisible():
+            return
+        self._set_preview_subscription(self.active_camera_name)
+        if not self.camera_preview_timer.isActive():
+            self.camera_preview_timer.start(300)
+        self.update_camera_previews(force=True)
+
+    def _suspend_camera_preview(self) -> None:
+        self.camera_preview_timer.stop()
+        self._set_preview_subscription(None)
+
     def close_camera_panel(self) -> None:
         if self.camera_toggle_btn.isChecked():
             self.camera_toggle_btn.setChecked(False)
@@ -240,26 +267,26 @@ class DashboardCameraMixin:
             return edge_pixels / total_pixels if total_pixels else 0.0
         return cv2.mean(gray, mask=mask)[0] / 255.0
 
-    def _render_camera_frame(self, camera_name: str, frame, zones: Optional[List[dict]] = None):
+    def _evaluate_camera_zones(self, camera_name: str, frame, zones: Optional[List[dict]] = None):
+        """Evaluate zones on ``frame`` and return ``(overlays, status)`` for the renderer."""
         if cv2 is None or np is None:
-            return frame, "nominal"
+            return [], "nominal"
 
         zones = zones if zones is not None else self.vision_zones.get(camera_name, [])
         if not zones:
-            return frame, "nominal"
+            return [], "nominal"
 
         height, width = frame.shape[:2]
         gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
 
         triggered_any = False
-        valid_zone = False
+        overlays = []
 
         for zone in zones:
             polygon = zone.get("polygon", [])
             pts = self._polygon_to_pixels(polygon, width, height)
             if pts.size == 0:
                 continue
-            valid_zone = True
 
             mask = np.zeros((height, width), dtype=np.uint8)
             cv2.fillPoly(mask, [pts], 255)
@@ -272,20 +299,17 @@ class DashboardCameraMixin:
                 triggered_any = True
 
             color = (76, 175, 80) if triggered else (244, 67, 54)
-            overlay = np.zeros_like(frame)
-            cv2.fillPoly(overlay, [pts], color)
-            frame = cv2.addWeighted(frame, 1.0, overlay, 0.28, 0)
-            cv2.polylines(frame, [pts], True, color, 2, cv2.LINE_AA)
+            overlays.append((pts, color))
 
-        if not valid_zone:
-            return frame, "nominal"
-        return frame, "triggered" if triggered_any else "idle"
+        if not overlays:
+            return [], "nominal"
+        return overlays, "triggered" if triggered_any else "idle"
 
-    def _frame_to_pixmap(self, frame: "np.ndarray") -> QPixmap:
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        height, width, channel = rgb.shape
-        image = QImage(rgb.data, width, height, channel * width, QImage.Format_RGB888)
-        return QPixmap.fromImage(image)
+    def _frame_to_pixmap(self, frame: "np.ndarray", size=None, overlays=None) -> QPixmap:
+        renderer = getattr(self, "_preview_renderer", None)
+        if renderer is None:
+            renderer = self._preview_renderer = PreviewRenderer()
+        return QPixmap.fromImage(renderer.render(frame, size, overlays))
 
     def _get_preview_zones(self, camera_name: str) -> List[dict]:
         zones = self.active_vision_zones.get(camera_name)
@@ -314,8 +338,9 @@ class DashboardCameraMixin:
             return
 
         zones = self._get_preview_zones(self.active_camera_name)
-        render_frame, status = self._render_camera_frame(self.active_camera_name, frame.copy(), zones)
-        pixmap = self._frame_to_pixmap(render_frame)
+        overlays, status = self._evaluate_camera_zones(self.active_camera_name, frame, zones)
+        label_size = self.single_camera_preview.preview_label.contentsRect().size()
+        pixmap = self._frame_to_pixmap(frame, (label_size.width(), label_size.height()), overlays)
         status_text = {
             "triggered": "Triggered",
             "idle": "Watching",
@@ -344,7 +369,7 @@ class DashboardCameraMixin:
             camera_name,
             camera_cfg,
             zones,
-            self._render_camera_frame,
+            self._evaluate_camera_zones,
             self.camera_hub,
             parent=self,
         )
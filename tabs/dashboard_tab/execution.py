@@ -293,9 +293,7 @@ class DashboardExecutionMixin:
             self.worker = RobotWorker(model_config)
 
             # Connect signals with error handling
-            self.worker.status_update.connect(self._on_status_update)
-            self.worker.log_message.connect(self._on_log_message)
-            self.worker.progress_update.connect(self._on_progress_update)
+            self._worker_events.attach(self.worker)
             self.worker.run_completed.connect(self._on_model_completed)
             self.worker.finished.connect(self._on_worker_thread_finished)
 
@@ -329,13 +327,15 @@ class DashboardExecutionMixin:
         )
 
         # Connect signals
-        self.execution_worker.status_update.connect(self._on_status_update)
-        self.execution_worker.log_message.connect(self._on_log_message)
-        self.execution_worker.progress_update.connect(self._on_progress_update)
+        # Status, progress and log lines are coalesced to the display rate
+        self._worker_events.attach(self.execution_worker)
         self.execution_worker.execution_completed.connect(self._on_execution_completed)
         self.execution_worker.sequence_step_started.connect(self._on_sequence_step_started)
         self.execution_worker.sequence_step_completed.connect(self._on_sequence_step_completed)
         self.execution_worker.vision_state_update.connect(self._on_vision_state_update)
+        self.execution_worker.cycle_completed.connect(self._on_cycle_completed)
+        self.cycle_label.clear()
+        self.cycle_label.hide()
 
         # Start execution
         self.execution_worker.set_speed_multiplier(self.master_speed)
@@ -394,21 +394,29 @@ class DashboardExecutionMixin:
             self._append_log_entry("stop", "Stopping the current run…", code="run_stopping")
             self.action_label.setText("Stopping…")
 
-        # Stop execution worker (for recordings/sequences)
-        if self.execution_worker and self.execution_worker.isRunning():
+        # Ask the workers to stop (recordings/sequences and models)
+        execution_running = bool(self.execution_worker and self.execution_worker.isRunning())
+        robot_running = bool(self.worker and self.worker.isRunning())
+        if execution_running:
             self.execution_worker.stop()
-            self.execution_worker.wait(5000)  # Wait up to 5 seconds
-
-        # Stop robot worker (for models)
-        if self.worker and self.worker.isRunning():
+        if robot_running:
             self.worker.stop()
-            self.worker.wait(5000)  # Wait up to 5 seconds
 
-        # Emergency stop: drop torque immediately on all arms
+        # Emergency stop: drop torque on all arms now, not after a move in progress finishes
         try:
-            MotorManager.instance().emergency_stop_all()
+            latencies = MotorManager.instance().emergency_stop_all()
         except Exception:
-            pass
+            latencies = {}
+        stopped = [latency for latency in latencies.values() if latency is not None]
+        if stopped and not quiet:
+            self._append_log_entry(
+                "stop", f"Motors stopped within {max(stopped):.0f} ms.", code="estop_latency"
+            )
+
+        if execution_running:
+            self.execution_worker.wait(5000)  # Wait up to 5 seconds
+        if robot_running:
+            self.worker.wait(5000)  # Wait up to 5 seconds
 
         # Reset UI
         self._reset_ui_after_run()
@@ -484,6 +492,11 @@ class DashboardExecutionMixin:
         self._set_action_label_style("#383838")
         self.action_label.setText(status)
 
+    def _on_log_batch(self, messages: list):
+        """Handle a batch of coalesced log messages from the worker"""
+        for level, message in messages:
+            self._on_log_message(level, message)
+
     def _on_log_message(self, level: str, message: str):
         """Handle log message from worker"""
         entry = translate_worker_message(level, message)
@@ -536,6 +549,32 @@ class DashboardExecutionMixin:
         # Placeholder for future use (e.g., marking completed)
         pass
 
+    def _on_cycle_completed(self, payload: dict):
+        """Show the latest loop iteration and rolling percentiles for looping sequences."""
+        record = payload.get("record", {})
+        summary = payload.get("summary", {})
+        wall = summary.get("wall_s", {})
+        self.cycle_label.setText(
+            f"Cycle {record.get('wall_s', 0.0):.1f}s · p95 {wall.get('p95', 0.0):.1f}s · "
+            f"{summary.get('parts_per_hour', 0.0):.0f} pph"
+        )
+        lines = [f"Last {summary.get('count', 0)} iterations (p50 / p95 / p99):"]
+        for key, label in (
+            ("wall_s", "Total"),
+            ("vision_s", "Vision wait"),
+            ("motion_s", "Motion"),
+            ("settle_s", "Settle"),
+            ("model_s", "Model start-up"),
+            ("settle_saved_s", "Settle saved vs timed wait"),
+        ):
+            values = summary.get(key, {})
+            lines.append(
+                f"{label}: {values.get('p50', 0.0):.2f} / {values.get('p95', 0.0):.2f} / {values.get('p99', 0.0):.2f} s"
+            )
+        self.cycle_label.setToolTip("\n".join(lines))
+        if not self.camera_view_active:
+            self.cycle_label.show()
+
     def _on_vision_state_update(self, state: str, payload: dict):
         message = payload.get("message", state.title())
         camera_name = payload.get("camera_name")
@@ -553,6 +592,7 @@ class DashboardExecutionMixin:
 
     def _on_execution_completed(self, success: bool, summary: str):
         """Handle execution completion (for recordings/sequences)"""
+        self._worker_events.flush()
         status_level = "success" if success else "error"
         self._append_log_entry(status_level, summary.strip(), code="execution_summary")
 
@@ -569,6 +609,7 @@ class DashboardExecutionMixin:
 
     def _on_model_completed(self, success: bool, summary: str):
         """Handle model execution completion"""
+        self._worker_events.flush()
         try:
             status_level = "success" if success else "error"
             self._append_log_entry(status_level, summary.strip(), code="model_summary")
@@ -638,6 +679,7 @@ class DashboardExecutionMixin:
 
             # Clean up execution worker (recordings/sequences)
             if self.execution_worker:
+                self._worker_events.detach(self.execution_worker)
                 try:
                     if self.execution_worker.isRunning():
                         self.execution_worker.quit()
@@ -648,6 +690,7 @@ class DashboardExecutionMixin:
 
             # Clean up robot worker (models) - be very careful here
             if self.worker:
+                self._worker_events.detach(self.worker)
                 try:
                     if self.worker.isRunning():
                         self.worker.quit()
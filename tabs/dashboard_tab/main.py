@@ -4,12 +4,11 @@ This is the existing UI refactored as a tab
 """
 
 from typing import Optional, Dict, List, Tuple
-try:
-    import cv2  # type: ignore
-    import numpy as np  # type: ignore
-except ImportError:  # pragma: no cover - optional dependency
-    cv2 = None
-    np = None
+from utils.lazy_import import optional_module
+
+# Optional dependencies, imported on first use to keep start-up fast
+cv2 = optional_module("cv2")
+np = optional_module("numpy")
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
@@ -25,6 +24,7 @@ from utils.config_compat import (
     get_active_arm_index,
     set_active_arm_index,
 )
+from utils.worker_event_bus import WorkerEventBus
 from .widgets import CameraDetailDialog, CameraPreviewWidget, CircularProgress, StatusIndicator
 from .state import DashboardStateMixin
 from .camera import DashboardCameraMixin
@@ -53,6 +53,10 @@ class DashboardTab(QWidget, DashboardStateMixin, DashboardCameraMixin, Dashboard
         self._last_log_code: Optional[str] = None
         self._last_log_message: Optional[str] = None
         self._stopping_run = False
+        self._worker_events = WorkerEventBus(parent=self)
+        self._worker_events.status_changed.connect(self._on_status_update)
+        self._worker_events.progress_changed.connect(self._on_progress_update)
+        self._worker_events.logs_ready.connect(self._on_log_batch)
 
         control_cfg = self.config.setdefault("control", {})
         self.master_speed = float(control_cfg.get("speed_multiplier", 1.0))
@@ -219,6 +223,12 @@ class DashboardTab(QWidget, DashboardStateMixin, DashboardCameraMixin, Dashboard
         self.time_label.setStyleSheet("color: #4CAF50; font-size: 12px; font-weight: bold; font-family: monospace;")
         status_bar.addWidget(self.time_label)
 
+        # Rolling cycle time / throughput for looping sequences (hidden until the first iteration)
+        self.cycle_label = QLabel("")
+        self.cycle_label.setStyleSheet("color: #90caf9; font-size: 12px; font-weight: bold; font-family: monospace;")
+        self.cycle_label.hide()
+        status_bar.addWidget(self.cycle_label)
+
         self.action_label = QLabel("At home position")
         self._action_label_style_template = (
             "color: #ffffff; font-size: 14px; font-weight: bold; "
@@ -573,6 +583,15 @@ class DashboardTab(QWidget, DashboardStateMixin, DashboardCameraMixin, Dashboard
         self.speed_slider.blockSignals(False)
         self.on_speed_slider_changed(initial_speed)
 
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        super().showEvent(event)
+        self._resume_camera_preview()
+
+    def hideEvent(self, event) -> None:  # type: ignore[override]
+        # Switching tabs hides the dashboard; stop polling and release the preview tier
+        self._suspend_camera_preview()
+        super().hideEvent(event)
+
     def _refresh_arm_selector(self) -> None:
         self.active_robot_arm_index = get_active_arm_index(
             self.config,
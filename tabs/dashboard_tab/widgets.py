@@ -4,15 +4,14 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-try:
-    import cv2  # type: ignore
-    import numpy as np  # type: ignore
-except ImportError:  # pragma: no cover - optional dependency
-    cv2 = None
-    np = None
+from utils.lazy_import import optional_module
+
+# Optional dependencies, imported on first use to keep start-up fast
+cv2 = optional_module("cv2")
+np = optional_module("numpy")
 
 from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QColor, QImage, QPainter, QPen, QPixmap
+from PySide6.QtGui import QColor, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import (
     QDialog,
     QFrame,
@@ -23,6 +22,7 @@ from PySide6.QtWidgets import (
 )
 
 from utils.camera_hub import CameraStreamHub
+from utils.preview_renderer import PreviewRenderer
 
 
 class CircularProgress(QWidget):
@@ -218,7 +218,7 @@ class CameraDetailDialog(QDialog):
         camera_name: str,
         camera_config: dict,
         vision_zones: List[dict],
-        render_callback,
+        zone_callback,
         camera_hub: Optional[CameraStreamHub],
         parent: Optional[QWidget] = None,
     ) -> None:
@@ -226,8 +226,11 @@ class CameraDetailDialog(QDialog):
         self.camera_name = camera_name
         self.camera_config = camera_config
         self.vision_zones = vision_zones
-        self.render_callback = render_callback
+        self.zone_callback = zone_callback
         self.camera_hub = camera_hub
+        self.renderer = PreviewRenderer()
+        if self.camera_hub:
+            self.camera_hub.subscribe(camera_name, preview=False)
 
         self.setWindowTitle(f"Camera Preview - {camera_name}")
         self.setModal(True)
@@ -270,10 +273,9 @@ class CameraDetailDialog(QDialog):
             self.status_label.setText("No frames available.")
             return
 
-        render_frame, status = self.render_callback(self.camera_name, frame.copy(), self.vision_zones)
-        rgb = cv2.cvtColor(render_frame, cv2.COLOR_BGR2RGB)
-        height, width, channel = rgb.shape
-        image = QImage(rgb.data, width, height, channel * width, QImage.Format_RGB888)
+        overlays, status = self.zone_callback(self.camera_name, frame, self.vision_zones)
+        label_size = self.preview_label.contentsRect().size()
+        image = self.renderer.render(frame, (label_size.width(), label_size.height()), overlays)
         self.preview_label.setPixmap(QPixmap.fromImage(image))
         status_text = {
             "triggered": "Active detection",
@@ -284,6 +286,13 @@ class CameraDetailDialog(QDialog):
         }
         self.status_label.setText(status_text.get(status, ""))
 
+    def done(self, result: int) -> None:  # type: ignore[override]
+        self.timer.stop()
+        if self.camera_hub:
+            self.camera_hub.unsubscribe(self.camera_name, preview=False)
+            self.camera_hub = None
+        super().done(result)
+
     def closeEvent(self, event) -> None:  # type: ignore[override]
         self.timer.stop()
         super().closeEvent(event)
@@ -6,14 +6,15 @@ import json
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QTableWidget, QTableWidgetItem, QRadioButton, QButtonGroup,
-    QComboBox, QHeaderView, QFrame, QSizePolicy
+    QComboBox, QHeaderView, QFrame, QSizePolicy, QPlainTextEdit
 )
 from PySide6.QtCore import Qt, QTimer, Signal
-from PySide6.QtGui import QColor, QFont
+from PySide6.QtGui import QColor, QFont, QTextCursor
 
 from utils.logging_utils import log_exception
 from utils.app_state import AppStateStore
 from utils.motor_manager import get_motor_handle
+from utils.motor_events import DEBUG, INFO, WARNING, MotorEventDrain, motor_event_ring
 
 
 class DiagnosticsTab(QWidget):
@@ -29,6 +30,9 @@ class DiagnosticsTab(QWidget):
     VOLTAGE_MIN = 11.0  # V
     VOLTAGE_MAX = 13.0  # V
     
+    EVENT_LEVELS = [("All events", DEBUG), ("Info and above", INFO), ("Warnings only", WARNING)]
+    EVENT_HISTORY = 300
+
     MOTOR_NAMES = [
         "Shoulder Pan",
         "Shoulder Lift", 
@@ -46,8 +50,15 @@ class DiagnosticsTab(QWidget):
         self.is_connected = False
         self._pending_reconnect = False
         self._last_snapshot = None
+        self._event_cursor = motor_event_ring.head
         
         self.init_ui()
+
+        # Motor events are read straight from the in-memory ring (2 Hz)
+        self.events_timer = QTimer(self)
+        self.events_timer.timeout.connect(self.refresh_events)
+        self.events_timer.start(500)
+        self.reload_events()
         
         # Setup auto-refresh timer (0.2s = 5 Hz)
         self.refresh_timer = QTimer(self)
@@ -193,6 +204,38 @@ class DiagnosticsTab(QWidget):
         self.table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         
         layout.addWidget(self.table, stretch=1)  # Give it a stretch factor
+
+        # ========== MOTOR EVENTS ==========
+        events_header = QHBoxLayout()
+        events_title = QLabel("Motor events")
+        events_title.setStyleSheet("color: #4CAF50; font-size: 14px; font-weight: bold;")
+        events_header.addWidget(events_title)
+        events_header.addStretch()
+
+        self.event_level_combo = QComboBox()
+        for label, _ in self.EVENT_LEVELS:
+            self.event_level_combo.addItem(label)
+        self.event_level_combo.setCurrentIndex(1)
+        self.event_level_combo.setStyleSheet("QComboBox { color: #e0e0e0; font-size: 13px; padding: 4px; }")
+        self.event_level_combo.currentIndexChanged.connect(lambda _index: self.reload_events())
+        events_header.addWidget(self.event_level_combo)
+        layout.addLayout(events_header)
+
+        self.events_view = QPlainTextEdit()
+        self.events_view.setReadOnly(True)
+        self.events_view.setMaximumBlockCount(self.EVENT_HISTORY)
+        self.events_view.setFixedHeight(140)
+        self.events_view.setStyleSheet("""
+            QPlainTextEdit {
+                background-color: #1e1e1e;
+                color: #e0e0e0;
+                border: 1px solid #555555;
+                border-radius: 4px;
+                font-family: monospace;
+                font-size: 12px;
+            }
+        """)
+        layout.addWidget(self.events_view)
     
     def clear_table_data(self):
         """Fill table with placeholder data"""
@@ -361,8 +404,31 @@ class DiagnosticsTab(QWidget):
             move_item.setText("Yes" if is_moving else "No")
             move_item.setBackground(QColor("#2196F3") if is_moving else QColor("#2d2d2d"))
     
+    def _event_min_level(self) -> int:
+        return self.EVENT_LEVELS[max(0, self.event_level_combo.currentIndex())][1]
+
+    def reload_events(self):
+        """Rebuild the event view from the ring (e.g. after a filter change)"""
+        events = motor_event_ring.recent(self.EVENT_HISTORY, self._event_min_level())
+        self._event_cursor = motor_event_ring.head
+        self.events_view.setPlainText("\n".join(MotorEventDrain.format_event(event) for event in events))
+        self.events_view.moveCursor(QTextCursor.End)
+
+    def refresh_events(self):
+        """Append motor events published since the last refresh"""
+        if not self.isVisible():
+            return
+        events, self._event_cursor, missed = motor_event_ring.since(self._event_cursor)
+        min_level = self._event_min_level()
+        lines = [MotorEventDrain.format_event(event) for event in events if event.level >= min_level]
+        if missed:
+            lines.insert(0, f"… {missed} older events were overwritten")
+        if lines:
+            self.events_view.appendPlainText("\n".join(lines))
+
     def cleanup(self):
         """Cleanup when tab is closed"""
         self.refresh_timer.stop()
+        self.events_timer.stop()
         if self.motor_controller:
             self.motor_controller.disconnect()
@@ -7,8 +7,10 @@ from typing import Any, Dict, List
 
 from PySide6.QtCore import QTimer
 
+from utils import motor_events
 from utils.logging_utils import log_exception
 from utils.motor_controller import MotorController
+from utils.motor_events import DEBUG, WARNING
 from utils.motor_manager import get_motor_handle, MotorManager
 
 
@@ -149,7 +151,7 @@ class TransportControlsMixin:
                     if not positions:
                         positions = controller.read_positions()
             if not positions or len(positions) != 6:
-                print("[LIVE RECORD] ⚠️ Failed to read positions")
+                motor_events.record(WARNING, "LIVE RECORD", "read_failed", "⚠️ Failed to read positions")
                 return
 
             timestamp = time.time() - self.live_record_start_time
@@ -175,7 +177,11 @@ class TransportControlsMixin:
 
             point_count = len(self.live_recorded_data)
             self.status_label.setText(f"🔴 REC: {point_count} pts, {timestamp:.1f}s")
-            print(f"[LIVE RECORD] Point {point_count}: t={timestamp:.3f}s, Δ={max_change} units")
+            motor_events.record(
+                DEBUG, "LIVE RECORD", "sample",
+                "Point {point}: t={timestamp:.3f}s, Δ={change} units",
+                point=point_count, timestamp=timestamp, change=max_change,
+            )
 
         except Exception as exc:
             log_exception("RecordTab: capture_live_position failed", exc, stack=True)
@@ -215,6 +221,8 @@ class TransportControlsMixin:
             self.play_btn.setChecked(False)
             return
 
+        # Stopping playback latches an emergency stop; pressing play re-arms
+        MotorManager.instance().rearm_all()
         self.is_playing = True
         self.play_btn.setText("⏹ STOP")
         self.set_btn.setEnabled(False)
@@ -24,10 +24,9 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-try:  # Optional dependency used for live previews
-    import cv2  # type: ignore
-except ImportError:  # pragma: no cover - optional dependency
-    cv2 = None
+from utils.lazy_import import optional_module
+
+cv2 = optional_module("cv2")  # Optional dependency used for live previews
 
 from utils.camera_backend import open_capture
 
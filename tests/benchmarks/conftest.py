@@ -0,0 +1,105 @@
+"""
+Fixtures for the hardware-free performance suite (requires pytest-benchmark).
+
+Every benchmark drives the real motor code against a simulated Feetech bus
+(``sim://`` ports, see ``utils/sim_motor_bus.py``), so results depend on the
+modelled serial timing rather than on which arm is plugged in.
+
+    python -m pytest tests/benchmarks
+    python -m pytest tests/benchmarks --benchmark-autosave          # keep wall-time history
+    python -m pytest tests/benchmarks --benchmark-compare --benchmark-compare-fail=mean:25%
+
+Besides pytest-benchmark's wall-time statistics, each test checks a domain
+metric (bus occupancy, command lateness, retry overhead, ...) against
+``baselines.json`` next to this file.  Run with ``NICEBOT_UPDATE_BASELINES=1``
+to rewrite the baselines from the current results after an intended change.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from itertools import count
+from pathlib import Path
+from typing import Dict, Optional
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from utils.sim_motor_bus import SimBusProfile, reset_simulated_arms, simulated_arm  # noqa: E402
+
+BASELINE_PATH = Path(__file__).with_name("baselines.json")
+UPDATE_ENV = "NICEBOT_UPDATE_BASELINES"
+
+_port_ids = count(1)
+
+
+class PerfBaselines:
+    """Compare named metrics with stored values, allowing a relative tolerance."""
+
+    def __init__(self, path: Path, update: bool) -> None:
+        self.path = path
+        self.update = update
+        self.stored: Dict[str, dict] = json.loads(path.read_text()) if path.exists() else {}
+        self.measured: Dict[str, dict] = {}
+
+    def check(self, name: str, value: float, *, tolerance: float = 0.25, higher_is_better: bool = False,
+              benchmark=None) -> None:
+        entry = {"value": round(float(value), 6), "tolerance": tolerance, "higher_is_better": higher_is_better}
+        self.measured[name] = entry
+        if benchmark is not None:
+            benchmark.extra_info[name] = entry["value"]
+        reference = self.stored.get(name)
+        if self.update or reference is None:
+            return
+        baseline = float(reference["value"])
+        tolerance = float(reference.get("tolerance", tolerance))
+        if higher_is_better:
+            limit = baseline * (1.0 - tolerance)
+            assert value >= limit, f"{name}: {value:.4g} fell below baseline {baseline:.4g} (limit {limit:.4g})"
+        else:
+            # Small absolute floor so near-zero baselines do not fail on noise
+            limit = baseline * (1.0 + tolerance) + 1e-3
+            assert value <= limit, f"{name}: {value:.4g} exceeds baseline {baseline:.4g} (limit {limit:.4g})"
+
+    def write(self) -> None:
+        merged = dict(self.stored)
+        merged.update(self.measured)
+        self.path.write_text(json.dumps(dict(sorted(merged.items())), indent=2) + "\n")
+
+
+@pytest.fixture(scope="session")
+def perf_baseline():
+    baselines = PerfBaselines(BASELINE_PATH, update=os.environ.get(UPDATE_ENV, "") in {"1", "true", "yes"})
+    yield baselines
+    if baselines.update and baselines.measured:
+        baselines.write()
+
+
+@pytest.fixture
+def sim_arm():
+    """Factory: ``port, arm = sim_arm(profile=..., positions=...)`` on a fresh ``sim://`` port."""
+
+    def _make(profile: Optional[SimBusProfile] = None, positions=None):
+        port = f"sim://bench{next(_port_ids)}"
+        return port, simulated_arm(port, profile or SimBusProfile(seed=1), positions=positions)
+
+    yield _make
+    reset_simulated_arms()
+
+
+@pytest.fixture
+def sim_config():
+    """Minimal single-arm config pointing at ``port``."""
+
+    def _make(port: str, **robot) -> dict:
+        return {
+            "robot": {"arms": [{"enabled": True, "id": "bench", "port": port}], **robot},
+            "control": {"speed_multiplier": 1.0},
+        }
+
+    return _make
@@ -0,0 +1,95 @@
+"""Execution-path benchmarks (live playback, palletize) against the simulated bus."""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+import HomePos  # noqa: E402
+from utils.execution import ExecutionContext, playback_live_recording  # noqa: E402
+from utils.motor_controller import MotorController  # noqa: E402
+from utils.palletize_runtime import PalletizeRuntime  # noqa: E402
+
+
+class _Signal:
+    def emit(self, *args):
+        pass
+
+
+def _context(config, controller):
+    worker = SimpleNamespace(
+        _stop_requested=False, log_message=_Signal(), status_update=_Signal(), progress_update=_Signal()
+    )
+    return ExecutionContext(worker, config, controller, None, None, None, {})
+
+
+def test_live_playback_timing(benchmark, perf_baseline, sim_arm, sim_config):
+    port, arm = sim_arm()
+    config = sim_config(port)
+    controller = MotorController(config)
+    assert controller.connect()
+    # 1.5 s of 20 Hz live recording sweeping every joint
+    points = [
+        {"timestamp": i * 0.05, "positions": [2048 + 8 * i] * 6, "velocity": 1200}
+        for i in range(30)
+    ]
+    recording = {"recorded_data": points, "speed": 100}
+    p95_per_round = []
+
+    def play():
+        arm.goal_writes.clear()
+        start = time.perf_counter()
+        playback_live_recording(_context(config, controller), recording)
+        writes = [stamp for stamp, motor, _ in arm.goal_writes if motor == HomePos.MOTOR_NAMES[0]]
+        lateness = sorted(stamp - (start + point["timestamp"]) for stamp, point in zip(writes, points))
+        p95_per_round.append(lateness[int(len(lateness) * 0.95) - 1])
+
+    try:
+        benchmark.pedantic(play, rounds=3, iterations=1)
+    finally:
+        controller.disconnect()
+
+    # Best round: scheduler stalls on a loaded host only ever add lateness
+    perf_baseline.check("live_playback.lateness_p95_ms", min(p95_per_round) * 1000,
+                        tolerance=0.5, benchmark=benchmark)
+    assert arm.goal_writes[-1][2] == points[-1]["positions"][-1]
+
+
+def test_palletize_cycle_time(benchmark, perf_baseline, sim_arm, sim_config, monkeypatch):
+    port, arm = sim_arm(positions=[2048] * 6)
+    config = sim_config(port)
+    # read_current_position() loads config.json; point it at the simulated arm
+    monkeypatch.setattr(HomePos, "read_config", lambda: config)
+    step = {
+        "corners": [
+            [1900, 1800, 1800, 2000, 2048, 2048],
+            [2200, 1800, 1800, 2000, 2048, 2048],
+            [2200, 1900, 1700, 2000, 2048, 2048],
+            [1900, 1900, 1700, 2000, 2048, 2048],
+        ],
+        "divisions": {"c1_c2": 2, "c2_c3": 2},
+        "down_offsets": {"2": -150, "3": 150},
+        "release_offset": 200,
+        "approach_velocity": 3000,
+        "down_velocity": 2000,
+    }
+    runtime = PalletizeRuntime(config)
+    controller = MotorController(config)
+    assert controller.connect()
+    cells = iter(range(100))
+    durations = []
+
+    def place():
+        start = time.perf_counter()
+        # Cells back to back, as a looping sequence of palletize steps runs them
+        runtime.execute(step, cell_index=next(cells), controller=controller, followed_by_move=True)
+        durations.append(time.perf_counter() - start)
+
+    try:
+        benchmark.pedantic(place, rounds=3, iterations=1)
+    finally:
+        controller.disconnect()
+
+    perf_baseline.check("palletize.cycle_s", min(durations), tolerance=0.35, benchmark=benchmark)
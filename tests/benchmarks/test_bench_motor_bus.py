@@ -0,0 +1,130 @@
+"""Motor-path benchmarks against the simulated Feetech bus."""
+
+import statistics
+import time
+from itertools import cycle
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+import HomePos  # noqa: E402
+from utils import cycle_metrics  # noqa: E402
+from utils.motor_controller import MotorController  # noqa: E402
+from utils.motor_manager import MotorHandle  # noqa: E402
+from utils.resilient_motor_bus import ResilientMotorBus  # noqa: E402
+from utils.sim_motor_bus import SimBusProfile  # noqa: E402
+
+POSES = ([1800] * 6, [2300] * 6)
+
+
+def _timed(durations):
+    def wrap(fn):
+        def run(*args):
+            start = time.perf_counter()
+            fn(*args)
+            durations.append(time.perf_counter() - start)
+        return run
+    return wrap
+
+
+def test_set_positions_throughput(benchmark, perf_baseline, sim_arm, sim_config):
+    port, arm = sim_arm()
+    controller = MotorController(sim_config(port))
+    assert controller.connect()
+    poses = cycle(POSES)
+    durations = []
+
+    @_timed(durations)
+    def command():
+        controller.set_positions(next(poses), velocity=1500, wait=False, keep_connection=True)
+
+    try:
+        arm.reset_stats()
+        benchmark.pedantic(command, rounds=30, iterations=1)
+    finally:
+        controller.disconnect()
+
+    perf_baseline.check("set_positions.commands_per_s", 1.0 / statistics.median(durations), higher_is_better=True,
+                        tolerance=0.35, benchmark=benchmark)
+    perf_baseline.check("set_positions.transactions_per_call", arm.stats.transactions / len(durations),
+                        tolerance=0.0, benchmark=benchmark)
+
+
+def test_position_verification_time(benchmark, perf_baseline, sim_arm, sim_config):
+    port, arm = sim_arm()
+    controller = MotorController(sim_config(port))
+    assert controller.connect()
+    poses = cycle(([2048] * 6, [2348] * 6))
+    recorder = cycle_metrics.start_recording("bench", {}, {"cycle_metrics": {"enabled": False}})
+    records = []
+
+    def move():
+        recorder.begin_iteration(len(records) + 1)
+        controller.set_positions(next(poses), velocity=3000, wait=True, keep_connection=True)
+        records.append(recorder.end_iteration())
+
+    try:
+        benchmark.pedantic(move, rounds=6, iterations=1)
+    finally:
+        cycle_metrics.stop_recording(recorder)
+        controller.disconnect()
+
+    assert arm.positions() in ([2048] * 6, [2348] * 6)
+    completion = statistics.median(record["motion_s"] + record["settle_s"] for record in records)
+    perf_baseline.check("verify.completion_s", completion, tolerance=0.35, benchmark=benchmark)
+    perf_baseline.check("verify.saved_vs_timed_s", statistics.median(record["settle_saved_s"] for record in records),
+                        higher_is_better=True, tolerance=0.35, benchmark=benchmark)
+
+
+def test_telemetry_bus_occupancy(benchmark, perf_baseline, sim_arm, sim_config):
+    port, arm = sim_arm()
+    handle = MotorHandle(sim_config(port), arm_index=0)
+    poses = cycle(POSES)
+    latencies = []
+
+    @_timed(latencies)
+    def command():
+        handle.set_positions(next(poses), velocity=1500, wait=False, keep_connection=True)
+
+    def window():
+        arm.reset_stats()
+        deadline = time.perf_counter() + 1.0
+        while time.perf_counter() < deadline:
+            command()
+            time.sleep(0.05)
+
+    assert handle.connect()
+    try:
+        benchmark.pedantic(window, rounds=1, iterations=1)
+        occupancy = arm.stats.occupancy()
+    finally:
+        handle.disconnect()
+
+    perf_baseline.check("telemetry.bus_occupancy", occupancy, tolerance=0.35, benchmark=benchmark)
+    # Commands queue behind telemetry sweeps; the median shows the typical wait
+    perf_baseline.check("telemetry.set_positions_median_ms", statistics.median(latencies) * 1000,
+                        tolerance=0.5, benchmark=benchmark)
+
+
+@pytest.mark.parametrize("error_rate", [0.0, 0.01, 0.05])
+def test_resilient_retry_overhead(benchmark, perf_baseline, sim_arm, error_rate):
+    profile = SimBusProfile(error_rate=error_rate, seed=42)
+    reads = 20 * len(HomePos.MOTOR_NAMES)
+    durations = []
+
+    def fresh_bus():
+        # Same seed every round, so every round sees the same failures
+        port, _ = sim_arm(profile)
+        return (ResilientMotorBus(HomePos.create_motor_bus(port)),), {}
+
+    @_timed(durations)
+    def read_poses(bus):
+        for index in range(reads):
+            assert bus.read("Present_Position", HomePos.MOTOR_NAMES[index % 6], normalize=False) is not None
+
+    benchmark.pedantic(read_poses, setup=fresh_bus, rounds=3, iterations=1)
+
+    ideal = reads * (profile.line_time(16) + profile.turnaround_s)
+    perf_baseline.check(f"resilient.overhead_ratio[{error_rate}]", min(durations) / ideal,
+                        tolerance=0.5, benchmark=benchmark)
@@ -0,0 +1,74 @@
+"""
+Shared fixtures for tests that drive the real motor code against a simulated
+Feetech bus (``sim://`` ports, see ``utils/sim_motor_bus.py``).
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from utils.motor_controller import MotorController  # noqa: E402
+from utils.motor_manager import MotorManager  # noqa: E402
+from utils.sim_motor_bus import SimBusProfile, reset_simulated_arms, simulated_arm  # noqa: E402
+
+HOME = [2048] * 6
+
+
+def _arm_config(port: str, control: dict) -> dict:
+    config = {"robot": {"arms": [{"enabled": True, "id": "x", "port": port}]}}
+    if control:
+        config["control"] = control
+    return config
+
+
+@pytest.fixture
+def sim_controller():
+    """Factory: ``arm, controller = sim_controller(port, positions=..., **control)``.
+
+    The controller is connected to a fresh simulated arm; everything is
+    disconnected and the simulated arms are dropped on teardown.
+    """
+    controllers = []
+
+    def _make(port: str, positions=None, **control):
+        arm = simulated_arm(port, SimBusProfile(), positions=positions or HOME)
+        controller = MotorController(_arm_config(port, control))
+        assert controller.connect()
+        controllers.append(controller)
+        return arm, controller
+
+    yield _make
+    for controller in controllers:
+        controller.disconnect()
+    reset_simulated_arms()
+
+
+@pytest.fixture
+def sim_handle():
+    """Factory: ``arm, handle = sim_handle(port, positions=..., subscriber=...)``.
+
+    Like ``sim_controller`` but through a :class:`MotorHandle` of a private
+    :class:`MotorManager`, so telemetry and the I/O service are running.
+    """
+    handles = []
+
+    def _make(port: str, positions=None, subscriber=None, **control):
+        arm = simulated_arm(port, SimBusProfile(), positions=positions or HOME)
+        handle = MotorManager().get_handle(0, _arm_config(port, control))
+        if subscriber is not None:
+            handle.subscribe(subscriber)
+        assert handle.connect()
+        handles.append(handle)
+        return arm, handle
+
+    yield _make
+    for handle in handles:
+        handle.disconnect()
+    reset_simulated_arms()
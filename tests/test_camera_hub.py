@@ -0,0 +1,83 @@
+import threading
+import time
+
+import utils.camera_hub as camera_hub
+from utils.camera_hub import CameraStream
+
+
+def _stream(**kwargs):
+    return CameraStream("front", 0, (640, 480), 30.0, **kwargs)
+
+
+def test_subscriptions_control_demanded_tiers():
+    stream = _stream()
+    assert stream.demanded_tiers() == set()
+
+    stream.subscribe(preview=True)
+    assert stream.demanded_tiers() == {"preview"}
+
+    with stream.subscription(preview=False):
+        assert stream.demanded_tiers() == {"full", "preview"}
+
+    stream.unsubscribe(preview=True)
+    stream.unsubscribe(preview=True)  # extra unsubscribe is harmless
+    assert stream.demanded_tiers() == set()
+
+
+def test_polling_lease_expires(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(camera_hub.time, "time", lambda: clock[0])
+    stream = _stream(demand_timeout=2.0)
+
+    with stream._lock:
+        cold, _ = stream._touch("full")
+    assert cold
+    assert stream._wake.is_set()
+    assert stream.demanded_tiers() == {"full"}
+
+    clock[0] += 1.5
+    with stream._lock:
+        cold, _ = stream._touch("full")
+    assert not cold
+
+    clock[0] += 2.5
+    assert stream.demanded_tiers() == set()
+
+
+def _cold_stream_with_live_thread(monkeypatch):
+    stream = _stream(wake_timeout=0.5)
+    monkeypatch.setattr(stream, "_thread", type("Alive", (), {"is_alive": lambda self: True})())
+    return stream
+
+
+def test_gui_thread_never_waits_for_a_cold_stream(monkeypatch):
+    from PySide6.QtCore import QCoreApplication
+
+    QCoreApplication.instance() or QCoreApplication([])
+    stream = _cold_stream_with_live_thread(monkeypatch)
+
+    started = time.perf_counter()
+    assert stream.get_frame(preview=True) is None
+    assert time.perf_counter() - started < 0.1
+    # The lease was still renewed, so the capture thread wakes up for the next tick
+    assert stream._wake.is_set() and stream.demanded_tiers() == {"preview"}
+
+
+def test_worker_threads_wait_for_a_fresh_frame(monkeypatch):
+    stream = _cold_stream_with_live_thread(monkeypatch)
+    waited = []
+
+    def worker():
+        started = time.perf_counter()
+        stream.get_frame(preview=False)
+        waited.append(time.perf_counter() - started)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join(2.0)
+    assert waited and waited[0] >= 0.4
+    # Explicit opt-out, e.g. for a caller that polls anyway
+    stream._last_poll["full"] = 0.0
+    started = time.perf_counter()
+    stream.get_frame(preview=False, wait=False)
+    assert time.perf_counter() - started < 0.1
@@ -2,9 +2,11 @@ from utils.camera_support import (
     build_jetson_csi_pipeline,
     choose_backend,
     coerce_backend,
+    list_video_devices,
     looks_like_gstreamer_pipeline,
     prepare_camera_source,
     resolve_jetson_csi_source,
+    video_device_index,
 )
 
 
@@ -59,3 +61,31 @@ def test_prepare_camera_source_handles_defaults():
     source, backend = prepare_camera_source(cfg_pipeline, width=640, height=480, fps=30)
     assert "nvarguscamerasrc" in source
     assert backend == "gstreamer"
+
+
+def test_video_device_index_parses_common_forms():
+    assert video_device_index(2) == 2
+    assert video_device_index("3") == 3
+    assert video_device_index("/dev/video4") == 4
+    assert video_device_index("nvarguscamerasrc ! appsink") is None
+    assert video_device_index(True) is None
+
+
+def test_list_video_devices_reads_sysfs_and_caches(tmp_path):
+    for name, node_index, label in (("video0", "0", "USB Cam"), ("video1", "1", "USB Cam"), ("video2", "0", "Wrist")):
+        entry = tmp_path / name
+        entry.mkdir()
+        (entry / "index").write_text(node_index)
+        (entry / "name").write_text(label)
+
+    devices = list_video_devices(sysfs_root=tmp_path, refresh=True)
+    assert devices == [
+        {"index": 0, "path": "/dev/video0", "name": "USB Cam"},
+        {"index": 2, "path": "/dev/video2", "name": "Wrist"},
+    ]
+
+    (tmp_path / "video4").mkdir()
+    assert list_video_devices(sysfs_root=tmp_path) == devices
+    assert len(list_video_devices(sysfs_root=tmp_path, refresh=True)) == 3
+
+    assert list_video_devices(sysfs_root=tmp_path / "missing", refresh=True) is None
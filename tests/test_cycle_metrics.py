@@ -0,0 +1,55 @@
+from utils import cycle_metrics
+from utils.cycle_metrics import CycleStore, config_fingerprint, percentile, summarize
+
+
+def test_percentile_and_summary():
+    values = [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert percentile(values, 50) == 3.0
+    assert percentile(values, 95) == 4.8
+    assert percentile([], 99) == 0.0
+
+    records = [{"wall_s": 10.0, "vision_s": 2.0}, {"wall_s": 20.0, "vision_s": 4.0}]
+    summary = summarize(records)
+    assert summary["count"] == 2
+    assert summary["wall_s"]["p50"] == 15.0
+    assert summary["parts_per_hour"] == 240.0  # 2 parts in 30 s
+
+
+def test_store_round_trip_and_trim(tmp_path):
+    store = CycleStore("Pick / place", metrics_dir=tmp_path, max_records=10)
+    for index in range(20):
+        store.append({"ts": index, "iteration": index, "wall_s": 1.0})
+    assert store.path.name == "Pick_place.jsonl"
+
+    records = store.load()
+    assert 10 <= len(records) <= 12
+    assert records[-1]["iteration"] == 19
+    assert [record["iteration"] for record in store.load(last=3)] == [17, 18, 19]
+
+
+def test_recorder_attributes_time_to_steps(tmp_path):
+    sequence = {"steps": [{"type": "vision"}, {"type": "action", "name": "pick"}]}
+    recorder = cycle_metrics.start_recording("seq", sequence, {"cycle_metrics": {"dir": str(tmp_path)}})
+    try:
+        recorder.begin_iteration(1)
+        recorder.begin_step(0, "vision")
+        cycle_metrics.add("vision", 0.5)
+        recorder.end_step()
+        recorder.begin_step(1, "action")
+        cycle_metrics.add("motion", 0.25)
+        cycle_metrics.add("settle", 0.125)
+        cycle_metrics.add("unknown", 1.0)
+        recorder.end_step()
+        record = recorder.end_iteration()
+    finally:
+        cycle_metrics.stop_recording(recorder)
+
+    assert record["vision_s"] == 0.5
+    assert record["motion_s"] == 0.25 and record["settle_s"] == 0.125
+    assert [row[:2] for row in record["steps"]] == [[0, "vision"], [1, "action"]]
+    assert record["steps"][1][4:6] == [0.25, 0.125]
+    assert record["fingerprint"] == config_fingerprint(sequence, {})
+    assert CycleStore("seq", metrics_dir=tmp_path).load()[0]["iteration"] == 1
+
+    cycle_metrics.add("motion", 1.0)  # No active recorder: ignored
+    assert recorder.rolling_summary()["count"] == 1
@@ -0,0 +1,37 @@
+import threading
+
+from PySide6.QtCore import QCoreApplication, QThread, Qt
+
+from utils.device_manager import DeviceDiscoveryWorker, DeviceManager
+
+CONFIG = {
+    "robot": {"arms": [{"enabled": True, "id": "left", "port": "/dev/null"}]},
+    "cameras": {"front": {"index_or_path": "/dev/video99"}},
+}
+
+
+def test_worker_only_probes_and_the_gui_thread_applies():
+    app = QCoreApplication.instance() or QCoreApplication([])
+    manager = DeviceManager(CONFIG)
+    changes = []
+    manager.robot_arm_status_changed.connect(
+        lambda name, status: changes.append((name, status, threading.current_thread())), Qt.DirectConnection
+    )
+    probes = []
+    worker = DeviceDiscoveryWorker(manager)
+    thread = QThread()
+    worker.moveToThread(thread)
+    thread.started.connect(worker.run)
+    worker.finished.connect(probes.append, Qt.DirectConnection)
+    worker.finished.connect(thread.quit, Qt.DirectConnection)
+    thread.start()
+    assert thread.wait(10_000)
+
+    # Probing left every status alone
+    assert probes and not changes and manager.robot_arm_statuses["left"] == "empty"
+
+    manager.apply_discovery(probes[0])
+    app.processEvents()
+    assert manager.robot_arm_statuses["left"] == "online"
+    assert manager.camera_statuses["front"] == "offline"
+    assert changes == [("left", "online", threading.main_thread())]
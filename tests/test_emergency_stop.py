@@ -0,0 +1,142 @@
+import threading
+import time
+
+import pytest
+
+from utils.motor_manager import MotorManager
+from utils.sim_motor_bus import SimBusProfile, reset_simulated_arms, simulated_arm
+
+
+def _config(*ports, **safety):
+    return {
+        "robot": {"arms": [{"enabled": True, "id": f"arm{i}", "port": port} for i, port in enumerate(ports)]},
+        "safety": safety,
+    }
+
+
+@pytest.fixture(autouse=True)
+def _fresh_arms():
+    reset_simulated_arms()
+    yield
+    reset_simulated_arms()
+
+
+def _start_slow_move(handle):
+    # 2000 steps at 200 steps/s: a ~10 s move wait followed by verification
+    thread = threading.Thread(
+        target=handle.set_positions, args=([4000] * 6,), kwargs={"velocity": 200, "keep_connection": True}
+    )
+    thread.start()
+    time.sleep(0.1)
+    return thread
+
+
+def test_emergency_stop_preempts_move_in_progress():
+    arm = simulated_arm("sim://estop", SimBusProfile(), positions=[2000] * 6)
+    manager = MotorManager()
+    handle = manager.get_handle(0, _config("sim://estop"))
+    assert handle.connect()
+    try:
+        move = _start_slow_move(handle)
+        started = time.perf_counter()
+        latencies = manager.emergency_stop_all()
+        move.join(timeout=1.0)
+        elapsed = time.perf_counter() - started
+    finally:
+        handle.disconnect()
+
+    assert not move.is_alive()
+    assert elapsed < 0.5
+    assert latencies[0] is not None and latencies[0] < 50.0
+    assert all(servo.registers["Torque_Enable"] == 0 for servo in arm.servos.values())
+
+
+def test_emergency_stop_all_fans_out_and_can_hold():
+    arms = [simulated_arm(f"sim://estop{i}", SimBusProfile(), positions=[2000] * 6) for i in range(2)]
+    manager = MotorManager()
+    config = _config("sim://estop0", "sim://estop1", estop_mode="hold")
+    handles = [manager.get_handle(i, config) for i in range(2)]
+    for handle in handles:
+        assert handle.connect()
+    try:
+        moves = [_start_slow_move(handle) for handle in handles]
+        latencies = manager.emergency_stop_all()
+        for move in moves:
+            move.join(timeout=1.0)
+        # Acceleration-limited servos brake past the hold point, then return to it
+        time.sleep(0.5)
+        settled = [arm.positions() for arm in arms]
+    finally:
+        for handle in handles:
+            handle.disconnect()
+
+    assert set(latencies) == {0, 1} and all(latency is not None for latency in latencies.values())
+    assert not any(move.is_alive() for move in moves)
+    # Hold keeps torque on and parks each arm where it was when stopped
+    for arm, pose in zip(arms, settled):
+        servos = list(arm.servos.values())
+        assert all(servo.registers["Torque_Enable"] == 1 for servo in servos)
+        assert all(2000 < servo.registers["Goal_Position"] < 4000 for servo in servos)
+        assert pose == [servo.registers["Goal_Position"] for servo in servos]
+
+
+@pytest.mark.parametrize("delay_s", [0.005, 0.03, 0.08, 0.12])
+def test_stop_during_move_setup_is_not_overwritten(delay_s):
+    # 5 ms per transaction: the 18 setup writes and 6 goal writes take ~120 ms
+    arm = simulated_arm("sim://estop-setup", SimBusProfile(turnaround_s=0.005), positions=[2000] * 6)
+    manager = MotorManager()
+    handle = manager.get_handle(0, _config("sim://estop-setup"))
+    assert handle.connect()
+    try:
+        results = []
+        move = threading.Thread(target=lambda: results.append(
+            handle.set_positions([2600] * 6, velocity=600, keep_connection=True)
+        ))
+        move.start()
+        time.sleep(delay_s)
+        manager.emergency_stop_all()
+        move.join(timeout=2.0)
+        torque = [servo.registers["Torque_Enable"] for servo in arm.servos.values()]
+    finally:
+        handle.disconnect()
+
+    assert results == [False]
+    assert torque == [0] * 6
+
+
+def test_stop_stays_latched_until_rearm():
+    arm = simulated_arm("sim://estop-latch", SimBusProfile(), positions=[2000] * 6)
+    manager = MotorManager()
+    handle = manager.get_handle(0, _config("sim://estop-latch"))
+    assert handle.connect()
+    try:
+        manager.emergency_stop_all()
+        # Neither a new move nor a hold re-torques the arm
+        assert handle.set_positions([2100] * 6, velocity=2000, keep_connection=True) is False
+        assert handle.hold_position(0.1) is None
+        assert all(servo.registers["Torque_Enable"] == 0 for servo in arm.servos.values())
+
+        manager.rearm_all()
+        assert handle.set_positions([2100] * 6, velocity=2000, keep_connection=True)
+    finally:
+        handle.disconnect()
+    assert arm.positions() == [2100] * 6
+
+
+def test_async_stop_latches_before_the_port_is_free():
+    arm = simulated_arm("sim://estop-async", SimBusProfile(), positions=[2000] * 6)
+    handle = MotorManager().get_handle(0, _config("sim://estop-async"))
+    assert handle.connect()
+    try:
+        gate, started = threading.Event(), threading.Event()
+        handle.submit(lambda bus: (started.set(), gate.wait(1.0)))
+        assert started.wait(1.0)
+
+        future = handle.emergency_stop_async()
+        # Waits see the stop while the port is still busy; the write follows
+        assert handle._controller._stop_event.is_set() and not future.done()
+        gate.set()
+        assert future.result(1.0) is not None
+    finally:
+        handle.disconnect()
+    assert all(servo.registers["Torque_Enable"] == 0 for servo in arm.servos.values())
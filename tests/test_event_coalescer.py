@@ -0,0 +1,46 @@
+import threading
+
+from utils.event_coalescer import EventCoalescer
+
+
+def test_status_and_progress_keep_latest_value():
+    coalescer = EventCoalescer()
+    for step in range(50):
+        coalescer.post_status(f"Step {step}")
+        coalescer.post_progress(step, 50)
+    coalescer.post_log("info", "first")
+    coalescer.post_log("warning", "second")
+
+    events = coalescer.drain()
+    assert events.status == "Step 49"
+    assert events.progress == (49, 50)
+    assert events.logs == [("info", "first"), ("warning", "second")]
+    assert coalescer.coalesced == 98
+    assert not coalescer.pending
+    assert not coalescer.drain()
+
+
+def test_log_backlog_is_bounded_and_counts_drops():
+    coalescer = EventCoalescer(max_pending_logs=3)
+    for index in range(5):
+        coalescer.post_log("info", str(index))
+
+    events = coalescer.drain()
+    assert [message for _, message in events.logs] == ["2", "3", "4"]
+    assert events.dropped_logs == 2
+
+
+def test_concurrent_posts_are_not_lost():
+    coalescer = EventCoalescer(max_pending_logs=10_000)
+
+    def post(worker: int) -> None:
+        for index in range(1000):
+            coalescer.post_log("info", f"{worker}:{index}")
+
+    threads = [threading.Thread(target=post, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(coalescer.drain().logs) == 4000
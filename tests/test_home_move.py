@@ -0,0 +1,101 @@
+import time
+
+import pytest
+
+from utils import home_move_worker
+from utils.home_move_worker import home_arms, home_multiple_arms
+from utils.motor_io import MotorIOService
+from utils.motor_manager import MotorManager
+from utils.sim_motor_bus import SimBusProfile, reset_simulated_arms, simulated_arm
+
+HOME = [2048, 2048, 2048, 2048, 2048, 2048]
+
+
+@pytest.fixture
+def station(monkeypatch):
+    manager = MotorManager()
+    monkeypatch.setattr(home_move_worker, "get_motor_handle", manager.get_handle)
+
+    def _make(starts, **arm_fields):
+        arms = [simulated_arm(f"sim://home{i}", SimBusProfile(), positions=start) for i, start in enumerate(starts)]
+        config = {"robot": {"arms": [
+            {"enabled": True, "id": f"arm{i}", "port": f"sim://home{i}", "home_positions": HOME,
+             "home_velocity": 1000, **arm_fields}
+            for i in range(len(starts))
+        ]}}
+        return arms, config, manager
+
+    yield _make
+    manager.disconnect_all()
+    reset_simulated_arms()
+
+
+def test_arms_are_time_scaled_to_arrive_together(station):
+    # Arm 0 travels 800 steps, arm 1 only 200
+    arms, config, manager = station([[2848] * 6, [2248] * 6])
+    results = home_arms(config, [0, 1], release_torque=False)
+
+    assert [result.success for result in results] == [True, True]
+    assert all(arm.positions() == HOME for arm in arms)
+    far, near = results
+    assert near.velocity < far.velocity == 1000
+    assert abs(far.completed_s - near.completed_s) < 0.1
+    assert far.completed_s == pytest.approx(far.predicted_s, abs=0.25)
+
+
+def test_open_handles_are_reused_and_stay_open(station):
+    arms, config, manager = station([[2300] * 6, [1800] * 6], usb_hub="hub-a")
+    handle = manager.get_handle(0, config)
+    assert handle.connect()
+    client = handle.bus
+
+    success, per_arm = home_multiple_arms(config, [0, 1])
+
+    assert success and [idx for idx, _, _ in per_arm] == [0, 1]
+    assert handle.bus is client
+    # Arm 1 was opened just for homing and closed again; torque is released on both
+    assert manager.get_handle(1, config).bus is None
+    assert "sim://home1" not in MotorIOService.instance().stats()
+    assert all(servo.registers["Torque_Enable"] == 0 for arm in arms for servo in arm.servos.values())
+
+
+def test_missing_home_is_reported_per_arm(station):
+    arms, config, manager = station([[2100] * 6, [2100] * 6])
+    config["robot"]["arms"][1]["home_positions"] = None
+    started = time.perf_counter()
+    success, per_arm = home_multiple_arms(config, [0, 1])
+
+    assert not success
+    assert per_arm[0][1] and not per_arm[1][1] and "No home position" in per_arm[1][2]
+    assert time.perf_counter() - started < 2.0
+
+
+def test_arm_stopped_short_of_home_is_held_not_released(station):
+    arms, config, manager = station([[2848] * 6], home_velocity=100)
+    started = time.perf_counter()
+    result = home_arms(config, [0], should_stop=lambda: time.perf_counter() - started > 0.2)[0]
+
+    assert not result.success
+    arm = arms[0]
+    time.sleep(0.1)
+    positions = arm.positions()
+    assert positions != HOME and positions == arm.positions()
+    for servo, position in zip(arm.servos.values(), positions):
+        assert servo.registers["Torque_Enable"] == 1
+        # Holding where it stopped, no longer heading home
+        assert abs(servo.registers["Goal_Position"] - position) <= 20
+
+
+def test_latched_stop_refuses_to_home(station):
+    arms, config, manager = station([[2300] * 6])
+    handle = manager.get_handle(0, config)
+    assert handle.connect()
+    handle.emergency_stop()
+    arms[0].goal_writes.clear()
+
+    result = home_arms(config, [0])[0]
+
+    assert not result.success and "latched" in result.message
+    assert handle.stop_requested and not arms[0].goal_writes
+    assert arms[0].positions() == [2300] * 6
+    assert all(servo.registers["Torque_Enable"] == 0 for servo in arms[0].servos.values())
@@ -0,0 +1,51 @@
+import json
+
+from utils import latency_trace
+from utils.latency_trace import LatencyTrace, now_ns
+
+
+def test_trigger_to_first_write_latency(tmp_path):
+    trace = LatencyTrace("sequence_pick place", trace_dir=tmp_path)
+    captured = now_ns()
+    consumed = captured + 5_000_000
+    trace.trigger_confirmed(captured, consumed, zones=["Tray"])
+
+    trace.step_started()
+    assert trace.stage("first_bus_write", "motor", once_per_step=True)
+    assert not trace.stage("first_bus_write", "motor", once_per_step=True)
+
+    assert len(trace.latencies) == 1
+    breakdown = trace.latencies[0]
+    assert breakdown["capture_to_consume_ms"] == 5.0
+    assert breakdown["frame_to_motion_ms"] >= breakdown["trigger_to_first_write_ms"]
+
+    path = trace.write()
+    assert path.name.startswith("sequence_pick_place_")
+    data = json.loads(path.read_text())
+    names = [event["name"] for event in data["traceEvents"]]
+    assert {"trigger_confirmed", "first_bus_write", "frame_to_motion"} <= set(names)
+    assert data["otherData"]["frame_to_motion"]["count"] == 1
+
+
+def test_module_helpers_are_noops_when_disabled(monkeypatch):
+    monkeypatch.delenv(latency_trace.TRACE_ENV, raising=False)
+    assert latency_trace.start_trace("run", {"latency_tracing": {"enabled": False}}) is None
+    assert latency_trace.active_trace() is None
+    latency_trace.stage("first_bus_write", "motor")
+    with latency_trace.span("position_verified", "motor") as args:
+        args["success"] = True
+
+
+def test_active_trace_collects_spans(tmp_path):
+    trace = latency_trace.start_trace("run", {"latency_tracing": {"enabled": True, "dir": str(tmp_path)}})
+    try:
+        with latency_trace.span("position_verified", "motor") as args:
+            args["success"] = True
+        start = now_ns()
+        latency_trace.complete("ACTION • pick", "sequencer", start, step_index=0)
+    finally:
+        path = latency_trace.finish_trace(trace)
+    assert latency_trace.active_trace() is None
+    events = [event for event in json.loads(path.read_text())["traceEvents"] if event["ph"] == "X"]
+    assert [event["name"] for event in events] == ["position_verified", "ACTION • pick"]
+    assert events[0]["args"] == {"success": True}
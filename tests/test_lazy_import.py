@@ -0,0 +1,27 @@
+import sys
+
+from utils.lazy_import import LazyModule, lazy_module, module_available, optional_module
+
+
+def test_optional_module_missing_returns_none():
+    assert optional_module("definitely_not_a_real_module_xyz") is None
+    assert not module_available("definitely_not_a_real_module_xyz")
+
+
+def test_lazy_module_defers_import_until_attribute_access():
+    sys.modules.pop("colorsys", None)
+    proxy = lazy_module("colorsys")
+    assert isinstance(proxy, LazyModule)
+    assert "colorsys" not in sys.modules
+    assert not proxy.is_loaded
+
+    assert proxy.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert proxy.is_loaded
+    assert "colorsys" in sys.modules
+
+
+def test_already_imported_module_is_returned_directly():
+    import json
+
+    assert lazy_module("json") is json
+    assert optional_module("json") is json
@@ -0,0 +1,28 @@
+from utils.log_messages import translate_worker_message
+
+
+def test_noise_is_skipped():
+    assert translate_worker_message("info", "[EXEC] Loop iteration 3") is None
+    assert translate_worker_message("info", "   ") is None
+
+
+def test_rules_apply_in_order():
+    entry = translate_worker_message("error", "Robot port not found: /dev/ttyACM0")
+    assert entry.code == "robot_port_missing" and entry.fatal
+
+    entry = translate_worker_message("warning", "ResilientMotorBus: retry 2 on motor 3")
+    assert entry.code == "motor_resilience_retry"
+
+    entry = translate_worker_message("info", "Loading model act_v2")
+    assert entry.code == "model_loading"
+    # Prefix rules only match at the start of the message
+    assert translate_worker_message("info", "Now loading model").code is None
+
+    entry = translate_worker_message("error", "Robot control app message: servo overload")
+    assert entry.message == "Servo overload" and entry.fatal
+
+
+def test_plain_messages_pass_through():
+    entry = translate_worker_message("INFO", "  Gripper opened  ")
+    assert (entry.level, entry.message, entry.code) == ("info", "Gripper opened", None)
+    assert translate_worker_message("info", "[EXEC] something internal") is None
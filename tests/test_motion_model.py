@@ -0,0 +1,46 @@
+import pytest
+
+from utils.motion_model import MotionModel, calibrate_motion_model, profile_time
+
+
+def test_profile_time_trapezoid_and_triangle():
+    assert profile_time(1000, 1000, 10000) == pytest.approx(1.1)
+    assert profile_time(100, 1000, 10000) == pytest.approx(0.2)
+    assert profile_time(0, 1000, 10000) == 0.0
+
+
+def test_model_is_stored_per_arm(tmp_path):
+    config = {"control": {"motion_model": {"dir": str(tmp_path)}}}
+    model = MotionModel.for_arm(config, {"id": "follower arm"}, "/dev/ttyACM0")
+    model.profile(1, -50).velocity_gain = 0.8
+    model.completion_offset = 0.03
+    assert model.save()
+
+    loaded = MotionModel.for_arm(config, {"id": "follower arm"}, "/dev/ttyACM0")
+    assert loaded.path == tmp_path / "follower_arm.json"
+    assert loaded.profiles["1-"].velocity_gain == 0.8
+    assert loaded.completion_offset == 0.03
+    assert MotionModel.for_arm(config, {}, "sim://x").path is None
+    assert MotionModel.for_arm({"control": {"motion_model": {"enabled": False}}}, {}, "x") is None
+
+
+def test_learned_model_predicts_completion_better_than_the_formula(sim_controller):
+    _, controller = sim_controller("sim://motion-model")
+    calibrate_motion_model(controller, joints=(0, 1), velocities=(800, 2400), span=250)
+    assert controller.motion_model.ready([2048] * 6, [2248, 1848, 2048, 2048, 2048, 2048])
+
+    formula_errors, model_errors = [], []
+    for target, velocity in (([2300, 1900], 700), ([1900, 2200], 2000), ([2100, 2000], 1200)):
+        target = target + [2048] * 4
+        start = controller.read_positions_from_bus()
+        formula = (max(abs(a - b) for a, b in zip(start, target)) / velocity
+                   + 0.4 * (1.0 - int(velocity / 4000 * 255) / 255.0))
+        assert controller.set_positions(target, velocity=velocity, wait=True, keep_connection=True)
+        move = controller.last_move
+        assert move["source"] == "model"
+        formula_errors.append(abs(formula - move["actual_s"]))
+        model_errors.append(abs(move["predicted_s"] - move["actual_s"]))
+
+    assert max(model_errors) < 0.05
+    assert sum(model_errors) < sum(formula_errors) / 2
+    assert controller.motion_model.errors >= 3  # Later calibration moves are predicted too
@@ -0,0 +1,61 @@
+import threading
+
+from utils.motor_events import INFO, WARNING, MotorEvent, MotorEventDrain, MotorEventRing, RepeatSampler
+
+
+def _event(timestamp: float, name: str = "retry") -> MotorEvent:
+    return MotorEvent(0, timestamp, INFO, "RESILIENT", name, "retry", None)
+
+
+def test_ring_reports_overwritten_events():
+    ring = MotorEventRing(capacity=16)
+    for index in range(40):
+        ring.append(INFO, "MOTOR", "point", "Point {index}", {"index": index})
+
+    events, cursor, missed = ring.since(0)
+    assert missed == 24
+    assert [event.fields["index"] for event in events] == list(range(24, 40))
+    assert cursor == 40
+    assert events[-1].text() == "Point 39"
+    assert ring.since(cursor) == ([], 40, 0)
+
+
+def test_concurrent_writers_get_unique_sequences():
+    ring = MotorEventRing(capacity=8192)
+
+    def write() -> None:
+        for _ in range(1000):
+            ring.append(INFO, "MOTOR", "point", "x")
+
+    threads = [threading.Thread(target=write) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    events, cursor, missed = ring.since(0)
+    assert cursor == 4000 and missed == 0
+    assert sorted(event.seq for event in events) == list(range(4000))
+
+
+def test_sampler_keeps_burst_and_summarises_the_rest():
+    sampler = RepeatSampler(window=1.0, burst=3)
+    kept = [sampler.allow(_event(0.1 * index)) for index in range(8)]
+    assert kept == [True, True, True, False, False, False, False, False]
+    assert sampler.allow(_event(0.2, "other"))
+    assert sampler.take_suppressed(now=0.5) == []
+    assert sampler.take_suppressed(now=2.0) == [("RESILIENT", "retry", 5)]
+
+
+def test_drain_filters_levels_into_rotating_file(tmp_path):
+    ring = MotorEventRing(capacity=64)
+    path = tmp_path / "motor_events.log"
+    drain = MotorEventDrain(ring, path=path, file_level=INFO, console_level=WARNING + 100, sample_burst=0)
+    ring.append(10, "MOTOR", "velocity_scale", "debug only")
+    ring.append(INFO, "MOTOR", "position_reached", "reached in {elapsed:.2f}s", {"elapsed": 0.5})
+
+    assert drain.drain(final=True) == 2
+    drain.stop()
+    lines = path.read_text().splitlines()
+    assert len(lines) == 1
+    assert "[MOTOR] position_reached: reached in 0.50s" in lines[0]
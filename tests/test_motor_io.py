@@ -0,0 +1,120 @@
+import threading
+import time
+
+import pytest
+
+from utils.motor_io import PRIORITY_ESTOP, PRIORITY_MOTION, PRIORITY_TELEMETRY, MotorIOService
+
+
+class _RecordingBus:
+    def __init__(self):
+        self.calls = []
+
+    def read(self, register, motor_name, normalize=True):
+        self.calls.append((register, motor_name))
+        return 7
+
+    def disconnect(self):
+        self.calls.append(("disconnect", None))
+
+
+@pytest.fixture
+def port():
+    service = MotorIOService.instance()
+    bus = _RecordingBus()
+    client = service.attach("test://io", bus)
+    yield service, client, bus
+    service.detach("test://io")
+
+
+def _block(client):
+    gate = threading.Event()
+    started = threading.Event()
+    client.submit(lambda bus: (started.set(), gate.wait(1.0)))
+    started.wait(1.0)
+    return gate
+
+
+def test_requests_run_by_priority_then_deadline(port):
+    service, client, bus = port
+    gate = _block(client)
+    now = time.perf_counter()
+    futures = [
+        client.submit(lambda b: b.read("Present_Load", "a"), priority=PRIORITY_TELEMETRY),
+        client.submit(lambda b: b.read("Goal_Position", "late"), priority=PRIORITY_MOTION, deadline=now + 2.0),
+        client.submit(lambda b: b.read("Goal_Position", "soon"), priority=PRIORITY_MOTION, deadline=now + 1.0),
+        client.submit(lambda b: b.read("Torque_Enable", "all"), priority=PRIORITY_ESTOP),
+    ]
+    gate.set()
+
+    assert [future.result(1.0) for future in futures] == [7] * 4
+    assert [motor for _, motor in bus.calls] == ["all", "soon", "late", "a"]
+
+
+def test_expired_requests_fail_without_touching_the_bus(port):
+    service, client, bus = port
+    gate = _block(client)
+    stale = client.submit(lambda b: b.read("Present_Position", "x"), deadline=time.perf_counter() + 0.01)
+    time.sleep(0.05)
+    gate.set()
+
+    with pytest.raises(TimeoutError):
+        stale.result(1.0)
+    assert bus.calls == [] and service.stats()["test://io"]["expired"] == 1
+
+
+def test_client_calls_block_and_errors_reach_the_caller(port):
+    service, client, bus = port
+    assert client.read("Present_Position", "x") == 7
+    with service.priority(PRIORITY_ESTOP):
+        # Nested calls from the port's own thread run inline instead of deadlocking
+        assert client.submit(lambda b: client.read("Moving", "y") + 1).result(1.0) == 8
+    with pytest.raises(ZeroDivisionError):
+        client.submit(lambda b: 1 / 0).result(1.0)
+    assert bus.calls == [("Present_Position", "x"), ("Moving", "y")]
+
+
+def test_handle_telemetry_is_a_periodic_job_on_the_port(sim_handle):
+    port = "sim://io-telemetry"
+    received = []
+    arm, handle = sim_handle(port, positions=[2100] * 6, subscriber=received.append)
+    assert handle.set_positions([2200] * 6, velocity=2000, wait=True, keep_connection=True)
+    # Polls keep running between moves; wait for one taken after the move
+    deadline = time.perf_counter() + 1.0
+    while (not received or received[-1][0]["position"] != 2200) and time.perf_counter() < deadline:
+        time.sleep(0.02)
+    telemetry = handle.last_telemetry()
+    stats = MotorIOService.instance().stats()[port]
+    handle.disconnect()
+
+    assert telemetry[0]["position"] == arm.positions()[0] == 2200
+    assert stats["completed"] > 0 and stats["failed"] == 0
+    assert port not in MotorIOService.instance().stats()
+
+
+def test_ports_on_one_hub_take_turns():
+    service = MotorIOService.instance()
+    clients = [service.attach(f"test://hub{i}", _RecordingBus(), hub="hub-a") for i in range(2)]
+    clients.append(service.attach("test://own-hub", _RecordingBus()))
+    active, overlaps = [], []
+
+    def transaction(bus):
+        overlaps.append(len(active))
+        active.append(bus)
+        time.sleep(0.05)
+        active.remove(bus)
+
+    try:
+        shared = [client.submit(transaction) for client in clients[:2]]
+        for future in shared:
+            future.result(1.0)
+        assert overlaps == [0, 0]
+        # A port on its own hub runs alongside the others
+        overlaps.clear()
+        both = [client.submit(transaction) for client in clients[1:]]
+        for future in both:
+            future.result(1.0)
+        assert sorted(overlaps) == [0, 1]
+    finally:
+        for client in clients:
+            service.detach(client.port)
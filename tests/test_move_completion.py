@@ -0,0 +1,40 @@
+import time
+
+from utils import cycle_metrics
+
+
+def _timed_move(controller, target, **kwargs):
+    recorder = cycle_metrics.start_recording("test", {}, {"cycle_metrics": {"enabled": False}})
+    try:
+        recorder.begin_iteration(1)
+        start = time.perf_counter()
+        controller.set_positions(target, velocity=3000, wait=True, keep_connection=True, **kwargs)
+        elapsed = time.perf_counter() - start
+        return elapsed, recorder.end_iteration()
+    finally:
+        cycle_metrics.stop_recording(recorder)
+
+
+def test_event_completion_beats_timed_wait(sim_controller):
+    _, event = sim_controller("sim://complete-event")
+    _, timed = sim_controller("sim://complete-timed", move_completion="timed")
+    target = [2348] * 6
+
+    event_s, record = _timed_move(event, target)
+    timed_s, _ = _timed_move(timed, target)
+
+    assert max(abs(a - b) for a, b in zip(event.read_positions_from_bus(), target)) <= event.POSITION_TOLERANCE
+    assert event_s < timed_s
+    assert record["settle_saved_s"] > 0
+    assert record["motion_s"] > 0 and record["settle_s"] < 0.05
+
+
+def test_settle_tail_per_move_and_position_fallback(sim_controller):
+    _, controller = sim_controller("sim://complete-tail", settle_tail_s=0.0)
+    _, record = _timed_move(controller, [2148] * 6, settle_tail=0.2)
+    assert 0.2 <= record["settle_s"] < 0.3
+
+    # Bus without a readable Moving flag: stops are detected from position changes
+    controller._moving_flag_failures = 3
+    elapsed, record = _timed_move(controller, [2048] * 6)
+    assert record["settle_s"] < 0.05 and elapsed < 1.0
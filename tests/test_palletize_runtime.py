@@ -0,0 +1,67 @@
+import copy
+
+from utils.motor_controller import MotorController
+from utils.palletize_runtime import STAGES, PalletizeRuntime
+
+STEP = {
+    "corners": [
+        [1900, 1800, 1800, 2000, 2048, 2048],
+        [2200, 1800, 1800, 2000, 2048, 2048],
+        [2200, 1900, 1700, 2000, 2048, 2048],
+        [1900, 1900, 1700, 2000, 2048, 2048],
+    ],
+    "divisions": {"c1_c2": 2, "c2_c3": 2},
+    "down_offsets": {"2": -150, "3": 150},
+    "release_offset": 200,
+    "approach_velocity": 3000,
+    "down_velocity": 2000,
+    "settle_time": 0.1,
+}
+
+
+def test_cell_plans_are_cached_per_geometry():
+    runtime = PalletizeRuntime({})
+    plans = runtime.plan(STEP)
+    assert runtime.plan(copy.deepcopy(STEP)) is plans
+    assert plans[1].cell == (2200, 1800, 1800, 2000, 2048, 2048)
+    assert plans[1].clearance == (2200, 1650, 1950, 2000, 2048, 2048)
+
+    # Velocities do not change the geometry; corners do
+    assert runtime.plan({**STEP, "down_velocity": 500}) is plans
+    moved = copy.deepcopy(STEP)
+    moved["corners"][0][0] = 1950
+    assert runtime.plan(moved)[0].cell[0] == 1950
+
+
+def _place_cells(sim_controller, port, step, cells=2, keep_moving=True):
+    arm, controller = sim_controller(port)
+    runtime = PalletizeRuntime(controller.config)
+    timings = []
+    for cell in range(cells):
+        # keep_moving: another step follows, as in a looping sequence
+        runtime.execute(step, cell_index=cell, controller=controller,
+                        followed_by_move=keep_moving or cell < cells - 1)
+        timings.append(runtime.last_timing)
+    runtime.final_positions = arm.positions()
+    return runtime, timings
+
+
+def test_blended_stages_raise_throughput(sim_controller):
+    stop_runtime, stop = _place_cells(sim_controller, "sim://pallet-stop", {**STEP, "blend_radius": 0})
+    blend_runtime, blend = _place_cells(sim_controller, "sim://pallet-blend", STEP)
+
+    assert set(blend[-1]) == set(STAGES) | {"total"}
+    # Drop and release still settle fully (settle_time is spent after the drop)
+    assert blend[-1]["drop"] >= STEP["settle_time"]
+    assert sum(blend[-1][stage] for stage in STAGES) <= blend[-1]["total"]
+    assert blend_runtime.cells_per_minute > stop_runtime.cells_per_minute * 1.1
+
+
+def test_step_ends_on_a_verified_stop_at_clearance(sim_controller):
+    runtime, _ = _place_cells(sim_controller, "sim://pallet-last", STEP, cells=1, keep_moving=False)
+    exit_pose = list(runtime.plan(STEP)[0].clearance)
+    exit_pose[5] = 2048 + STEP["release_offset"]
+
+    # No blend on the last move: the arm is within tolerance of the exit pose, not a blend radius away
+    tolerance = MotorController.POSITION_TOLERANCE
+    assert all(abs(p - t) <= tolerance for p, t in zip(runtime.final_positions, exit_pose))
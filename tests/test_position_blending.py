@@ -0,0 +1,44 @@
+import time
+from types import SimpleNamespace
+
+from utils.execution import ExecutionContext, execute_position_component
+from utils.execution.positions_strategy import DEFAULT_BLEND_RADIUS, _blend_radius
+from utils.motor_controller import MotorController
+
+
+class _Signal:
+    def emit(self, *args):
+        pass
+
+
+def _run_path(sim_controller, port, waypoint_extra, component_extra=None):
+    arm, controller = sim_controller(port)
+    worker = SimpleNamespace(
+        _stop_requested=False, log_message=_Signal(), status_update=_Signal(), progress_update=_Signal()
+    )
+    context = ExecutionContext(worker, {}, controller, None, None, None, {})
+    path = [[2048 + 150 * i, 2048 + 200 * i, 2048 - 100 * i, 2048, 2048, 2048] for i in range(1, 6)]
+    component = {"positions": [{"motor_positions": pose, "velocity": 2000, **waypoint_extra} for pose in path]}
+    component.update(component_extra or {})
+    start = time.perf_counter()
+    execute_position_component(context, component, 100)
+    return time.perf_counter() - start, arm.positions(), path[-1]
+
+
+def test_blend_radius_rules():
+    assert _blend_radius({}, False, 80) == 0
+    assert _blend_radius({"wait_for_completion": False}, False, 80) == 80
+    assert _blend_radius({"blend_radius": 40}, False, DEFAULT_BLEND_RADIUS) == 40
+    assert _blend_radius({"blend_radius": 40, "stop": True}, False, 80) == 0
+    assert _blend_radius({"wait_for_completion": False}, True, 80) == 0  # Last waypoint always stops
+    assert _blend_radius([2048] * 6, False, 80) == 0
+
+
+def test_pass_through_waypoints_blend_into_the_next_goal(sim_controller):
+    stop_s, _, _ = _run_path(sim_controller, "sim://blend-stop", {})
+    blend_s, final, target = _run_path(sim_controller, "sim://blend-pass", {"wait_for_completion": False},
+                                       {"blend_radius": 150})
+
+    # The last waypoint is still a verified stop point
+    assert max(abs(a - b) for a, b in zip(final, target)) <= MotorController.POSITION_TOLERANCE
+    assert blend_s < stop_s * 0.8
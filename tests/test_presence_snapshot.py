@@ -0,0 +1,95 @@
+"""Tests for presence background snapshots (save, load, seed and periodic reset)."""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from vision_triggers.daemon import VisionDaemon
+from vision_triggers.detectors.presence import PresenceDetector
+
+# The object sits in the top-left corner; an untrained model sees one whole-frame blob,
+# centred outside the zone
+ZONE = {"name": "bin", "zone_id": "bin", "polygon": [(0, 0), (70, 0), (70, 50), (0, 50)]}
+
+
+def _background(rng: np.random.Generator) -> np.ndarray:
+    frame = np.full((120, 160, 3), 120, dtype=np.int16)
+    frame += rng.integers(-3, 4, frame.shape, dtype=np.int16)
+    return frame.astype(np.uint8)
+
+
+def _with_object(frame: np.ndarray) -> np.ndarray:
+    frame = frame.copy()
+    frame[15:45, 20:60] = 30
+    return frame
+
+
+def _detector(snapshot_path) -> PresenceDetector:
+    detector = PresenceDetector(min_blob_area=400, snapshot_path=snapshot_path, snapshot_interval_seconds=0)
+    assert detector.initialize()
+    return detector
+
+
+def test_snapshot_round_trip_seeds_the_first_frame(tmp_path):
+    rng = np.random.default_rng(1)
+    snapshot = tmp_path / "background.npz"
+    trained = _detector(snapshot)
+    for _ in range(30):
+        trained.detect(_background(rng), [ZONE])
+    assert trained.save_snapshot() and snapshot.exists()
+
+    background, variance = trained.load_snapshot()
+    assert background.shape == (120, 160, 3) and variance.shape == (120, 160)
+
+    seeded = _detector(snapshot)
+    first = seeded.detect(_with_object(_background(rng)), [ZONE])[0]
+    assert seeded.seeded
+    assert first.detected and first.metadata["object_count"] == 1
+
+    cold = _detector(tmp_path / "missing.npz")
+    assert not cold.detect(_with_object(_background(rng)), [ZONE])[0].detected
+    assert not cold.seeded
+
+
+def test_snapshot_of_another_resolution_is_ignored(tmp_path):
+    rng = np.random.default_rng(2)
+    snapshot = tmp_path / "background.npz"
+    trained = _detector(snapshot)
+    for _ in range(5):
+        trained.detect(_background(rng), [ZONE])
+    assert trained.save_snapshot()
+
+    detector = _detector(snapshot)
+    detector.detect(np.full((60, 80, 3), 120, dtype=np.uint8), [ZONE])
+    assert not detector.seeded
+
+
+def test_daemon_resets_the_background_seeded_on_schedule():
+    resets = []
+    daemon = SimpleNamespace(
+        background_reset_interval=3600.0,
+        detector=SimpleNamespace(reset=lambda seeded: resets.append(seeded)),
+        last_background_reset=time.monotonic(),
+    )
+
+    VisionDaemon._maybe_reset_background(daemon)
+    assert resets == []
+
+    daemon.last_background_reset -= 3601.0
+    VisionDaemon._maybe_reset_background(daemon)
+    assert resets == [True]
+    assert time.monotonic() - daemon.last_background_reset < 1.0
+
+    daemon.background_reset_interval = 0
+    daemon.last_background_reset -= 10_000.0
+    VisionDaemon._maybe_reset_background(daemon)
+    assert resets == [True]
@@ -0,0 +1,60 @@
+import json
+import math
+
+from utils.composite_recording import CompositeRecording
+from utils.recording_simplify import max_deviation, simplify_recording
+
+
+def _sweep(points=200, dt=0.02):
+    """A slow reach: straight ramps on most joints, one smooth arc, a little sensor jitter."""
+    data = []
+    for i in range(points):
+        t = i * dt
+        jitter = (-1) ** i
+        data.append({
+            "timestamp": round(t, 3),
+            "positions": [2048 + 5 * i + jitter, 1500 + 3 * i, 2600 - 4 * i,
+                          int(2048 + 300 * math.sin(t)), 2048, 2048 + jitter],
+            "velocity": 600,
+        })
+    return data
+
+
+def test_simplified_recording_stays_within_tolerance():
+    original = _sweep()
+    for tolerance in (2, 4, 10):
+        reduced = simplify_recording(original, tolerance)
+        assert max_deviation(original, reduced) <= tolerance
+        assert reduced[0] is original[0] and reduced[-1] is original[-1]
+        # Kept points keep their recorded timing and velocity
+        assert all(point in original for point in reduced)
+    assert len(simplify_recording(original, 4)) < len(original) / 5
+    assert simplify_recording(original, 0) == original
+
+
+def test_timing_is_part_of_the_error():
+    # The arm pauses halfway: the middle point is on the line but not at the matching time
+    data = [{"timestamp": t, "positions": [q] * 6, "velocity": 600}
+            for t, q in ((0.0, 2000), (1.0, 2100), (2.0, 2100), (3.0, 2200))]
+    assert len(simplify_recording(data, 5)) == 4
+    # Per-joint bounds: only the joints that moved need a loose bound
+    assert len(simplify_recording(data, [200] * 6)) == 2
+
+
+def test_composite_save_simplifies_once(tmp_path):
+    original = _sweep()
+    composite = CompositeRecording("reach", tmp_path)
+    composite.create_new()
+    filename = composite.add_live_recording_component("reach", original, simplify_tolerance=4)
+    saved = json.loads((tmp_path / "reach" / filename).read_text())
+
+    assert saved["metadata"]["point_count"] < len(original)
+    assert saved["metadata"]["simplified"]["original_points"] == len(original)
+    assert saved["metadata"]["simplified"]["max_deviation"] <= 4
+
+    # Re-saving loaded data must not simplify it again
+    resaved = composite.add_live_recording_component("reach", saved["recorded_data"], simplify_tolerance=4,
+                                                     metadata=saved["metadata"])
+    again = json.loads((tmp_path / "reach" / resaved).read_text())
+    assert again["recorded_data"] == saved["recorded_data"]
+    assert again["metadata"]["simplified"] == saved["metadata"]["simplified"]
@@ -0,0 +1,83 @@
+"""Tests for :mod:`vision_triggers.detectors.change` and the daemon's quiet-scene skip."""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from vision_triggers.daemon import VisionDaemon
+from vision_triggers.detectors.change import SceneChangeDetector
+
+# 64×48 thumbnail = 3072 pixels: "on" at 31 changed pixels (1 %), "off" below 13 (0.4 %)
+SIZE = (64, 48)
+
+
+class Scene:
+    """Grayscale frames where exactly ``changed`` pixels differ from the previous frame."""
+
+    def __init__(self):
+        self.frame = np.zeros((SIZE[1], SIZE[0]), dtype=np.uint8)
+
+    def step(self, changed: int) -> np.ndarray:
+        flat = self.frame.reshape(-1)
+        flat[:changed] = 100 - flat[:changed]
+        return self.frame.copy()
+
+
+def test_hysteresis_between_on_and_off_fractions():
+    detector = SceneChangeDetector(size=SIZE, pixel_threshold=12, on_fraction=0.01, off_fraction=0.004)
+    scene = Scene()
+
+    assert detector.update(scene.step(0)) is False  # First frame only sets the reference
+    states = [detector.update(scene.step(changed)) for changed in (20, 40, 20, 20, 5, 20, 40)]
+
+    # 20 pixels neither switches on nor off; 40 switches on, 5 switches off
+    assert states == [False, True, True, True, False, False, True]
+    assert detector.change_events == 2
+    assert detector.get_stats()["last_fraction"] == round(40 / 3072, 4)
+
+
+def test_reset_forgets_the_reference():
+    detector = SceneChangeDetector(size=SIZE)
+    scene = Scene()
+    detector.update(scene.step(0))
+    assert detector.update(scene.step(200))
+
+    detector.reset()
+    # A new reference is taken rather than diffed against the old one
+    assert detector.update(scene.step(200)) is False and detector.last_fraction == 0.0
+
+
+def _daemon(last_full: float, active: bool = False):
+    return SimpleNamespace(
+        change_detector=SceneChangeDetector(size=SIZE),
+        max_quiet_seconds=60.0,
+        last_full_detection=last_full,
+        _scene_active=lambda: active,
+    )
+
+
+def test_quiet_scene_skips_until_max_quiet_seconds():
+    now = 1000.0
+    assert VisionDaemon._scene_quiet(_daemon(last_full=now - 59.0), now)
+    # Forced full pass once the model has not been refreshed for max_quiet_seconds
+    assert not VisionDaemon._scene_quiet(_daemon(last_full=now - 60.0), now)
+
+
+def test_change_or_activity_always_runs_the_full_pass():
+    now = 1000.0
+    changing = _daemon(last_full=now - 1.0)
+    changing.change_detector.changed = True
+    assert not VisionDaemon._scene_quiet(changing, now)
+    assert not VisionDaemon._scene_quiet(_daemon(last_full=now - 1.0, active=True), now)
+
+    no_probe = _daemon(last_full=now - 1.0)
+    no_probe.change_detector = None
+    assert not VisionDaemon._scene_quiet(no_probe, now)
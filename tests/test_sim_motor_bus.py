@@ -0,0 +1,63 @@
+import time
+
+import pytest
+
+import HomePos
+from utils.resilient_motor_bus import ResilientMotorBus
+from utils.sim_motor_bus import SimBusProfile, SimulatedFeetechBus, reset_simulated_arms, simulated_arm
+
+
+@pytest.fixture(autouse=True)
+def _fresh_arms():
+    reset_simulated_arms()
+    yield
+    reset_simulated_arms()
+
+
+def test_create_motor_bus_returns_simulated_bus_with_query_profile():
+    bus = HomePos.create_motor_bus("sim://arm?baudrate=115200&turnaround_s=0")
+    assert isinstance(bus, SimulatedFeetechBus)
+    assert bus.is_connected
+    assert bus.arm.profile.baudrate == 115200
+
+    start = time.perf_counter()
+    assert bus.read("Present_Position", "shoulder_pan", normalize=False) == 2048
+    # 8-byte request + 8-byte status at 115200 baud (8N1) is ~1.4 ms on the wire
+    assert time.perf_counter() - start >= 0.0013
+    assert bus.arm.stats.reads == 1 and bus.arm.stats.bytes_on_wire == 16
+
+    bus.disconnect()
+    with pytest.raises(ConnectionError):
+        bus.read("Present_Position", "shoulder_pan")
+
+
+def test_servo_follows_velocity_limited_profile():
+    arm = simulated_arm("sim://motion", SimBusProfile(turnaround_s=0), positions=[1000] * 6)
+    bus = SimulatedFeetechBus("sim://motion")
+    bus.connect()
+    bus.write("Torque_Enable", "elbow_flex", 1)
+    bus.write("Goal_Velocity", "elbow_flex", 2000)
+    bus.write("Goal_Position", "elbow_flex", 1400)
+
+    time.sleep(0.1)
+    midway = bus.read("Present_Position", "elbow_flex")
+    assert 1050 < midway < 1400
+    assert bus.read("Moving", "elbow_flex") == 1
+
+    time.sleep(0.15)
+    assert bus.read("Present_Position", "elbow_flex") == 1400
+    assert bus.read("Moving", "elbow_flex") == 0
+    # Other joints are untouched and the arm keeps its pose across connections
+    assert arm.positions()[0] == 1000
+    assert SimulatedFeetechBus("sim://motion").arm is arm
+
+
+def test_injected_errors_are_retried_by_resilient_bus():
+    simulated_arm("sim://flaky", SimBusProfile(error_rate=0.3, error_timeout_s=0.0, turnaround_s=0, seed=7))
+    bus = ResilientMotorBus(HomePos.create_motor_bus("sim://flaky"))
+    bus.RETRY_DELAY_BASE = 0.0
+
+    values = [bus.read("Present_Position", "gripper", normalize=False) for _ in range(50)]
+
+    assert all(value == 2048 for value in values)
+    assert bus.total_retries == bus.bus.arm.stats.errors > 0
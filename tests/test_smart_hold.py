@@ -0,0 +1,68 @@
+import threading
+import time
+
+POSE = [2100, 1900, 2300, 2048, 2000, 2200]
+
+
+def _hold(arm, controller, mode, duration=1.0):
+    arm.reset_stats()
+    arm.goal_writes.clear()
+    stats = controller.hold_position(duration, mode=mode)
+    return stats, len(arm.goal_writes), arm.stats.occupancy()
+
+
+def test_smart_hold_uses_a_fraction_of_the_bus(sim_controller):
+    arm, controller = sim_controller("sim://hold-smart", positions=POSE)
+    smart, smart_writes, smart_busy = _hold(arm, controller, "smart")
+    resend, resend_writes, resend_busy = _hold(arm, controller, "resend")
+
+    assert smart["target"] == POSE and smart["reasserts"] == 0
+    assert smart["max_error"] <= controller.POSITION_TOLERANCE
+    assert resend["max_error"] <= controller.POSITION_TOLERANCE
+    # One goal write per motor for the whole hold
+    assert smart_writes == len(POSE)
+    assert resend_writes >= 9 * len(POSE)
+    assert smart_busy < resend_busy / 2
+    assert 0 < smart["bus_occupancy"] < resend["bus_occupancy"]
+
+
+def test_smart_hold_reasserts_after_a_servo_reset(sim_controller):
+    arm, controller = sim_controller("sim://hold-reset", positions=POSE)
+
+    def brownout():
+        time.sleep(0.3)
+        # The wrist reboots: torque off, and it sags under gravity
+        servo = arm.servos[controller.motor_names[3]]
+        servo.registers["Torque_Enable"] = 0
+        servo.position -= 150
+
+    threading.Thread(target=brownout).start()
+    stats = controller.hold_position(1.2)
+
+    assert stats["reasserts"] >= 1
+    assert max(abs(a - b) for a, b in zip(arm.positions(), POSE)) <= controller.POSITION_TOLERANCE
+
+
+def test_hold_ends_when_asked_to_stop(sim_controller):
+    arm, controller = sim_controller("sim://hold-stop", positions=POSE)
+    deadline = time.perf_counter() + 0.2
+    stats = controller.hold_position(5.0, should_stop=lambda: time.perf_counter() > deadline)
+    assert stats["held_s"] < 0.4
+
+
+def test_hold_through_a_shared_motor_handle(sim_handle):
+    _, handle = sim_handle("sim://hold-handle", positions=POSE)
+    stats = handle.hold_position(0.3)
+    positions, reason = handle.check_hold(POSE, handle.POSITION_TOLERANCE)
+    assert stats["target"] == POSE and reason is None
+
+
+def test_hold_after_an_emergency_stop_leaves_torque_off(sim_controller):
+    arm, controller = sim_controller("sim://hold-estop", positions=POSE)
+    controller.emergency_stop()
+    arm.goal_writes.clear()
+
+    assert controller.hold_position(0.3) is None
+    assert controller.assert_goal(POSE, "torque_off") is False
+    assert not arm.goal_writes
+    assert all(servo.registers["Torque_Enable"] == 0 for servo in arm.servos.values())
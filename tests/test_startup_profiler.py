@@ -0,0 +1,52 @@
+import json
+import sys
+
+from utils.startup_profiler import ImportProfiler, StartupProfiler, check_budget, load_budget
+
+
+def test_import_profiler_records_cumulative_and_self_time(tmp_path, monkeypatch):
+    (tmp_path / "profiled_parent.py").write_text("import profiled_child\nVALUE = profiled_child.VALUE\n")
+    (tmp_path / "profiled_child.py").write_text("import time\ntime.sleep(0.02)\nVALUE = 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    profiler = ImportProfiler()
+    profiler.install()
+    try:
+        import profiled_parent  # noqa: F401
+    finally:
+        profiler.uninstall()
+        sys.modules.pop("profiled_parent", None)
+        sys.modules.pop("profiled_child", None)
+
+    rows = {row["module"]: row for row in profiler.records()}
+    assert rows["profiled_child"]["cumulative_ms"] >= 15
+    assert rows["profiled_parent"]["cumulative_ms"] >= rows["profiled_child"]["cumulative_ms"]
+    assert rows["profiled_parent"]["self_ms"] < rows["profiled_child"]["cumulative_ms"]
+
+
+def test_budget_check_flags_cold_start_and_slow_modules():
+    report = {
+        "cold_start_ms": 4200.0,
+        "imports": [{"module": "cv2", "cumulative_ms": 900.0, "self_ms": 850.0}],
+    }
+    assert check_budget(report, {"cold_start_ms": 5000, "max_module_ms": 1000}) == []
+    violations = check_budget(report, {"cold_start_ms": 4000, "max_module_ms": 500})
+    assert len(violations) == 2
+    assert "cold start" in violations[0]
+    assert "cv2" in violations[1]
+
+
+def test_profiler_writes_report_with_budget(tmp_path, monkeypatch):
+    monkeypatch.delenv("NICEBOT_STARTUP_BUDGET_MS", raising=False)
+    budget_path = tmp_path / "budget.json"
+    budget_path.write_text(json.dumps({"default": {"cold_start_ms": 10}, "demo": {"max_module_ms": 50}}))
+    assert load_budget("demo", budget_path) == {"cold_start_ms": 10, "max_module_ms": 50}
+
+    profiler = StartupProfiler("demo", report_dir=tmp_path, budget_path=budget_path).start()
+    report = profiler.finish("ready")
+
+    written = json.loads((tmp_path / "demo.json").read_text())
+    assert written["app"] == "demo"
+    assert written["ready_mark"] == "ready"
+    assert report["budget"]["cold_start_ms"] == 10
+    assert not profiler.imports.installed
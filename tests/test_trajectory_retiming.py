@@ -0,0 +1,105 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from utils.execution import ExecutionContext, playback_live_recording
+from utils.trajectory_retiming import JointLimits, TrajectoryRetimer
+
+LIMITS = JointLimits(velocity=(1000.0,) * 6, acceleration=(5000.0,) * 6)
+
+
+def _ramp(points=20, step=20, dt=0.05):
+    return [[2048 + step * i] * 6 for i in range(points)], [i * dt for i in range(points)]
+
+
+def _max_accel_ratio(retimer, durations, start=0, entry=None):
+    """Worst joint acceleration across waypoints relative to its limit."""
+    velocities = [retimer.segment_velocity(start + i, d) for i, d in enumerate(durations)]
+    if entry is not None:
+        # The planner spreads the change from the entry speed over the first segment
+        velocities.insert(0, entry)
+        durations = [durations[0]] + list(durations)
+    worst = 0.0
+    for i in range(1, len(velocities)):
+        span = (durations[i - 1] + durations[i]) / 2
+        for j, limit in enumerate(retimer.limits.acceleration):
+            worst = max(worst, abs(velocities[i][j] - velocities[i - 1][j]) / span / limit)
+    return worst
+
+
+def test_limits_from_config_accept_scalars_and_lists():
+    limits = JointLimits.from_config({"control": {"joint_limits": {"velocity": 2000, "acceleration": [1, 2]}}})
+    assert limits.velocity == (2000.0,) * 6
+    assert limits.acceleration[:3] == (1.0, 2.0, 20000.0)
+
+
+def test_recorded_timing_kept_at_or_below_full_speed():
+    positions, timestamps = _ramp()
+    for scale in (0.5, 1.0):
+        times = TrajectoryRetimer(positions, timestamps, LIMITS).schedule(scale)
+        assert times == pytest.approx([t / scale for t in timestamps])
+
+
+def test_speed_scale_respects_velocity_and_acceleration_limits():
+    positions, timestamps = _ramp()
+    retimer = TrajectoryRetimer(positions, timestamps, LIMITS)
+    durations = retimer.durations(4.0)
+    # 4x would ask for 1600 steps/s; the limit is 1000
+    assert min(durations) >= 20 / 1000.0 - 1e-9
+    assert _max_accel_ratio(retimer, durations) <= 1.0 + 1e-6
+    assert sum(durations) < sum(retimer.durations(1.0))
+
+
+def test_replan_mid_path_ramps_from_entry_speed():
+    positions, timestamps = _ramp()
+    retimer = TrajectoryRetimer(positions, timestamps, LIMITS)
+    slow = retimer.durations(1.0)
+    entry = retimer.segment_velocity(9, slow[9])
+    durations = retimer.durations(3.0, start=10, entry_speed=retimer.recorded[9] / slow[9])
+    assert len(durations) == len(positions) - 11
+    assert _max_accel_ratio(retimer, durations, start=10, entry=entry) <= 1.0 + 1e-6
+    # Speeding up is gradual: no faster than the velocity limit, and ramping
+    assert durations[0] > durations[3] >= 20 / 1000.0 - 1e-9
+
+
+def test_faster_request_never_slower_on_noisy_path():
+    random = __import__("random").Random(1)
+    positions = [[2048] * 6]
+    for _ in range(1200):
+        positions.append([p + random.randint(-30, 30) for p in positions[-1]])
+    retimer = TrajectoryRetimer(positions, [i * 0.05 for i in range(len(positions))], JointLimits.from_config({}))
+    start = time.perf_counter()
+    totals = [sum(retimer.durations(scale)) for scale in (0.5, 1.0, 2.0, 4.0)]
+    assert time.perf_counter() - start < 0.5
+    assert totals == sorted(totals, reverse=True)
+    # Jitter never slows playback below the recorded timing
+    assert totals[:2] == pytest.approx([120.0, 60.0])
+
+
+class _Signal:
+    def emit(self, *args):
+        pass
+
+
+def test_playback_speeds_up_when_multiplier_changes_mid_run(sim_controller):
+    arm, controller = sim_controller("sim://retime")
+    worker = SimpleNamespace(
+        _stop_requested=False, log_message=_Signal(), status_update=_Signal(), progress_update=_Signal()
+    )
+    context = ExecutionContext(worker, controller.config, controller, None, None, None, {})
+    positions, timestamps = _ramp(points=40, step=10)
+    recording = {"recorded_data": [{"timestamp": t, "positions": p, "velocity": 600}
+                                   for t, p in zip(timestamps, positions)]}
+    playback = threading.Thread(target=playback_live_recording, args=(context, recording))
+    start = time.perf_counter()
+    playback.start()
+    time.sleep(0.5)
+    controller.speed_multiplier = 2.0
+    playback.join(timeout=5.0)
+    elapsed = time.perf_counter() - start
+
+    # 2 s recording: ~0.5 s at 1x, then the remaining ~1.5 s at 2x
+    assert 1.1 < elapsed < 1.6
+    assert arm.goal_writes[-1][2] == positions[-1][-1]
@@ -0,0 +1,100 @@
+"""Tests for compiled trigger evaluation in :mod:`vision_triggers.trigger_rules`."""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from vision_triggers.detectors.base import DetectionResult
+from vision_triggers.trigger_rules import TriggerEvaluator
+
+
+def _result(zone_id, count):
+    return DetectionResult(
+        detected=count > 0,
+        boxes=[(10, 10, 5, 5)] * count,
+        confidence=0.9,
+        metadata={"zone_id": zone_id, "zone_name": zone_id.title(), "object_count": count},
+    )
+
+
+RESULTS = [_result("work_area", 1), _result("box_1", 2), _result("box_2", 0)]
+
+
+def test_helpers_evaluate_through_compiled_plans():
+    evaluator = TriggerEvaluator()
+
+    presence = evaluator.evaluate_presence(RESULTS, "work_area", 1)
+    assert presence.triggered and presence.reason == "Found 1 object(s), got 1"
+
+    count = evaluator.evaluate_count(RESULTS, "box_1", 2, "==")
+    assert count.triggered and count.reason == "Count 2 == 2: True"
+    assert count.details["cumulative_count"] is None
+
+    multi = evaluator.evaluate_multi_zone(RESULTS, [{"zone": "box_1"}, {"zone": "box_2"}], "AND")
+    assert not multi.triggered and multi.reason == "Not all zones satisfied"
+    assert multi.details["satisfied_count"] == 1
+
+    assert evaluator.evaluate_multi_zone(RESULTS, []).reason == "No zone rules specified"
+    missing = evaluator.evaluate_count(RESULTS, "missing", 2)
+    assert not missing.triggered and missing.reason == "Zone missing not found"
+
+
+def test_plans_are_compiled_once_and_missing_zones_do_not_fire():
+    evaluator = TriggerEvaluator()
+    trigger = {"trigger_id": "p", "type": "presence",
+               "conditions": {"rules": {"zone": "missing", "min_objects": 1}}}
+
+    plan = evaluator.compile_trigger(trigger)
+    assert evaluator.compile_trigger(trigger) is plan
+
+    evaluation = evaluator.evaluate_trigger(trigger, RESULTS)
+    assert not evaluation.triggered
+    assert evaluation.details == {"zone_id": "missing"}
+
+
+def test_cumulative_count_keeps_accumulating_until_reset():
+    evaluator = TriggerEvaluator()
+    trigger = {"trigger_id": "cum", "type": "count",
+               "conditions": {"rules": {"zone": "box_1", "count": 4, "operator": ">=",
+                                        "cumulative": True}}}
+
+    # Firing does not consume the total; only reset_cumulative_count does
+    fired = [evaluator.evaluate_trigger(trigger, RESULTS).triggered for _ in range(4)]
+    assert fired == [False, True, True, True]
+    assert evaluator.get_cumulative_count("cum") == 8
+
+    evaluator.reset_cumulative_count("cum")
+    assert not evaluator.evaluate_trigger(trigger, RESULTS).triggered
+    assert evaluator.evaluate_count(RESULTS, "box_1", 4, cumulative=True, trigger_id="cum").triggered
+    assert evaluator.get_cumulative_count("cum") == 4
+
+
+def test_results_list_mutated_in_place_is_reindexed():
+    evaluator = TriggerEvaluator()
+    trigger = {"trigger_id": "p", "type": "presence",
+               "conditions": {"rules": {"zone": "work_area", "min_objects": 1}}}
+    results = list(RESULTS)
+    assert evaluator.evaluate_trigger(trigger, results).triggered
+
+    # Same list object and length, different contents
+    results[0] = _result("work_area", 0)
+    assert not evaluator.evaluate_trigger(trigger, results).triggered
+
+
+def test_evaluations_stay_valid_after_later_frames():
+    evaluator = TriggerEvaluator()
+    trigger = {"trigger_id": "p", "type": "presence",
+               "conditions": {"rules": {"zone": "work_area", "min_objects": 1}}}
+
+    fired = evaluator.evaluate_trigger(trigger, RESULTS)
+    quiet = evaluator.evaluate_trigger(trigger, [_result("work_area", 0)])
+
+    assert fired is not quiet
+    assert fired.triggered and fired.reason == "Found 1 object(s), got 1"
+    assert fired.details["object_count"] == 1
+    assert not quiet.triggered and quiet.reason == "Need 1 object(s), got 0"
@@ -0,0 +1,73 @@
+"""Tests for :mod:`vision_triggers.scheduler`."""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from vision_triggers.scheduler import TriggerScheduler
+
+
+def test_triggers_only_due_at_their_interval():
+    scheduler = TriggerScheduler()
+    scheduler.add("fast", 1.0, now=0.0)
+    scheduler.add("slow", 5.0, now=0.0)
+
+    assert scheduler.pop_due(0.0) == ["fast", "slow"]
+    scheduler.mark_run("fast", 0.0, 0.01)
+    scheduler.mark_run("slow", 0.0, 0.01)
+
+    assert scheduler.pop_due(0.5) == []
+    assert scheduler.time_until_due(0.5) == 0.5
+    assert scheduler.pop_due(1.0) == ["fast"]
+    scheduler.mark_run("fast", 1.0, 0.01)
+
+    due = []
+    for tick in (2.0, 3.0, 4.0, 5.0):
+        for trigger_id in scheduler.pop_due(tick):
+            due.append((tick, trigger_id))
+            scheduler.mark_run(trigger_id, tick, 0.01)
+    assert sorted(due) == [(2.0, "fast"), (3.0, "fast"), (4.0, "fast"), (5.0, "fast"), (5.0, "slow")]
+
+
+def test_min_interval_and_late_runs_do_not_burst():
+    scheduler = TriggerScheduler(min_interval=0.5)
+    scheduler.add("t", 0.1, now=0.0)
+    assert scheduler.get_stats(0.0)["t"]["interval"] == 0.5
+
+    scheduler.pop_due(0.0)
+    # Evaluation overran several intervals; next run is one interval later
+    scheduler.mark_run("t", 0.0, 2.0)
+    assert scheduler.next_due() == 2.5
+
+
+def test_set_interval_and_remove():
+    scheduler = TriggerScheduler()
+    scheduler.add("t", 10.0, now=0.0)
+    scheduler.pop_due(0.0)
+    scheduler.mark_run("t", 0.0, 0.0)
+    assert scheduler.next_due() == 10.0
+
+    scheduler.set_interval("t", 2.0, now=1.0)
+    assert scheduler.next_due() == 2.0
+    assert scheduler.pop_due(2.0) == ["t"]
+
+    scheduler.remove("t")
+    assert scheduler.next_due() is None
+    assert scheduler.pop_due(100.0) == []
+
+
+def test_duty_cycle_reporting():
+    scheduler = TriggerScheduler()
+    scheduler.add("t", 1.0, now=0.0)
+    for tick in range(10):
+        scheduler.pop_due(float(tick))
+        scheduler.mark_run("t", float(tick), 0.1)
+
+    stats = scheduler.get_stats(10.0)["t"]
+    assert stats["runs"] == 10
+    assert abs(stats["duty_cycle"] - 0.1) < 1e-6
@@ -0,0 +1,119 @@
+"""Tests for :mod:`vision_triggers.watchdog` with a fake daemon process."""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import sys
+import time
+
+import pytest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from vision_triggers import watchdog as watchdog_module
+from vision_triggers.ipc import DAEMON_EXIT_MEMORY_EXCEEDED
+from vision_triggers.watchdog import VisionWatchdog
+
+# No such process, so memory comes from the heartbeat instead of psutil
+FAKE_PID = 2 ** 22 + 12345
+
+
+class FakeProcess:
+    def __init__(self, *args, pid: int = FAKE_PID, **kwargs):
+        self.pid = pid
+        self.returncode = None
+        self.terminated = False
+
+    def poll(self):
+        return self.returncode
+
+    def terminate(self):
+        self.terminated = True
+        self.returncode = -15
+
+    def wait(self, timeout=None):
+        return self.returncode
+
+    def kill(self):
+        self.returncode = -9
+
+
+@pytest.fixture
+def dog(tmp_path, monkeypatch):
+    config = tmp_path / "vision_config.yaml"
+    config.write_text(
+        "memory:\n  max_memory_mb: 100\n"
+        "watchdog:\n  hang_timeout_seconds: 5\n  max_restart_attempts: 3\n  notify_on_restart: false\n"
+    )
+    spawned = []
+
+    def _popen(*args, **kwargs):
+        spawned.append(FakeProcess(pid=FAKE_PID + len(spawned)))
+        return spawned[-1]
+
+    monkeypatch.setattr(watchdog_module.subprocess, "Popen", _popen)
+    dog = VisionWatchdog(config, tmp_path / "runtime")
+    delays = []
+    monkeypatch.setattr(dog, "_sleep", delays.append)
+    dog.spawned, dog.delays = spawned, delays
+    dog._start_daemon()
+    return dog
+
+
+def _beat(dog, age: float = 0.0, **fields):
+    beat = {"pid": dog.process.pid, "monotonic": time.monotonic() - age, "loop_latency": 0.0}
+    beat.update(fields)
+    dog.ipc.heartbeat_file.write_text(json.dumps(beat))
+
+
+def test_fresh_heartbeat_is_healthy(dog):
+    _beat(dog, age=1.0, memory_mb=50)
+    assert dog.check_health() is None
+
+
+def test_stale_or_foreign_heartbeat_means_hung(dog):
+    _beat(dog, age=10.0)
+    assert dog.check_health().startswith("no heartbeat for 10s")
+
+    # A fresh beat from a previous daemon does not count; the start time does
+    _beat(dog, pid=dog.process.pid + 1)
+    dog.started_at = time.monotonic() - 6.0
+    assert dog.check_health().startswith("no heartbeat for 6s")
+
+    _beat(dog, loop_latency=7.5)
+    assert dog.check_health() == "loop latency 7.5s"
+
+
+def test_memory_and_exit_codes(dog):
+    _beat(dog, memory_mb=150)
+    assert dog.check_health() == "memory 150MB > 100MB"
+
+    dog.process.returncode = DAEMON_EXIT_MEMORY_EXCEEDED
+    assert dog.check_health() == "memory exceeded"
+    dog.process.returncode = 1
+    assert dog.check_health() == "exited with code 1"
+    dog.process.returncode = 0
+    assert dog.check_health() is None
+
+
+def test_restart_backs_off_and_gives_up(dog):
+    first = dog.process
+    assert [dog._restart("hung") for _ in range(4)] == [True, True, True, False]
+
+    assert first.terminated and len(dog.spawned) == 4
+    assert dog.delays == [1.0, 2.0, 4.0]
+    assert dog.get_status()["total_restarts"] == 3
+    assert dog.get_status()["last_restart_reason"] == "hung"
+
+
+def test_stable_daemon_resets_the_attempt_counter(dog):
+    dog._restart("hung")
+    _beat(dog)
+    assert dog.check_health() is None and dog.restart_attempts == 1
+
+    dog.started_at = time.monotonic() - dog.STABLE_AFTER_SECONDS - 1.0
+    _beat(dog)
+    assert dog.check_health() is None and dog.restart_attempts == 0
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Train an arm's motion model with a short out-and-back sweep per joint.
+
+Each joint (gripper excluded by default) moves ``--span`` steps towards the
+middle of its range and back at several velocities.  The learned profiles are
+saved to ``runtime/motion_models/<arm id>.json`` and used by
+``MotorController`` to predict move completion (see ``utils/motion_model.py``).
+
+Examples:
+    python tools/calibrate_motion_model.py
+    python tools/calibrate_motion_model.py --arm 1 --span 150 --velocities 400 1200 2400
+    python tools/calibrate_motion_model.py --show        # print the stored model, no motion
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.config import CONFIG_PATH, load_config  # noqa: E402
+from utils import motor_events  # noqa: E402
+from utils.motion_model import calibrate_motion_model  # noqa: E402
+from utils.motor_controller import MotorController  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--config", type=Path, default=CONFIG_PATH)
+    parser.add_argument("--arm", type=int, default=0, help="robot arm index (default 0)")
+    parser.add_argument("--span", type=int, default=200, help="steps each joint moves out and back")
+    parser.add_argument("--velocities", type=int, nargs="+", default=[600, 1500, 3000])
+    parser.add_argument("--repeats", type=int, default=2)
+    parser.add_argument("--joints", type=int, nargs="+", default=[1, 2, 3, 4, 5],
+                        help="1-based joint numbers (default: all but the gripper)")
+    parser.add_argument("--show", action="store_true", help="print the stored model and exit")
+    args = parser.parse_args()
+
+    config = load_config(args.config)
+    motor_events.configure(config)
+    motor_events.start_drain()
+    controller = MotorController(config, arm_index=args.arm)
+    model = controller.motion_model
+    if model is None:
+        print("❌ Motion model disabled (control.motion_model.enabled = false)")
+        return 1
+    if args.show:
+        print(json.dumps(model.to_dict(), indent=2))
+        return 0
+
+    if not controller.connect():
+        print(f"❌ Could not connect to {controller.port}")
+        return 1
+    try:
+        rows = calibrate_motion_model(
+            controller,
+            joints=[j - 1 for j in args.joints],
+            velocities=args.velocities,
+            span=args.span,
+            repeats=args.repeats,
+        )
+    finally:
+        controller.disconnect()
+
+    for row in rows:
+        print(f"joint {row['joint'] + 1}  v={row['velocity']:>4}  "
+              f"{row.get('source', '-'):>7} {row.get('predicted_s', 0.0):.3f}s  actual {row.get('actual_s', 0.0):.3f}s")
+    print(f"✓ {len(rows)} moves, saved {model.path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Cold-start regression check for the GUI, vision designer and vision daemon.
+
+Each target is launched in a fresh interpreter with the start-up profiler
+enabled (``NICEBOT_PROFILE_STARTUP=1``) and told to exit once it is ready
+(``NICEBOT_PROFILE_EXIT=1``).  The JSON reports written to
+``runtime/startup_profile/`` are checked against ``config/startup_budget.json``
+and, optionally, against a saved baseline.
+
+Examples:
+    python tools/check_startup_budget.py
+    python tools/check_startup_budget.py --target vision_daemon --runs 3
+    python tools/check_startup_budget.py --save-baseline runtime/startup_baseline.json
+    python tools/check_startup_budget.py --baseline runtime/startup_baseline.json --tolerance 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from utils.startup_profiler import (  # noqa: E402
+    DEFAULT_REPORT_DIR,
+    PROFILE_ENV,
+    PROFILE_EXIT_ENV,
+    check_budget,
+    load_budget,
+)
+
+
+def _target_commands(runtime_dir: Path) -> Dict[str, List[str]]:
+    return {
+        "app": [sys.executable, "app.py", "--windowed"],
+        "vision_app": [sys.executable, "vision_app.py"],
+        "vision_daemon": [
+            sys.executable,
+            "-m",
+            "vision_triggers.daemon",
+            "--runtime-dir",
+            str(runtime_dir),
+        ],
+    }
+
+
+def run_target(name: str, command: List[str], timeout: float) -> Optional[dict]:
+    report_path = DEFAULT_REPORT_DIR / f"{name}.json"
+    if report_path.exists():
+        report_path.unlink()
+
+    env = dict(os.environ)
+    env[PROFILE_ENV] = "1"
+    env[PROFILE_EXIT_ENV] = "1"
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    try:
+        subprocess.run(
+            command,
+            cwd=str(PROJECT_ROOT),
+            env=env,
+            timeout=timeout,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            check=False,
+        )
+    except subprocess.TimeoutExpired:
+        print(f"❌ {name}: did not become ready within {timeout:.0f}s")
+        return None
+
+    try:
+        return json.loads(report_path.read_text())
+    except Exception as exc:
+        print(f"❌ {name}: no profile report ({exc})")
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Check cold-start time against the configured budget")
+    parser.add_argument("--target", action="append", choices=["app", "vision_app", "vision_daemon"],
+                        help="Target(s) to profile (default: all)")
+    parser.add_argument("--runs", type=int, default=1, help="Runs per target; the fastest run is used")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Seconds to wait for each run")
+    parser.add_argument("--baseline", type=Path, help="Baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed slowdown versus the baseline (fraction, default 0.25)")
+    parser.add_argument("--save-baseline", type=Path, help="Write the measured cold-start times here")
+    args = parser.parse_args(argv)
+
+    baseline: Dict[str, float] = {}
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+
+    failures = 0
+    measured: Dict[str, float] = {}
+    with tempfile.TemporaryDirectory(prefix="nicebot_startup_") as tmp:
+        commands = _target_commands(Path(tmp))
+        for name in args.target or list(commands):
+            reports = [run_target(name, commands[name], args.timeout) for _ in range(max(1, args.runs))]
+            reports = [report for report in reports if report]
+            if not reports:
+                failures += 1
+                continue
+
+            best = min(reports, key=lambda report: report["cold_start_ms"])
+            cold_start = float(best["cold_start_ms"])
+            measured[name] = cold_start
+            violations = check_budget(best, load_budget(name))
+
+            reference = baseline.get(name)
+            if reference and cold_start > reference * (1.0 + args.tolerance):
+                violations.append(
+                    f"cold start {cold_start:.0f} ms is {cold_start / reference - 1.0:+.0%} vs baseline {reference:.0f} ms"
+                )
+
+            slowest = ", ".join(f"{row['module']} {row['cumulative_ms']:.0f}ms" for row in best["imports"][:3])
+            status = "❌" if violations else "✓"
+            print(f"{status} {name}: {cold_start:.0f} ms (imports {best['import_total_ms']:.0f} ms; {slowest})")
+            for violation in violations:
+                print(f"    - {violation}")
+            failures += bool(violations)
+
+    if args.save_baseline and measured:
+        args.save_baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.save_baseline.write_text(json.dumps(measured, indent=2))
+        print(f"Baseline written to {args.save_baseline}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Cycle-time and throughput report for looping sequences.
+
+Reads the per-iteration time series written by ``utils/cycle_metrics.py``
+(``runtime/cycle_metrics/<sequence>.jsonl``) and prints p50/p95/p99 for wall
+time, vision wait, motion, settle and model start-up, plus parts per hour.
+Iterations are grouped into consecutive runs with the same config
+fingerprint, so a throughput change after editing a sequence or the motion
+settings shows up as a new group.
+
+Examples:
+    python tools/cycle_report.py
+    python tools/cycle_report.py "Pick and place" --last 500 --steps
+    python tools/cycle_report.py "Pick and place" --tolerance 0.1   # exit 1 on a >10% pph drop
+    python tools/cycle_report.py "Pick and place" --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from utils.cycle_metrics import (  # noqa: E402
+    CATEGORIES,
+    DEFAULT_METRICS_DIR,
+    METRICS,
+    CycleStore,
+    percentile,
+    summarize,
+)
+
+LABELS = {
+    "wall_s": "total",
+    "vision_s": "vision wait",
+    "motion_s": "motion",
+    "settle_s": "settle",
+    "model_s": "model start-up",
+    "settle_saved_s": "settle saved",
+}
+
+
+def group_by_fingerprint(records: List[Dict[str, object]]) -> List[List[Dict[str, object]]]:
+    """Split records into consecutive runs that share a config fingerprint."""
+    groups: List[List[Dict[str, object]]] = []
+    for record in records:
+        if groups and groups[-1][0].get("fingerprint") == record.get("fingerprint"):
+            groups[-1].append(record)
+        else:
+            groups.append([record])
+    return groups
+
+
+def step_summary(records: List[Dict[str, object]]) -> List[Dict[str, object]]:
+    """Per-step p50/p95 of wall time and its breakdown."""
+    by_step: Dict[tuple, List[list]] = {}
+    for record in records:
+        for row in record.get("steps", []):
+            by_step.setdefault((row[0], row[1]), []).append(row)
+    rows = []
+    for (index, step_type), samples in sorted(by_step.items()):
+        row: Dict[str, object] = {"step": index + 1, "type": step_type, "count": len(samples)}
+        for offset, name in enumerate(("wall",) + CATEGORIES):
+            values = [float(sample[2 + offset]) for sample in samples]
+            row[name] = {"p50": round(percentile(values, 50), 3), "p95": round(percentile(values, 95), 3)}
+        rows.append(row)
+    return rows
+
+
+def _format_time(ts: float) -> str:
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(ts))
+
+
+def print_group(records: List[Dict[str, object]], show_steps: bool) -> dict:
+    summary = summarize(records)
+    print(
+        f"  config {records[0].get('fingerprint', '?')}  "
+        f"{_format_time(records[0]['ts'])} → {_format_time(records[-1]['ts'])}  "
+        f"{summary['count']} iterations  {summary['parts_per_hour']:.0f} parts/h"
+    )
+    print(f"    {'':<15}{'p50':>9}{'p95':>9}{'p99':>9}")
+    for metric in METRICS:
+        values = summary[metric]
+        print(f"    {LABELS[metric]:<15}{values['p50']:>8.2f}s{values['p95']:>8.2f}s{values['p99']:>8.2f}s")
+    if show_steps:
+        print("    per step (p50 / p95):")
+        for row in step_summary(records):
+            print(
+                f"      {row['step']:>2}. {row['type']:<10} {row['wall']['p50']:>7.2f} / {row['wall']['p95']:.2f}s"
+                f"  vision {row['vision']['p50']:.2f}  motion {row['motion']['p50']:.2f}"
+                f"  settle {row['settle']['p50']:.2f}  model {row['model']['p50']:.2f}"
+            )
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Summarise sequence cycle times and throughput")
+    parser.add_argument("sequence", nargs="?", help="Sequence name (default: every recorded sequence)")
+    parser.add_argument("--dir", type=Path, default=DEFAULT_METRICS_DIR, help="Cycle metrics directory")
+    parser.add_argument("--last", type=int, help="Only use the newest N iterations")
+    parser.add_argument("--steps", action="store_true", help="Include a per-step breakdown")
+    parser.add_argument("--tolerance", type=float,
+                        help="Fail if the newest config's parts/h is this fraction below the previous one")
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    args = parser.parse_args(argv)
+
+    if args.sequence:
+        stores = [CycleStore(args.sequence, metrics_dir=args.dir)]
+    else:
+        stores = [CycleStore(path.stem, metrics_dir=args.dir) for path in sorted(args.dir.glob("*.jsonl"))]
+    if not stores:
+        print(f"No cycle metrics in {args.dir}")
+        return 1
+
+    failures = 0
+    report: Dict[str, list] = {}
+    for store in stores:
+        records = store.load(last=args.last)
+        if not records:
+            print(f"❌ {store.path.stem}: no iterations recorded")
+            failures += 1
+            continue
+
+        groups = group_by_fingerprint(records)
+        if args.json:
+            report[store.path.stem] = [
+                {
+                    "fingerprint": group[0].get("fingerprint"),
+                    "first": group[0]["ts"],
+                    "last": group[-1]["ts"],
+                    "summary": summarize(group),
+                    **({"steps": step_summary(group)} if args.steps else {}),
+                }
+                for group in groups
+            ]
+        else:
+            print(f"{store.path.stem}:")
+            for group in groups:
+                print_group(group, args.steps)
+
+        if args.tolerance is not None and len(groups) > 1:
+            before = summarize(groups[-2])["parts_per_hour"]
+            after = summarize(groups[-1])["parts_per_hour"]
+            if before and after < before * (1.0 - args.tolerance):
+                failures += 1
+                if not args.json:
+                    print(f"  ❌ throughput dropped {after / before - 1.0:+.0%} ({before:.0f} → {after:.0f} parts/h)")
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -40,6 +40,17 @@ BACKUPS_DIR = ROOT_DIR / "data" / "backups" / "recordings"
 LEGACY_ACTIONS_FILE = ROOT_DIR / "data" / "actions.json"
 
 
+def _simplify_tolerance():
+    """Save-time simplification bound from ``config["recording"]`` (0 = off)."""
+    try:
+        from utils.config_store import ConfigStore
+        config = ConfigStore.instance().get_config()
+    except Exception as exc:
+        log_exception("ActionsManager: config unavailable, recordings saved unsimplified", exc, level="warning")
+        return 0.0
+    return (config.get("recording", {}) or {}).get("simplify_tolerance", 0.0) or 0.0
+
+
 class ActionsManager:
     """Manage composite recordings with folder-based storage"""
     
@@ -298,7 +309,9 @@ class ActionsManager:
                     component_file = composite.add_live_recording_component(
                         name=name,
                         recorded_data=recorded_data,
-                        description=data.get("description", "")
+                        description=data.get("description", ""),
+                        simplify_tolerance=_simplify_tolerance(),
+                        metadata=data.get("metadata")
                     )
                     
                     if component_file:
@@ -364,7 +377,9 @@ class ActionsManager:
                     component_file = composite.add_live_recording_component(
                         name=step_name,
                         recorded_data=recorded_data,
-                        description=component_data.get("description", "")
+                        description=component_data.get("description", ""),
+                        simplify_tolerance=_simplify_tolerance(),
+                        metadata=component_data.get("metadata")
                     )
                 elif step_type == "position_set":
                     positions = component_data.get("positions", [])
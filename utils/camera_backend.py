@@ -8,10 +8,10 @@ from typing import List, Optional, Tuple
 
 from utils.logging_utils import log_exception
 
-try:  # Optional dependency - consumers should handle absence gracefully
-    import cv2  # type: ignore
-except ImportError:  # pragma: no cover - OpenCV not installed on host
-    cv2 = None  # type: ignore
+from utils.lazy_import import optional_module
+
+# Optional dependency - consumers should handle absence gracefully
+cv2 = optional_module("cv2")
 
 
 BACKEND_ALIASES = {
@@ -9,31 +9,52 @@ variants of each frame:
 * Full-resolution (as configured in settings) for high-priority clients.
 * Preview-resolution (~320 px width, throttled to a few FPS) for UI use.
 
-The hub spins a lightweight thread per camera that reads frames at the
-camera's native rate and stores the latest copies in RAM.  Consumers simply
-pull snapshots; no additional buffering or queues are required.
+The hub spins a lightweight thread per camera that stores the latest copies
+in RAM.  Consumers simply pull snapshots; no additional buffering or queues are
+required.
+
+Each variant is only produced while somebody wants it.  Widgets hold an
+explicit subscription (``subscribe``/``unsubscribe``) for as long as they are
+on screen; plain ``get_frame`` callers get a short lease that is renewed on
+every poll.  With no demand the thread drops to ``keepalive_fps`` grabs (or
+stops reading entirely when that is 0) but keeps the device handle open, so
+the next consumer does not pay the reopen latency.
+
+A poll that wakes a cold variant waits up to ``wake_timeout`` for a fresh
+frame, except on the Qt GUI thread: preview timers get whatever is cached
+(possibly stale, or None) and pick up the fresh frame on their next tick.
 """
 
 from __future__ import annotations
 
+import sys
 import threading
 import time
 from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Dict, Iterator, Optional, Tuple
+from typing import Dict, Iterator, Optional, Set, Tuple
 
-try:  # Optional dependency
-    import cv2  # type: ignore
-    import numpy as np  # type: ignore
-except ImportError:  # pragma: no cover
-    cv2 = None
-    np = None
+from utils.lazy_import import optional_module
+
+# Optional dependencies, imported on first use to keep start-up fast
+cv2 = optional_module("cv2")
+np = optional_module("numpy")
 
 from utils.camera_backend import open_capture
 from utils.camera_support import CameraSource, prepare_camera_source
 from utils.logging_utils import log_exception
 
 
+def _on_gui_thread() -> bool:
+    """True when called on the Qt GUI thread (without importing Qt)."""
+
+    qtcore = sys.modules.get("PySide6.QtCore")
+    if qtcore is None:
+        return False
+    app = qtcore.QCoreApplication.instance()
+    return app is not None and app.thread() == qtcore.QThread.currentThread()
+
+
 @dataclass
 class FrameBundle:
     """Latest frames cached by a `CameraStream`."""
@@ -42,6 +63,9 @@ class FrameBundle:
     preview: Optional["np.ndarray"] = None
     full_timestamp: float = 0.0
     preview_timestamp: float = 0.0
+    # time.monotonic_ns() at capture, for latency tracing across threads
+    full_captured_ns: int = 0
+    preview_captured_ns: int = 0
 
 
 class CameraStream:
@@ -55,6 +79,9 @@ class CameraStream:
         fps: float,
         preview_width: int = 320,
         preview_fps: float = 5.0,
+        keepalive_fps: float = 1.0,
+        demand_timeout: float = 2.0,
+        wake_timeout: float = 0.5,
     ) -> None:
         self.name = name
         self.source = source
@@ -62,10 +89,17 @@ class CameraStream:
         self.target_fps = max(1.0, float(fps or 30.0))
         self.preview_width = preview_width
         self.preview_fps = max(0.5, preview_fps)
+        self.keepalive_fps = max(0.0, float(keepalive_fps or 0.0))
+        self.demand_timeout = max(0.0, float(demand_timeout))
+        self.wake_timeout = max(0.0, float(wake_timeout))
         self.backend_name: Optional[str] = None
 
         self._lock = threading.Lock()
         self._frames = FrameBundle()
+        self._frame_ready = threading.Condition(self._lock)
+        self._subscribers = {"full": 0, "preview": 0}
+        self._last_poll = {"full": 0.0, "preview": 0.0}
+        self._wake = threading.Event()
 
         self._capture: Optional["cv2.VideoCapture"] = None if cv2 is not None else None
         self._thread: Optional[threading.Thread] = None
@@ -88,6 +122,7 @@ class CameraStream:
 
     def stop(self) -> None:
         self._stop_event.set()
+        self._wake.set()
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=1.5)
         self._thread = None
@@ -98,32 +133,114 @@ class CameraStream:
                 log_exception(f"CameraStream[{self.name}]: release failed", exc, level="debug")
             self._capture = None
 
+    # ------------------------------------------------------------------
+    # Demand tracking
+
+    @staticmethod
+    def _tier(preview: bool) -> str:
+        return "preview" if preview else "full"
+
+    def subscribe(self, preview: bool) -> None:
+        """Keep producing the given variant until :meth:`unsubscribe`."""
+
+        with self._lock:
+            self._subscribers[self._tier(preview)] += 1
+        self._wake.set()
+
+    def unsubscribe(self, preview: bool) -> None:
+        with self._lock:
+            tier = self._tier(preview)
+            self._subscribers[tier] = max(0, self._subscribers[tier] - 1)
+
+    @contextmanager
+    def subscription(self, preview: bool) -> Iterator["CameraStream"]:
+        self.subscribe(preview)
+        try:
+            yield self
+        finally:
+            self.unsubscribe(preview)
+
+    def _demanded_tiers(self, now: float) -> Set[str]:
+        """Variants that currently have a subscriber or a live polling lease (lock held)."""
+
+        return {
+            tier
+            for tier in ("full", "preview")
+            if self._subscribers[tier] or now - self._last_poll[tier] <= self.demand_timeout
+        }
+
+    def demanded_tiers(self) -> Set[str]:
+        with self._lock:
+            return self._demanded_tiers(time.time())
+
+    def _touch(self, tier: str) -> Tuple[bool, float]:
+        """Renew the polling lease; returns (was_cold, cached timestamp) (lock held)."""
+
+        now = time.time()
+        cold = tier not in self._demanded_tiers(now)
+        self._last_poll[tier] = now
+        if cold:
+            self._wake.set()
+        timestamp = self._frames.preview_timestamp if tier == "preview" else self._frames.full_timestamp
+        return cold, timestamp
+
+    def _await_fresh(self, tier: str, wait: Optional[bool]) -> None:
+        """After a cold start, wait briefly for the capture thread to catch up (lock held).
+
+        ``wait=None`` waits unless this is the GUI thread.
+        """
+
+        cold, stale_ts = self._touch(tier)
+        if not cold or not self.wake_timeout or not (self._thread and self._thread.is_alive()):
+            return
+        if wait is None:
+            wait = not _on_gui_thread()
+        if not wait:
+            return
+        if tier == "preview":
+            self._frame_ready.wait_for(lambda: self._frames.preview_timestamp > stale_ts, self.wake_timeout)
+        else:
+            self._frame_ready.wait_for(lambda: self._frames.full_timestamp > stale_ts, self.wake_timeout)
+
     # ------------------------------------------------------------------
     # Frame access
 
-    def get_frame(self, preview: bool, copy: bool = True) -> Optional["np.ndarray"]:
+    def get_frame(self, preview: bool, copy: bool = True, wait: Optional[bool] = None) -> Optional["np.ndarray"]:
         if np is None:  # pragma: no cover
             return None
 
         with self._lock:
+            self._await_fresh(self._tier(preview), wait)
             frame = self._frames.preview if preview else self._frames.full
             if frame is None:
                 return None
             return frame.copy() if copy else frame
 
-    def get_frame_with_timestamp(self, preview: bool) -> Tuple[Optional["np.ndarray"], float]:
+    def get_frame_with_timestamp(
+        self, preview: bool, wait: Optional[bool] = None
+    ) -> Tuple[Optional["np.ndarray"], float]:
+        frame, timestamp, _ = self.get_frame_with_capture_time(preview, wait)
+        return frame, timestamp
+
+    def get_frame_with_capture_time(
+        self, preview: bool, wait: Optional[bool] = None
+    ) -> Tuple[Optional["np.ndarray"], float, int]:
+        """Like ``get_frame_with_timestamp`` plus the monotonic capture time in ns."""
         if np is None:  # pragma: no cover
-            return None, 0.0
+            return None, 0.0, 0
 
         with self._lock:
+            self._await_fresh(self._tier(preview), wait)
             if preview:
                 return (
                     self._frames.preview.copy() if self._frames.preview is not None else None,
                     self._frames.preview_timestamp,
+                    self._frames.preview_captured_ns,
                 )
             return (
                 self._frames.full.copy() if self._frames.full is not None else None,
                 self._frames.full_timestamp,
+                self._frames.full_captured_ns,
             )
 
     # ------------------------------------------------------------------
@@ -179,15 +296,41 @@ class CameraStream:
 
         preview_interval = 1.0 / self.preview_fps
         next_preview_ts = time.time()
+        idle = False
 
         while not self._stop_event.is_set():
             assert self._capture is not None
+            self._wake.clear()
+            with self._lock:
+                demand = self._demanded_tiers(time.time())
+
+            if not demand:
+                # Nobody is watching: keep the handle warm but skip decoding.
+                idle = True
+                if self.keepalive_fps > 0:
+                    self._capture.grab()
+                    self._wake.wait(1.0 / self.keepalive_fps)
+                else:
+                    self._wake.wait(1.0)
+                continue
+
+            if idle:
+                # Drop whatever the driver buffered while we were idle.
+                self._capture.grab()
+                idle = False
+
+            if "full" not in demand and time.time() < next_preview_ts:
+                # Preview-only: drain the driver without decoding in between previews.
+                self._capture.grab()
+                continue
+
             ok, frame = self._capture.read()
             timestamp = time.time()
+            captured_ns = time.monotonic_ns()
 
             if not ok or frame is None:
                 time.sleep(0.05)
-                if timestamp - self._frames.full_timestamp > 2.0:
+                if timestamp - max(self._frames.full_timestamp, self._frames.preview_timestamp) > 2.0:
                     # Likely camera dropped; attempt reconnect.
                     if self._open_capture():
                         continue
@@ -195,15 +338,19 @@ class CameraStream:
                     continue
 
             with self._lock:
-                self._frames.full = frame.copy()
-                self._frames.full_timestamp = timestamp
+                if "full" in demand:
+                    self._frames.full = frame.copy()
+                    self._frames.full_timestamp = timestamp
+                    self._frames.full_captured_ns = captured_ns
 
-                if timestamp >= next_preview_ts:
+                if "preview" in demand and timestamp >= next_preview_ts:
                     # Downsample while respecting aspect ratio.
                     preview_frame = self._downsample(frame)
                     self._frames.preview = preview_frame
                     self._frames.preview_timestamp = timestamp
+                    self._frames.preview_captured_ns = captured_ns
                     next_preview_ts = timestamp + preview_interval
+                self._frame_ready.notify_all()
 
         # Cleanup on exit
         if self._capture is not None:
@@ -285,6 +432,7 @@ class CameraStreamHub:
             width = int(camera_cfg.get("width", 640))
             height = int(camera_cfg.get("height", 480))
             fps = float(camera_cfg.get("fps", 30))
+            hub_cfg = self._config.get("camera_hub", {}) or {}
 
             source, backend = prepare_camera_source(camera_cfg, width, height, fps)
 
@@ -294,26 +442,53 @@ class CameraStreamHub:
                 (width, height),
                 fps,
                 preview_width=min(400, width),
-                preview_fps=5.0,
+                preview_fps=float(hub_cfg.get("preview_fps", 5.0)),
+                keepalive_fps=float(hub_cfg.get("keepalive_fps", 1.0)),
+                demand_timeout=float(hub_cfg.get("demand_timeout_s", 2.0)),
             )
             stream.backend_name = backend
             stream.start()
             self._streams[camera_name] = stream
             return stream
 
-    def get_frame(self, camera_name: str, preview: bool = False) -> Optional["np.ndarray"]:
+    def get_frame(
+        self, camera_name: str, preview: bool = False, wait: Optional[bool] = None
+    ) -> Optional["np.ndarray"]:
+        """Latest frame; a cold stream is waited on unless ``wait`` is False (default: off the GUI thread)."""
         stream = self.get_stream(camera_name)
         if not stream:
             return None
-        return stream.get_frame(preview=preview)
+        return stream.get_frame(preview=preview, wait=wait)
 
     def get_frame_with_timestamp(
-        self, camera_name: str, preview: bool = False
+        self, camera_name: str, preview: bool = False, wait: Optional[bool] = None
     ) -> Tuple[Optional["np.ndarray"], float]:
         stream = self.get_stream(camera_name)
         if not stream:
             return None, 0.0
-        return stream.get_frame_with_timestamp(preview=preview)
+        return stream.get_frame_with_timestamp(preview=preview, wait=wait)
+
+    def get_frame_with_capture_time(
+        self, camera_name: str, preview: bool = False, wait: Optional[bool] = None
+    ) -> Tuple[Optional["np.ndarray"], float, int]:
+        stream = self.get_stream(camera_name)
+        if not stream:
+            return None, 0.0, 0
+        return stream.get_frame_with_capture_time(preview=preview, wait=wait)
+
+    def subscribe(self, camera_name: str, preview: bool = True) -> Optional[CameraStream]:
+        """Register a long-lived consumer (e.g. a visible preview widget)."""
+
+        stream = self.get_stream(camera_name)
+        if stream:
+            stream.subscribe(preview)
+        return stream
+
+    def unsubscribe(self, camera_name: str, preview: bool = True) -> None:
+        with self._streams_lock:
+            stream = self._streams.get(camera_name)
+        if stream:
+            stream.unsubscribe(preview)
 
     def shutdown(self) -> None:
         with self._streams_lock:
@@ -10,11 +10,15 @@ capture backends on platforms that use GStreamer pipelines.
 from __future__ import annotations
 
 import platform
+import time
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 CameraSource = Union[int, str]
 
+VIDEO4LINUX_SYSFS = Path("/sys/class/video4linux")
+_DEVICE_CACHE: Dict[str, Tuple[float, Optional[List[Dict[str, Any]]]]] = {}
+
 
 def is_jetson_platform() -> bool:
     """Return ``True`` when running on a NVIDIA Jetson device."""
@@ -185,13 +189,78 @@ def prepare_camera_source(
     return source, backend
 
 
+def video_device_index(source: Any) -> Optional[int]:
+    """Return the V4L2 index for ``0``, ``"0"`` or ``"/dev/video0"`` style sources."""
+
+    if isinstance(source, bool):
+        return None
+    if isinstance(source, int):
+        return source if source >= 0 else None
+    if isinstance(source, str):
+        text = source.strip()
+        if text.startswith("/dev/video"):
+            text = text[len("/dev/video"):]
+        if text.isdigit():
+            return int(text)
+    return None
+
+
+def list_video_devices(
+    max_age: float = 30.0,
+    refresh: bool = False,
+    sysfs_root: Path = VIDEO4LINUX_SYSFS,
+) -> Optional[List[Dict[str, Any]]]:
+    """List V4L2 capture nodes from sysfs without opening any device.
+
+    Results are cached for ``max_age`` seconds so repeated rescans are free.
+    Metadata nodes (sysfs ``index`` other than 0) are skipped.
+
+    Returns:
+        A list of ``{"index", "path", "name"}`` dicts sorted by index, or
+        ``None`` when no sysfs listing is available (non-Linux hosts).
+    """
+
+    key = str(sysfs_root)
+    now = time.monotonic()
+    cached = _DEVICE_CACHE.get(key)
+    if cached and not refresh and now - cached[0] < max_age:
+        return cached[1]
+
+    devices: Optional[List[Dict[str, Any]]]
+    if not sysfs_root.is_dir():
+        devices = None
+    else:
+        devices = []
+        for entry in sysfs_root.glob("video*"):
+            index = video_device_index(f"/dev/{entry.name}")
+            if index is None:
+                continue
+            try:
+                node_index = (entry / "index").read_text().strip()
+            except OSError:
+                node_index = "0"
+            if node_index not in ("", "0"):
+                continue
+            try:
+                name = (entry / "name").read_text().strip()
+            except OSError:
+                name = ""
+            devices.append({"index": index, "path": f"/dev/video{index}", "name": name})
+        devices.sort(key=lambda item: item["index"])
+
+    _DEVICE_CACHE[key] = (now, devices)
+    return devices
+
+
 __all__ = [
     "CameraSource",
     "build_jetson_csi_pipeline",
     "choose_backend",
     "coerce_backend",
     "is_jetson_platform",
+    "list_video_devices",
     "looks_like_gstreamer_pipeline",
     "prepare_camera_source",
     "resolve_jetson_csi_source",
+    "video_device_index",
 ]
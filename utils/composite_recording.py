@@ -23,6 +23,7 @@ from typing import Optional, List, Dict
 import pytz
 
 from utils.logging_utils import log_exception
+from utils.recording_simplify import max_deviation, simplify_recording
 
 try:
     from .recording_component import RecordingComponent, LiveRecordingComponent, PositionSetComponent
@@ -276,15 +277,37 @@ class CompositeRecording:
         return self.steps.copy()
     
     def add_live_recording_component(self, name: str, recorded_data: List[Dict],
-                                    description: str = "") -> str:
+                                    description: str = "", simplify_tolerance=0.0,
+                                    metadata: Optional[Dict] = None) -> str:
         """Create and save a live recording component
         
+        Args:
+            simplify_tolerance: Drop points that playback reproduces within this
+                many encoder steps per joint (scalar or per joint; 0 keeps all)
+            metadata: Metadata of the component being re-saved, if any. Data that
+                was already simplified is kept as is, so repeated saves never
+                add up error.
+        
         Returns:
             component_filename: Filename of saved component
         """
         try:
             # Create component
             component = LiveRecordingComponent(name, description, recorded_data)
+            previous = (metadata or {}).get("simplified")
+            if previous:
+                component.simplification = previous
+            elif simplify_tolerance and len(recorded_data) > 2:
+                reduced = simplify_recording(recorded_data, simplify_tolerance)
+                if len(reduced) < len(recorded_data):
+                    component.recorded_data = reduced
+                    component.simplification = {
+                        "tolerance": simplify_tolerance,
+                        "original_points": len(recorded_data),
+                        "max_deviation": round(max_deviation(recorded_data, reduced), 2),
+                    }
+                    print(f"[COMPOSITE] Simplified {name}: {len(recorded_data)} -> {len(reduced)} points "
+                          f"(max deviation {component.simplification['max_deviation']} steps)")
             
             # Generate filename
             filename = f"{self._next_step_number:02d}_{name.lower().replace(' ', '_')}_live.json"
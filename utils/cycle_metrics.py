@@ -0,0 +1,242 @@
+"""
+Cycle-time analytics for looping production sequences.
+
+``ExecutionWorker._execute_sequence`` opens a :class:`CycleRecorder` per run.
+Every loop iteration becomes one record with its wall time split into:
+
+``vision_s``   waiting on vision triggers
+``motion_s``   commanding moves and waiting for them to (nearly) finish
+``settle_s``   position-verification polling after a move
+``model_s``    model subprocess start-up (spawn until the policy is acting)
+
+Records also carry ``settle_saved_s``: how much sooner moves were confirmed
+than the old timed wait-then-poll verification would have managed (see
+``MotorController.await_move_complete``).  It is not part of the wall time.
+
+Motor and model code report time with the module-level :func:`add`, which is a
+no-op when no recorder is active.  Records (plus a compact per-step
+breakdown) are appended as JSON lines to
+``runtime/cycle_metrics/<sequence>.jsonl``; the file is trimmed to the newest
+``max_records`` entries.  Each record carries a short fingerprint of the
+sequence definition and the motion-related config so a report can compare
+throughput before and after a change (``tools/cycle_report.py``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import re
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, Iterable, List, Optional, Sequence
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_METRICS_DIR = ROOT / "runtime" / "cycle_metrics"
+
+CATEGORIES = ("vision", "motion", "settle", "model")
+# Reported alongside the breakdown but not part of the wall time; may be negative
+SAVINGS = ("settle_saved",)
+METRICS = ("wall_s",) + tuple(f"{name}_s" for name in CATEGORIES + SAVINGS)
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Linear-interpolated percentile of ``values`` (0 for an empty sequence)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    if low == high:
+        return float(ordered[low])
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(records: Iterable[Dict[str, object]]) -> Dict[str, object]:
+    """p50/p95/p99 per metric plus parts per hour for a set of iteration records."""
+    records = list(records)
+    summary: Dict[str, object] = {"count": len(records)}
+    if not records:
+        return summary
+    for metric in METRICS:
+        values = [float(record.get(metric, 0.0)) for record in records]
+        summary[metric] = {f"p{pct}": round(percentile(values, pct), 3) for pct in PERCENTILES}
+    total_wall = sum(float(record.get("wall_s", 0.0)) for record in records)
+    summary["parts_per_hour"] = round(3600.0 * len(records) / total_wall, 1) if total_wall > 0 else 0.0
+    return summary
+
+
+def config_fingerprint(sequence: Dict[str, object], config: Dict[str, object]) -> str:
+    """Short hash of everything that should change cycle time when edited."""
+    robot_cfg = config.get("robot", {}) or {}
+    relevant = {
+        "steps": sequence.get("steps", []),
+        "control": config.get("control", {}),
+        "position_tolerance": robot_cfg.get("position_tolerance"),
+        "policy": config.get("policy", {}),
+    }
+    blob = json.dumps(relevant, sort_keys=True, default=str)
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()[:10]
+
+
+def _safe_name(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("_") or "sequence"
+
+
+class CycleStore:
+    """Append-only JSON-lines time series for one sequence."""
+
+    def __init__(self, sequence_name: str, metrics_dir: Path = DEFAULT_METRICS_DIR, max_records: int = 20_000):
+        self.path = Path(metrics_dir) / f"{_safe_name(sequence_name)}.jsonl"
+        self.max_records = max(1, int(max_records))
+        self._count: Optional[int] = None
+
+    def load(self, last: Optional[int] = None) -> List[Dict[str, object]]:
+        if not self.path.exists():
+            return []
+        records: Deque[Dict[str, object]] = deque(maxlen=last) if last else deque()
+        with open(self.path, "r", encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue  # Torn line from a crash; skip it
+        return list(records)
+
+    def append(self, record: Dict[str, object]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self._count is None:
+            self._count = len(self.load()) if self.path.exists() else 0
+        with open(self.path, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._count += 1
+        # Trim with some slack so the rewrite happens rarely
+        if self._count > self.max_records * 1.2:
+            self._trim()
+
+    def _trim(self) -> None:
+        records = self.load(last=self.max_records)
+        tmp_path = self.path.with_suffix(".jsonl.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            for record in records:
+                handle.write(json.dumps(record, separators=(",", ":")) + "\n")
+        tmp_path.replace(self.path)
+        self._count = len(records)
+
+
+class CycleRecorder:
+    """Accumulates step and iteration timings for one sequence run."""
+
+    def __init__(self, sequence_name: str, fingerprint: str, store: Optional[CycleStore] = None, window: int = 50):
+        self.sequence_name = sequence_name
+        self.fingerprint = fingerprint
+        self.store = store
+        self.recent: Deque[Dict[str, object]] = deque(maxlen=max(1, int(window)))
+        self._lock = threading.Lock()
+        self._iteration = 0
+        self._iteration_start = 0.0
+        self._iteration_totals = dict.fromkeys(CATEGORIES + SAVINGS, 0.0)
+        self._steps: List[list] = []
+        self._step: Optional[list] = None  # [index, type, start, {category: seconds}]
+
+    def begin_iteration(self, iteration: int) -> None:
+        with self._lock:
+            self._iteration = iteration
+            self._iteration_start = time.perf_counter()
+            self._iteration_totals = dict.fromkeys(CATEGORIES + SAVINGS, 0.0)
+            self._steps = []
+            self._step = None
+
+    def begin_step(self, index: int, step_type: str) -> None:
+        with self._lock:
+            self._step = [index, step_type, time.perf_counter(), dict.fromkeys(CATEGORIES, 0.0)]
+
+    def add(self, category: str, seconds: float) -> None:
+        if category in SAVINGS:
+            with self._lock:
+                self._iteration_totals[category] += seconds
+            return
+        if category not in self._iteration_totals or seconds <= 0:
+            return
+        with self._lock:
+            self._iteration_totals[category] += seconds
+            if self._step is not None:
+                self._step[3][category] += seconds
+
+    def end_step(self) -> None:
+        with self._lock:
+            if self._step is None:
+                return
+            index, step_type, start, totals = self._step
+            wall = time.perf_counter() - start
+            # [index, type, wall, vision, motion, settle, model]
+            self._steps.append([index, step_type, round(wall, 3)] + [round(totals[name], 3) for name in CATEGORIES])
+            self._step = None
+
+    def end_iteration(self) -> Dict[str, object]:
+        """Close the iteration, persist it and return the record."""
+        with self._lock:
+            record: Dict[str, object] = {
+                "ts": round(time.time(), 3),
+                "iteration": self._iteration,
+                "fingerprint": self.fingerprint,
+                "wall_s": round(time.perf_counter() - self._iteration_start, 3),
+            }
+            for name in CATEGORIES + SAVINGS:
+                record[f"{name}_s"] = round(self._iteration_totals[name], 3)
+            record["steps"] = list(self._steps)
+            self.recent.append(record)
+        if self.store is not None:
+            self.store.append(record)
+        return record
+
+    def rolling_summary(self) -> Dict[str, object]:
+        with self._lock:
+            records = list(self.recent)
+        return summarize(records)
+
+
+# ----------------------------------------------------------------------
+# Active recorder (one sequence run at a time)
+
+_active: Optional[CycleRecorder] = None
+
+
+def start_recording(sequence_name: str, sequence: Dict[str, object], config: Dict[str, object]) -> CycleRecorder:
+    global _active
+    settings = config.get("cycle_metrics", {}) or {}
+    store = None
+    if settings.get("enabled", True):
+        store = CycleStore(
+            sequence_name,
+            metrics_dir=Path(settings.get("dir", DEFAULT_METRICS_DIR)),
+            max_records=int(settings.get("max_records", 20_000)),
+        )
+    _active = CycleRecorder(
+        sequence_name,
+        config_fingerprint(sequence, config),
+        store=store,
+        window=int(settings.get("window", 50)),
+    )
+    return _active
+
+
+def stop_recording(recorder: Optional[CycleRecorder]) -> None:
+    global _active
+    if recorder is not None and _active is recorder:
+        _active = None
+
+
+def add(category: str, seconds: float) -> None:
+    """Attribute ``seconds`` to ``category`` in the active recorder, if any."""
+    recorder = _active
+    if recorder is not None:
+        recorder.add(category, seconds)
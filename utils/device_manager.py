@@ -8,11 +8,12 @@ Handles:
 - Startup device discovery
 """
 
+import copy
 import sys
 from contextlib import nullcontext
 from pathlib import Path
 from typing import Dict, List, Optional
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, Slot
 
 from utils.camera_backend import open_capture
 from utils.app_state import AppStateStore
@@ -270,43 +271,60 @@ class DeviceManager(QObject):
         Returns:
             dict: Discovery results with robot and camera info
         """
-        import sys
-        
+        return self.apply_discovery(self.probe_devices())
+
+    def probe_devices(self, config: Optional[dict] = None) -> Dict[str, any]:
+        """Probe serial ports and cameras without touching manager state.
+
+        Safe to call from a worker thread: it only reads ``config`` (pass a
+        snapshot taken on the GUI thread) and returns the raw probe for
+        :meth:`apply_discovery`.
+        """
+        config = self.config if config is None else config
+        probe = {"robot": None, "cameras": None, "errors": []}
+        try:
+            probe["robot"] = self._probe_robot(config)
+        except Exception as exc:
+            log_exception("DeviceManager: robot discovery failed", exc)
+            probe["errors"].append(f"Robot discovery error: {exc}")
+        try:
+            probe["cameras"] = self._discover_cameras()
+        except Exception as exc:
+            log_exception("DeviceManager: camera discovery failed", exc)
+            probe["errors"].append(f"Camera discovery error: {exc}")
+        return probe
+
+    def apply_discovery(self, probe: Dict[str, any]) -> Dict[str, any]:
+        """Update statuses and emit logs from a :meth:`probe_devices` result.
+
+        Runs on the GUI thread: this is the only part of discovery that
+        changes manager state and emits status signals.
+        """
         results = {
             "robot": [],
             "cameras": [],
-            "errors": []
+            "errors": list(probe.get("errors", [])),
         }
         
-        # Discover robot
+        # Robot
         robot_infos: List[Dict] = []
         robot_count = 0
-        try:
-            robot_infos = self._discover_robot()
+        if probe.get("robot") is not None:
+            robot_infos = self._apply_robot_probe(probe["robot"])
             results["robot"] = robot_infos
             robot_count = sum(1 for info in robot_infos if info.get("port"))
-        except Exception as exc:
-            log_exception("DeviceManager: robot discovery failed", exc)
-            error_msg = f"Robot discovery error: {exc}"
-            results["errors"].append(error_msg)
+        else:
             self._set_overall_robot_status("empty")
-            robot_infos = []
 
-        # Discover cameras
+        # Cameras
         self._sync_camera_status_map()
         camera_assignments = {}
-        try:
-            cameras_info = self._discover_cameras()
-            if cameras_info:
-                results["cameras"] = cameras_info
-                # Try to match cameras to config
-                camera_assignments = self._match_cameras_to_config(cameras_info)
-            else:
-                self._mark_cameras_missing()
-        except Exception as exc:
-            log_exception("DeviceManager: camera discovery failed", exc)
-            error_msg = f"Camera discovery error: {exc}"
-            results["errors"].append(error_msg)
+        cameras_info = probe.get("cameras")
+        if cameras_info:
+            results["cameras"] = cameras_info
+            # Try to match cameras to config
+            camera_assignments = self._match_cameras_to_config(cameras_info)
+        else:
             self._mark_cameras_missing()
         
         # Print compact summary (both terminal and GUI)
@@ -446,12 +464,25 @@ class DeviceManager(QObject):
     def _discover_robot(self) -> List[Dict]:
         """Scan serial ports for robot arms."""
 
+        return self._apply_robot_probe(self._probe_robot(self.config))
+
+    def _probe_robot(self, config: dict) -> Dict:
+        """Serial scan for :meth:`_apply_robot_probe`; reads ``config`` only."""
+
+        arms = (config.get("robot", {}) or {}).get("arms", []) or []
+        if not arms:
+            return {"legacy": self._discover_single_robot(config)}
+        return {"ports": self._list_robot_ports()}
+
+    def _apply_robot_probe(self, probe: Dict) -> List[Dict]:
+        """Update arm statuses from a robot probe; returns the discovered arms."""
+
         robot_cfg = self.config.get("robot", {}) or {}
         arms = robot_cfg.get("arms", []) or []
         self._sync_robot_arm_status_map()
 
         if not arms:
-            legacy = self._discover_single_robot()
+            legacy = probe.get("legacy")
             if legacy:
                 self._set_robot_arm_status("robot", "online")
                 self._set_overall_robot_status("online")
@@ -462,7 +493,9 @@ class DeviceManager(QObject):
             self.discovered_robot_ports = {}
             return []
 
-        ports = self._list_robot_ports()
+        ports = probe.get("ports")
+        if ports is None:  # Config gained arms since the probe
+            ports = self._list_robot_ports()
         discovered: List[Dict] = []
         for idx, arm_cfg in enumerate(arms):
             key = self._robot_arm_key(idx, arm_cfg)
@@ -481,7 +514,7 @@ class DeviceManager(QObject):
         self._set_overall_robot_status(self._aggregate_robot_status())
         return discovered
 
-    def _discover_single_robot(self) -> Optional[Dict]:
+    def _discover_single_robot(self, config: Optional[dict] = None) -> Optional[Dict]:
         """Legacy single-arm discovery for backward compatibility."""
 
         try:
@@ -490,7 +523,8 @@ class DeviceManager(QObject):
             log_exception("DeviceManager: robot scan unavailable", exc, level="warning")
             return None
 
-        configured_port = self.config.get("robot", {}).get("port", "/dev/ttyACM0")
+        config = self.config if config is None else config
+        configured_port = config.get("robot", {}).get("port", "/dev/ttyACM0")
         if Path(configured_port).exists():
             return {
                 "name": "robot",
@@ -633,3 +667,32 @@ class DeviceManager(QObject):
             camera_name: "front" or "wrist"
         """
         return self.camera_statuses.get(camera_name, "empty")
+
+
+class DeviceDiscoveryWorker(QObject):
+    """Run :meth:`DeviceManager.probe_devices` on a background thread.
+
+    Discovery probes serial ports and opens cameras, which takes seconds on
+    the Jetson. The worker only probes, against a config snapshot taken when
+    it is created; ``finished`` carries the probe back and the receiver
+    passes it to :meth:`DeviceManager.apply_discovery` on the GUI thread,
+    so manager state and status signals never leave that thread.
+    """
+
+    finished = Signal(dict)
+    failed = Signal(str)
+
+    def __init__(self, device_manager: DeviceManager, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._device_manager = device_manager
+        self._config = copy.deepcopy(device_manager.config)
+
+    @Slot()
+    def run(self) -> None:
+        try:
+            result = self._device_manager.probe_devices(self._config)
+        except Exception as exc:  # pragma: no cover - defensive
+            log_exception("DeviceDiscoveryWorker: discovery failed", exc)
+            self.failed.emit(str(exc))
+        else:
+            self.finished.emit(result)
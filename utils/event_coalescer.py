@@ -0,0 +1,80 @@
+"""Thread-safe mailbox that coalesces worker updates for the UI.
+
+Execution workers report status text, progress and log lines on their hot
+path.  Posting them here costs a short lock and an assignment/append, never a
+cross-thread Qt event: status and progress keep only the latest value, log
+lines queue up (bounded, oldest dropped first) until the UI drains them in one
+batch at its display rate.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, List, Optional, Tuple
+
+
+@dataclass(slots=True)
+class WorkerEvents:
+    """Everything posted since the previous :meth:`EventCoalescer.drain`."""
+
+    status: Optional[str] = None
+    progress: Optional[Tuple[int, int]] = None
+    logs: List[Tuple[str, str]] = field(default_factory=list)
+    dropped_logs: int = 0
+
+    def __bool__(self) -> bool:
+        return self.status is not None or self.progress is not None or bool(self.logs) or self.dropped_logs > 0
+
+
+class EventCoalescer:
+    """Latest-wins status/progress plus a bounded batch of log lines."""
+
+    def __init__(self, max_pending_logs: int = 500) -> None:
+        self._lock = threading.Lock()
+        self._status: Optional[str] = None
+        self._progress: Optional[Tuple[int, int]] = None
+        self._logs: Deque[Tuple[str, str]] = deque(maxlen=max(1, int(max_pending_logs)))
+        self._dropped_logs = 0
+        self.posted = 0
+        self.coalesced = 0
+
+    def post_status(self, status: str) -> None:
+        with self._lock:
+            self.posted += 1
+            if self._status is not None:
+                self.coalesced += 1
+            self._status = status
+
+    def post_progress(self, current: int, total: int) -> None:
+        with self._lock:
+            self.posted += 1
+            if self._progress is not None:
+                self.coalesced += 1
+            self._progress = (current, total)
+
+    def post_log(self, level: str, message: str) -> None:
+        with self._lock:
+            self.posted += 1
+            if len(self._logs) == self._logs.maxlen:
+                self._dropped_logs += 1
+            self._logs.append((level, message))
+
+    @property
+    def pending(self) -> bool:
+        with self._lock:
+            return self._status is not None or self._progress is not None or bool(self._logs)
+
+    def drain(self) -> WorkerEvents:
+        """Take everything posted so far, leaving the mailbox empty."""
+        with self._lock:
+            events = WorkerEvents(self._status, self._progress, list(self._logs), self._dropped_logs)
+            self._status = None
+            self._progress = None
+            self._logs.clear()
+            self._dropped_logs = 0
+        return events
+
+    def clear(self) -> None:
+        self.drain()
@@ -1,50 +1,115 @@
-"""Live recording playback helpers."""
+"""Live recording playback helpers.
+
+Send times come from :class:`~utils.trajectory_retiming.TrajectoryRetimer`:
+the recorded timing at ``speed% x speed_multiplier``, stretched wherever a
+joint would exceed ``control.joint_limits``.  When the dashboard speed slider
+changes ``speed_multiplier`` mid-run, the remaining points are re-planned from
+the point just sent, so the arm ramps to the new speed instead of stuttering.
+"""
 
 from __future__ import annotations
 
+import math
 import time
-from typing import Dict
+from typing import Callable, Dict, List, Sequence
+
+from utils import cycle_metrics
+from utils.trajectory_retiming import JointLimits, TrajectoryRetimer
 
 from .context import ExecutionContext
 
+VELOCITY_HEADROOM = 1.2  # Goal_Velocity margin over the speed a segment needs
+MAX_GOAL_VELOCITY = 4000
 
-def execute_live_component(context: ExecutionContext, component: Dict, speed_override: int) -> None:
-    """Execute a live-recording component inside a composite recording."""
-    recorded_data = component.get("recorded_data", [])
 
-    if not recorded_data:
-        context.log_warning("No recorded data in component")
-        return
+def _speed_multiplier(controller) -> float:
+    return float(getattr(controller, "speed_multiplier", 1.0) or 1.0)
 
-    total_points = len(recorded_data)
-    context.log_info(f"Playing {total_points} recorded points at {speed_override}% speed")
 
-    start_time = time.time()
+def _goal_velocity(recorded: int, scale: float, delta: Sequence[float], duration: float) -> int:
+    """Velocity for one streamed point: the scaled recorded value, or what the segment needs."""
+    needed = max((abs(d) for d in delta), default=0.0) / max(duration, 1e-3)
+    velocity = max(recorded * scale, math.ceil(needed * VELOCITY_HEADROOM))
+    return int(max(1, min(MAX_GOAL_VELOCITY, velocity)))
+
+
+def _stream_recording(
+    context: ExecutionContext,
+    recorded_data: List[Dict],
+    speed: float,
+    on_point: Callable[[int], None],
+) -> None:
+    """Stream ``recorded_data`` to the motors on a retimed schedule."""
+    controller = context.motor_controller
+    retimer = TrajectoryRetimer.from_recording(recorded_data, JointLimits.from_config(context.config))
+    multiplier = _speed_multiplier(controller)
+    scale = speed / 100.0 * multiplier
+    times = retimer.schedule(scale)
+    first = 0  # times[i - first] is the send time of point i
+
+    start_time = time.perf_counter()
 
     for idx, point in enumerate(recorded_data):
         if context.should_stop():
             break
 
-        positions = point["positions"]
-        target_timestamp = point["timestamp"] * (100.0 / speed_override)
-        velocity = int(point.get("velocity", 600) * (speed_override / 100.0))
-
-        current_time = time.time() - start_time
-        wait_time = target_timestamp - current_time
+        current = _speed_multiplier(controller)
+        if current != multiplier and idx > 0:
+            # Re-plan the rest from the point just sent, entering at its playback speed
+            sent = idx - 1
+            entry = 0.0
+            if sent > 0:
+                entry = retimer.recorded[sent - 1] / max(times[sent - first] - times[sent - 1 - first], 1e-3)
+            multiplier = current
+            scale = speed / 100.0 * multiplier
+            times = retimer.schedule(scale, start=sent, start_time=times[sent - first], entry_speed=entry)
+            first = sent
+            context.log_info(f"  ↻ Retimed {len(recorded_data) - idx} remaining points for {multiplier:.0%} speed")
+
+        wait_time = times[idx - first] - (time.perf_counter() - start_time)
         if wait_time > 0:
             time.sleep(wait_time)
 
-        if idx % 10 == 0:
-            progress = int((idx / total_points) * 100)
-            context.log_info(f"  → Point {idx}/{total_points} ({progress}%)")
+        on_point(idx)
+
+        recorded_velocity = point.get("velocity", 600)
+        if idx > 0:
+            velocity = _goal_velocity(
+                recorded_velocity, scale, retimer.deltas[idx - 1], times[idx - first] - times[idx - 1 - first]
+            )
+        else:
+            velocity = _goal_velocity(recorded_velocity, scale, (), 1.0)
 
         context.motor_controller.set_positions(
-            positions,
+            point["positions"],
             velocity=velocity,
             wait=False,
             keep_connection=True,
+            scale_velocity=False,
         )
 
+    # Streamed playback never waits per point, so the whole pass is motion time
+    cycle_metrics.add("motion", time.perf_counter() - start_time)
+
+
+def execute_live_component(context: ExecutionContext, component: Dict, speed_override: int) -> None:
+    """Execute a live-recording component inside a composite recording."""
+    recorded_data = component.get("recorded_data", [])
+
+    if not recorded_data:
+        context.log_warning("No recorded data in component")
+        return
+
+    total_points = len(recorded_data)
+    context.log_info(f"Playing {total_points} recorded points at {speed_override}% speed")
+
+    def on_point(idx: int) -> None:
+        if idx % 10 == 0:
+            progress = int((idx / total_points) * 100)
+            context.log_info(f"  → Point {idx}/{total_points} ({progress}%)")
+
+    _stream_recording(context, recorded_data, speed_override, on_point)
+
 
 def playback_live_recording(context: ExecutionContext, recording: Dict) -> None:
     """Play back a recorded live trajectory with time-based interpolation."""
@@ -58,30 +123,11 @@ def playback_live_recording(context: ExecutionContext, recording: Dict) -> None:
     total_points = len(recorded_data)
     context.log_info(f"Playing {total_points} recorded points at {speed}% speed")
 
-    start_time = time.time()
-
-    for idx, point in enumerate(recorded_data):
-        if context.should_stop():
-            break
-
-        positions = point["positions"]
-        target_timestamp = point["timestamp"] * (100.0 / speed)
-        velocity = int(point.get("velocity", 600) * (speed / 100.0))
-
-        current_time = time.time() - start_time
-        wait_time = target_timestamp - current_time
-        if wait_time > 0:
-            time.sleep(wait_time)
-
+    def on_point(idx: int) -> None:
         if idx % 10 == 0:
             progress = int((idx / total_points) * 100)
             context.update_progress(idx, total_points)
             context.set_status(f"Playing: {progress}%")
             context.log_info(f"→ Point {idx}/{total_points} ({progress}%)")
 
-        context.motor_controller.set_positions(
-            positions,
-            velocity=velocity,
-            wait=False,
-            keep_connection=True,
-        )
+    _stream_recording(context, recorded_data, speed, on_point)
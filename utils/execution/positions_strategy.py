@@ -1,4 +1,14 @@
-"""Position-set playback helpers for ExecutionWorker."""
+"""Position-set playback helpers for ExecutionWorker.
+
+Waypoints are stop points by default: the arm comes to rest and is verified
+before the next goal is sent.  Intermediate waypoints can instead blend:
+a waypoint with ``"blend_radius": <units>`` (or a pass-through waypoint,
+``"wait_for_completion": false``, which uses the component's
+``blend_radius`` or :data:`DEFAULT_BLEND_RADIUS`) is left as soon as every
+joint is within the radius, so the arm flows into the next goal without
+stopping.  The last waypoint, waypoints with ``"stop": true`` and waypoints
+followed by a delay are always full stop points.
+"""
 
 from __future__ import annotations
 
@@ -9,6 +19,7 @@ from .context import ExecutionContext
 
 RESCUE_RETRY_WINDOW = 2.0  # seconds to keep re-issuing the waypoint after a dropout
 RESCUE_RETRY_INTERVAL = 0.15  # seconds between retry sends
+DEFAULT_BLEND_RADIUS = 60  # position units, for pass-through waypoints without their own radius
 
 
 def _within_tolerance(current: List[int], target: List[int], tolerance: int) -> bool:
@@ -18,8 +29,23 @@ def _within_tolerance(current: List[int], target: List[int], tolerance: int) ->
     return max(abs(current[i] - target[i]) for i in range(len(target))) <= tolerance
 
 
+def _blend_radius(pos_data, stop_point: bool, default_radius: int) -> int:
+    """Blend radius for a waypoint, or 0 for a stop point that gets full verification."""
+    if stop_point or not isinstance(pos_data, dict) or pos_data.get("stop"):
+        return 0
+    radius = pos_data.get("blend_radius")
+    if radius is None and not pos_data.get("wait_for_completion", True):
+        radius = default_radius
+    return max(0, int(radius or 0))
+
+
 def _rescue_waypoint(context: ExecutionContext, target: List[int], velocity: int) -> bool:
-    """Keep nudging the same waypoint for a short window when motors momentarily drop out."""
+    """Watch a waypoint for a short window when motors momentarily drop out.
+
+    The goal is only re-sent when a check says it was lost (failed read,
+    torque off after a servo reset) or the arm stopped short of it; a goal the
+    servos still hold is not rewritten on every poll.
+    """
     controller = context.motor_controller
     tol = getattr(controller, "POSITION_TOLERANCE", 10)
 
@@ -29,24 +55,26 @@ def _rescue_waypoint(context: ExecutionContext, target: List[int], velocity: int
 
     start = time.time()
     warned = False
+    sent = False
 
     while (time.time() - start) < RESCUE_RETRY_WINDOW:
-        positions = controller.read_positions_from_bus()
+        if getattr(controller, "stop_requested", False):
+            return False
+        positions, reason = controller.check_hold(target, tol)
         if _within_tolerance(positions, target, tol):
             if warned:
                 context.log_info("Resilience: motor bus recovered, target reached.")
             return True
 
-        # Re-send the goal to keep the bus nudging toward target
-        try:
-            for idx, motor_name in enumerate(controller.motor_names):
-                controller.bus.write("Goal_Position", motor_name, target[idx], normalize=False)
-        except Exception as exc:  # Keep going; transient errors are expected here
-            if not warned:
-                context.log_warning(f"Resilience: retrying waypoint after bus error ({exc})")
-            warned = True
-            time.sleep(RESCUE_RETRY_INTERVAL)
-            continue
+        # Re-send the goal only once the servos have lost it or stopped short
+        if reason or not sent:
+            sent = controller.assert_goal(target, reason)
+            if not sent:
+                if not warned:
+                    context.log_warning("Resilience: retrying waypoint after bus error")
+                warned = True
+                time.sleep(RESCUE_RETRY_INTERVAL)
+                continue
 
         if not warned:
             context.log_warning(
@@ -69,6 +97,7 @@ def execute_position_component(context: ExecutionContext, component: Dict, speed
         return
 
     total_positions = len(positions_list)
+    default_blend = component.get("blend_radius", DEFAULT_BLEND_RADIUS)
     context.log_info(f"Moving through {total_positions} waypoints at {speed_override}% speed")
 
     for idx, pos_data in enumerate(positions_list):
@@ -78,21 +107,33 @@ def execute_position_component(context: ExecutionContext, component: Dict, speed
         pos_name = pos_data.get("name", f"Position {idx + 1}")
         motor_positions = pos_data.get("motor_positions", [])
         velocity = pos_data.get("velocity", 600)
-        wait_for_completion = pos_data.get("wait_for_completion", True)
+        settle_tail = pos_data.get("settle_tail")
+        blend = _blend_radius(pos_data, idx == total_positions - 1, default_blend)
 
         velocity = int(velocity * (speed_override / 100.0))
 
-        context.log_info(
-            f"  → {pos_name}: {motor_positions[:3]}... @ {velocity} vel"
-        )
-        context.motor_controller.set_positions(
+        if blend:
+            context.log_info(
+                f"  ↷ {pos_name}: {motor_positions[:3]}... @ {velocity} vel (blend ±{blend})"
+            )
+        else:
+            context.log_info(
+                f"  → {pos_name}: {motor_positions[:3]}... @ {velocity} vel"
+            )
+        confirmed = context.motor_controller.set_positions(
             motor_positions,
             velocity=velocity,
-            wait=wait_for_completion,
+            wait=True,
             keep_connection=True,
+            settle_tail=settle_tail,
+            blend_radius=blend or None,
         )
+        if blend and confirmed:
+            continue
+        if context.should_stop():
+            break
         tol = getattr(context.motor_controller, "POSITION_TOLERANCE", 10)
-        reached = _within_tolerance(
+        reached = confirmed or _within_tolerance(
             context.motor_controller.read_positions_from_bus(), motor_positions, tol
         ) or _rescue_waypoint(context, motor_positions, velocity)
 
@@ -110,6 +151,7 @@ def playback_position_recording(context: ExecutionContext, recording: Dict) -> N
     delays = recording.get("delays", {})
 
     total_steps = len(positions_list)
+    default_blend = recording.get("blend_radius", DEFAULT_BLEND_RADIUS)
     context.log_info(f"Playing {total_steps} positions at {speed}% speed")
 
     for idx, pos_data in enumerate(positions_list):
@@ -119,30 +161,40 @@ def playback_position_recording(context: ExecutionContext, recording: Dict) -> N
         if isinstance(pos_data, dict):
             positions = pos_data.get("motor_positions", pos_data.get("positions", []))
             velocity = pos_data.get("velocity", 600)
+            settle_tail = pos_data.get("settle_tail")
         else:
             positions = pos_data
             velocity = 600
+            settle_tail = None
 
         velocity = int(velocity * (speed / 100.0))
+        delay = delays.get(str(idx), 0)
+        blend = _blend_radius(pos_data, idx == total_steps - 1 or delay > 0, default_blend)
 
         context.update_progress(idx + 1, total_steps)
         context.set_status(f"Position {idx + 1}/{total_steps}")
 
-        context.log_info(f"→ Position {idx + 1}: {positions[:3]}... @ {velocity} vel")
-        context.motor_controller.set_positions(
+        suffix = f" (blend ±{blend})" if blend else ""
+        context.log_info(f"→ Position {idx + 1}: {positions[:3]}... @ {velocity} vel{suffix}")
+        confirmed = context.motor_controller.set_positions(
             positions,
             velocity=velocity,
             wait=True,
             keep_connection=True,
+            settle_tail=settle_tail,
+            blend_radius=blend or None,
         )
+        if blend and confirmed:
+            continue
+        if context.should_stop():
+            break
         tol = getattr(context.motor_controller, "POSITION_TOLERANCE", 10)
-        reached = _within_tolerance(
+        reached = confirmed or _within_tolerance(
             context.motor_controller.read_positions_from_bus(), positions, tol
         ) or _rescue_waypoint(context, positions, velocity)
         if not reached:
             context.log_warning("Resilience: waypoint not confirmed; moving on.")
 
-        delay = delays.get(str(idx), 0)
         if delay > 0:
             context.log_info(f"Delay: {delay}s")
             time.sleep(delay)
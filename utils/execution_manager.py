@@ -18,14 +18,18 @@ import math
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
 
-import cv2
-import numpy as np
 from PySide6.QtCore import QThread, Signal
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.motor_manager import get_motor_handle
+from utils.lazy_import import lazy_module
+
+# Only vision steps need OpenCV/NumPy; import them on first use
+cv2 = lazy_module("cv2")
+np = lazy_module("numpy")
+
+from utils.motor_manager import MotorManager, get_motor_handle
 from utils.actions_manager import ActionsManager
 from utils.sequences_manager import SequencesManager
 from utils.camera_backend import open_capture
@@ -39,7 +43,11 @@ from utils.execution import (
     playback_live_recording,
     playback_position_recording,
 )
-from utils.home_move_worker import home_multiple_arms
+from utils.home_move_worker import home_arms
+from utils import cycle_metrics, latency_trace
+
+# Sequence steps that start by moving the arm, so a move before them need not stop first
+MOVE_STEP_TYPES = ("action", "home", "palletize")
 
 
 class ExecutionWorker(QThread):
@@ -53,6 +61,7 @@ class ExecutionWorker(QThread):
     sequence_step_started = Signal(int, int, dict)   # step_index, total_steps, step data
     sequence_step_completed = Signal(int, int, dict) # step_index, total_steps, step data
     vision_state_update = Signal(str, dict)          # state, payload
+    cycle_completed = Signal(dict)                   # iteration record + rolling summary
     
     def __init__(self, config: dict, execution_type: str, execution_name: str, execution_data: dict = None):
         """
@@ -104,6 +113,9 @@ class ExecutionWorker(QThread):
         Handles: recordings, sequences, and models (in local mode)
         """
         self._stop_requested = False
+        # Starting a run is the operator's re-arm after an emergency stop
+        MotorManager.instance().rearm_all()
+        trace = latency_trace.start_trace(f"{self.execution_type}_{self.execution_name}", self.config)
         
         try:
             if self.execution_type == "recording":
@@ -118,6 +130,25 @@ class ExecutionWorker(QThread):
         except Exception as e:
             self.log_message.emit('error', f"Execution error: {e}")
             self.execution_completed.emit(False, f"Failed: {e}")
+        finally:
+            self._finish_latency_trace(trace)
+
+    def _finish_latency_trace(self, trace: Optional[latency_trace.LatencyTrace]) -> None:
+        if trace is None:
+            return
+        try:
+            path = latency_trace.finish_trace(trace)
+        except Exception as exc:
+            self.log_message.emit('warning', f"Could not write latency trace: {exc}")
+            return
+        summary = trace.as_chrome_trace()["otherData"]["frame_to_motion"]
+        if summary:
+            self.log_message.emit(
+                'info',
+                f"Frame-to-motion latency: median {summary['median_ms']:.0f} ms, "
+                f"max {summary['max_ms']:.0f} ms over {summary['count']} trigger(s)",
+            )
+        self.log_message.emit('info', f"Latency trace written to {path}")
 
     def set_speed_multiplier(self, multiplier: float):
         self.speed_multiplier = multiplier
@@ -268,9 +299,11 @@ class ExecutionWorker(QThread):
         # Execute steps
         iteration = 0
         self._reset_vision_tracking()
+        cycles = cycle_metrics.start_recording(self.execution_name, sequence, self.config)
         try:
             while True:
                 iteration += 1
+                cycles.begin_iteration(iteration)
                 
                 for idx, step in enumerate(steps):
                     if self._stop_requested:
@@ -283,6 +316,9 @@ class ExecutionWorker(QThread):
                     self.status_update.emit(f"Step {idx+1}/{total_steps}: {step_label}")
                     self.log_message.emit('info', f"→ {step_label}")
                     self.sequence_step_started.emit(idx, total_steps, step)
+                    step_start_ns = latency_trace.now_ns()
+                    latency_trace.step_started()
+                    cycles.begin_step(idx, step_type or "unknown")
                     
                     if step_type == "action":
                         # Execute action/recording
@@ -322,7 +358,9 @@ class ExecutionWorker(QThread):
                                 break
                             self.log_message.emit('warning', "Vision step skipped due to error")
                     elif step_type == "palletize":
-                        if not self._execute_palletize_step(step, idx):
+                        next_step = steps[idx + 1] if idx + 1 < len(steps) else (steps[0] if loop else None)
+                        followed_by_move = bool(next_step) and next_step.get("type") in MOVE_STEP_TYPES
+                        if not self._execute_palletize_step(step, idx, followed_by_move):
                             if self._stop_requested:
                                 break
                             self.log_message.emit('warning', "Palletize step skipped due to error")
@@ -331,6 +369,14 @@ class ExecutionWorker(QThread):
                         self.log_message.emit('warning', f"Unknown step type: {step_type}")
                     
                     self.sequence_step_completed.emit(idx, total_steps, step)
+                    cycles.end_step()
+                    latency_trace.complete(
+                        step_label, "sequencer", step_start_ns,
+                        step_index=idx, step_type=step_type, iteration=iteration,
+                    )
+                
+                if not self._stop_requested:
+                    self._record_cycle(cycles)
                 
                 if self._stop_requested or not loop:
                     break
@@ -338,6 +384,7 @@ class ExecutionWorker(QThread):
                 self.log_message.emit('info', f"Loop iteration {iteration} completed, repeating...")
         
         finally:
+            cycle_metrics.stop_recording(cycles)
             # Clean up policy server
             if policy_server_process:
                 self.log_message.emit('info', "Shutting down policy server...")
@@ -356,6 +403,24 @@ class ExecutionWorker(QThread):
             self.execution_completed.emit(False, "Stopped by user")
         self._reset_vision_tracking()
 
+    def _record_cycle(self, cycles: cycle_metrics.CycleRecorder) -> None:
+        """Close the current loop iteration, persist it and publish the rolling summary."""
+        try:
+            record = cycles.end_iteration()
+        except OSError as exc:
+            self.log_message.emit('warning', f"Could not write cycle metrics: {exc}")
+            return
+        summary = cycles.rolling_summary()
+        self.log_message.emit(
+            'info',
+            f"Cycle {record['iteration']}: {record['wall_s']:.2f}s "
+            f"(vision {record['vision_s']:.2f}s, motion {record['motion_s']:.2f}s, "
+            f"settle {record['settle_s']:.2f}s, model {record['model_s']:.2f}s, "
+            f"saved {record['settle_saved_s']:.2f}s) · "
+            f"{summary['parts_per_hour']:.0f} parts/h"
+        )
+        self.cycle_completed.emit({"record": record, "summary": summary})
+
     def _describe_step(self, step_type: str, step: Dict) -> str:
         """Readable label for a sequence step."""
         step_type = (step_type or "unknown").lower()
@@ -561,6 +626,7 @@ class ExecutionWorker(QThread):
         confirm_start = None
         last_check = 0.0
         last_frame_ts = 0.0
+        watch_start_ns = latency_trace.now_ns()
 
         try:
             while not self._stop_requested:
@@ -580,7 +646,7 @@ class ExecutionWorker(QThread):
                     continue
 
                 if use_hub:
-                    frame, frame_ts = self.camera_hub.get_frame_with_timestamp(camera_name, preview=False)
+                    frame, frame_ts, captured_ns = self.camera_hub.get_frame_with_capture_time(camera_name, preview=False)
                     if frame is None:
                         self._emit_vision_state("watching", {
                             "message": "Camera feed unavailable",
@@ -596,6 +662,7 @@ class ExecutionWorker(QThread):
                     last_frame_ts = frame_ts
                 else:
                     ret, frame = cap.read()
+                    captured_ns = latency_trace.now_ns()
                     if not ret or frame is None:
                         self._emit_vision_state("watching", {
                             "message": "Camera read failed",
@@ -608,7 +675,9 @@ class ExecutionWorker(QThread):
 
                 last_check = now
 
+                consumed_ns = latency_trace.now_ns()
                 evaluation = self._evaluate_vision_zones(frame, trigger_cfg)
+                evaluated_ns = latency_trace.now_ns()
                 triggered = evaluation["triggered"]
                 triggered_zones = evaluation["triggered_zones"]
                 best_metric = evaluation["best_metric"]
@@ -628,6 +697,15 @@ class ExecutionWorker(QThread):
                             "zone_polygons": zone_payload,
                         })
                         self.log_message.emit('info', f"Vision trigger confirmed after {elapsed:.2f}s")
+                        trace = latency_trace.active_trace()
+                        if trace is not None:
+                            trace.stage("frame_captured", "camera", ts_ns=captured_ns or consumed_ns, camera=camera_label)
+                            trace.complete("frame_consumed", "vision", captured_ns or consumed_ns, consumed_ns)
+                            trace.complete("evaluate_zones", "vision", consumed_ns, evaluated_ns, metric=round(best_metric, 3))
+                            trace.complete("vision_wait", "vision", watch_start_ns, camera=camera_label)
+                            trace.trigger_confirmed(
+                                captured_ns, consumed_ns, zones=triggered_zones, hold_s=round(elapsed, 3)
+                            )
                         success = True
                         break
                     else:
@@ -657,6 +735,7 @@ class ExecutionWorker(QThread):
         finally:
             if cap is not None:
                 cap.release()
+            cycle_metrics.add("vision", (latency_trace.now_ns() - watch_start_ns) / 1e9)
 
         if success:
             self._emit_vision_state("complete", {
@@ -681,8 +760,12 @@ class ExecutionWorker(QThread):
 
         return success
 
-    def _execute_palletize_step(self, step: Dict, step_index: int) -> bool:
-        """Execute a palletization step."""
+    def _execute_palletize_step(self, step: Dict, step_index: int, followed_by_move: bool = False) -> bool:
+        """Execute a palletization step.
+
+        ``followed_by_move`` is set when the next step starts with a move, so
+        the final retract may blend into it instead of stopping.
+        """
         try:
             runtime = self._palletize_runtime
             runtime.speed_multiplier = self.speed_multiplier
@@ -714,6 +797,7 @@ class ExecutionWorker(QThread):
                 logger=lambda level, msg: self.log_message.emit(level, msg),
                 stop_cb=lambda: self._stop_requested,
                 controller=controller,
+                followed_by_move=followed_by_move,
             )
             return True
         except Exception as exc:
@@ -763,51 +847,31 @@ class ExecutionWorker(QThread):
                 time.sleep(duration)
                 return
         
+        if self.motor_controller.stop_requested:
+            self.log_message.emit('warning', "Emergency stop latched - delay without holding")
+            return
+
+        start_time = time.time()
         try:
-            # Read current positions
-            current_positions = self.motor_controller.read_positions_from_bus()
+            # Writes the goal once, then only bulk-reads at a low rate and re-asserts
+            # on drift, torque loss or a reset (control.hold_mode)
+            stats = self.motor_controller.hold_position(duration, should_stop=lambda: self._stop_requested)
             
-            if not current_positions:
+            if stats is None:
                 self.log_message.emit('warning', "Could not read positions - delay without holding")
                 time.sleep(duration)
                 return
             
-            self.log_message.emit('info', f"Holding position: {current_positions}")
-            
-            # Hold position by periodically re-sending position commands
-            # This keeps torque enabled and arm locked in place
-            start_time = time.time()
-            hold_interval = 0.1  # Re-send position every 100ms
-            
-            while (time.time() - start_time) < duration:
-                if self._stop_requested:
-                    break
-                
-                # Re-send position command to maintain hold
-                try:
-                    for idx, motor_name in enumerate(self.motor_controller.motor_names):
-                        self.motor_controller.bus.write(
-                            "Goal_Position",
-                            motor_name,
-                            current_positions[idx],
-                            normalize=False
-                        )
-                except Exception as e:
-                    self.log_message.emit('warning', f"Hold position error: {e}")
-                
-                # Sleep for hold interval (or remaining time if less)
-                remaining = duration - (time.time() - start_time)
-                sleep_time = min(hold_interval, remaining)
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
-            
-            self.log_message.emit('info', "✓ Delay complete (position held)")
+            self.log_message.emit(
+                'info',
+                f"✓ Delay complete (position held, {stats['mode']}): max error {stats['max_error']} units, "
+                f"{stats['reasserts']} re-asserts, bus busy {stats['bus_occupancy']:.1%}"
+            )
             
         except Exception as e:
             self.log_message.emit('error', f"Error during delay hold: {e}")
             # Fall back to regular sleep for any remaining time
-            elapsed = time.time() - start_time if 'start_time' in locals() else 0
-            remaining = duration - elapsed
+            remaining = duration - (time.time() - start_time)
             if remaining > 0:
                 time.sleep(remaining)
     
@@ -847,11 +911,11 @@ class ExecutionWorker(QThread):
         
         # Home each selected arm
         indexes = [idx for idx, _, _ in arms_to_home]
-        success, per_arm = home_multiple_arms(self.config, indexes)
-        for idx, arm_success, msg in per_arm:
-            arm_name = f"Arm {idx + 1}"
-            self.log_message.emit('info' if arm_success else 'error', f"{arm_name}: {msg}")
-        if not success:
+        results = home_arms(self.config, indexes, should_stop=lambda: self._stop_requested)
+        for result in results:
+            arm_name = f"Arm {result.arm_index + 1}"
+            self.log_message.emit('info' if result.success else 'error', f"{arm_name}: {result.message}")
+        if not all(result.success for result in results):
             self.log_message.emit('warning', "One or more arms failed to home.")
 
     def _stabilize_arm_after_model(self, hold_seconds: float = 1.0) -> bool:
@@ -979,6 +1043,7 @@ class ExecutionWorker(QThread):
             self.log_message.emit('info', "Starting robot client...")
             
             # Start robot client
+            spawn_start = time.perf_counter()
             robot_process = subprocess.Popen(
                 robot_cmd,
                 stdout=subprocess.PIPE,
@@ -995,6 +1060,7 @@ class ExecutionWorker(QThread):
                 self.log_message.emit('error', "Robot client failed to start")
                 return
             
+            cycle_metrics.add("model", time.perf_counter() - spawn_start)
             self.log_message.emit('info', f"✓ Model running for {duration}s")
             
             # Run for specified duration (check for stop every second)
@@ -1285,6 +1351,8 @@ class ExecutionWorker(QThread):
             # print(f"[EXEC] Full command:\n{cmd_str}")
             
             # Start process with correct working directory
+            spawn_start = time.perf_counter()
+            startup_recorded = threading.Event()
             process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
@@ -1305,6 +1373,10 @@ class ExecutionWorker(QThread):
                             break
                         line = line.rstrip()
                         output_lines.append(line)
+                        if not startup_recorded.is_set() and "recording episode" in line.lower():
+                            # lerobot-record is loaded and acting: the rest is episode time
+                            startup_recorded.set()
+                            cycle_metrics.add("model", time.perf_counter() - spawn_start)
                         # Log important lines to GUI
                         if 'INFO' in line or 'ERROR' in line or 'Traceback' in line:
                             # Extract just the message part
@@ -1337,6 +1409,8 @@ class ExecutionWorker(QThread):
                     print(f"[lerobot] {line}")
                 return False
             
+            startup_wait_s = time.perf_counter() - spawn_start
+            
             # Calculate total runtime (1 episode * episode_time + buffer)
             total_time = duration + 10  # 10s buffer for startup/shutdown
             
@@ -1377,6 +1451,10 @@ class ExecutionWorker(QThread):
             
             # Wait for output thread to finish
             output_thread.join(timeout=2)
+            if not startup_recorded.is_set():
+                # No episode-start line seen (older lerobot); count the fixed start-up wait
+                startup_recorded.set()
+                cycle_metrics.add("model", startup_wait_s)
             
             return True  # Success
             
@@ -1439,7 +1517,8 @@ class ExecutionWorker(QThread):
             policy_cmd = self._build_policy_server_cmd(checkpoint_path)
             robot_cmd = self._build_robot_client_cmd(checkpoint_path)
             
-            # Start policy server
+            # Start policy server (start-up time counts from here)
+            spawn_start = time.perf_counter()
             policy_process = subprocess.Popen(
                 policy_cmd,
                 stdout=subprocess.PIPE,
@@ -1478,6 +1557,7 @@ class ExecutionWorker(QThread):
                 policy_process.wait(5)
                 return
             
+            cycle_metrics.add("model", time.perf_counter() - spawn_start)
             self.log_message.emit('info', f"✓ Model running for {duration}s")
             
             # Run for specified duration (check for stop every second)
@@ -1,16 +1,35 @@
-"""Qt worker utilities for running home moves without freezing the UI."""
+"""Qt worker utilities for running home moves without freezing the UI.
+
+All homing goes through :func:`home_arms`, which moves every requested arm
+together on its already-open ``MotorHandle``:
+
+- each arm's move time is predicted (motion model, else the distance formula)
+  and faster arms are slowed down so every arm arrives together;
+- the moves are started with bulk writes queued on each port's I/O thread,
+  and arms on a shared USB hub (``usb_hub`` in the arm config) take turns
+  on the bus (see utils/motor_io.py);
+- one thread polls every arm until it is in tolerance and stopped, and the
+  per-arm completion times are reported.
+"""
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
-from typing import Any, Mapping, Optional
-import threading
+from typing import Any, Callable, Mapping, Optional
 
 from PySide6.QtCore import QObject, Signal, Slot
 
+from . import motor_events
+from .motor_events import INFO, WARNING
 from .motor_manager import get_motor_handle
 from .config_compat import get_home_positions, get_home_velocity, get_arm_port
 
+MIN_HOME_VELOCITY = 50
+MAX_HOME_VELOCITY = 1200
+HOME_POLL_MIN = 0.01  # Seconds between completion polls close to arrival
+HOME_POLL_MAX = 0.1  # Seconds between completion polls early in the move
+
 
 @dataclass(slots=True)
 class HomeMoveRequest:
@@ -19,12 +38,26 @@ class HomeMoveRequest:
     config: Mapping[str, Any]
     velocity_override: Optional[int] = None
     arm_index: int = 0  # Which arm to home (0 for first arm)
+    arm_indexes: Optional[list[int]] = None  # Home several arms together (overrides arm_index)
+
+
+@dataclass(slots=True)
+class HomeResult:
+    """Outcome of one arm's home move."""
+
+    arm_index: int
+    success: bool
+    message: str
+    velocity: int = 0
+    predicted_s: float = 0.0
+    completed_s: Optional[float] = None  # Goal write to in tolerance and stopped
 
 
 class HomeMoveWorker(QObject):
     """Execute the home move sequence on a background thread."""
 
     progress = Signal(str)
+    arm_finished = Signal(int, bool, str)
     finished = Signal(bool, str)
 
     def __init__(self, request: HomeMoveRequest, parent: Optional[QObject] = None) -> None:
@@ -35,144 +68,244 @@ class HomeMoveWorker(QObject):
     def run(self) -> None:
         """Perform the home move while emitting progress updates."""
 
-        config = dict(self._request.config or {})
-        arm_index = self._request.arm_index
-        
-        # Get home positions using config helper
-        positions = get_home_positions(config, arm_index)
-        if not positions:
-            self.finished.emit(False, f"No home position configured for arm {arm_index}. Set home first.")
-            return
-
-        # Check port is configured
-        port = get_arm_port(config, arm_index, "robot")
-        if not port:
-            self.finished.emit(False, f"Robot port not configured for arm {arm_index}. Check settings.")
-            return
-
-        # Get velocity
-        base_velocity = get_home_velocity(config, arm_index)
-        velocity = self._request.velocity_override or base_velocity
-
+        indexes = list(self._request.arm_indexes or [self._request.arm_index])
+        names = ", ".join(str(idx) for idx in indexes)
+        self.progress.emit(f"Moving to home (arm {names})...")
         try:
-            velocity = int(max(50, min(1200, velocity)))
-        except Exception:
-            velocity = int(max(50, min(1200, base_velocity)))
-
-        self.progress.emit(f"Connecting to motors (arm {arm_index})...")
-
-        try:
-            controller = get_motor_handle(arm_index, config)
-        except Exception as exc:  # pragma: no cover - controller init touches hardware libs
-            self.finished.emit(False, f"Motor controller initialisation failed: {exc}")
-            return
-
-        try:
-            if not controller.connect():
-                self.finished.emit(False, "Failed to connect to motors.")
-                return
-
-            self.progress.emit(f"Moving to home @ velocity {velocity}")
-            controller.set_positions(
-                positions,
-                velocity=velocity,
-                wait=True,
-                keep_connection=True,  # Keep connection for torque disable
-            )
-
-            # Disable torque after reaching home to let the arm rest
-            try:
-                if controller.bus:
-                    for name in controller.motor_names:
-                        controller.bus.write("Torque_Enable", name, 0, normalize=False)
-            except Exception:
-                pass
-            finally:
-                # Clean up connection
-                try:
-                    controller.disconnect()
-                except Exception:
-                    pass
+            # Pressing Home is an explicit operator action, so it re-arms a latched stop
+            results = home_arms(self._request.config, indexes, self._request.velocity_override, rearm=True)
         except Exception as exc:  # pragma: no cover - hardware specific
             self.finished.emit(False, f"Home move failed: {exc}")
-        else:
-            self.finished.emit(True, f"✓ Home position reached @ {velocity}")
-
+            return
 
-def home_arm_blocking(config: Mapping[str, Any], arm_index: int, velocity_override: Optional[int] = None) -> tuple[bool, str]:
-    """Blocking home for a single arm. Returns (success, message)."""
-    cfg = dict(config or {})
-    positions = get_home_positions(cfg, arm_index)
-    if not positions:
-        return False, f"No home position configured for arm {arm_index}. Set home first."
+        for result in results:
+            self.arm_finished.emit(result.arm_index, result.success, result.message)
+        failed = [result for result in results if not result.success]
+        if len(results) == 1:
+            self.finished.emit(results[0].success, results[0].message)
+        elif failed:
+            self.finished.emit(False, f"{len(failed)}/{len(results)} arm(s) failed to home")
+        else:
+            self.finished.emit(True, "✓ All arms reached home")
 
-    port = get_arm_port(cfg, arm_index, "robot")
-    if not port:
-        return False, f"Robot port not configured for arm {arm_index}. Check settings."
 
-    base_velocity = get_home_velocity(cfg, arm_index)
+def _home_velocity(config: Mapping[str, Any], arm_index: int, velocity_override: Optional[int]) -> int:
+    base_velocity = get_home_velocity(config, arm_index)
     try:
-        velocity = int(max(50, min(1200, velocity_override or base_velocity)))
+        return int(max(MIN_HOME_VELOCITY, min(MAX_HOME_VELOCITY, velocity_override or base_velocity)))
     except Exception:
-        velocity = int(max(50, min(1200, base_velocity)))
+        return int(max(MIN_HOME_VELOCITY, min(MAX_HOME_VELOCITY, base_velocity)))
+
+
+def _velocity_for_duration(handle, target: list[int], start: list[int], velocity: int, duration: float) -> int:
+    """Slowest velocity (down to MIN_HOME_VELOCITY) whose predicted move still fits ``duration``."""
+    if handle.predict_move_time(target, velocity, start) >= duration:
+        return velocity
+    low, high = MIN_HOME_VELOCITY, velocity
+    if handle.predict_move_time(target, low, start) <= duration:
+        return low
+    # Predicted time falls as velocity rises; keep predict(low) > duration >= predict(high)
+    while high - low > 1:
+        mid = (low + high) // 2
+        if handle.predict_move_time(target, mid, start) > duration:
+            low = mid
+        else:
+            high = mid
+    return high
+
+
+@dataclass
+class _HomeMove:
+    arm_index: int
+    handle: Any
+    target: list[int]
+    start: list[int]
+    velocity: int
+    opened: bool
+    predicted_s: float = 0.0
+    motion_start: Optional[float] = None  # None until the move was actually started
+    completed_s: Optional[float] = None
+    error: Optional[str] = None
+    last_positions: Optional[list[int]] = None
+    max_error: Optional[int] = None
+
+
+def home_arms(
+    config: Mapping[str, Any],
+    arm_indexes: list[int],
+    velocity_override: Optional[int] = None,
+    *,
+    release_torque: bool = True,
+    should_stop: Optional[Callable[[], bool]] = None,
+    rearm: bool = False,
+) -> list[HomeResult]:
+    """Move ``arm_indexes`` home together; returns one HomeResult per arm, in order.
+
+    Handles that are already connected stay connected (the caller owns
+    them); handles opened here are closed again. With ``release_torque``
+    arms that reached home go limp there, as homing always has; an arm
+    that did not (stopped, timed out, failed) is held where it is.
+
+    An arm with a latched emergency stop is not moved unless ``rearm`` is
+    set, which only operator-initiated homing does.
+    """
+    cfg = dict(config or {})
+    results: dict[int, HomeResult] = {}
+    moves: list[_HomeMove] = []
 
-    try:
-        controller = get_motor_handle(arm_index, cfg)
-    except Exception as exc:
-        return False, f"Motor controller initialisation failed: {exc}"
+    for idx in arm_indexes:
+        positions = get_home_positions(cfg, idx)
+        if not positions:
+            results[idx] = HomeResult(idx, False, f"No home position configured for arm {idx}. Set home first.")
+            continue
+        if not get_arm_port(cfg, idx, "robot"):
+            results[idx] = HomeResult(idx, False, f"Robot port not configured for arm {idx}. Check settings.")
+            continue
+        try:
+            handle = get_motor_handle(idx, cfg)
+        except Exception as exc:
+            results[idx] = HomeResult(idx, False, f"Motor controller initialisation failed: {exc}")
+            continue
+        opened = not handle.bus
+        if not handle.connect():
+            results[idx] = HomeResult(idx, False, "Failed to connect to motors.")
+            continue
+        if handle.stop_requested:
+            if not rearm:
+                results[idx] = HomeResult(idx, False, "Emergency stop is latched; re-arm before homing.")
+                if opened:
+                    handle.disconnect()
+                continue
+            handle.rearm()
+        velocity = _home_velocity(cfg, idx, velocity_override)
+        moves.append(_HomeMove(idx, handle, list(positions), handle.read_positions_from_bus(), velocity, opened))
 
     try:
-        if not controller.connect():
-            return False, "Failed to connect to motors."
-
-        controller.set_positions(
-            positions,
-            velocity=velocity,
-            wait=True,
-            keep_connection=True,
+        if moves:
+            _run_home_moves(moves, should_stop)
+        for move in moves:
+            results[move.arm_index] = _home_result(move)
+    except Exception as exc:
+        for move in moves:
+            results[move.arm_index] = HomeResult(move.arm_index, False, f"Home move failed: {exc}", move.velocity)
+    finally:
+        for move in moves:
+            _finish_home_move(move, release_torque)
+
+    ordered = [results[idx] for idx in arm_indexes if idx in results]
+    homed = [result for result in ordered if result.completed_s is not None]
+    if homed:
+        times = [result.completed_s for result in homed]
+        motor_events.record(
+            INFO, "HOME", "arms_homed",
+            "Homed {homed}/{arms} arm(s) in {total_s:.2f}s (arrival spread {spread_ms:.0f} ms)",
+            homed=len(homed), arms=len(ordered), total_s=max(times),
+            spread_ms=(max(times) - min(times)) * 1000.0,
+            per_arm={result.arm_index: round(result.completed_s, 3) for result in homed},
         )
+    return ordered
 
-        # Disable torque after reaching home to let the arm rest
+
+def _run_home_moves(moves: list[_HomeMove], should_stop: Optional[Callable[[], bool]]) -> None:
+    # Every arm gets the slowest arm's duration
+    for move in moves:
+        move.predicted_s = move.handle.predict_move_time(move.target, move.velocity, move.start)
+    duration = max(move.predicted_s for move in moves)
+    for move in moves:
+        move.velocity = _velocity_for_duration(move.handle, move.target, move.start, move.velocity, duration)
+        move.predicted_s = move.handle.predict_move_time(move.target, move.velocity, move.start)
+
+    # Start every arm: the writes queue on each port's I/O thread and run side by side
+    started = [(move, move.handle.command_move_async(move.target, move.velocity)) for move in moves]
+    for move, future in started:
         try:
-            if controller.bus:
-                for name in controller.motor_names:
-                    controller.bus.write("Torque_Enable", name, 0, normalize=False)
-        except Exception:
-            pass
-        finally:
+            # None: an emergency stop latched before the move could start
+            move.motion_start = future.result(timeout=2.0)
+        except Exception as exc:
+            move.error = f"Home move failed: {exc}"
+
+    deadline = time.perf_counter() + duration + max(2.0, duration * 0.5)
+    pending = [move for move in moves if move.motion_start is not None]
+    while pending:
+        polls = [(move, move.handle.read_motion_state_async()) for move in pending]
+        for move, future in polls:
             try:
-                controller.disconnect()
+                positions, moving = future.result(timeout=1.0)
             except Exception:
-                pass
+                continue
+            now = time.perf_counter()
+            if not positions:
+                continue
+            move.max_error = max(abs(p - t) for p, t in zip(positions, move.target))
+            if moving is None:
+                moving = move.last_positions is None or any(
+                    abs(p - q) > 2 for p, q in zip(positions, move.last_positions)
+                )
+            move.last_positions = positions
+            if move.max_error <= move.handle.POSITION_TOLERANCE and not moving:
+                move.completed_s = now - move.motion_start
+                pending.remove(move)
+
+        now = time.perf_counter()
+        if not pending or now > deadline:
+            break
+        if (should_stop and should_stop()) or any(move.handle.stop_requested for move in pending):
+            break
+        remaining = min(move.motion_start + move.predicted_s for move in pending) - now
+        time.sleep(min(HOME_POLL_MAX, max(HOME_POLL_MIN, 0.5 * remaining)))
+
+
+def _home_result(move: _HomeMove) -> HomeResult:
+    if move.completed_s is not None:
+        message = f"✓ Home position reached in {move.completed_s:.2f}s @ {move.velocity}"
+        return HomeResult(move.arm_index, True, message, move.velocity, move.predicted_s, move.completed_s)
+    if move.error:
+        message = move.error
+    elif move.handle.stop_requested:
+        message = "Home move cancelled by emergency stop"
+    elif move.max_error is None:
+        message = "Home move failed: no position feedback"
+    else:
+        message = f"Home move did not settle (max error {move.max_error} units)"
+    motor_events.record(WARNING, "HOME", "home_failed", "Arm {arm}: {message}", arm=move.arm_index, message=message)
+    return HomeResult(move.arm_index, False, message, move.velocity, move.predicted_s)
+
+
+def _finish_home_move(move: _HomeMove, release_torque: bool) -> None:
+    names = list(move.handle.motor_names)
+    try:
+        if move.motion_start is None or move.handle.stop_requested:
+            pass  # Never started, or an emergency stop owns the arm now
+        elif move.completed_s is not None:
+            if release_torque:
+                move.handle.submit(
+                    lambda bus: bus.sync_write("Torque_Enable", dict.fromkeys(names, 0), normalize=False)
+                ).result(timeout=1.0)
+        else:
+            # Short of home and possibly still moving: never go limp mid-move, hold here
+            positions = move.handle.read_positions_from_bus()
+            if positions:
+                move.handle.assert_goal(positions, "drift")
     except Exception as exc:
-        return False, f"Home move failed: {exc}"
-
-    return True, f"✓ Home position reached @ {velocity}"
-
-
-def home_multiple_arms(config: Mapping[str, Any], arm_indexes: list[int], velocity_override: Optional[int] = None) -> tuple[bool, list[tuple[int, bool, str]]]:
-    """Home the selected arms in parallel. Returns aggregate success and per-arm results."""
-    results: list[tuple[int, bool, str]] = []
-
-    if not arm_indexes:
-        return True, results
-
-    threads = []
-    result_map: dict[int, tuple[bool, str]] = {}
-
-    def _run(idx: int):
-        result_map[idx] = home_arm_blocking(config, idx, velocity_override)
+        motor_events.record(
+            WARNING, "HOME", "finish_failed", "Arm {arm}: could not release or hold after homing ({error})",
+            arm=move.arm_index, error=str(exc),
+        )
+    finally:
+        if move.opened:
+            try:
+                move.handle.disconnect()
+            except Exception:
+                pass
 
-    for idx in arm_indexes:
-        t = threading.Thread(target=_run, args=(idx,), daemon=True)
-        threads.append(t)
-        t.start()
 
-    for t in threads:
-        t.join()
+def home_arm_blocking(config: Mapping[str, Any], arm_index: int, velocity_override: Optional[int] = None) -> tuple[bool, str]:
+    """Blocking home for a single arm. Returns (success, message)."""
+    result = home_arms(config, [arm_index], velocity_override)[0]
+    return result.success, result.message
 
-    for idx in arm_indexes:
-        success, msg = result_map.get(idx, (False, "Unknown error"))
-        results.append((idx, success, msg))
 
+def home_multiple_arms(config: Mapping[str, Any], arm_indexes: list[int], velocity_override: Optional[int] = None) -> tuple[bool, list[tuple[int, bool, str]]]:
+    """Home the selected arms together. Returns aggregate success and per-arm results."""
+    results = [(r.arm_index, r.success, r.message) for r in home_arms(config, arm_indexes, velocity_override)]
     return all(r[1] for r in results), results
@@ -53,7 +53,8 @@ class HomeSequenceRunner(QObject):
         self._had_failure = False
         self._parallel_mode = False
         self._parallel_threads: list[QThread] = []
-        self._pending_parallel = 0
+        self._parallel_arms: dict[int, HomeArmInfo] = {}
+        self._velocity_override: Optional[int] = None
 
     @property
     def is_running(self) -> bool:
@@ -107,7 +108,8 @@ class HomeSequenceRunner(QObject):
         self._had_failure = False
         self._parallel_mode = False
         self._parallel_threads = []
-        self._pending_parallel = 0
+        self._parallel_arms = {}
+        self._velocity_override = velocity_override
         self._running = True
         self.started.emit([info.as_dict() for info in queue])
         # If all arms requested and we have more than one, run in parallel
@@ -259,28 +261,15 @@ class HomeSequenceRunner(QObject):
     # Parallel homing helpers
 
     def _start_parallel(self, queue: list[HomeArmInfo]) -> None:
-        """Start homing all arms concurrently."""
-        self._pending_parallel = len(queue)
+        """Home all arms together with one worker; they arrive at the same time."""
+        self._parallel_arms = {info.arm_index: info for info in queue}
         for info in queue:
-            try:
-                self._start_parallel_arm(info)
-            except Exception as exc:
-                self._had_failure = True
-                log_exception("HomeSequenceRunner: failed to start parallel arm", exc, level="error", stack=True)
-                self.arm_finished.emit(info.as_dict(), False, f"Homing error: {exc}")
-                self._pending_parallel -= 1
-
-        if self._pending_parallel <= 0:
-            self._finish_parallel()
-
-    def _start_parallel_arm(self, info: HomeArmInfo) -> None:
-        """Start a single arm in parallel mode."""
-        self.arm_started.emit(info.as_dict())
+            self.arm_started.emit(info.as_dict())
 
         request = HomeMoveRequest(
             config=self._config,
-            velocity_override=info.velocity,
-            arm_index=info.arm_index,
+            velocity_override=self._velocity_override,
+            arm_indexes=list(self._parallel_arms),
         )
 
         worker = HomeMoveWorker(request)
@@ -289,22 +278,19 @@ class HomeSequenceRunner(QObject):
 
         thread.started.connect(worker.run)
         worker.progress.connect(self.progress.emit, Qt.QueuedConnection)
-        worker.finished.connect(lambda success, message, info=info: self._handle_parallel_finished(info, success, message), Qt.QueuedConnection)
+        worker.arm_finished.connect(self._handle_parallel_finished, Qt.QueuedConnection)
+        worker.finished.connect(lambda success, message: self._finish_parallel(), Qt.QueuedConnection)
         worker.finished.connect(thread.quit, Qt.QueuedConnection)
         thread.finished.connect(lambda: self._cleanup_parallel_thread(thread, worker), Qt.QueuedConnection)
 
         self._parallel_threads.append(thread)
         thread.start()
 
-    def _handle_parallel_finished(self, info: HomeArmInfo, success: bool, message: str) -> None:
-        try:
-            if not success:
-                self._had_failure = True
-            self.arm_finished.emit(info.as_dict(), success, message)
-        finally:
-            self._pending_parallel -= 1
-            if self._pending_parallel <= 0:
-                self._finish_parallel()
+    def _handle_parallel_finished(self, arm_index: int, success: bool, message: str) -> None:
+        if not success:
+            self._had_failure = True
+        info = self._parallel_arms.get(arm_index)
+        self.arm_finished.emit(info.as_dict() if info else {"arm_index": arm_index}, success, message)
 
     def _cleanup_parallel_thread(self, thread: QThread, worker: HomeMoveWorker) -> None:
         try:
@@ -0,0 +1,260 @@
+"""
+End-to-end latency tracing for sequence runs (vision -> sequencer -> motors).
+
+A :class:`LatencyTrace` is opened per run by ``ExecutionWorker`` and made the
+*active* trace; instrumented code calls the module-level helpers
+(:func:`stage`, :func:`span`, :func:`complete`) which are a single ``None``
+check when tracing is off.  All timestamps come from ``time.monotonic_ns``
+(camera frames are stamped with the same clock when captured), so spans from
+different threads line up.
+
+Stages recorded on the way from a part appearing to the arm moving:
+
+``frame_captured``   camera thread read the frame (``CameraStream`` stamps it)
+``frame_consumed``   the vision step picked it up (span from capture)
+``trigger_confirmed`` zone evaluation + hold time accepted the trigger
+``step``             sequencer step start/end
+``first_bus_write``  first ``Goal_Position`` write after a step starts
+``position_verified`` feedback polling confirmed (or gave up on) the target
+
+Whenever a trigger is followed by a bus write, a ``frame_to_motion`` span is
+added and its breakdown stored in the report's ``latencies`` list.
+
+:func:`finish_trace` writes the run as Chrome trace JSON
+(``runtime/traces/<run>_<trace_id>.json``), which opens in ``chrome://tracing``
+or https://ui.perfetto.dev.  Enable with ``"latency_tracing": {"enabled":
+true}`` in the config or ``NICEBOT_TRACE=1``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_TRACE_DIR = ROOT / "runtime" / "traces"
+TRACE_ENV = "NICEBOT_TRACE"
+
+# Chrome trace "threads": one row per pipeline stage
+TRACKS = {"camera": 1, "vision": 2, "sequencer": 3, "motor": 4, "latency": 5}
+
+
+def now_ns() -> int:
+    return time.monotonic_ns()
+
+
+class LatencyTrace:
+    """Collects Chrome trace events for one run."""
+
+    def __init__(self, run_name: str, trace_dir: Path = DEFAULT_TRACE_DIR, max_events: int = 200_000) -> None:
+        self.run_name = run_name
+        self.trace_id = uuid.uuid4().hex[:12]
+        self.trace_dir = Path(trace_dir)
+        self.max_events = int(max_events)
+        self.origin_ns = now_ns()
+        self.started_wall = time.time()
+        self.dropped_events = 0
+        self.latencies: List[Dict[str, float]] = []
+        self._events: List[Dict[str, object]] = []
+        self._lock = threading.Lock()
+        self._step_marks: set = set()
+        self._pending_trigger: Optional[Dict[str, int]] = None
+        self.path: Optional[Path] = None
+
+    # ------------------------------------------------------------------
+    # Recording
+
+    def _us(self, ts_ns: int) -> float:
+        return (ts_ns - self.origin_ns) / 1000.0
+
+    def _add(self, event: Dict[str, object]) -> None:
+        with self._lock:
+            if len(self._events) >= self.max_events:
+                self.dropped_events += 1
+                return
+            self._events.append(event)
+
+    def instant(self, name: str, track: str, ts_ns: Optional[int] = None, **args) -> None:
+        self._add({
+            "name": name, "ph": "i", "s": "t", "pid": 1, "tid": TRACKS.get(track, 0),
+            "ts": self._us(ts_ns if ts_ns is not None else now_ns()), "args": args,
+        })
+
+    def complete(self, name: str, track: str, start_ns: int, end_ns: Optional[int] = None, **args) -> None:
+        end_ns = end_ns if end_ns is not None else now_ns()
+        self._add({
+            "name": name, "ph": "X", "pid": 1, "tid": TRACKS.get(track, 0),
+            "ts": self._us(start_ns), "dur": max(0.0, (end_ns - start_ns) / 1000.0), "args": args,
+        })
+
+    @contextmanager
+    def span(self, name: str, track: str, **args) -> Iterator[Dict[str, object]]:
+        """Time a block; callers may add result details to the yielded ``args``."""
+        start = now_ns()
+        try:
+            yield args
+        finally:
+            self.complete(name, track, start, **args)
+
+    def stage(self, name: str, track: str, once_per_step: bool = False, ts_ns: Optional[int] = None, **args) -> bool:
+        """Mark a pipeline stage; with ``once_per_step`` only the first mark after a step start counts."""
+        if once_per_step:
+            with self._lock:
+                if name in self._step_marks:
+                    return False
+                self._step_marks.add(name)
+        ts_ns = ts_ns if ts_ns is not None else now_ns()
+        self.instant(name, track, ts_ns, trace_id=self.trace_id, **args)
+        if name == "first_bus_write":
+            self._close_trigger_latency(ts_ns)
+        return True
+
+    def step_started(self) -> None:
+        with self._lock:
+            self._step_marks.clear()
+
+    def trigger_confirmed(self, frame_captured_ns: int, frame_consumed_ns: int, **args) -> None:
+        confirmed = now_ns()
+        self.stage("trigger_confirmed", "vision", ts_ns=confirmed, **args)
+        with self._lock:
+            self._pending_trigger = {
+                "captured": frame_captured_ns or frame_consumed_ns,
+                "consumed": frame_consumed_ns,
+                "confirmed": confirmed,
+            }
+
+    def _close_trigger_latency(self, write_ns: int) -> None:
+        with self._lock:
+            pending, self._pending_trigger = self._pending_trigger, None
+        if pending is None:
+            return
+        breakdown = {
+            "capture_to_consume_ms": (pending["consumed"] - pending["captured"]) / 1e6,
+            "consume_to_trigger_ms": (pending["confirmed"] - pending["consumed"]) / 1e6,
+            "trigger_to_first_write_ms": (write_ns - pending["confirmed"]) / 1e6,
+            "frame_to_motion_ms": (write_ns - pending["captured"]) / 1e6,
+        }
+        breakdown = {key: round(value, 3) for key, value in breakdown.items()}
+        self.latencies.append(breakdown)
+        self.complete("frame_to_motion", "latency", pending["captured"], write_ns, **breakdown)
+
+    # ------------------------------------------------------------------
+    # Export
+
+    def as_chrome_trace(self) -> Dict[str, object]:
+        with self._lock:
+            events = list(self._events)
+        metadata = [
+            {"name": "process_name", "ph": "M", "pid": 1, "args": {"name": f"{self.run_name} [{self.trace_id}]"}}
+        ] + [
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": track}}
+            for track, tid in TRACKS.items()
+        ]
+        frame_to_motion = sorted(item["frame_to_motion_ms"] for item in self.latencies)
+        summary = {}
+        if frame_to_motion:
+            summary = {
+                "count": len(frame_to_motion),
+                "min_ms": frame_to_motion[0],
+                "median_ms": frame_to_motion[len(frame_to_motion) // 2],
+                "max_ms": frame_to_motion[-1],
+            }
+        return {
+            "traceEvents": metadata + events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "trace_id": self.trace_id,
+                "run": self.run_name,
+                "started": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started_wall)),
+                "dropped_events": self.dropped_events,
+                "latencies": self.latencies,
+                "frame_to_motion": summary,
+            },
+        }
+
+    def write(self) -> Path:
+        self.trace_dir.mkdir(parents=True, exist_ok=True)
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]+", "_", self.run_name).strip("_") or "run"
+        path = self.trace_dir / f"{safe_name}_{self.trace_id}.json"
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as handle:
+            json.dump(self.as_chrome_trace(), handle)
+        os.replace(tmp_path, path)
+        self.path = path
+        return path
+
+
+# ----------------------------------------------------------------------
+# Active trace (one run at a time)
+
+_active: Optional[LatencyTrace] = None
+
+
+def tracing_enabled(config: Optional[dict]) -> bool:
+    if os.environ.get(TRACE_ENV, "").strip().lower() in {"1", "true", "yes", "on"}:
+        return True
+    return bool(((config or {}).get("latency_tracing") or {}).get("enabled", False))
+
+
+def start_trace(run_name: str, config: Optional[dict] = None) -> Optional[LatencyTrace]:
+    """Begin tracing a run if enabled; returns the new active trace."""
+    global _active
+    if not tracing_enabled(config):
+        _active = None
+        return None
+    settings = (config or {}).get("latency_tracing") or {}
+    _active = LatencyTrace(
+        run_name,
+        trace_dir=Path(settings.get("dir", DEFAULT_TRACE_DIR)),
+        max_events=int(settings.get("max_events", 200_000)),
+    )
+    return _active
+
+
+def finish_trace(trace: Optional[LatencyTrace]) -> Optional[Path]:
+    """Write ``trace`` and clear it if it is still the active one."""
+    global _active
+    if trace is None:
+        return None
+    if _active is trace:
+        _active = None
+    return trace.write()
+
+
+def active_trace() -> Optional[LatencyTrace]:
+    return _active
+
+
+def stage(name: str, track: str, once_per_step: bool = False, **args) -> None:
+    trace = _active
+    if trace is not None:
+        trace.stage(name, track, once_per_step=once_per_step, **args)
+
+
+def complete(name: str, track: str, start_ns: int, end_ns: Optional[int] = None, **args) -> None:
+    trace = _active
+    if trace is not None:
+        trace.complete(name, track, start_ns, end_ns, **args)
+
+
+def step_started() -> None:
+    trace = _active
+    if trace is not None:
+        trace.step_started()
+
+
+@contextmanager
+def span(name: str, track: str, **args) -> Iterator[Dict[str, object]]:
+    trace = _active
+    if trace is None:
+        yield args
+        return
+    with trace.span(name, track, **args) as span_args:
+        yield span_args
@@ -0,0 +1,79 @@
+"""Deferred imports for heavy optional dependencies (OpenCV, NumPy, ...).
+
+``optional_module("cv2")`` keeps the existing ``cv2 is None`` checks working:
+it returns ``None`` when the package is not installed (a cheap ``find_spec``
+lookup, nothing is executed) and otherwise a proxy that performs the real
+import on first attribute access.  Modules that are already imported are
+returned as-is.
+
+Because the import is deferred, an installed-but-broken package now fails
+at first use instead of at startup; those call sites already run inside the
+same defensive ``try`` blocks as any other OpenCV failure.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import sys
+import types
+from typing import Optional
+
+
+class LazyModule(types.ModuleType):
+    """Module proxy that imports the real module on first attribute access."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            module = importlib.import_module(self.__name__)
+            self.__dict__["_lazy_module"] = module
+            # Copy the namespace so later lookups never reach __getattr__
+            self.__dict__.update({k: v for k, v in module.__dict__.items() if k != "__name__"})
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.__dict__["_lazy_module"] is not None
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "deferred"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def module_available(name: str) -> bool:
+    """Return True if ``name`` can be imported, without importing it."""
+
+    if name in sys.modules:
+        return sys.modules[name] is not None
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def lazy_module(name: str) -> types.ModuleType:
+    """Return ``name`` if already imported, otherwise a :class:`LazyModule`."""
+
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
+
+
+def optional_module(name: str) -> Optional[types.ModuleType]:
+    """Lazy handle for an optional dependency, or ``None`` if it is missing."""
+
+    if not module_available(name):
+        return None
+    return lazy_module(name)
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Optional, Tuple
 
 
 @dataclass(slots=True)
@@ -18,6 +19,207 @@ class LogEntry:
     dedupe: bool = True
 
 
+# Noise that the dashboard should ignore.
+_SKIP_SIGNALS = (
+    "loop iteration",
+    "→ model",
+    "starting episode",
+    "pausing shared camera streams",
+    "resumed shared camera streams",
+    "torque hold unavailable, moving to home",
+    "using local mode",
+    "using server mode",
+    "starting policy server",
+    "policy server ready",
+    "starting robot client",
+    "launching client",
+    "waiting for vision trigger",
+    "vision trigger complete",
+    "eval_",
+    "dataset:",
+    "total steps",
+    "step types",
+    "step complete",
+    "checkpoint",
+    "traceback",
+    "warning: qt",
+    "qt.qpa.",
+    "output reading error",
+    "force killing process",
+    "point ",
+)
+
+_RuleHandler = Callable[[str, str], Optional[LogEntry]]
+
+
+# A rule condition is (regex, gate tokens). A message can only match the rule
+# if it contains one of the gate tokens, which keeps the shared gate regex a
+# plain literal alternation.
+_Condition = Tuple[str, Tuple[str, ...]]
+
+
+def _any(*tokens: str) -> _Condition:
+    return "|".join(re.escape(token) for token in tokens), tokens
+
+
+def _all(*tokens: str) -> _Condition:
+    return r"\A" + "".join(f"(?=.*?{re.escape(token)})" for token in tokens), tokens[:1]
+
+
+def _prefix(token: str) -> _Condition:
+    return rf"\A{re.escape(token)}", (token,)
+
+
+def _entry(**fields) -> _RuleHandler:
+    # LogEntry is mutable, so every match gets a fresh instance
+    return lambda text, level: LogEntry(**fields)
+
+
+def _drop(text: str, level: str) -> None:
+    return None
+
+
+def _client_message(text: str, level: str) -> Optional[LogEntry]:
+    body = text.split(":", 1)[-1].strip()
+    if not body:
+        return None
+    return LogEntry(
+        level="error",
+        message=body.capitalize(),
+        action="Check the robot connection and try again.",
+        code="client_message",
+        fatal="error" in level,
+    )
+
+
+def _client_warning(text: str, level: str) -> Optional[LogEntry]:
+    body = text.split(":", 1)[-1].strip()
+    if not body:
+        return None
+    return LogEntry(level="warning", message=body.capitalize(), code="client_warning")
+
+
+# Friendly translations, checked in order; the first matching rule decides.
+_RULES: Tuple[Tuple[_Condition, _RuleHandler], ...] = (
+    (_any("robot port not found", "no such file or directory: /dev/ttyacm"), _entry(
+        level="error",
+        message="The robot is unplugged.",
+        action="Check the USB cable and power, then reconnect and press Start.",
+        code="robot_port_missing",
+        fatal=True,
+    )),
+    (_any("make sure the robot is connected"), _drop),
+    (_any("failed to connect to motors"), _entry(
+        level="error",
+        message="We couldn't talk to the robot motors.",
+        action="Confirm the robot is powered on and the USB cable is secure, then restart the run.",
+        code="motor_connect_failed",
+        fatal=True,
+    )),
+    (_any("unable to connect to motors for torque hold"), _entry(
+        level="warning",
+        message="The robot couldn't hold its current pose.",
+        action="Make sure the robot is online before starting the run.",
+        code="torque_hold_failed",
+    )),
+    (_any("monitor error", "execution error"), _entry(
+        level="error",
+        message="The run stopped because of an unexpected error.",
+        action="Check the terminal for details, fix the issue, then try again.",
+        code="execution_error",
+        fatal=True,
+    )),
+    (_any("resilience: motor dropout detected", "resilience: retrying waypoint"), _entry(
+        level="warning",
+        message="Motor dropout detected; retrying to reach the waypoint.",
+        code="motor_resilience_retry",
+    )),
+    (_any("resilience: motor bus recovered"), _entry(
+        level="success",
+        message="Motor link recovered; continuing the run.",
+        code="motor_resilience_recovered",
+    )),
+    (_all("resilient", "retry", "motor"), _entry(
+        level="warning",
+        message="Motor bus retrying after a dropout.",
+        code="motor_resilience_retry",
+        dedupe=True,
+    )),
+    (_all("resilient", "recovered"), _entry(
+        level="success",
+        message="Motor link recovered; continuing the run.",
+        code="motor_resilience_recovered",
+    )),
+    (_any("resilience: waypoint not confirmed"), _entry(
+        level="warning",
+        message="Waypoint not confirmed after retries; continuing.",
+        code="motor_resilience_continue",
+        dedupe=True,
+    )),
+    (_all("port is in use", "txrxresult"), _entry(
+        level="warning",
+        message="Motor bus is busy; retrying with resilience.",
+        code="motor_port_busy",
+        dedupe=True,
+    )),
+    (_any("process exited with code", "robot control app closed with code"), _entry(
+        level="error",
+        message="The robot control app closed unexpectedly.",
+        action="Review the terminal output, resolve the issue, and restart the run.",
+        code="client_exit",
+        fatal=True,
+    )),
+    (_any("robot control app message:"), _client_message),
+    (_any("robot control app warning:"), _client_warning),
+    (_any("model execution completed", "run completed successfully"), _drop),
+    (_all("episode ", "failed"), _entry(
+        level="error",
+        message="The run stopped because the episode failed.",
+        action="Review the terminal for the exact error, fix it, and run again.",
+        code="episode_failed",
+        fatal=True,
+    )),
+    (_any("stopping by user", "stopped by user"), _entry(
+        level="info",
+        message="Run cancelled by user.",
+        code="user_stop",
+    )),
+    (_prefix("loading model"), _entry(
+        level="info",
+        message="Loading the selected model…",
+        code="model_loading",
+    )),
+    (_prefix("loading recording"), _entry(
+        level="info",
+        message="Loading the selected action…",
+        code="recording_loading",
+    )),
+    (_prefix("loading sequence"), _entry(
+        level="info",
+        message="Loading the selected sequence…",
+        code="sequence_loading",
+    )),
+    (_any("policy server is ready"), _entry(
+        level="info",
+        message="Robot control software is ready.",
+        code="policy_ready",
+    )),
+    (_any("policy server could not start"), _entry(
+        level="error",
+        message="Could not start the robot control software.",
+        action="Check the terminal for errors, then restart the run.",
+        code="policy_failed",
+        fatal=True,
+    )),
+)
+
+# Compiled once: a single scan rejects noise, and a literal alternation of the
+# rule gate tokens lets ordinary messages skip the ordered rule walk entirely.
+_SKIP_RE = re.compile(_any(*_SKIP_SIGNALS)[0])
+_RULE_RES = tuple((re.compile(pattern, re.DOTALL), handler) for (pattern, _), handler in _RULES)
+_RULE_GATE_RE = re.compile(_any(*(token for (_, gate), _ in _RULES for token in gate))[0])
+
+
 def translate_worker_message(level: str, message: str) -> Optional[LogEntry]:
     """Convert low-level worker logs into friendly dashboard messages."""
 
@@ -32,215 +234,16 @@ def translate_worker_message(level: str, message: str) -> Optional[LogEntry]:
     lowered = text.lower()
     level = (level or "info").lower()
 
-    # Noise that the dashboard should ignore.
-    skip_signals = (
-        "loop iteration",
-        "→ model",
-        "starting episode",
-        "pausing shared camera streams",
-        "resumed shared camera streams",
-        "torque hold unavailable, moving to home",
-        "using local mode",
-        "using server mode",
-        "starting policy server",
-        "policy server ready",
-        "starting robot client",
-        "launching client",
-        "waiting for vision trigger",
-        "vision trigger complete",
-        "eval_",
-        "dataset:",
-        "total steps",
-        "step types",
-        "step complete",
-        "checkpoint",
-        "traceback",
-        "warning: qt",
-        "qt.qpa.",
-        "output reading error",
-        "force killing process",
-        "point ",
-    )
-    if any(token in lowered for token in skip_signals):
-        return None
-
-    # Friendly translations.
-    if "robot port not found" in lowered or "no such file or directory: /dev/ttyacm" in lowered:
-        return LogEntry(
-            level="error",
-            message="The robot is unplugged.",
-            action="Check the USB cable and power, then reconnect and press Start.",
-            code="robot_port_missing",
-            fatal=True,
-        )
-
-    if "make sure the robot is connected" in lowered:
+    if _SKIP_RE.search(lowered):
         return None
 
-    if "failed to connect to motors" in lowered:
-        return LogEntry(
-            level="error",
-            message="We couldn't talk to the robot motors.",
-            action="Confirm the robot is powered on and the USB cable is secure, then restart the run.",
-            code="motor_connect_failed",
-            fatal=True,
-        )
-
-    if "unable to connect to motors for torque hold" in lowered:
-        return LogEntry(
-            level="warning",
-            message="The robot couldn't hold its current pose.",
-            action="Make sure the robot is online before starting the run.",
-            code="torque_hold_failed",
-        )
-
-    if "monitor error" in lowered or "execution error" in lowered:
-        return LogEntry(
-            level="error",
-            message="The run stopped because of an unexpected error.",
-            action="Check the terminal for details, fix the issue, then try again.",
-            code="execution_error",
-            fatal=True,
-        )
-
-    if "resilience: motor dropout detected" in lowered or "resilience: retrying waypoint" in lowered:
-        return LogEntry(
-            level="warning",
-            message="Motor dropout detected; retrying to reach the waypoint.",
-            code="motor_resilience_retry",
-        )
-
-    if "resilience: motor bus recovered" in lowered:
-        return LogEntry(
-            level="success",
-            message="Motor link recovered; continuing the run.",
-            code="motor_resilience_recovered",
-        )
-
-    if "resilient" in lowered and "retry" in lowered and "motor" in lowered:
-        return LogEntry(
-            level="warning",
-            message="Motor bus retrying after a dropout.",
-            code="motor_resilience_retry",
-            dedupe=True,
-        )
-
-    if "resilient" in lowered and "recovered" in lowered:
-        return LogEntry(
-            level="success",
-            message="Motor link recovered; continuing the run.",
-            code="motor_resilience_recovered",
-        )
-
-    if "resilience: waypoint not confirmed" in lowered:
-        return LogEntry(
-            level="warning",
-            message="Waypoint not confirmed after retries; continuing.",
-            code="motor_resilience_continue",
-            dedupe=True,
-        )
-
-    if "port is in use" in lowered and "txrxresult" in lowered:
-        return LogEntry(
-            level="warning",
-            message="Motor bus is busy; retrying with resilience.",
-            code="motor_port_busy",
-            dedupe=True,
-        )
-
-    if "process exited with code" in lowered or "robot control app closed with code" in lowered:
-        return LogEntry(
-            level="error",
-            message="The robot control app closed unexpectedly.",
-            action="Review the terminal output, resolve the issue, and restart the run.",
-            code="client_exit",
-            fatal=True,
-        )
-
-    if "robot control app message:" in lowered:
-        body = text.split(":", 1)[-1].strip()
-        if body:
-            return LogEntry(
-                level="error",
-                message=body.capitalize(),
-                action="Check the robot connection and try again.",
-                code="client_message",
-                fatal="error" in level,
-            )
-        return None
-
-    if "robot control app warning:" in lowered:
-        body = text.split(":", 1)[-1].strip()
-        if body:
-            return LogEntry(
-                level="warning",
-                message=body.capitalize(),
-                code="client_warning",
-            )
-        return None
-
-    if "model execution completed" in lowered or "run completed successfully" in lowered:
-        return None
-
-    if "episode " in lowered and "failed" in lowered:
-        return LogEntry(
-            level="error",
-            message="The run stopped because the episode failed.",
-            action="Review the terminal for the exact error, fix it, and run again.",
-            code="episode_failed",
-            fatal=True,
-        )
-
-    if "stopping by user" in lowered or "stopped by user" in lowered:
-        return LogEntry(
-            level="info",
-            message="Run cancelled by user.",
-            code="user_stop",
-        )
-
-    if lowered.startswith("loading model"):
-        return LogEntry(
-            level="info",
-            message="Loading the selected model…",
-            code="model_loading",
-        )
-
-    if lowered.startswith("loading recording"):
-        return LogEntry(
-            level="info",
-            message="Loading the selected action…",
-            code="recording_loading",
-        )
-
-    if lowered.startswith("loading sequence"):
-        return LogEntry(
-            level="info",
-            message="Loading the selected sequence…",
-            code="sequence_loading",
-        )
-
-    if "policy server is ready" in lowered:
-        return LogEntry(
-            level="info",
-            message="Robot control software is ready.",
-            code="policy_ready",
-        )
-
-    if "policy server could not start" in lowered:
-        return LogEntry(
-            level="error",
-            message="Could not start the robot control software.",
-            action="Check the terminal for errors, then restart the run.",
-            code="policy_failed",
-            fatal=True,
-        )
+    if _RULE_GATE_RE.search(lowered):
+        for pattern, handler in _RULE_RES:
+            if pattern.search(lowered):
+                return handler(text, level)
 
     # If we reach here and the message still has bracket prefixes, skip it.
     if raw.startswith("[") and "]" in raw[:6]:
         return None
 
-    clean = raw.strip()
-    if not clean:
-        return None
-
-    return LogEntry(level=level, message=clean)
+    return LogEntry(level=level, message=raw)
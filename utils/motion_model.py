@@ -0,0 +1,316 @@
+"""
+Per-joint motion profiles learned from the arm's own moves.
+
+``set_positions`` used to guess a move's duration as ``distance / velocity``
+plus a fixed acceleration allowance.  Real joints rarely match that: the
+shoulder lifts slower than it lowers, the servo's internal ramp differs from
+the register value, and the bus adds a little dead time before anything
+moves.  :class:`MotionModel` keeps, for every joint and direction of travel,
+
+* ``velocity_gain``: cruise velocity reached / commanded ``Goal_Velocity``
+* ``accel_gain``: effective acceleration / commanded ``Acceleration``
+* ``latency``: seconds from the goal write until the joint starts moving
+
+and predicts a move's completion as the slowest joint's trapezoidal profile
+time.  Direction stands in for load: a gravity-loaded joint is learned
+separately going up and coming down, without reading ``Present_Load`` during
+the move.
+
+Every event-driven move is an observation: the position samples that
+:meth:`MotorController.await_move_complete` polls anyway give each joint's
+start, peak speed and arrival.  Gains are running averages that turn into
+exponential averages after :data:`MotionModel.HISTORY` moves, so the model
+follows wear and payload changes.  Predictions are used once every joint in
+the move has :data:`MotionModel.MIN_OBSERVATIONS`; until then the controller
+keeps the old formula.  :func:`calibrate_motion_model` runs a short sweep to
+get there without waiting for production moves.
+
+Models are stored per arm in ``runtime/motion_models/<arm id>.json``;
+``config["control"]["motion_model"]`` can disable them or move the directory::
+
+    "motion_model": {"enabled": true, "dir": "runtime/motion_models"}
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_MODEL_DIR = ROOT / "runtime" / "motion_models"
+
+ACCELERATION_UNIT = 100.0  # steps/s² per Acceleration register step (STS3215)
+MAX_ACCELERATION_REGISTER = 254  # 0 means "no ramp"; treat it as the steepest one
+MOVE_THRESHOLD = 3  # steps a joint must leave its start by to count as moving
+MIN_LEARN_DISTANCE = 30  # steps (and at least twice the tolerance); shorter moves say little
+
+Sample = Tuple[float, Sequence[int]]
+
+
+def commanded_acceleration(register: int) -> float:
+    """steps/s² for an ``Acceleration`` register value."""
+    register = int(register) if register else MAX_ACCELERATION_REGISTER
+    return min(max(register, 1), MAX_ACCELERATION_REGISTER) * ACCELERATION_UNIT
+
+
+def profile_time(distance: float, velocity: float, acceleration: float) -> float:
+    """Duration of a rest-to-rest trapezoidal (or triangular) move."""
+    if distance <= 0:
+        return 0.0
+    velocity = max(velocity, 1.0)
+    if acceleration <= 0 or math.isinf(acceleration):
+        return distance / velocity
+    if distance >= velocity * velocity / acceleration:
+        return distance / velocity + velocity / acceleration
+    return 2.0 * math.sqrt(distance / acceleration)
+
+
+@dataclass
+class JointProfile:
+    velocity_gain: float = 1.0
+    accel_gain: float = 1.0
+    latency: float = 0.02
+    observations: int = 0
+
+
+class MotionModel:
+    """Learned per-joint, per-direction motion profiles for one arm."""
+
+    HISTORY = 20  # moves after which averaging becomes exponential (alpha = 1/HISTORY)
+    MIN_OBSERVATIONS = 3
+    AUTOSAVE_EVERY = 20
+
+    def __init__(self, path: Optional[Path] = None, joints: int = 6):
+        self.path = path
+        self.joints = joints
+        self.profiles: Dict[str, JointProfile] = {}
+        # Prediction error (actual - predicted, seconds) of model-based estimates
+        self.errors = 0
+        self.mean_abs_error = 0.0
+        self.mean_error = 0.0
+        # Arm-wide correction between a joint's arrival and the controller's
+        # confirmed completion (in tolerance *and* stopped, seen by a poll)
+        self.completion_offset = 0.0
+        self._unsaved = 0
+
+    @staticmethod
+    def _key(joint: int, delta: float) -> str:
+        return f"{joint}{'+' if delta >= 0 else '-'}"
+
+    def profile(self, joint: int, delta: float) -> JointProfile:
+        return self.profiles.setdefault(self._key(joint, delta), JointProfile())
+
+    # -- Prediction ---------------------------------------------------------
+
+    def _moving_joints(self, start: Sequence[int], target: Sequence[int]) -> Iterable[Tuple[int, float]]:
+        for joint, (a, b) in enumerate(zip(start, target)):
+            delta = float(b) - float(a)
+            if abs(delta) > MOVE_THRESHOLD:
+                yield joint, delta
+
+    def ready(self, start: Sequence[int], target: Sequence[int]) -> bool:
+        """True when every joint in the move has been observed often enough."""
+        return all(
+            self.profiles.get(self._key(joint, delta), JointProfile()).observations >= self.MIN_OBSERVATIONS
+            for joint, delta in self._moving_joints(start, target)
+        )
+
+    def joint_time(self, joint: int, delta: float, velocity: float, acceleration_register: int) -> float:
+        profile = self.profile(joint, delta)
+        return profile.latency + profile_time(
+            abs(delta),
+            velocity * profile.velocity_gain,
+            commanded_acceleration(acceleration_register) * profile.accel_gain,
+        )
+
+    def predict(self, start: Sequence[int], target: Sequence[int], velocity: float,
+                acceleration_register: int) -> float:
+        """Seconds from the goal write until the move is confirmed complete."""
+        slowest = max(
+            (self.joint_time(joint, delta, velocity, acceleration_register)
+             for joint, delta in self._moving_joints(start, target)),
+            default=0.0,
+        )
+        return max(0.0, slowest + self.completion_offset)
+
+    # -- Learning -----------------------------------------------------------
+
+    def _blend(self, current: float, observed: float, count: int) -> float:
+        weight = 1.0 / min(count + 1, self.HISTORY)
+        return current + weight * (observed - current)
+
+    def observe(self, start: Sequence[int], target: Sequence[int], velocity: float, acceleration_register: int,
+                motion_start: float, samples: Sequence[Sample], tolerance: int) -> int:
+        """Learn from one completed move; returns the number of joints updated.
+
+        ``samples`` are ``(perf_counter, positions)`` polled from the goal
+        write until the arm settled.  Event times are taken halfway between
+        the samples either side, which halves the bias of the poll interval.
+        """
+        if len(samples) < 2:
+            return 0
+        accel_cmd = commanded_acceleration(acceleration_register)
+        updated = 0
+        for joint, delta in self._moving_joints(start, target):
+            distance = abs(delta)
+            if distance < max(MIN_LEARN_DISTANCE, 2 * tolerance):
+                continue
+            times = [motion_start] + [t for t, _ in samples]
+            values = [float(start[joint])] + [float(p[joint]) for _, p in samples]
+
+            moved = next((i for i, q in enumerate(values) if abs(q - values[0]) > MOVE_THRESHOLD), None)
+            # Arrived: the first sample after which the joint sits at its final, in-tolerance value
+            arrived = None
+            for i in range(len(values) - 1, -1, -1):
+                if abs(values[i] - target[joint]) > tolerance or abs(values[i] - values[-1]) > MOVE_THRESHOLD:
+                    break
+                arrived = i
+            if moved is None or arrived is None or arrived < moved:
+                continue
+
+            latency = max(0.0, (times[moved - 1] + times[moved]) / 2 - motion_start) if moved else 0.0
+            duration = (times[arrived - 1] + times[arrived]) / 2 - motion_start - latency if arrived else 0.0
+            if duration <= 0:
+                continue
+            peak = max(
+                (abs(values[i + 1] - values[i]) / (times[i + 1] - times[i])
+                 for i in range(arrived) if times[i + 1] > times[i]),
+                default=0.0,
+            )
+
+            profile = self.profile(joint, delta)
+            count = profile.observations
+            # Peak speed is only the cruise speed when the commanded profile has a cruise phase
+            if distance >= 2.0 * velocity * velocity / accel_cmd and peak > 0:
+                gain = min(1.5, max(0.2, peak / velocity))
+                profile.velocity_gain = self._blend(profile.velocity_gain, gain, count)
+            cruise = velocity * profile.velocity_gain
+            if duration > distance / cruise and distance >= cruise * cruise / accel_cmd:
+                acceleration = cruise / (duration - distance / cruise)
+            else:
+                acceleration = 4.0 * distance / (duration * duration)
+            profile.accel_gain = self._blend(profile.accel_gain, min(5.0, max(0.05, acceleration / accel_cmd)), count)
+            profile.latency = self._blend(profile.latency, latency, count)
+            profile.observations = count + 1
+            updated += 1
+
+        if updated:
+            self._unsaved += 1
+            if self.path and self._unsaved >= self.AUTOSAVE_EVERY:
+                self.save()
+        return updated
+
+    def record_error(self, predicted: float, actual: float) -> None:
+        """Track the error of a model prediction and fold it into the completion offset."""
+        error = actual - predicted
+        self.errors += 1
+        weight = 1.0 / min(self.errors, self.HISTORY * 5)
+        self.mean_abs_error += weight * (abs(error) - self.mean_abs_error)
+        self.mean_error += weight * (error - self.mean_error)
+        self.completion_offset += error / min(self.errors, self.HISTORY)
+
+    # -- Storage ------------------------------------------------------------
+
+    def to_dict(self) -> dict:
+        return {
+            "profiles": {key: asdict(profile) for key, profile in sorted(self.profiles.items())},
+            "completion_offset_s": round(self.completion_offset, 4),
+            "prediction_error": {
+                "count": self.errors,
+                "mean_abs_s": round(self.mean_abs_error, 4),
+                "mean_s": round(self.mean_error, 4),
+            },
+        }
+
+    def save(self) -> bool:
+        if not self.path:
+            return False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self.to_dict(), indent=2))
+            tmp.replace(self.path)
+            self._unsaved = 0
+            return True
+        except OSError as exc:
+            print(f"[MOTION] Failed to save motion model {self.path}: {exc}")
+            return False
+
+    @classmethod
+    def load(cls, path: Optional[Path], joints: int = 6) -> "MotionModel":
+        model = cls(path, joints)
+        if not path or not path.exists():
+            return model
+        try:
+            data = json.loads(path.read_text())
+            for key, values in (data.get("profiles") or {}).items():
+                model.profiles[key] = JointProfile(**{
+                    name: values[name] for name in JointProfile.__dataclass_fields__ if name in values
+                })
+            model.completion_offset = float(data.get("completion_offset_s", 0.0))
+            errors = data.get("prediction_error") or {}
+            model.errors = int(errors.get("count", 0))
+            model.mean_abs_error = float(errors.get("mean_abs_s", 0.0))
+            model.mean_error = float(errors.get("mean_s", 0.0))
+        except (OSError, ValueError, TypeError) as exc:
+            print(f"[MOTION] Ignoring unreadable motion model {path}: {exc}")
+        return model
+
+    @classmethod
+    def for_arm(cls, config: dict, arm_config: Optional[dict], port: str) -> Optional["MotionModel"]:
+        """The arm's stored model, or None when disabled in ``control.motion_model``.
+
+        Simulated arms (``sim://`` ports) get an in-memory model so they never
+        overwrite a real arm's calibration.
+        """
+        settings = (config.get("control", {}) or {}).get("motion_model", {}) or {}
+        if not settings.get("enabled", True):
+            return None
+        if str(port).startswith("sim://"):
+            return cls(None)
+        arm_id = (arm_config or {}).get("id") or port
+        name = re.sub(r"[^A-Za-z0-9_.-]+", "_", str(arm_id)).strip("_") or "arm"
+        directory = Path(settings.get("dir", DEFAULT_MODEL_DIR))
+        if not directory.is_absolute():
+            directory = ROOT / directory
+        return cls.load(directory / f"{name}.json")
+
+
+def calibrate_motion_model(controller, *, joints: Sequence[int] = (0, 1, 2, 3, 4),
+                           velocities: Sequence[int] = (600, 1500, 3000), span: int = 200,
+                           repeats: int = 2) -> List[dict]:
+    """Sweep each joint out and back at several velocities to train the model.
+
+    The arm moves ``span`` steps away from its current pose on one joint at a
+    time (towards the middle of the range) and returns, so make sure it has
+    that much room.  Returns one row per move with the model's prediction
+    and the measured completion, and saves the model.
+    """
+    model = controller.motion_model
+    if model is None:
+        raise RuntimeError("Motion model disabled in control.motion_model")
+    home = controller.read_positions_from_bus()
+    if len(home) != 6:
+        raise RuntimeError("Calibration needs a readable 6-joint pose")
+
+    rows = []
+    for joint in joints:
+        direction = 1 if home[joint] < 2048 else -1
+        away = list(home)
+        away[joint] = home[joint] + direction * span
+        for velocity in velocities:
+            for _ in range(repeats):
+                for target in (away, home):
+                    if controller.stop_requested:
+                        model.save()
+                        return rows
+                    controller.set_positions(target, velocity=velocity, wait=True, keep_connection=True,
+                                             scale_velocity=False)
+                    move = controller.last_move or {}
+                    rows.append({"joint": joint, "velocity": velocity, **move})
+    model.save()
+    return rows
@@ -2,6 +2,8 @@
 Motor Controller - Unified interface for motor operations with position verification
 """
 
+import contextlib
+import threading
 import time
 from pathlib import Path
 import sys
@@ -21,6 +23,10 @@ except ImportError:
 
 # Import config compatibility layer
 from utils.config_compat import get_arm_port, get_arm_config
+from utils import cycle_metrics, latency_trace, motor_events
+from utils.motion_model import MotionModel, commanded_acceleration, profile_time
+from utils.motor_io import PortClient
+from utils.motor_events import DEBUG, INFO, WARNING, ERROR
 
 
 class MotorController:
@@ -31,6 +37,16 @@ class MotorController:
     POLL_INTERVAL = 0.05  # Seconds - how often to check position during verification
     POSITION_STABLE_TIME = 0.1  # Seconds - position must be stable for this long
     
+    # Event-driven completion ("event" mode): bulk-read position + Moving flag,
+    # polling faster as the remaining distance shrinks
+    COMPLETION_POLL_MIN = 0.01  # Seconds - poll interval close to the target
+    COMPLETION_POLL_MAX = 0.1  # Seconds - poll interval at the start of a long move
+    
+    # Holding ("smart" mode): write the goal once, then bulk-read at a low rate and
+    # re-assert only on drift, torque loss or a servo reset
+    HOLD_CHECK_INTERVAL = 0.25  # Seconds between hold checks
+    HOLD_RESEND_INTERVAL = 0.1  # Seconds between goal writes in "resend" mode
+    
     def __init__(self, config: dict = None, arm_index: int = 0):
         """
         Args:
@@ -50,10 +66,29 @@ class MotorController:
         
         self.motor_names = MOTOR_NAMES
         self.bus = None
+        # When set (MotorHandle does), connect() hands the bus to this MotorIOService
+        # and talks to it through a queued PortClient
+        self.io_service = None
+        # Set by emergency_stop(); interrupts move waits and verification polling
+        self._stop_event = threading.Event()
+        self.last_stop_latency_ms = None
         control_cfg = config.get("control", {})
         self.speed_multiplier = control_cfg.get("speed_multiplier", 1.0)
         if not 0.1 <= self.speed_multiplier <= 1.2:
             self.speed_multiplier = 1.0
+        # "event" polls until every joint is in tolerance and stopped; "timed" is the
+        # original sleep-80%-then-verify behaviour
+        self.move_completion = control_cfg.get("move_completion", "event")
+        # Extra dwell after a move is confirmed; steps can override it per move
+        self.settle_tail = max(0.0, float(control_cfg.get("settle_tail_s", 0.0)))
+        self._moving_flag_failures = 0
+        # Learned per-joint profiles for move-time prediction (None = disabled)
+        self.motion_model = MotionModel.for_arm(config, get_arm_config(config, arm_index, "robot"), self.port)
+        # Prediction vs measured completion of the last verified move
+        self.last_move = None
+        # "smart" monitors the held pose; "resend" rewrites the goal every 100 ms
+        self.hold_mode = control_cfg.get("hold_mode", "smart")
+        self.hold_check_interval = float(control_cfg.get("hold_check_interval_s", self.HOLD_CHECK_INTERVAL))
         
         # Load position tolerance from config if available
         robot_cfg = config.get("robot", {})
@@ -73,7 +108,7 @@ class MotorController:
             positions = read_current_position(self.arm_index)
             return positions if positions else []
         except Exception as e:
-            print(f"Error reading positions: {e}")
+            motor_events.record(ERROR, "MOTOR", "read_failed", "Error reading positions: {error}", error=str(e))
             return []
     
     def read_positions_from_bus(self) -> list[int]:
@@ -110,11 +145,15 @@ class MotorController:
                         continue
                 
                 # Non-transient error or final attempt - log and fallback
-                print(f"[MOTOR] Error reading positions (attempt {attempt+1}/3): {e}")
+                motor_events.record(
+                    WARNING, "MOTOR", "bus_read_failed",
+                    "Error reading positions (attempt {attempt}/3): {error}",
+                    attempt=attempt + 1, error=str(e), arm=self.arm_index,
+                )
                 
                 # Use last known positions if available
                 if self._last_positions:
-                    print(f"[MOTOR] Using last known positions to continue operation")
+                    motor_events.record(INFO, "MOTOR", "bus_read_fallback", "Using last known positions to continue operation")
                     return self._last_positions
                 
                 return []
@@ -130,20 +169,25 @@ class MotorController:
             (success, final_positions) - True if all motors within tolerance
         """
         if not self.bus:
-            print("[MOTOR] ⚠️ Cannot verify - no bus connection")
+            motor_events.record(WARNING, "MOTOR", "verify_no_bus", "⚠️ Cannot verify - no bus connection")
             return False, []
         
         start_time = time.time()
         stable_since = None
         last_positions = None
         
-        print(f"[MOTOR] 🎯 Verifying position (tolerance: ±{self.POSITION_TOLERANCE} units)")
+        motor_events.record(
+            DEBUG, "MOTOR", "verify_start",
+            "🎯 Verifying position (tolerance: ±{tolerance} units)",
+            tolerance=self.POSITION_TOLERANCE, arm=self.arm_index,
+        )
         
         while (time.time() - start_time) < timeout:
             current_positions = self.read_positions_from_bus()
             
             if not current_positions:
-                time.sleep(self.POLL_INTERVAL)
+                if self._stop_event.wait(self.POLL_INTERVAL):
+                    return False, []
                 continue
             
             # Check if all motors within tolerance
@@ -162,7 +206,11 @@ class MotorController:
                             stable_since = time.time()
                         elif (time.time() - stable_since) >= self.POSITION_STABLE_TIME:
                             elapsed = time.time() - start_time
-                            print(f"[MOTOR] ✓ Position reached in {elapsed:.2f}s (max error: {max_error} units)")
+                            motor_events.record(
+                                INFO, "MOTOR", "position_reached",
+                                "✓ Position reached in {elapsed:.2f}s (max error: {max_error} units)",
+                                elapsed=elapsed, max_error=max_error, arm=self.arm_index,
+                            )
                             return True, current_positions
                     else:
                         # Still moving
@@ -172,18 +220,24 @@ class MotorController:
                     stable_since = None
             
             last_positions = current_positions
-            time.sleep(self.POLL_INTERVAL)
+            if self._stop_event.wait(self.POLL_INTERVAL):
+                motor_events.record(
+                    INFO, "MOTOR", "verify_cancelled", "Position verification cancelled by emergency stop",
+                    arm=self.arm_index,
+                )
+                return False, current_positions
         
         # Timeout reached
         final_positions = self.read_positions_from_bus()
         if final_positions:
             errors = [abs(final_positions[i] - target_positions[i]) for i in range(6)]
             max_error = max(errors)
-            print(f"[MOTOR] ⚠️ Position verification timeout ({timeout}s)")
-            print(f"[MOTOR]    Max error: {max_error} units (tolerance: {self.POSITION_TOLERANCE})")
-            print(f"[MOTOR]    Target:  {target_positions}")
-            print(f"[MOTOR]    Current: {final_positions}")
-            print(f"[MOTOR]    Errors:  {errors}")
+            motor_events.record(
+                WARNING, "MOTOR", "verify_timeout",
+                "⚠️ Position verification timeout ({timeout}s), max error {max_error} units (tolerance: {tolerance})",
+                timeout=timeout, max_error=max_error, tolerance=self.POSITION_TOLERANCE,
+                target=list(target_positions), current=final_positions, errors=errors, arm=self.arm_index,
+            )
             return False, final_positions
         
         return False, []
@@ -214,6 +268,14 @@ class MotorController:
                 except Exception:
                     print("[MOTOR] Using resilient bus wrapper")
 
+            if self.io_service is not None and bus is not None:
+                try:
+                    hub = (get_arm_config(self.config, self.arm_index, "robot") or {}).get("usb_hub")
+                    bus = self.io_service.attach(self.port, bus, hub=hub)
+                except Exception:
+                    bus.disconnect()
+                    raise
+
             self.bus = bus
             _PORT_OWNERS[self.port] = self
             return True
@@ -223,6 +285,8 @@ class MotorController:
     
     def disconnect(self):
         """Disconnect from motor bus"""
+        if self.motion_model:
+            self.motion_model.save()
         if self.bus:
             try:
                 self.bus.disconnect()
@@ -235,14 +299,289 @@ class MotorController:
         except Exception:
             pass
     
-    def set_positions(self, positions: list[int], velocity: int = 600, wait: bool = True, keep_connection: bool = False):
-        """Set motor positions with velocity and position verification (Option D - Hybrid Approach)
+    def await_move_complete(self, target_positions: list[int], velocity: int, timeout: float,
+                            settle_tail: float = 0.0, motion_start: float = None, blend_radius: int = None,
+                            samples: list = None):
+        """Poll until every joint is within tolerance and stopped (event-driven completion)
+        
+        Each poll is one bulk read of Present_Position plus the servos' Moving
+        flags. The interval is half the estimated time left at ``velocity``,
+        clamped to COMPLETION_POLL_MIN..COMPLETION_POLL_MAX, so polling speeds
+        up as the arm closes in. Without Moving flags, "stopped" means two
+        consecutive samples within 2 units.
+        
+        With ``blend_radius`` the wait ends as soon as every joint is within
+        that many units of the target, still moving or not, so the caller can
+        stream the next waypoint without the arm stopping.
+        
+        Args:
+            target_positions: List of 6 target positions
+            velocity: Effective velocity of the move (units/s), for the poll rate
+            timeout: Maximum time to wait, measured from ``motion_start``
+            settle_tail: Seconds the arm must stay in tolerance and stopped
+            motion_start: perf_counter() of the goal write (defaults to now)
+            blend_radius: Pass-through radius in position units (None = full stop)
+            samples: Optional list that receives every ``(perf_counter, positions)`` read
+        
+        Returns:
+            (success, final_positions, arrived_at) - ``arrived_at`` is the
+            perf_counter() of the first settled (or in-zone) sample, or None
+        """
+        if not self.bus:
+            motor_events.record(WARNING, "MOTOR", "verify_no_bus", "⚠️ Cannot verify - no bus connection")
+            return False, [], None
+        
+        motion_start = time.perf_counter() if motion_start is None else motion_start
+        deadline = motion_start + timeout
+        velocity = max(1, velocity)
+        arrived_at = None
+        last_positions = None
+        positions = []
+        
+        while True:
+            positions, moving = self._read_motion_state()
+            now = time.perf_counter()
+            interval = self.COMPLETION_POLL_MIN
+            if positions:
+                if samples is not None:
+                    samples.append((now, positions))
+                max_error = max(abs(positions[i] - target_positions[i]) for i in range(6))
+                if moving is None:
+                    moving = last_positions is None or any(
+                        abs(positions[i] - last_positions[i]) > 2 for i in range(6)
+                    )
+                last_positions = positions
+                if blend_radius and max_error <= blend_radius:
+                    motor_events.record(
+                        DEBUG, "MOTOR", "blend_zone_entered",
+                        "Blend zone entered after {elapsed:.2f}s (max error: {max_error} units, radius {radius})",
+                        elapsed=now - motion_start, max_error=max_error, radius=blend_radius, arm=self.arm_index,
+                    )
+                    return True, positions, now
+                if not blend_radius and max_error <= self.POSITION_TOLERANCE and not moving:
+                    arrived_at = arrived_at or now
+                    if now - arrived_at >= settle_tail:
+                        motor_events.record(
+                            INFO, "MOTOR", "position_reached",
+                            "✓ Position reached in {elapsed:.2f}s (max error: {max_error} units)",
+                            elapsed=now - motion_start, max_error=max_error, arm=self.arm_index,
+                        )
+                        return True, positions, arrived_at
+                else:
+                    arrived_at = None
+                    remaining = max_error - (blend_radius or 0)
+                    interval = min(self.COMPLETION_POLL_MAX,
+                                   max(self.COMPLETION_POLL_MIN, 0.5 * remaining / velocity))
+            
+            if now >= deadline:
+                break
+            if self._stop_event.wait(min(interval, max(0.0, deadline - now))):
+                motor_events.record(
+                    INFO, "MOTOR", "verify_cancelled", "Position verification cancelled by emergency stop",
+                    arm=self.arm_index,
+                )
+                return False, positions, None
+        
+        errors = [abs(positions[i] - target_positions[i]) for i in range(6)] if positions else []
+        motor_events.record(
+            WARNING, "MOTOR", "verify_timeout",
+            "⚠️ Position verification timeout ({timeout}s), max error {max_error} units (tolerance: {tolerance})",
+            timeout=round(timeout, 2), max_error=max(errors) if errors else None, tolerance=self.POSITION_TOLERANCE,
+            target=list(target_positions), current=positions, errors=errors, arm=self.arm_index,
+        )
+        return False, positions, None
+    
+    def _read_motion_state(self):
+        """One bulk position read plus the Moving flags (None when unavailable)
+        
+        Returns:
+            (positions, moving) - positions is [] when the read failed
+        """
+        try:
+            present = self._sync_read(self.bus, "Present_Position")
+            positions = [int(present[name]) for name in self.motor_names]
+        except Exception as e:
+            motor_events.record(
+                DEBUG, "MOTOR", "bulk_read_failed", "Bulk position read failed: {error}",
+                error=str(e), arm=self.arm_index,
+            )
+            return [], None
+        
+        # Stop asking for Moving after repeated failures (bus or firmware without it)
+        if self._moving_flag_failures >= 3:
+            return positions, None
+        try:
+            flags = self._sync_read(self.bus, "Moving")
+            moving = any(int(flags[name]) for name in self.motor_names)
+            self._moving_flag_failures = 0
+            return positions, moving
+        except Exception as e:
+            self._moving_flag_failures += 1
+            if self._moving_flag_failures >= 3:
+                motor_events.record(
+                    INFO, "MOTOR", "moving_flag_unavailable",
+                    "Moving flag unreadable ({error}); detecting stops from position changes",
+                    error=str(e), arm=self.arm_index,
+                )
+            return positions, None
+    
+    def check_hold(self, target: list[int], tolerance: int = None):
+        """One hold check: bulk-read position, Moving and Torque_Enable
+        
+        Returns:
+            (positions, reason) - reason is why the goal should be re-asserted
+            ("read_failed", "torque_off" or "drift") or None while it holds.
+            Drift only counts once the servos have stopped moving.
+        """
+        tolerance = self.POSITION_TOLERANCE if tolerance is None else tolerance
+        positions, moving = self._read_motion_state()
+        if not positions:
+            return [], "read_failed"
+        try:
+            torque = self._sync_read(self.bus, "Torque_Enable")
+            # A servo that browned out and rebooted comes back with torque off
+            if not all(int(torque[name]) for name in self.motor_names):
+                return positions, "torque_off"
+        except Exception:
+            pass  # Torque state unknown; position drift still catches a limp joint
+        if not moving and max(abs(p - t) for p, t in zip(positions, target)) > tolerance:
+            return positions, "drift"
+        return positions, None
+    
+    def assert_goal(self, target: list[int], reason: str = None) -> bool:
+        """Write ``target`` as the goal in one bulk write
+        
+        Torque is (re-)enabled first unless ``reason`` is "drift", i.e. the
+        servos are known to still be powered and holding. Nothing is written
+        (and False returned) while an emergency stop is latched.
+        """
+        goal = {name: int(target[idx]) for idx, name in enumerate(self.motor_names)}
+        try:
+            if reason != "drift":
+                # Enabling torque latches the present pose, so the goal goes after it
+                if not self._unless_stopped(
+                    lambda bus: self._sync_write(bus, "Torque_Enable", dict.fromkeys(self.motor_names, 1))
+                ):
+                    return False
+            return self._unless_stopped(lambda bus: self._sync_write(bus, "Goal_Position", goal))
+        except Exception as e:
+            motor_events.record(
+                WARNING, "MOTOR", "hold_write_failed", "Hold goal write failed on arm {arm} ({error})",
+                arm=self.arm_index, error=str(e),
+            )
+            return False
+    
+    def hold_position(self, duration: float, target: list[int] = None, should_stop=None,
+                      mode: str = None) -> dict:
+        """Hold the arm at ``target`` (default: where it is now) for ``duration`` seconds
+        
+        In "smart" mode the goal is written once; after that the bus only sees
+        a bulk read every ``hold_check_interval`` and a goal write when
+        :meth:`check_hold` reports drift, torque loss or a reset. "resend"
+        keeps the original behaviour of rewriting the goal every 100 ms (plus
+        the same checks, so both modes report a comparable hold error).
+        
+        Args:
+            should_stop: Optional callable; the hold ends early when it returns True
+            mode: "smart" or "resend" (default: control.hold_mode)
+        
+        Returns:
+            Stats dict (mode, target, max_error, reasserts, bus_occupancy, held_s),
+            or None if the present position could not be read or an emergency
+            stop is latched (a hold never re-enables torque after a stop)
+        """
+        mode = mode or self.hold_mode
+        if self._stop_event.is_set():
+            return None
+        start = time.perf_counter()
+        busy = 0.0
+        
+        if target is None:
+            target = self.read_positions_from_bus()
+            busy += time.perf_counter() - start
+            if not target:
+                return None
+        target = [int(p) for p in target]
+        
+        t0 = time.perf_counter()
+        self.assert_goal(target, "start")
+        busy += time.perf_counter() - t0
+        
+        max_error = 0
+        reasserts = 0
+        next_check = next_resend = start + self.HOLD_RESEND_INTERVAL
+        deadline = start + duration
+        while True:
+            now = time.perf_counter()
+            if now >= deadline or self._stop_event.is_set() or (should_stop and should_stop()):
+                break
+            if mode == "resend" and now >= next_resend:
+                t0 = time.perf_counter()
+                try:
+                    for idx, name in enumerate(self.motor_names):
+                        self.bus.write("Goal_Position", name, target[idx], normalize=False)
+                except Exception as e:
+                    motor_events.record(
+                        WARNING, "MOTOR", "hold_write_failed", "Hold goal write failed on arm {arm} ({error})",
+                        arm=self.arm_index, error=str(e),
+                    )
+                busy += time.perf_counter() - t0
+                next_resend = now + self.HOLD_RESEND_INTERVAL
+            if now >= next_check:
+                t0 = time.perf_counter()
+                positions, reason = self.check_hold(target)
+                if positions:
+                    max_error = max(max_error, max(abs(p - t) for p, t in zip(positions, target)))
+                if reason and mode != "resend":
+                    reasserts += 1
+                    motor_events.record(
+                        INFO, "MOTOR", "hold_reassert", "Re-asserting hold goal on arm {arm} ({reason})",
+                        arm=self.arm_index, reason=reason,
+                    )
+                    self.assert_goal(target, reason)
+                busy += time.perf_counter() - t0
+                next_check = now + self.hold_check_interval
+            # Short sleeps so should_stop() is noticed promptly; they cost no bus time
+            wake = min(next_check, next_resend if mode == "resend" else deadline, deadline)
+            self._stop_event.wait(max(0.0, min(wake - time.perf_counter(), 0.05)))
+        
+        held = time.perf_counter() - start
+        stats = {
+            "mode": mode,
+            "target": target,
+            "max_error": max_error,
+            "reasserts": reasserts,
+            "bus_occupancy": busy / held if held > 0 else 0.0,
+            "held_s": held,
+        }
+        motor_events.record(
+            INFO, "MOTOR", "hold_complete",
+            "Held arm {arm} for {held_s:.1f}s ({mode}): max error {max_error} units, "
+            "{reasserts} re-asserts, bus busy {occupancy:.1%}",
+            arm=self.arm_index, held_s=held, mode=mode, max_error=max_error,
+            reasserts=reasserts, occupancy=stats["bus_occupancy"],
+        )
+        return stats
+    
+    def set_positions(self, positions: list[int], velocity: int = 600, wait: bool = True, keep_connection: bool = False,
+                      settle_tail: float = None, blend_radius: int = None, scale_velocity: bool = True):
+        """Set motor positions with velocity and position verification
         
         Args:
             positions: List of 6 motor positions
             velocity: Movement velocity (0-4000)
             wait: If True, wait for movement to complete with verification
             keep_connection: If True, keep bus connected (for smooth sequences)
+            settle_tail: Seconds the arm must stay in tolerance and stopped before
+                the move counts as complete (default: control.settle_tail_s)
+            blend_radius: With wait=True, return once every joint is within this
+                many units instead of waiting for the arm to stop
+            scale_velocity: Apply speed_multiplier to ``velocity``; False when the
+                caller already did (retimed live playback)
+        
+        Returns:
+            True if the move was confirmed (or sent, with wait=False); False if it
+            was cancelled by an emergency stop or could not be verified
         """
         if not MOTOR_CONTROL_AVAILABLE:
             raise RuntimeError("Motor control not available")
@@ -250,6 +589,10 @@ class MotorController:
         if len(positions) != 6:
             raise ValueError(f"Expected 6 positions, got {len(positions)}")
         
+        # A latched emergency stop refuses new moves until rearm()
+        if self._stop_event.is_set():
+            motor_events.record(INFO, "MOTOR", "move_refused", "Move refused: emergency stop is latched", arm=self.arm_index)
+            return False
         connected_locally = False
         if not self.bus:
             if not self.connect():
@@ -260,22 +603,35 @@ class MotorController:
             # Read current positions to calculate actual move distance
             current_positions = self.read_positions_from_bus()
             
-            # Enable torque (always keep on for smooth sequences)
-            for name in self.motor_names:
-                self.bus.write("Torque_Enable", name, 1, normalize=False)
-
-            effective_velocity = max(1, min(4000, int(velocity * self.speed_multiplier)))
+            multiplier = self.speed_multiplier if scale_velocity else 1.0
+            effective_velocity = max(1, min(4000, int(velocity * multiplier)))
             effective_acceleration = min(int(effective_velocity / 4000 * 255), 255)
 
+            # Enable torque (always keep on for smooth sequences), then the profile.
+            # Every write is checked against the stop latch, so a stop that lands
+            # mid-setup is never overwritten by the rest of the setup
+            setup = [("Torque_Enable", name, 1) for name in self.motor_names]
             for name in self.motor_names:
-                self.bus.write("Goal_Velocity", name, effective_velocity, normalize=False)
-                self.bus.write("Acceleration", name, effective_acceleration, normalize=False)
-            print(f"[MOTOR] Velocity scale applied: base={velocity}, multiplier={self.speed_multiplier:.2f}, "
-                  f"effective={effective_velocity}, acceleration={effective_acceleration}")
+                setup += [("Goal_Velocity", name, effective_velocity), ("Acceleration", name, effective_acceleration)]
+            for register, name, value in setup:
+                if not self._write_unless_stopped(register, name, value):
+                    motor_events.record(INFO, "MOTOR", "move_cancelled", "Move cancelled by emergency stop", arm=self.arm_index)
+                    return False
+            motor_events.record(
+                DEBUG, "MOTOR", "velocity_scale",
+                "Velocity scale applied: base={base}, multiplier={multiplier:.2f}, "
+                "effective={effective}, acceleration={acceleration}",
+                base=velocity, multiplier=multiplier,
+                effective=effective_velocity, acceleration=effective_acceleration,
+            )
             
             # Set goal positions
+            latency_trace.stage("first_bus_write", "motor", once_per_step=True, arm=self.arm_index)
+            motion_start = time.perf_counter()
             for idx, name in enumerate(self.motor_names):
-                self.bus.write("Goal_Position", name, positions[idx], normalize=False)
+                if not self._write_unless_stopped("Goal_Position", name, positions[idx]):
+                    motor_events.record(INFO, "MOTOR", "move_cancelled", "Move cancelled by emergency stop", arm=self.arm_index)
+                    return False
             
             # Wait for movement if requested
             if wait:
@@ -284,10 +640,13 @@ class MotorController:
                 if current_positions:
                     distances = [abs(positions[i] - current_positions[i]) for i in range(6)]
                     max_distance = max(distances) if distances else 500
-                    print(f"[MOTOR] 📏 Move distance: {max_distance} units (max across all motors)")
+                    motor_events.record(
+                        DEBUG, "MOTOR", "move_distance",
+                        "📏 Move distance: {distance} units (max across all motors)", distance=max_distance,
+                    )
                 else:
                     max_distance = 500  # Fallback if can't read current position
-                    print(f"[MOTOR] ⚠️ Couldn't read current position, using estimate")
+                    motor_events.record(WARNING, "MOTOR", "move_distance_estimate", "⚠️ Couldn't read current position, using estimate")
                 
                 # 2. Calculate movement time with proper acceleration consideration
                 # For STS3215: position units are 0-4095, velocity in units/sec
@@ -299,36 +658,279 @@ class MotorController:
                     total_time = base_time + accel_time
                 else:
                     total_time = 3.0  # Fallback
+                estimate_source = "formula"
+                # Once every joint in the move has been observed, the learned profiles replace the guess
+                if self.motion_model and current_positions and self.motion_model.ready(current_positions, positions):
+                    total_time = self.motion_model.predict(
+                        current_positions, positions, effective_velocity, effective_acceleration
+                    )
+                    estimate_source = "model"
+                
+                # Blending needs position feedback, so it always uses the event-driven wait
+                if blend_radius or self.move_completion != "timed":
+                    tail = self.settle_tail if settle_tail is None else max(0.0, float(settle_tail))
+                    return self._wait_event_driven(
+                        positions, effective_velocity, total_time, tail, motion_start, blend_radius,
+                        start_positions=current_positions, acceleration=effective_acceleration,
+                        estimate_source=estimate_source,
+                    )
                 
                 # 3. Wait for 80% of estimated time (let most of move complete)
                 wait_time = total_time * 0.8
-                print(f"[MOTOR] ⏱️ Estimated move time: {total_time:.2f}s, waiting {wait_time:.2f}s before verification")
-                time.sleep(wait_time)
+                motor_events.record(
+                    DEBUG, "MOTOR", "move_time",
+                    "⏱️ Estimated move time: {total:.2f}s, waiting {wait:.2f}s before verification",
+                    total=total_time, wait=wait_time,
+                )
+                with latency_trace.span("move_wait", "motor", estimate_s=round(total_time, 3)):
+                    stopped = self._stop_event.wait(wait_time)
+                settle_start = time.perf_counter()
+                cycle_metrics.add("motion", settle_start - motion_start)
+                if stopped:
+                    motor_events.record(INFO, "MOTOR", "move_cancelled", "Move cancelled by emergency stop", arm=self.arm_index)
+                    return False
                 
                 # 4. Poll position feedback until stable or timeout
                 verification_timeout = max(2.0, total_time * 0.5)  # At least 2s for verification
-                success, final_positions = self.verify_position_reached(positions, timeout=verification_timeout)
+                with latency_trace.span("position_verified", "motor", arm=self.arm_index) as trace_args:
+                    success, final_positions = self.verify_position_reached(positions, timeout=verification_timeout)
+                    trace_args["success"] = success
+                cycle_metrics.add("settle", time.perf_counter() - settle_start)
                 
                 if not success:
-                    print(f"[MOTOR] ⚠️ Position verification failed - motors may not have reached target")
+                    motor_events.record(
+                        WARNING, "MOTOR", "verify_failed",
+                        "⚠️ Position verification failed - motors may not have reached target",
+                    )
                     # Don't raise error, just warn - sometimes acceptable in loose control
+                return success
+            return True
             
         finally:
             # Only disconnect if we connected locally AND not keeping connection
             if connected_locally and not keep_connection:
                 self.disconnect()
     
-    def move_to_position(self, positions: list[int], velocity: int = 600, wait: bool = True, keep_connection: bool = False):
+    def _wait_event_driven(self, positions: list[int], velocity: int, estimate: float, tail: float,
+                           motion_start: float, blend_radius: int = None, start_positions: list[int] = None,
+                           acceleration: int = 0, estimate_source: str = "formula") -> bool:
+        """Wait for a move with await_move_complete() and account motion/settle/saved time
+        
+        Full stops also feed the motion model and log how far off the estimate was.
+        """
+        timeout = estimate + max(2.0, estimate * 0.5)
+        mode = "blend" if blend_radius else "event"
+        samples = [] if self.motion_model and start_positions and not blend_radius else None
+        with latency_trace.span("position_verified", "motor", arm=self.arm_index, mode=mode) as trace_args:
+            success, _, arrived_at = self.await_move_complete(
+                positions, velocity, timeout, settle_tail=tail, motion_start=motion_start, blend_radius=blend_radius,
+                samples=samples,
+            )
+            trace_args["success"] = success
+        done = time.perf_counter()
+        if self._stop_event.is_set():
+            cycle_metrics.add("motion", done - motion_start)
+            motor_events.record(INFO, "MOTOR", "move_cancelled", "Move cancelled by emergency stop", arm=self.arm_index)
+            return False
+        if not success:
+            cycle_metrics.add("motion", done - motion_start)
+            motor_events.record(
+                WARNING, "MOTOR", "verify_failed",
+                "⚠️ Position verification failed - motors may not have reached target",
+            )
+            return False
+        if blend_radius:
+            # Pass-through waypoint: no settling, the next goal follows immediately
+            cycle_metrics.add("motion", done - motion_start)
+            return True
+        
+        cycle_metrics.add("motion", arrived_at - motion_start)
+        cycle_metrics.add("settle", done - arrived_at)
+        if samples is not None:
+            self._learn_move(start_positions, positions, velocity, acceleration, motion_start, samples,
+                             estimate, estimate_source, arrived_at - motion_start)
+        # The timed path sleeps 80% of the estimate, then needs one in-tolerance
+        # sample, a second unchanged one and POSITION_STABLE_TIME on top
+        # (about half a poll of phase on average)
+        timed_done = max(estimate * 0.8, arrived_at - motion_start) + 1.5 * self.POLL_INTERVAL + self.POSITION_STABLE_TIME
+        saved = timed_done - (done - motion_start)
+        cycle_metrics.add("settle_saved", saved)
+        motor_events.record(
+            DEBUG, "MOTOR", "move_complete",
+            "Move complete in {elapsed:.3f}s (estimate {estimate:.2f}s, tail {tail:.2f}s, saved {saved:+.3f}s)",
+            elapsed=done - motion_start, estimate=estimate, tail=tail, saved=saved, arm=self.arm_index,
+        )
+        return True
+
+    def _learn_move(self, start: list[int], target: list[int], velocity: int, acceleration: int,
+                    motion_start: float, samples: list, estimate: float, source: str, actual: float):
+        """Update the motion model from a verified stop and log the prediction error"""
+        model = self.motion_model
+        if source == "model":
+            model.record_error(estimate, actual)
+        self.last_move = {"predicted_s": estimate, "actual_s": actual, "source": source}
+        motor_events.record(
+            DEBUG, "MOTOR", "move_prediction",
+            "Move time {estimate_source} estimate {predicted:.3f}s, arrived after {actual:.3f}s ({error_ms:+.0f} ms)",
+            estimate_source=source, predicted=estimate, actual=actual, error_ms=(actual - estimate) * 1000.0,
+            mean_abs_error_ms=model.mean_abs_error * 1000.0, arm=self.arm_index,
+        )
+        model.observe(start, target, velocity, acceleration, motion_start, samples, self.POSITION_TOLERANCE)
+    
+    def predict_move_time(self, target: list[int], velocity: int = 600, start: list[int] = None) -> float:
+        """Seconds a move to ``target`` should take, for scheduling around it
+        
+        Uses the learned motion model where it covers every moving joint,
+        otherwise the nominal trapezoid for the commanded velocity and
+        acceleration. ``start`` defaults to the last position read from the
+        bus. Velocity is scaled like set_positions().
+        """
+        start = start or getattr(self, "_last_positions", None) or self.read_positions_from_bus()
+        effective_velocity = max(1, min(4000, int(velocity * self.speed_multiplier)))
+        acceleration = min(int(effective_velocity / 4000 * 255), 255)
+        if not start:
+            return 500 / effective_velocity + 0.4 * (1.0 - acceleration / 255.0)
+        if self.motion_model and self.motion_model.ready(start, target):
+            return self.motion_model.predict(start, target, effective_velocity, acceleration)
+        max_distance = max(abs(t - s) for s, t in zip(start, target))
+        return profile_time(max_distance, effective_velocity, commanded_acceleration(acceleration))
+
+    def command_move(self, positions: list[int], velocity: int = 600) -> float:
+        """Start a move with four bulk writes and return its perf_counter() start
+
+        Torque, velocity, acceleration and goal each go out as one sync write
+        (set_positions() spends 24 single writes on the same). Nothing waits
+        or verifies; for callers that coordinate several arms themselves.
+        Velocity is scaled like set_positions(). Returns None, with nothing
+        (more) written, when an emergency stop is latched.
+        """
+        if len(positions) != 6:
+            raise ValueError(f"Expected 6 positions, got {len(positions)}")
+        effective_velocity = max(1, min(4000, int(velocity * self.speed_multiplier)))
+        acceleration = min(int(effective_velocity / 4000 * 255), 255)
+        writes = [
+            ("Torque_Enable", dict.fromkeys(self.motor_names, 1)),
+            ("Goal_Velocity", dict.fromkeys(self.motor_names, effective_velocity)),
+            ("Acceleration", dict.fromkeys(self.motor_names, acceleration)),
+            ("Goal_Position", {name: int(positions[idx]) for idx, name in enumerate(self.motor_names)}),
+        ]
+        motion_start = None
+        for register, values in writes:
+            motion_start = time.perf_counter()
+            if not self._unless_stopped(lambda bus, register=register, values=values:
+                                        self._sync_write(bus, register, values)):
+                return None
+        return motion_start
+
+    def move_to_position(self, positions: list[int], velocity: int = 600, wait: bool = True, keep_connection: bool = False,
+                         settle_tail: float = None, blend_radius: int = None):
         """Alias for set_positions (more descriptive name)"""
-        self.set_positions(positions, velocity, wait, keep_connection)
+        return self.set_positions(positions, velocity, wait, keep_connection,
+                                  settle_tail=settle_tail, blend_radius=blend_radius)
     
-    def emergency_stop(self):
-        """Emergency stop - disable all motor torque"""
-        if not self.bus:
-            return
+    def request_stop(self):
+        """Cancel any in-progress move wait or verification without touching the bus
+
+        Like emergency_stop(), this latches: moves and holds are refused until rearm().
+        """
+        self._stop_event.set()
+
+    def rearm(self):
+        """Clear a latched stop so the arm accepts commands again
+
+        Only explicit operator actions (starting a run, playback or homing)
+        re-arm; a new command never clears a stop by itself.
+        """
+        self._stop_event.clear()
+
+    def _unless_stopped(self, fn) -> bool:
+        """Run ``fn(bus)`` unless a stop is latched; returns False if it was
+
+        The latch check and the write form one transaction with respect to
+        emergency_stop(): on a MotorIOService port both run inside a single
+        queued request (the stop is its own, higher-priority request), on a
+        direct ResilientMotorBus under its I/O lock. A stop therefore lands
+        either before the check or after the write, never in between.
+        """
+        def guarded(bus):
+            if self._stop_event.is_set():
+                return False
+            fn(bus)
+            return True
+
+        if isinstance(self.bus, PortClient):
+            return self.bus.call(guarded)
+        lock = getattr(self.bus, "io_lock", None)
+        with lock if lock is not None else contextlib.nullcontext():
+            return guarded(self.bus)
+
+    def _write_unless_stopped(self, register: str, name: str, value) -> bool:
+        return self._unless_stopped(lambda bus: bus.write(register, name, value, normalize=False))
+
+    @property
+    def stop_requested(self) -> bool:
+        return self._stop_event.is_set()
+
+    def emergency_stop(self, mode: str = None):
+        """Emergency stop - cancel the current move and stop all motors with one bus write
+        
+        Safe to call from any thread while set_positions() is running: the
+        move wait and verification loop wake up immediately and the stop
+        packet only waits for the bus transaction already on the line.
+        
+        Args:
+            mode: "torque_off" (default) disables torque; "hold" freezes the
+                arm at its present position with torque on. Defaults to
+                config["safety"]["estop_mode"].
+        
+        Returns:
+            Milliseconds from the stop request to the completed bus write,
+            or None if there was no bus to write to.
+        """
+        requested = time.perf_counter()
+        self._stop_event.set()
+        bus = self.bus
+        if not bus:
+            return None
         
+        mode = mode or self.config.get("safety", {}).get("estop_mode", "torque_off")
         try:
+            if mode == "hold":
+                present = self._sync_read(bus, "Present_Position")
+                self._sync_write(bus, "Goal_Position", {name: int(pos) for name, pos in present.items()})
+            else:
+                self._sync_write(bus, "Torque_Enable", dict.fromkeys(self.motor_names, 0))
+        except Exception as exc:
+            motor_events.record(
+                ERROR, "ESTOP", "broadcast_failed",
+                "Broadcast stop failed on arm {arm} ({error}); writing motors one by one",
+                arm=self.arm_index, error=str(exc),
+            )
             for name in self.motor_names:
-                self.bus.write("Torque_Enable", name, 0, normalize=False)
-        except:
-            pass
+                try:
+                    bus.write("Torque_Enable", name, 0, normalize=False)
+                except Exception:
+                    pass
+        
+        latency_ms = (time.perf_counter() - requested) * 1000.0
+        self.last_stop_latency_ms = latency_ms
+        motor_events.record(
+            WARNING, "ESTOP", "stopped",
+            "Emergency stop ({mode}) on arm {arm}: bus write after {latency_ms:.1f} ms",
+            mode=mode, arm=self.arm_index, latency_ms=latency_ms,
+        )
+        return latency_ms
+
+    def _sync_write(self, bus, register: str, values: dict):
+        sync_write = getattr(bus, "sync_write", None)
+        if sync_write is None:
+            for name, value in values.items():
+                bus.write(register, name, value, normalize=False)
+        else:
+            sync_write(register, values, normalize=False)
+
+    def _sync_read(self, bus, register: str) -> dict:
+        sync_read = getattr(bus, "sync_read", None)
+        if sync_read is None:
+            return {name: bus.read(register, name, normalize=False) for name in self.motor_names}
+        return dict(sync_read(register, self.motor_names, normalize=False))
@@ -0,0 +1,359 @@
+"""
+Structured motor event log backed by an in-memory ring buffer.
+
+Motor hot paths (``MotorController.set_positions``, position verification,
+``ResilientMotorBus`` retries, live recording) used to ``print`` on every
+point.  At 20 Hz across several arms those writes were a measurable part of
+the control loop and blocked whenever the launching terminal was slow.
+
+They now call :func:`record`, which stores an unformatted event in a
+fixed-size ring: no lock, no string formatting, no I/O.  Each slot carries its
+own sequence number, so readers detect slots that were overwritten while
+they were behind (CPython makes the single slot assignment atomic).
+
+A :class:`MotorEventDrain` thread (started by the application entry points
+via :func:`start_drain`, never as a side effect of opening a bus; tests and
+benchmarks therefore leave no log files) reads the ring in the background, formats
+events and writes them to a rotating file (``runtime/logs/motor_events.log``)
+and, above a higher threshold, to the console with the familiar ``[MOTOR]``
+prefix.  Repetitive events are sampled per ``(source, event)`` key: a short
+burst is kept per window and the rest are summarised as one line.  The
+Diagnostics tab reads recent events straight from the ring.
+
+Settings live in the optional ``motor_events`` config block::
+
+    "motor_events": {
+        "ring_level": "debug",
+        "file_level": "info",
+        "console_level": "warning",
+        "sample_window_s": 5.0,
+        "sample_burst": 5,
+        "max_bytes": 1048576,
+        "backup_count": 3
+    }
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import threading
+import time
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from utils.logging_utils import log_exception
+from utils.safe_print import safe_print
+
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARNING = logging.WARNING
+ERROR = logging.ERROR
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_LOG_PATH = ROOT / "runtime" / "logs" / "motor_events.log"
+
+
+def level_value(level) -> int:
+    """Accept ``"warning"``/``logging.WARNING`` style levels."""
+    if isinstance(level, int):
+        return level
+    return getattr(logging, str(level or "info").upper(), INFO)
+
+
+class MotorEvent(NamedTuple):
+    seq: int
+    timestamp: float
+    level: int
+    source: str
+    event: str
+    message: str
+    fields: Optional[Dict[str, object]]
+
+    @property
+    def level_name(self) -> str:
+        return logging.getLevelName(self.level)
+
+    def text(self) -> str:
+        """Message with ``{field}`` placeholders filled in (done off the hot path)."""
+        if not self.fields:
+            return self.message
+        try:
+            return self.message.format(**self.fields)
+        except (KeyError, IndexError, ValueError):
+            return f"{self.message} {self.fields}"
+
+
+class MotorEventRing:
+    """Fixed-size, overwrite-oldest ring of :class:`MotorEvent`."""
+
+    def __init__(self, capacity: int = 4096) -> None:
+        size = 1
+        while size < max(16, int(capacity)):
+            size <<= 1
+        self.capacity = size
+        self._mask = size - 1
+        self._slots: List[Optional[MotorEvent]] = [None] * size
+        # next() on itertools.count is atomic under the GIL, so writers never collide
+        self._counter = itertools.count()
+        self._head = 0  # hint: one past the newest published sequence
+        self.min_level = DEBUG
+
+    def append(
+        self,
+        level: int,
+        source: str,
+        event: str,
+        message: str,
+        fields: Optional[Dict[str, object]] = None,
+    ) -> int:
+        seq = next(self._counter)
+        self._slots[seq & self._mask] = MotorEvent(seq, time.time(), level, source, event, message, fields)
+        if seq >= self._head:
+            self._head = seq + 1
+        return seq
+
+    @property
+    def head(self) -> int:
+        return self._head
+
+    def since(self, cursor: int) -> Tuple[List[MotorEvent], int, int]:
+        """
+        Events from sequence ``cursor`` onwards.
+
+        Returns ``(events, next_cursor, missed)`` where ``missed`` counts
+        events that were overwritten before this reader got to them.
+        """
+        head = self._head
+        missed = 0
+        oldest = head - self.capacity
+        if cursor < oldest:
+            missed = oldest - cursor
+            cursor = oldest
+        events: List[MotorEvent] = []
+        while cursor < head:
+            entry = self._slots[cursor & self._mask]
+            if entry is None or entry.seq < cursor:
+                break  # Claimed but not yet published; pick it up next time
+            if entry.seq > cursor:
+                # Lapped while reading; skip ahead to what is still there
+                missed += entry.seq - cursor
+                cursor = entry.seq
+            events.append(entry)
+            cursor += 1
+        return events, cursor, missed
+
+    def recent(self, limit: int = 200, min_level: int = DEBUG) -> List[MotorEvent]:
+        """Newest ``limit`` events at or above ``min_level``, oldest first."""
+        events, _, _ = self.since(max(0, self._head - self.capacity))
+        if min_level > DEBUG:
+            events = [event for event in events if event.level >= min_level]
+        return events[-limit:] if limit else events
+
+
+motor_event_ring = MotorEventRing()
+
+
+def record(level: int, source: str, event: str, message: str, **fields) -> None:
+    """Hot-path entry point: store one structured event, nothing else."""
+    if level < motor_event_ring.min_level:
+        return
+    motor_event_ring.append(level, source, event, message, fields or None)
+
+
+class RepeatSampler:
+    """Keep the first ``burst`` events per key in each ``window`` seconds."""
+
+    def __init__(self, window: float = 5.0, burst: int = 5) -> None:
+        self.window = float(window)
+        self.burst = int(burst)
+        self._windows: Dict[Tuple[str, str], List] = {}  # key -> [window_start, seen, suppressed]
+
+    def allow(self, event: MotorEvent) -> bool:
+        if self.burst <= 0 or self.window <= 0:
+            return True
+        key = (event.source, event.event)
+        state = self._windows.get(key)
+        if state is None or event.timestamp - state[0] >= self.window:
+            state = [event.timestamp, 0, state[2] if state else 0]
+            self._windows[key] = state
+        state[1] += 1
+        if state[1] <= self.burst:
+            return True
+        state[2] += 1
+        return False
+
+    def take_suppressed(self, now: float, force: bool = False) -> List[Tuple[str, str, int]]:
+        """``(source, event, count)`` for keys whose window closed with suppressed events."""
+        summaries = []
+        for key, state in list(self._windows.items()):
+            if not force and now - state[0] < self.window:
+                continue
+            if state[2]:
+                summaries.append((key[0], key[1], state[2]))
+            del self._windows[key]
+        return summaries
+
+
+class MotorEventDrain:
+    """Background writer: ring -> rotating file (+ console for important events)."""
+
+    def __init__(
+        self,
+        ring: MotorEventRing = motor_event_ring,
+        path: Path = DEFAULT_LOG_PATH,
+        file_level=INFO,
+        console_level=WARNING,
+        sample_window_s: float = 5.0,
+        sample_burst: int = 5,
+        max_bytes: int = 1_048_576,
+        backup_count: int = 3,
+        interval: float = 0.5,
+    ) -> None:
+        self.ring = ring
+        self.path = Path(path)
+        self.file_level = level_value(file_level)
+        self.console_level = level_value(console_level)
+        self.sampler = RepeatSampler(sample_window_s, sample_burst)
+        self.max_bytes = int(max_bytes)
+        self.backup_count = int(backup_count)
+        self.interval = float(interval)
+        self._cursor = ring.head
+        self._handler: Optional[RotatingFileHandler] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="MotorEventDrain", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        self._stop.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+        self.drain(final=True)
+        if self._handler:
+            self._handler.close()
+            self._handler = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.drain()
+            except Exception as exc:  # pragma: no cover - must never kill the thread
+                log_exception("MotorEventDrain: drain failed", exc, level="warning")
+
+    def _file_handler(self) -> Optional[RotatingFileHandler]:
+        if self._handler is None:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._handler = RotatingFileHandler(
+                    self.path, maxBytes=self.max_bytes, backupCount=self.backup_count, encoding="utf-8"
+                )
+            except OSError as exc:
+                log_exception(f"MotorEventDrain: cannot open {self.path}", exc, level="warning")
+                self.file_level = logging.CRITICAL + 1
+                return None
+        return self._handler
+
+    def _write(self, level: int, line: str) -> None:
+        if level >= self.file_level:
+            handler = self._file_handler()
+            if handler is not None:
+                handler.emit(logging.makeLogRecord({"msg": line, "levelno": level}))
+
+    @staticmethod
+    def format_event(event: MotorEvent) -> str:
+        stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(event.timestamp))
+        millis = int((event.timestamp % 1) * 1000)
+        line = f"{stamp}.{millis:03d} {event.level_name:<7} [{event.source}] {event.event}: {event.text()}"
+        if event.fields:
+            line += " " + json.dumps(event.fields, default=str, separators=(",", ":"))
+        return line
+
+    def drain(self, final: bool = False) -> int:
+        """Process everything published since the last call; returns events handled."""
+        events, self._cursor, missed = self.ring.since(self._cursor)
+        now = time.time()
+        if missed:
+            self._write(WARNING, f"{time.strftime('%Y-%m-%d %H:%M:%S')} WARNING [EVENTS] ring overrun: {missed} events lost")
+        threshold = min(self.file_level, self.console_level)
+        for event in events:
+            if event.level < threshold or not self.sampler.allow(event):
+                continue
+            self._write(event.level, self.format_event(event))
+            if event.level >= self.console_level:
+                safe_print(f"[{event.source}] {event.text()}", flush=False)
+        for source, name, count in self.sampler.take_suppressed(now, force=final):
+            self._write(INFO, f"{time.strftime('%Y-%m-%d %H:%M:%S')} INFO    [{source}] {name}: suppressed {count} similar events")
+        return len(events)
+
+
+_drain: Optional[MotorEventDrain] = None
+_drain_lock = threading.Lock()
+_settings: Dict[str, object] = {}
+
+
+def configure(config: Optional[dict]) -> None:
+    """Apply the ``motor_events`` config block (before or after the drain starts)."""
+    global _drain
+    settings = dict((config or {}).get("motor_events", {}) or {})
+    _settings.clear()
+    _settings.update(settings)
+    motor_event_ring.min_level = level_value(settings.get("ring_level", "debug"))
+    with _drain_lock:
+        if _drain is not None:
+            _drain.file_level = level_value(settings.get("file_level", "info"))
+            _drain.console_level = level_value(settings.get("console_level", "warning"))
+
+
+def start_drain() -> MotorEventDrain:
+    """Start the shared background drain (idempotent; cheap after the first call)."""
+    global _drain
+    if _drain is not None:
+        return _drain
+    with _drain_lock:
+        if _drain is None:
+            drain = MotorEventDrain(
+                path=Path(_settings.get("path", DEFAULT_LOG_PATH)),
+                file_level=_settings.get("file_level", "info"),
+                console_level=_settings.get("console_level", "warning"),
+                sample_window_s=float(_settings.get("sample_window_s", 5.0)),
+                sample_burst=int(_settings.get("sample_burst", 5)),
+                max_bytes=int(_settings.get("max_bytes", 1_048_576)),
+                backup_count=int(_settings.get("backup_count", 3)),
+            )
+            drain.start()
+            _drain = drain
+    return _drain
+
+
+def stop_drain() -> None:
+    global _drain
+    with _drain_lock:
+        drain, _drain = _drain, None
+    if drain is not None:
+        drain.stop()
+
+
+__all__ = [
+    "DEBUG",
+    "INFO",
+    "WARNING",
+    "ERROR",
+    "MotorEvent",
+    "MotorEventDrain",
+    "MotorEventRing",
+    "RepeatSampler",
+    "configure",
+    "motor_event_ring",
+    "record",
+    "start_drain",
+    "stop_drain",
+]
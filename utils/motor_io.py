@@ -0,0 +1,386 @@
+"""
+Motor I/O service - one scheduler for every serial port.
+
+Arms used to be driven by blocking bus calls on whichever thread owned them
+at the moment (execution QThreads, homing threads, one telemetry thread per
+``MotorHandle``), each serialised only by the bus's own lock.  Nothing could
+tell a stop packet from a telemetry poll, and nobody saw the whole station.
+
+:class:`MotorIOService` owns every open port instead.  Callers submit a
+request (a function of the bus) and get a :class:`concurrent.futures.Future`
+back; blocking callers simply wait on it, asyncio code can
+``await asyncio.wrap_future(...)``.  Per port the service keeps a queue
+ordered by
+
+1. priority (:data:`PRIORITY_ESTOP` < :data:`PRIORITY_MOTION` <
+   :data:`PRIORITY_TELEMETRY`), then
+2. deadline, earliest first, then submission order;
+
+a request whose deadline passes while it is still queued fails with
+``TimeoutError`` instead of delaying everything behind it, which is what
+periodic telemetry wants.  Ports attached with the same ``hub`` (arms on
+one USB hub) take turns per request, so their traffic never collides.
+
+Scheduling, deadlines and periodic jobs (:meth:`MotorIOService.every`) run
+on a single asyncio loop thread.  The Feetech SDK only offers blocking
+packet I/O, so each port executes its requests on exactly one dedicated I/O
+thread; the thread count is fixed at one per port no matter how many
+callers, pollers and subscribers an arm has, and ports run in parallel.
+
+:class:`PortClient` wraps a port in the ``read``/``write``/``sync_read``/
+``sync_write`` interface ``MotorController`` already uses, so the
+controller code is unchanged when its bus is a client.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import itertools
+import math
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from utils import motor_events
+from utils.motor_events import INFO
+
+PRIORITY_ESTOP = 0
+PRIORITY_MOTION = 10
+PRIORITY_TELEMETRY = 20
+
+_tls = threading.local()
+
+
+@dataclass
+class PortStats:
+    completed: int = 0
+    failed: int = 0
+    expired: int = 0
+    busy_s: float = 0.0
+    max_wait_s: float = 0.0
+    since: float = field(default_factory=time.perf_counter)
+
+    def as_dict(self, queued: int) -> dict:
+        elapsed = time.perf_counter() - self.since
+        return {
+            "queued": queued,
+            "completed": self.completed,
+            "failed": self.failed,
+            "expired": self.expired,
+            "occupancy": self.busy_s / elapsed if elapsed > 0 else 0.0,
+            "max_wait_ms": self.max_wait_s * 1000.0,
+        }
+
+
+@dataclass
+class _Request:
+    fn: Callable[[Any], Any]
+    future: concurrent.futures.Future
+    deadline: Optional[float]
+    submitted: float
+
+
+class _Port:
+    def __init__(self, name: str, bus: Any, hub_lock: Optional[threading.Lock] = None):
+        self.name = name
+        self.bus = bus
+        self.hub_lock = hub_lock
+        self.queue: Optional[asyncio.PriorityQueue] = None
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"MotorIO-{name}",
+            initializer=setattr, initargs=(_tls, "port", name),
+        )
+        self.stats = PortStats()
+        self.consumer: Optional[asyncio.Task] = None
+        self.jobs: set = set()
+        self.closed = False
+
+
+class MotorIOService:
+    """Process-wide owner of the open motor ports (see module docstring)."""
+
+    _instance: Optional["MotorIOService"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._ports: Dict[str, _Port] = {}
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._seq = itertools.count()
+        self._hub_locks: Dict[str, threading.Lock] = {}
+
+    @classmethod
+    def instance(cls) -> "MotorIOService":
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = MotorIOService()
+            return cls._instance
+
+    # ------------------------------------------------------------------
+    # Loop
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def run():
+                    asyncio.set_event_loop(self._loop)
+                    self._loop.call_soon(ready.set)
+                    self._loop.run_forever()
+
+                self._thread = threading.Thread(target=run, name="MotorIOLoop", daemon=True)
+                self._thread.start()
+                ready.wait()
+            return self._loop
+
+    def _on_loop_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def _run_on_loop(self, coro_or_fn, *args):
+        """Run a coroutine (or plain function) on the loop thread and wait for it."""
+        loop = self._ensure_loop()
+        if self._on_loop_thread():
+            raise RuntimeError("Motor I/O loop cannot wait on itself")
+
+        async def _call():
+            result = coro_or_fn(*args)
+            return await result if asyncio.iscoroutine(result) else result
+
+        return asyncio.run_coroutine_threadsafe(_call(), loop).result()
+
+    # ------------------------------------------------------------------
+    # Ports
+
+    def attach(self, port: str, bus: Any, hub: Optional[str] = None) -> "PortClient":
+        """Take ownership of ``bus`` for ``port`` and return a client for it.
+
+        Ports attached with the same ``hub`` run one request at a time between them.
+        """
+
+        async def _attach():
+            existing = self._ports.get(port)
+            if existing and not existing.closed:
+                raise RuntimeError(f"Port {port} is already attached to the motor I/O service")
+            hub_lock = self._hub_locks.setdefault(hub, threading.Lock()) if hub else None
+            entry = _Port(port, bus, hub_lock)
+            entry.queue = asyncio.PriorityQueue()
+            entry.consumer = asyncio.get_running_loop().create_task(self._serve(entry))
+            self._ports[port] = entry
+            return entry
+
+        self._run_on_loop(_attach)
+        return PortClient(self, port)
+
+    def detach(self, port: str) -> Optional[dict]:
+        """Stop serving ``port``; queued requests fail. Returns the port's final stats."""
+
+        async def _detach():
+            entry = self._ports.pop(port, None)
+            if entry is None:
+                return None
+            entry.closed = True
+            for job in list(entry.jobs):
+                job.cancel()
+            entry.consumer.cancel()
+            while not entry.queue.empty():
+                _, _, _, request = entry.queue.get_nowait()
+                if not request.future.done():
+                    request.future.set_exception(ConnectionError(f"{port} was closed"))
+            entry.executor.shutdown(wait=False)
+            return entry.stats.as_dict(0)
+
+        if self._loop is None:
+            return None
+        stats = self._run_on_loop(_detach)
+        if stats:
+            motor_events.record(
+                INFO, "MOTOR_IO", "port_detached",
+                "Motor I/O on {port}: {completed} requests, {expired} expired, "
+                "busy {occupancy:.1%}, longest queue wait {max_wait_ms:.1f} ms",
+                port=port, **stats,
+            )
+        return stats
+
+    def stats(self) -> Dict[str, dict]:
+        """Per-port queue and occupancy figures for every attached port."""
+        return {name: entry.stats.as_dict(entry.queue.qsize()) for name, entry in list(self._ports.items())}
+
+    # ------------------------------------------------------------------
+    # Requests
+
+    @contextmanager
+    def priority(self, priority: int):
+        """Submit requests from this thread at ``priority`` (e.g. for a stop)."""
+        previous = getattr(_tls, "priority", None)
+        _tls.priority = priority
+        try:
+            yield
+        finally:
+            _tls.priority = previous
+
+    def submit(self, port: str, fn: Callable[[Any], Any], *, priority: Optional[int] = None,
+               deadline: Optional[float] = None) -> concurrent.futures.Future:
+        """Queue ``fn(bus)`` on ``port``; ``deadline`` is a perf_counter() time."""
+        entry = self._ports.get(port)
+        if entry is None or entry.closed:
+            raise ConnectionError(f"{port} is not attached to the motor I/O service")
+        if priority is None:
+            priority = getattr(_tls, "priority", None)
+        if priority is None:
+            priority = PRIORITY_MOTION
+
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        request = _Request(fn, future, deadline, time.perf_counter())
+        item = (priority, deadline if deadline is not None else math.inf, next(self._seq), request)
+        self._loop.call_soon_threadsafe(entry.queue.put_nowait, item)
+        return future
+
+    def call(self, port: str, fn: Callable[[Any], Any], *, priority: Optional[int] = None,
+             timeout: Optional[float] = None) -> Any:
+        """Blocking :meth:`submit`. Runs inline when already on ``port``'s I/O thread."""
+        if getattr(_tls, "port", None) == port:
+            return fn(self._ports[port].bus)
+        if self._on_loop_thread():
+            raise RuntimeError("Blocking motor I/O from the motor I/O loop; use submit()")
+        return self.submit(port, fn, priority=priority).result(timeout)
+
+    async def _serve(self, entry: _Port) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            _, _, _, request = await entry.queue.get()
+            now = time.perf_counter()
+            if request.deadline is not None and now > request.deadline:
+                entry.stats.expired += 1
+                if not request.future.done():
+                    request.future.set_exception(TimeoutError(f"{entry.name}: request expired in queue"))
+                continue
+            if not request.future.set_running_or_notify_cancel():
+                continue
+            entry.stats.max_wait_s = max(entry.stats.max_wait_s, now - request.submitted)
+            try:
+                result = await loop.run_in_executor(entry.executor, self._execute, entry, request.fn)
+            except asyncio.CancelledError:
+                request.future.set_exception(ConnectionError(f"{entry.name} was closed"))
+                raise
+            except Exception as exc:
+                entry.stats.failed += 1
+                request.future.set_exception(exc)
+            else:
+                entry.stats.completed += 1
+                request.future.set_result(result)
+            finally:
+                entry.stats.busy_s += time.perf_counter() - now
+
+    @staticmethod
+    def _execute(entry: _Port, fn: Callable[[Any], Any]) -> Any:
+        if entry.hub_lock is None:
+            return fn(entry.bus)
+        with entry.hub_lock:
+            return fn(entry.bus)
+
+    # ------------------------------------------------------------------
+    # Periodic jobs
+
+    def every(self, port: str, interval: float, fn: Callable[[Any], Any],
+              callback: Callable[[Any], None], *, priority: int = PRIORITY_TELEMETRY) -> Callable[[], None]:
+        """Run ``fn(bus)`` every ``interval`` seconds and pass results to ``callback``.
+
+        Each run must start within one interval or it is skipped, so a busy
+        port sheds periodic work rather than queueing it.  ``callback`` runs on
+        the loop thread and must not block.  Returns a function that cancels
+        the job.
+        """
+        entry = self._ports.get(port)
+        if entry is None:
+            raise ConnectionError(f"{port} is not attached to the motor I/O service")
+
+        async def _job():
+            while True:
+                started = time.perf_counter()
+                future = self.submit(port, fn, priority=priority, deadline=started + interval)
+                try:
+                    result = await asyncio.wrap_future(future)
+                except (TimeoutError, ConnectionError):
+                    result = None
+                except Exception as exc:  # A failed poll should not end the job
+                    motor_events.record(
+                        motor_events.DEBUG, "MOTOR_IO", "periodic_failed", "Periodic read on {port} failed: {error}",
+                        port=port, error=str(exc),
+                    )
+                    result = None
+                if result is not None:
+                    try:
+                        callback(result)
+                    except Exception as exc:
+                        motor_events.record(
+                            motor_events.WARNING, "MOTOR_IO", "callback_failed",
+                            "Periodic callback on {port} failed: {error}", port=port, error=str(exc),
+                        )
+                await asyncio.sleep(max(0.0, started + interval - time.perf_counter()))
+
+        def _start():
+            task = asyncio.get_running_loop().create_task(_job())
+            entry.jobs.add(task)
+            task.add_done_callback(entry.jobs.discard)
+            return task
+
+        task = self._run_on_loop(_start)
+
+        def cancel():
+            if self._loop is not None and not self._loop.is_closed():
+                self._loop.call_soon_threadsafe(task.cancel)
+
+        return cancel
+
+
+class PortClient:
+    """Bus-shaped client for one attached port: every call is one queued request."""
+
+    def __init__(self, service: MotorIOService, port: str):
+        self.service = service
+        self.port = port
+
+    @property
+    def raw_bus(self):
+        entry = self.service._ports.get(self.port)
+        return entry.bus if entry else None
+
+    def submit(self, fn: Callable[[Any], Any], *, priority: Optional[int] = None,
+               deadline: Optional[float] = None) -> concurrent.futures.Future:
+        return self.service.submit(self.port, fn, priority=priority, deadline=deadline)
+
+    def call(self, fn: Callable[[Any], Any], *, priority: Optional[int] = None) -> Any:
+        """Run ``fn(bus)`` as one queued request and wait for its result."""
+        return self.service.call(self.port, fn, priority=priority)
+
+    def read(self, register: str, motor_name: str, normalize: bool = True):
+        return self.service.call(self.port, lambda bus: bus.read(register, motor_name, normalize=normalize))
+
+    def write(self, register: str, motor_name: str, value: Any, normalize: bool = True):
+        return self.service.call(self.port, lambda bus: bus.write(register, motor_name, value, normalize=normalize))
+
+    def sync_read(self, register: str, motor_names=None, normalize: bool = True):
+        return self.service.call(self.port, lambda bus: bus.sync_read(register, motor_names, normalize=normalize))
+
+    def sync_write(self, register: str, values: Dict[str, Any], normalize: bool = True):
+        return self.service.call(self.port, lambda bus: bus.sync_write(register, values, normalize=normalize))
+
+    def disconnect(self, *args, **kwargs):
+        """Disconnect the bus on its own I/O thread, then release the port."""
+        try:
+            return self.service.call(self.port, lambda bus: bus.disconnect(*args, **kwargs))
+        finally:
+            self.service.detach(self.port)
+
+    def __getattr__(self, name):
+        # Non-I/O attributes (stats, motor lists, ...) come from the bus itself
+        bus = self.raw_bus
+        if bus is None:
+            raise AttributeError(name)
+        return getattr(bus, name)
@@ -5,17 +5,37 @@ Purpose:
 - Ensure only one controller owns a given serial port at a time.
 - Provide shared access to the same controller for multiple callers.
 - Offer lightweight telemetry publishing for diagnostics without reopening the bus.
+- Stop every arm in parallel without waiting for in-progress moves.
+
+Handles are thin clients of the MotorIOService (utils/motor_io.py): the port's
+bus is owned by the service, moves go through its queue at motion priority,
+telemetry is a periodic low-priority job and stops jump the queue.
 """
 
 from __future__ import annotations
 
 import threading
 import time
+from concurrent.futures import Future
 from typing import Callable, Dict, List, Optional
 
+from utils import motor_events
 from utils.motor_controller import MotorController
+from utils.motor_io import PRIORITY_ESTOP, MotorIOService
 from utils.logging_utils import log_exception
 
+# (telemetry key, register) - one sync read per register per poll
+TELEMETRY_REGISTERS = (
+    ("position", "Present_Position"),
+    ("goal", "Goal_Position"),
+    ("velocity", "Present_Velocity"),
+    ("load", "Present_Load"),
+    ("temperature", "Present_Temperature"),
+    ("current", "Present_Current"),
+    ("voltage", "Present_Voltage"),
+    ("moving", "Moving"),
+)
+
 
 class MotorHandle:
     """Wrapper around MotorController that enforces single ownership and shares telemetry."""
@@ -26,9 +46,9 @@ class MotorHandle:
         self._config = config
         self._arm_index = arm_index
         self._controller = MotorController(config, arm_index=arm_index)
+        self._controller.io_service = MotorIOService.instance()
         self._lock = threading.RLock()
-        self._telemetry_thread: Optional[threading.Thread] = None
-        self._telemetry_running = threading.Event()
+        self._cancel_telemetry: Optional[Callable[[], None]] = None
         self._telemetry_subs: List[Callable[[dict], None]] = []
         self._last_telemetry: Optional[List[Optional[dict]]] = None
 
@@ -77,12 +97,84 @@ class MotorHandle:
         with self._lock:
             return self._controller.read_positions()
 
-    def emergency_stop(self):
+    @property
+    def POSITION_TOLERANCE(self) -> int:
+        return self._controller.POSITION_TOLERANCE
+
+    @property
+    def motion_model(self):
+        return self._controller.motion_model
+
+    def predict_move_time(self, *args, **kwargs) -> float:
         with self._lock:
-            try:
-                self._controller.emergency_stop()
-            except Exception as exc:
-                log_exception("MotorHandle: emergency_stop failed", exc, level="warning")
+            return self._controller.predict_move_time(*args, **kwargs)
+
+    def command_move_async(self, positions: List[int], velocity: int = 600):
+        """Queue MotorController.command_move() on the port; Future of the move's start time."""
+        return self.submit(lambda bus: self._controller.command_move(positions, velocity))
+
+    def read_motion_state_async(self):
+        """Queue one bulk read of positions and Moving flags; Future of (positions, moving)."""
+        return self.submit(lambda bus: self._controller._read_motion_state())
+
+    @property
+    def stop_requested(self) -> bool:
+        return self._controller.stop_requested
+
+    def rearm(self) -> None:
+        """Clear a latched emergency stop (see MotorController.rearm)."""
+        self._controller.rearm()
+
+    def hold_position(self, *args, **kwargs):
+        with self._lock:
+            return self._controller.hold_position(*args, **kwargs)
+
+    def check_hold(self, *args, **kwargs):
+        with self._lock:
+            return self._controller.check_hold(*args, **kwargs)
+
+    def assert_goal(self, *args, **kwargs):
+        with self._lock:
+            return self._controller.assert_goal(*args, **kwargs)
+
+    def submit(self, fn: Callable, *, priority: Optional[int] = None, deadline: Optional[float] = None):
+        """Queue ``fn(bus)`` on this arm's port; returns a concurrent.futures.Future."""
+        bus = self._controller.bus
+        if not bus or not hasattr(bus, "submit"):
+            raise ConnectionError(f"Arm {self._arm_index} is not connected")
+        return bus.submit(fn, priority=priority, deadline=deadline)
+
+    def emergency_stop_async(self):
+        """Queue a stop ahead of everything else on the port.
+
+        Returns a Future of the request-to-bus-write latency in ms (None when
+        not connected).  Deliberately does not take ``_lock``: ``set_positions``
+        holds it for the whole move.  The stop is latched right away so the
+        move's waits wake now; the queued request only does the bus write,
+        after at most the transaction in flight.
+        """
+        requested = time.perf_counter()
+        self._controller.request_stop()
+
+        def _stop(bus):
+            if self._controller.emergency_stop() is None:
+                return None
+            return (time.perf_counter() - requested) * 1000.0
+
+        try:
+            return self.submit(_stop, priority=PRIORITY_ESTOP)
+        except ConnectionError:
+            future = Future()
+            future.set_result(None)
+            return future
+
+    def emergency_stop(self) -> Optional[float]:
+        """Stop this arm now; returns the stop-to-bus-write latency in ms."""
+        try:
+            return self.emergency_stop_async().result(timeout=1.0)
+        except Exception as exc:
+            log_exception("MotorHandle: emergency_stop failed", exc, level="warning")
+            return None
 
     def subscribe(self, callback: Callable[[dict], None]) -> None:
         """Subscribe to telemetry dicts (list per motor)."""
@@ -101,53 +193,44 @@ class MotorHandle:
     # Telemetry
 
     def _start_telemetry(self):
-        if self._telemetry_thread and self._telemetry_thread.is_alive():
+        if self._cancel_telemetry is not None:
             return
-        self._telemetry_running.set()
-        self._telemetry_thread = threading.Thread(
-            target=self._telemetry_loop, name=f"MotorTelemetry-{self._arm_index}", daemon=True
+        bus = self._controller.bus
+        self._cancel_telemetry = bus.service.every(
+            bus.port, self.TELEMETRY_INTERVAL, self._read_telemetry, self._publish_telemetry
         )
-        self._telemetry_thread.start()
 
     def _stop_telemetry(self):
-        self._telemetry_running.clear()
-        if self._telemetry_thread and self._telemetry_thread.is_alive():
-            self._telemetry_thread.join(timeout=0.5)
-
-    def _telemetry_loop(self):
-        while self._telemetry_running.is_set():
-            snapshot = []
+        if self._cancel_telemetry is not None:
+            self._cancel_telemetry()
+            self._cancel_telemetry = None
+
+    def _read_telemetry(self, bus) -> List[Optional[dict]]:
+        """Runs on the port's I/O thread between queued moves."""
+        names = self._controller.motor_names
+        values = {}
+        for key, register in TELEMETRY_REGISTERS:
+            try:
+                values[key] = bus.sync_read(register, names, normalize=False)
+            except Exception as exc:
+                log_exception("MotorHandle: telemetry read failed", exc, level="warning")
+                values[key] = {}
+        snapshot = []
+        for name in names:
             try:
-                with self._lock:
-                    bus = self._controller.bus
-                    if not bus:
-                        time.sleep(self.TELEMETRY_INTERVAL)
-                        continue
-                    for name in self._controller.motor_names:
-                        try:
-                            data = {
-                                "position": int(bus.read("Present_Position", name, normalize=False)),
-                                "goal": int(bus.read("Goal_Position", name, normalize=False)),
-                                "velocity": int(bus.read("Present_Velocity", name, normalize=False)),
-                                "load": int(bus.read("Present_Load", name, normalize=False)),
-                                "temperature": int(bus.read("Present_Temperature", name, normalize=False)),
-                                "current": int(bus.read("Present_Current", name, normalize=False)),
-                                "voltage": int(bus.read("Present_Voltage", name, normalize=False)),
-                                "moving": int(bus.read("Moving", name, normalize=False)),
-                            }
-                            snapshot.append(data)
-                        except Exception as exc:
-                            log_exception("MotorHandle: telemetry read failed", exc, level="warning")
-                            snapshot.append(None)
-                self._last_telemetry = snapshot
-                if snapshot and self._telemetry_subs:
-                    for cb in list(self._telemetry_subs):
-                        try:
-                            cb(snapshot)
-                        except Exception as exc:
-                            log_exception("MotorHandle: telemetry callback failed", exc, level="warning")
-            finally:
-                time.sleep(self.TELEMETRY_INTERVAL)
+                snapshot.append({key: int(values[key][name]) for key, _ in TELEMETRY_REGISTERS})
+            except (KeyError, TypeError, ValueError):
+                snapshot.append(None)
+        return snapshot
+
+    def _publish_telemetry(self, snapshot: List[Optional[dict]]) -> None:
+        """Runs on the motor I/O loop; subscribers must not block."""
+        self._last_telemetry = snapshot
+        for cb in list(self._telemetry_subs):
+            try:
+                cb(snapshot)
+            except Exception as exc:
+                log_exception("MotorHandle: telemetry callback failed", exc, level="warning")
 
 
 class MotorManager:
@@ -172,10 +255,39 @@ class MotorManager:
                 self._handles[arm_index] = MotorHandle(config, arm_index)
             return self._handles[arm_index]
 
-    def emergency_stop_all(self):
+    def emergency_stop_all(self, timeout: float = 1.0) -> Dict[int, Optional[float]]:
+        """Stop every arm in parallel; returns ``{arm_index: latency_ms or None}``."""
+        requested = time.perf_counter()
         with self._lock:
-            for handle in self._handles.values():
-                handle.emergency_stop()
+            handles = dict(self._handles)
+        if not handles:
+            return {}
+
+        # Each stop is queued at the head of its own port, so one thread can fan out
+        futures = {arm_index: handle.emergency_stop_async() for arm_index, handle in handles.items()}
+        results: Dict[int, Optional[float]] = {}
+        deadline = requested + timeout
+        for arm_index, future in futures.items():
+            try:
+                results[arm_index] = future.result(max(0.0, deadline - time.perf_counter()))
+            except Exception as exc:
+                log_exception(f"MotorManager: emergency stop of arm {arm_index} failed", exc, level="warning")
+
+        stopped = [latency for latency in results.values() if latency is not None]
+        motor_events.record(
+            motor_events.WARNING, "ESTOP", "stopped_all",
+            "Emergency stop sent to {stopped}/{arms} arm(s) in {total_ms:.1f} ms (slowest bus write {slowest_ms:.1f} ms)",
+            stopped=len(stopped), arms=len(handles),
+            total_ms=(time.perf_counter() - requested) * 1000.0, slowest_ms=max(stopped, default=0.0),
+        )
+        return {arm_index: results.get(arm_index) for arm_index in handles}
+
+    def rearm_all(self) -> None:
+        """Clear latched emergency stops on every arm; for explicit operator starts."""
+        with self._lock:
+            handles = list(self._handles.values())
+        for handle in handles:
+            handle.rearm()
 
     def disconnect_all(self):
         with self._lock:
@@ -10,12 +10,19 @@ from __future__ import annotations
 
 """Helper utilities for palletization step configuration and playback."""
 
+import json
 import time
-from typing import Callable, Dict, List, Optional, Sequence
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 from utils.config_compat import get_active_arm_index
 from utils.motor_controller import MotorController
 
+DEFAULT_BLEND_RADIUS = 60  # position units; approach/rotate/retract (when followed by a move) hand over this close to their goal
+STAGES = ("approach", "rotate", "drop", "release", "retract")
+# Step keys the cell poses depend on (plus the legacy corner_N keys)
+PLAN_KEYS = ("corners", "divisions", "down_offsets")
+
 
 def create_default_palletize_config(config: Optional[dict] = None) -> dict:
     """Return a baseline configuration for a palletize step."""
@@ -162,15 +169,79 @@ def _apply_offsets(base: Sequence[int], offsets: Dict[int, int]) -> List[int]:
     return updated
 
 
+@dataclass(frozen=True)
+class CellPlan:
+    """Precomputed stage poses for one pallet cell.
+
+    The gripper value (index 5) is never taken from the corners; it is filled
+    in at run time from wherever the previous step left it.
+    """
+
+    index: int
+    cell: Tuple[int, ...]  # Exact drop pose
+    clearance: Tuple[int, ...]  # Cell pose lifted by the clearance offsets
+
+
+def _plan_key(step: Dict) -> str:
+    """Fingerprint of everything the cell geometry depends on."""
+    relevant = {key: step.get(key) for key in PLAN_KEYS}
+    relevant.update({f"corner_{idx}": step.get(f"corner_{idx}") for idx in range(1, 5)})
+    return json.dumps(relevant, sort_keys=True, default=str)
+
+
+def plan_pallet_cells(step: Dict) -> List[CellPlan]:
+    """Compute every cell's drop and clearance poses for a palletize step."""
+
+    clearance_offsets = _normalize_offsets(step.get("down_offsets"))
+    plans: List[CellPlan] = []
+    for index, cell in enumerate(compute_pallet_cells(step)):
+        cell = list(cell) + [0] * (6 - len(cell))
+        plans.append(CellPlan(index, tuple(cell), tuple(_apply_offsets(cell, clearance_offsets))))
+    return plans
+
+
 class PalletizeRuntime:
-    """Shared executor for palletization steps."""
+    """Shared executor for palletization steps.
+
+    Cell poses are planned once per step configuration and cached.  Each cell
+    runs five stages; approach and rotate only need to clear the pallet, so
+    they blend into the next stage once every joint is within ``blend_radius``
+    (step key, default :data:`DEFAULT_BLEND_RADIUS`, 0 = stop and verify every
+    stage).  The retract is the last move of the step and only blends when the
+    caller says another move follows (``followed_by_move``).  The drop and the
+    release are always verified stop points, and ``settle_time`` is only spent
+    after the drop.
+    """
+
+    PLAN_CACHE_SIZE = 16
 
     def __init__(self, config: dict, *, speed_multiplier: float = 1.0):
         self.config = config
         self.speed_multiplier = speed_multiplier
+        self._plans: Dict[str, List[CellPlan]] = {}
+        # Stage durations (s) of the last executed cell, plus a "total"
+        self.last_timing: Dict[str, float] = {}
+        self._cells_done = 0
+        self._cells_time = 0.0
+
+    def plan(self, step: Dict) -> List[CellPlan]:
+        """Cached :func:`plan_pallet_cells` for ``step``."""
+        key = _plan_key(step)
+        plans = self._plans.get(key)
+        if plans is None:
+            plans = plan_pallet_cells(step)
+            if len(self._plans) >= self.PLAN_CACHE_SIZE:
+                self._plans.pop(next(iter(self._plans)))
+            self._plans[key] = plans
+        return plans
 
     def compute_cells(self, step: Dict) -> List[List[int]]:
-        return compute_pallet_cells(step)
+        return [list(plan.cell) for plan in self.plan(step)]
+
+    @property
+    def cells_per_minute(self) -> float:
+        """Average placement rate over every cell this runtime has executed."""
+        return 60.0 * self._cells_done / self._cells_time if self._cells_time > 0 else 0.0
 
     def execute(
         self,
@@ -180,16 +251,21 @@ class PalletizeRuntime:
         logger: Optional[Callable[[str, str], None]] = None,
         stop_cb: Optional[Callable[[], bool]] = None,
         controller: Optional[MotorController] = None,
+        followed_by_move: bool = False,
     ) -> int:
-        """Execute the palletize routine for the requested cell."""
+        """Execute the palletize routine for the requested cell.
+
+        ``followed_by_move`` lets the final retract blend into whatever the
+        caller moves next; otherwise the step ends on a verified stop.
+        """
 
-        cells = self.compute_cells(step)
-        if not cells:
+        plans = self.plan(step)
+        if not plans:
             raise ValueError("Palletize step is missing corner definitions")
 
-        total_cells = len(cells)
+        total_cells = len(plans)
         active_index = cell_index % total_cells
-        approach_pose = cells[active_index]
+        plan = plans[active_index]
 
         arm_index = int(step.get("arm_index", get_active_arm_index(self.config)))
 
@@ -218,15 +294,24 @@ class PalletizeRuntime:
         release_velocity = _clamp_velocity(step.get("release_velocity", down_velocity))
         settle_time = max(0.0, float(step.get("settle_time", 0.0)))
         release_hold = max(0.0, float(step.get("release_hold", 0.0)))
-        # Interpret down_offsets as clearance offsets for joints 2–4
-        clearance_offsets = _normalize_offsets(step.get("down_offsets"))
+        # Optional completion tail per move (None = control.settle_tail_s)
+        settle_tail = step.get("settle_tail")
+        blend_radius = max(0, int(step.get("blend_radius", DEFAULT_BLEND_RADIUS) or 0))
         release_delta = int(step.get("release_offset", 0))
 
-        def _move(target: List[int], velocity: int, stage: str):
+        timing: Dict[str, float] = {}
+        cell_start = time.perf_counter()
+
+        def _move(target: List[int], velocity: int, stage: str, label: str, blend: bool = False):
             if _should_stop():
                 raise RuntimeError("Palletize step aborted")
-            _log("info", f"{stage}: velocity {velocity}")
-            controller.set_positions(target, velocity=velocity, wait=True, keep_connection=True)
+            _log("info", f"{label}: velocity {velocity}")
+            stage_start = time.perf_counter()
+            controller.set_positions(
+                target, velocity=velocity, wait=True, keep_connection=True, settle_tail=settle_tail,
+                blend_radius=blend_radius if blend else None,
+            )
+            timing[stage] = time.perf_counter() - stage_start
 
         _log(
             "info",
@@ -237,66 +322,61 @@ class PalletizeRuntime:
         # keeping motor 1 (base) and motor 5 (wrist) at their current angles.
         # Motor 6 (gripper) is never driven to an absolute value from corners;
         # it stays at the value from the previous step until we apply the
-        # release delta at the cell pose.
-        current_positions = controller.read_positions()
+        # release delta at the cell pose.  The bus is already open, so read it
+        # directly instead of opening a second connection.
+        current_positions = controller.read_positions_from_bus()
         if len(current_positions) != 6:
             raise RuntimeError("Palletize step failed: could not read 6 joint positions for clearance path")
 
         gripper_current = current_positions[5]
 
-        # Clearance pose derived from the final cell pose plus configurable offsets
-        clearance_pose = _apply_offsets(approach_pose, clearance_offsets)
-        # Ensure list has at least 6 entries and preserve current gripper value
-        if len(clearance_pose) < 6:
-            clearance_pose = list(clearance_pose) + [0] * (6 - len(clearance_pose))
-        else:
-            clearance_pose = list(clearance_pose)
+        clearance_pose = list(plan.clearance)
         clearance_pose[5] = gripper_current
 
         stage1_pose = list(clearance_pose)
         stage1_pose[0] = current_positions[0]  # keep base heading
         stage1_pose[4] = current_positions[4]  # keep wrist rotation
-        _move(stage1_pose, approach_velocity, "Approach (clearance height)")
-        if settle_time:
-            time.sleep(settle_time)
+        _move(stage1_pose, approach_velocity, "approach", "Approach (clearance height)", blend=True)
 
         # Stage 2: rotate base (motor 1) and wrist (motor 5) to their final
         # cell values while staying at the clearance height.
-        stage2_pose = list(clearance_pose)
-        _move(stage2_pose, down_velocity, "Approach (rotate base/wrist)")
-        if settle_time:
-            time.sleep(settle_time)
+        _move(clearance_pose, down_velocity, "rotate", "Approach (rotate base/wrist)", blend=True)
 
         # Stage 3: slow drop – move joints 2–4 down from clearance to the
         # exact corner/cell position, then perform the gripper release.
-        approach_pose_no_grip = list(approach_pose)
-        if len(approach_pose_no_grip) < 6:
-            approach_pose_no_grip += [0] * (6 - len(approach_pose_no_grip))
-        approach_pose_no_grip[5] = gripper_current
-        _move(approach_pose_no_grip, down_velocity, "Drop to cell")
+        drop_pose = list(plan.cell)
+        drop_pose[5] = gripper_current
+        _move(drop_pose, down_velocity, "drop", "Drop to cell")
         if settle_time:
             time.sleep(settle_time)
+            timing["drop"] += settle_time
 
-        # Release is performed at the exact cell pose (approach_pose).
-        release_pose = list(approach_pose_no_grip)
-        if len(release_pose) >= 6:
-            release_pose[5] = _clamp_position(release_pose[5] + release_delta)
-        else:
-            release_pose.append(_clamp_position(release_delta))
-
-        _move(release_pose, release_velocity, "Release")
+        # Release is performed at the exact cell pose.
+        release_pose = list(drop_pose)
+        release_pose[5] = _clamp_position(release_pose[5] + release_delta)
+        _move(release_pose, release_velocity, "release", "Release")
         if release_hold:
             time.sleep(release_hold)
+            timing["release"] += release_hold
 
         # Stage 4: retreat back to the clearance pose above the cell to exit
         # safely and prepare for the next cell. Keep motor 6 in its released
-        # (open) state while moving up.
+        # (open) state while moving up.  Nothing in this step comes after it,
+        # so it only blends when the caller starts another move right away.
         clearance_exit_pose = list(clearance_pose)
-        if len(release_pose) >= 6 and len(clearance_exit_pose) >= 6:
-            clearance_exit_pose[5] = release_pose[5]
-        _move(clearance_exit_pose, retract_velocity, "Retract to clearance")
-        if settle_time:
-            time.sleep(settle_time)
+        clearance_exit_pose[5] = release_pose[5]
+        _move(clearance_exit_pose, retract_velocity, "retract", "Retract to clearance", blend=followed_by_move)
+
+        timing["total"] = time.perf_counter() - cell_start
+        self.last_timing = timing
+        self._cells_done += 1
+        self._cells_time += timing["total"]
+        breakdown = " · ".join(f"{stage} {timing[stage]:.2f}s" for stage in STAGES)
+        _log(
+            "info",
+            f"Cell {active_index + 1}/{total_cells} placed in {timing['total']:.2f}s "
+            f"({self.cells_per_minute:.1f} cells/min): {breakdown}",
+        )
 
         if own_controller:
             try:
@@ -308,8 +388,10 @@ class PalletizeRuntime:
 
 
 __all__ = [
+    "CellPlan",
     "PalletizeRuntime",
     "compute_pallet_cells",
     "create_default_palletize_config",
     "extract_corner_positions",
+    "plan_pallet_cells",
 ]
@@ -0,0 +1,137 @@
+"""
+CPU-light rendering of BGR camera frames into Qt widgets.
+
+Every preview surface used to convert frames the same way: a full-frame
+``BGR2RGB`` conversion, a fresh ``QImage``/``QPixmap`` and, for vision zones,
+a full-frame ``np.zeros_like`` overlay blended with ``cv2.addWeighted`` per
+zone.  On the Jetson touch panel that chain dominated UI CPU time.
+
+:class:`PreviewRenderer` instead:
+
+* scales the frame to the widget size first, so nothing downstream touches
+  more pixels than are shown;
+* writes into a persistent numpy buffer wrapped by a ``Format_BGR888``
+  ``QImage`` (no colour conversion, no per-frame allocation);
+* paints zone overlays from a translucent layer (:class:`OverlayCache`) that
+  is only redrawn when the zones, their colours or the output size change.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Hashable, Optional, Sequence, Tuple
+
+from utils.lazy_import import optional_module
+
+# Optional dependencies, imported on first use to keep start-up fast
+cv2 = optional_module("cv2")
+np = optional_module("numpy")
+
+from PySide6.QtCore import QPointF, Qt
+from PySide6.QtGui import QColor, QImage, QPainter, QPen, QPolygonF
+
+# (points in frame pixel coordinates, BGR colour)
+ZoneOverlay = Tuple["np.ndarray", Tuple[int, int, int]]
+
+
+class OverlayCache:
+    """Translucent ARGB layer that is rebuilt only when its key or size changes."""
+
+    def __init__(self) -> None:
+        self._layer: Optional[QImage] = None
+        self._key: Optional[Hashable] = None
+
+    def get(self, key: Hashable, size: Tuple[int, int], draw: Callable[[QPainter], None]) -> QImage:
+        width, height = max(1, int(size[0])), max(1, int(size[1]))
+        full_key = (width, height, key)
+        if self._layer is None or self._key != full_key:
+            layer = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+            layer.fill(Qt.transparent)
+            painter = QPainter(layer)
+            painter.setRenderHint(QPainter.Antialiasing, True)
+            try:
+                draw(painter)
+            finally:
+                painter.end()
+            self._layer = layer
+            self._key = full_key
+        return self._layer
+
+    def invalidate(self) -> None:
+        self._layer = None
+        self._key = None
+
+
+class PreviewRenderer:
+    """Render BGR frames at display size into a reused ``QImage``."""
+
+    def __init__(self, fill_alpha: float = 0.28, outline_width: int = 2) -> None:
+        self.fill_alpha = fill_alpha
+        self.outline_width = outline_width
+        self._buffer: Optional["np.ndarray"] = None
+        self._image: Optional[QImage] = None
+        self._overlay = OverlayCache()
+
+    def _ensure_buffer(self, width: int, height: int) -> "np.ndarray":
+        if self._buffer is None or self._buffer.shape[:2] != (height, width):
+            self._buffer = np.empty((height, width, 3), dtype=np.uint8)
+            # The QImage aliases the numpy buffer; both live as long as the renderer
+            self._image = QImage(self._buffer.data, width, height, 3 * width, QImage.Format_BGR888)
+        return self._buffer
+
+    def render(
+        self,
+        frame: "np.ndarray",
+        size: Optional[Tuple[int, int]] = None,
+        zones: Optional[Sequence[ZoneOverlay]] = None,
+    ) -> QImage:
+        """
+        Scale ``frame`` to ``size`` and paint ``zones`` on top.
+
+        The returned image is owned by the renderer and overwritten by the
+        next call; take a ``QPixmap`` (or ``copy()``) if it must outlive it.
+        """
+        if frame is None or cv2 is None or np is None:
+            return QImage()
+        if frame.ndim == 2:
+            frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+
+        frame_h, frame_w = frame.shape[:2]
+        width, height = size if size else (frame_w, frame_h)
+        width, height = max(1, int(width)), max(1, int(height))
+
+        buffer = self._ensure_buffer(width, height)
+        if (frame_w, frame_h) == (width, height):
+            np.copyto(buffer, frame)
+        else:
+            shrinking = width * height < frame_w * frame_h
+            interpolation = cv2.INTER_AREA if shrinking else cv2.INTER_LINEAR
+            cv2.resize(frame, (width, height), dst=buffer, interpolation=interpolation)
+
+        if zones:
+            layer = self._zone_layer(zones, (frame_w, frame_h), (width, height))
+            painter = QPainter(self._image)
+            painter.drawImage(0, 0, layer)
+            painter.end()
+        return self._image
+
+    def _zone_layer(
+        self,
+        zones: Sequence[ZoneOverlay],
+        frame_size: Tuple[int, int],
+        size: Tuple[int, int],
+    ) -> QImage:
+        key = (frame_size, tuple((np.asarray(pts).tobytes(), tuple(color)) for pts, color in zones))
+        scale_x = size[0] / max(1, frame_size[0])
+        scale_y = size[1] / max(1, frame_size[1])
+
+        def draw(painter: QPainter) -> None:
+            for pts, color in zones:
+                polygon = QPolygonF([QPointF(float(x) * scale_x, float(y) * scale_y) for x, y in pts])
+                blue, green, red = color
+                fill = QColor(red, green, blue)
+                fill.setAlphaF(self.fill_alpha)
+                painter.setBrush(fill)
+                painter.setPen(QPen(QColor(red, green, blue), self.outline_width))
+                painter.drawPolygon(polygon)
+
+        return self._overlay.get(key, size, draw)
@@ -96,6 +96,8 @@ class LiveRecordingComponent(RecordingComponent):
     def __init__(self, name: str, description: str = "", recorded_data: List[Dict] = None):
         super().__init__("live_recording", name, description)
         self.recorded_data = recorded_data or []
+        # Set when recorded_data was reduced at save time (see utils.recording_simplify)
+        self.simplification: Optional[Dict] = None
     
     def add_point(self, timestamp: float, positions: List[int], velocity: int = 600):
         """Add a recorded point to the live recording"""
@@ -122,6 +124,8 @@ class LiveRecordingComponent(RecordingComponent):
         data["recorded_data"] = self.recorded_data
         data["metadata"]["point_count"] = self.get_point_count()
         data["metadata"]["duration"] = self.get_duration()
+        if self.simplification:
+            data["metadata"]["simplified"] = self.simplification
         return data
     
     @staticmethod
@@ -137,6 +141,7 @@ class LiveRecordingComponent(RecordingComponent):
         metadata = data.get("metadata", {})
         component.created_at = metadata.get("created_at", component.created_at)
         component.modified_at = metadata.get("modified_at", component.modified_at)
+        component.simplification = metadata.get("simplified")
         
         return component
 
@@ -154,9 +159,12 @@ class PositionSetComponent(RecordingComponent):
         self._next_position_id = 1
     
     def add_position(self, name: str, motor_positions: List[int], velocity: int = 600, 
-                    wait_for_completion: bool = True, notes: str = "") -> str:
+                    wait_for_completion: bool = True, notes: str = "", blend_radius: int = None) -> str:
         """Add a waypoint position to the set
         
+        ``wait_for_completion=False`` or a ``blend_radius`` makes this a
+        pass-through waypoint the arm blends through without stopping.
+        
         Returns:
             position_id: Unique ID for this position
         """
@@ -171,6 +179,8 @@ class PositionSetComponent(RecordingComponent):
             "wait_for_completion": wait_for_completion,
             "notes": notes
         }
+        if blend_radius is not None:
+            position["blend_radius"] = blend_radius
         
         self.positions.append(position)
         return position_id
@@ -0,0 +1,107 @@
+"""
+Error-bounded simplification of live recordings.
+
+Live recordings capture every joint at the teleop frame rate, so a slow
+straight move is stored (and streamed back to the bus) as dozens of points
+that sit on one line.  :func:`simplify_recording` drops those points with a
+Ramer–Douglas–Peucker pass in joint space:
+
+* the error of a dropped point is measured against the chord between the kept
+  points on either side, *at the dropped point's own timestamp*, so a point
+  that lies on the path but not at the matching time is still kept;
+* the bound is per joint (encoder steps, scalar or one value per joint) and a
+  point is kept as soon as any joint would leave its bound;
+* kept points are copied unchanged, with their original ``timestamp`` and
+  ``velocity``, so playback timing is exactly as recorded.
+
+Playback interpolates linearly between the points it streams, so the played
+path stays within ``tolerance`` of the recording at every original sample.
+
+Enabled through ``config["recording"]["simplify_tolerance"]`` (0 or absent
+leaves recordings untouched)::
+
+    "recording": {"simplify_tolerance": 4}
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Sequence, Tuple, Union
+
+Tolerance = Union[float, Sequence[float]]
+
+
+def _tolerances(tolerance: Tolerance, joints: int) -> Tuple[float, ...]:
+    if isinstance(tolerance, (int, float)):
+        return (float(tolerance),) * joints
+    values = [float(t) for t in tolerance][:joints]
+    # Joints without their own bound use the last one given
+    return tuple(values + [values[-1] if values else 0.0] * (joints - len(values)))
+
+
+def _chord_errors(points: Sequence[Dict], first: int, last: int, index: int) -> List[float]:
+    """Per-joint distance of point ``index`` from the ``first``→``last`` chord at its timestamp."""
+    t0, t1 = float(points[first]["timestamp"]), float(points[last]["timestamp"])
+    if t1 > t0:
+        fraction = (float(points[index]["timestamp"]) - t0) / (t1 - t0)
+    else:
+        fraction = (index - first) / (last - first)
+    start, end, here = points[first]["positions"], points[last]["positions"], points[index]["positions"]
+    return [abs(q - (a + fraction * (b - a))) for a, b, q in zip(start, end, here)]
+
+
+def _worst_point(points: Sequence[Dict], first: int, last: int, bounds: Sequence[float]) -> Tuple[int, float]:
+    """Interior point furthest outside its bound, as ``(index, error / bound)``."""
+    worst, worst_ratio = first, 0.0
+    for index in range(first + 1, last):
+        errors = _chord_errors(points, first, last, index)
+        ratio = max((e / b if b > 0 else (float("inf") if e > 0 else 0.0) for e, b in zip(errors, bounds)),
+                    default=0.0)
+        if ratio > worst_ratio:
+            worst, worst_ratio = index, ratio
+    return worst, worst_ratio
+
+
+def simplify_recording(recorded_data: Sequence[Dict], tolerance: Tolerance) -> List[Dict]:
+    """Drop recorded points that playback would reproduce within ``tolerance`` steps.
+
+    The first and last points are always kept.  A tolerance of 0 (or fewer
+    than three points) returns the recording unchanged.
+    """
+    points = list(recorded_data)
+    if len(points) < 3:
+        return points
+    bounds = _tolerances(tolerance, len(points[0]["positions"]))
+    if not any(b > 0 for b in bounds):
+        return points
+
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    pending = [(0, len(points) - 1)]
+    while pending:
+        first, last = pending.pop()
+        if last - first < 2:
+            continue
+        index, ratio = _worst_point(points, first, last, bounds)
+        if ratio > 1.0:
+            keep[index] = True
+            pending.append((first, index))
+            pending.append((index, last))
+    return [point for point, kept in zip(points, keep) if kept]
+
+
+def max_deviation(original: Sequence[Dict], simplified: Sequence[Dict]) -> float:
+    """Largest joint error (steps) of ``simplified`` replayed at ``original``'s sample times."""
+    if len(simplified) < 2:
+        return 0.0
+    worst = 0.0
+    segment = 0
+    for point in original:
+        t = float(point["timestamp"])
+        while segment < len(simplified) - 2 and float(simplified[segment + 1]["timestamp"]) < t:
+            segment += 1
+        a, b = simplified[segment], simplified[segment + 1]
+        ta, tb = float(a["timestamp"]), float(b["timestamp"])
+        fraction = min(max((t - ta) / (tb - ta), 0.0), 1.0) if tb > ta else 0.0
+        for qa, qb, q in zip(a["positions"], b["positions"], point["positions"]):
+            worst = max(worst, abs(q - (qa + fraction * (qb - qa))))
+    return worst
@@ -3,8 +3,12 @@ Resilient Motor Bus Wrapper
 Handles transient power brownout errors gracefully with retry logic
 """
 
+import threading
 import time
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, Optional
+
+from utils import motor_events
+from utils.motor_events import ERROR, INFO, WARNING
 
 
 class ResilientMotorBus:
@@ -16,6 +20,8 @@ class ResilientMotorBus:
     - Per-motor failure tracking
     - Graceful degradation (continue with healthy motors)
     - Automatic recovery detection
+    - Per-transaction I/O lock, so a stop request from another thread gets
+      the line after at most one packet instead of after a whole move
     """
     
     # Retry configuration
@@ -43,10 +49,16 @@ class ResilientMotorBus:
             bus: The underlying motor bus object (from lerobot/HomePos)
         """
         self.bus = bus
+        self._io_lock = threading.RLock()
         self.motor_failures = {}  # motor_name -> {count, last_error, last_attempt, recovered}
         self.total_retries = 0
         self.successful_recoveries = 0
     
+    @property
+    def io_lock(self) -> threading.RLock:
+        """Held for every bus transaction; hold it to make a check-then-write atomic."""
+        return self._io_lock
+
     def _is_retryable_error(self, error: Exception) -> bool:
         """Check if an error should trigger retry logic"""
         error_str = str(error)
@@ -94,7 +106,11 @@ class ResilientMotorBus:
             was_failed = self.motor_failures[motor_name]['count'] > 0
             if was_failed:
                 self.successful_recoveries += 1
-                print(f"[RESILIENT] ✅ Motor {motor_name} recovered after {self.motor_failures[motor_name]['count']} failures")
+                motor_events.record(
+                    INFO, "RESILIENT", "motor_recovered",
+                    "✅ Motor {motor} recovered after {failures} failures",
+                    motor=motor_name, failures=self.motor_failures[motor_name]['count'],
+                )
             
             # Reset failure tracking
             self.motor_failures[motor_name] = {
@@ -125,14 +141,19 @@ class ResilientMotorBus:
         
         for attempt in range(self.MAX_RETRIES):
             try:
-                value = self.bus.read(register, motor_name, normalize=normalize)
+                with self._io_lock:
+                    value = self.bus.read(register, motor_name, normalize=normalize)
                 
                 # Success! Record it
                 self._record_success(motor_name)
                 
                 if attempt > 0:
                     # Log recovery after retry
-                    print(f"[RESILIENT] ✓ Motor {motor_name}.{register} succeeded after {attempt} retries")
+                    motor_events.record(
+                        INFO, "RESILIENT", "read_recovered",
+                        "✓ Motor {motor}.{register} succeeded after {attempt} retries",
+                        motor=motor_name, register=register, attempt=attempt,
+                    )
                 
                 return value
                 
@@ -143,7 +164,11 @@ class ResilientMotorBus:
                 if not self._is_retryable_error(e):
                     # Not a transient error, don't retry
                     self._record_failure(motor_name, e)
-                    print(f"[RESILIENT] ❌ Motor {motor_name}.{register}: Non-retryable error: {e}")
+                    motor_events.record(
+                        ERROR, "RESILIENT", "read_error",
+                        "❌ Motor {motor}.{register}: Non-retryable error: {error}",
+                        motor=motor_name, register=register, error=str(e),
+                    )
                     return None
                 
                 # Transient error - retry with backoff
@@ -153,14 +178,23 @@ class ResilientMotorBus:
                         # First retry - just log at debug level
                         pass  # Don't spam logs on first retry
                     else:
-                        print(f"[RESILIENT] ⟳ Motor {motor_name}.{register} retry {attempt + 1}/{self.MAX_RETRIES} after {delay*1000:.0f}ms")
+                        motor_events.record(
+                            INFO, "RESILIENT", "read_retry",
+                            "⟳ Motor {motor}.{register} retry {attempt}/{max_retries} after {delay_ms:.0f}ms",
+                            motor=motor_name, register=register, attempt=attempt + 1,
+                            max_retries=self.MAX_RETRIES, delay_ms=delay * 1000,
+                        )
                     
                     time.sleep(delay)
                     delay = min(delay * self.BACKOFF_MULTIPLIER, self.RETRY_DELAY_MAX)
         
         # All retries exhausted
         self._record_failure(motor_name, last_error)
-        print(f"[RESILIENT] ⚠️ Motor {motor_name}.{register} failed after {self.MAX_RETRIES} attempts: {last_error}")
+        motor_events.record(
+            WARNING, "RESILIENT", "read_failed",
+            "⚠️ Motor {motor}.{register} failed after {attempts} attempts: {error}",
+            motor=motor_name, register=register, attempts=self.MAX_RETRIES, error=str(last_error),
+        )
         return None
     
     def write(self, register: str, motor_name: str, value: Any, normalize: bool = True) -> bool:
@@ -185,13 +219,18 @@ class ResilientMotorBus:
         
         for attempt in range(self.MAX_RETRIES):
             try:
-                self.bus.write(register, motor_name, value, normalize=normalize)
+                with self._io_lock:
+                    self.bus.write(register, motor_name, value, normalize=normalize)
                 
                 # Success!
                 self._record_success(motor_name)
                 
                 if attempt > 0:
-                    print(f"[RESILIENT] ✓ Motor {motor_name}.{register} write succeeded after {attempt} retries")
+                    motor_events.record(
+                        INFO, "RESILIENT", "write_recovered",
+                        "✓ Motor {motor}.{register} write succeeded after {attempt} retries",
+                        motor=motor_name, register=register, attempt=attempt,
+                    )
                 
                 return True
                 
@@ -200,7 +239,11 @@ class ResilientMotorBus:
                 
                 if not self._is_retryable_error(e):
                     self._record_failure(motor_name, e)
-                    print(f"[RESILIENT] ❌ Motor {motor_name}.{register} write: Non-retryable error: {e}")
+                    motor_events.record(
+                        ERROR, "RESILIENT", "write_error",
+                        "❌ Motor {motor}.{register} write: Non-retryable error: {error}",
+                        motor=motor_name, register=register, error=str(e),
+                    )
                     return False
                 
                 if attempt < self.MAX_RETRIES - 1:
@@ -210,7 +253,11 @@ class ResilientMotorBus:
         
         # All retries exhausted
         self._record_failure(motor_name, last_error)
-        print(f"[RESILIENT] ⚠️ Motor {motor_name}.{register} write failed after {self.MAX_RETRIES} attempts: {last_error}")
+        motor_events.record(
+            WARNING, "RESILIENT", "write_failed",
+            "⚠️ Motor {motor}.{register} write failed after {attempts} attempts: {error}",
+            motor=motor_name, register=register, attempts=self.MAX_RETRIES, error=str(last_error),
+        )
         return False
     
     def read_multiple(self, register: str, motor_names: list[str], normalize: bool = True) -> dict[str, Optional[Any]]:
@@ -230,6 +277,31 @@ class ResilientMotorBus:
             results[motor_name] = self.read(register, motor_name, normalize)
         return results
     
+    def sync_write(self, register: str, values: Dict[str, Any], normalize: bool = True) -> None:
+        """
+        Write ``values`` to several motors in one packet (no retries).
+
+        Used for emergency stops, where a bounded single attempt matters more
+        than resilience; falls back to per-motor writes on buses without
+        ``sync_write``.
+        """
+        with self._io_lock:
+            sync_write = getattr(self.bus, "sync_write", None)
+            if sync_write is not None:
+                sync_write(register, values, normalize=normalize)
+                return
+            for motor_name, value in values.items():
+                self.bus.write(register, motor_name, value, normalize=normalize)
+
+    def sync_read(self, register: str, motor_names: Iterable[str], normalize: bool = True) -> Dict[str, Any]:
+        """Read ``register`` from several motors in one exchange (no retries)."""
+        motor_names = list(motor_names)
+        with self._io_lock:
+            sync_read = getattr(self.bus, "sync_read", None)
+            if sync_read is not None:
+                return dict(sync_read(register, motor_names, normalize=normalize))
+            return {name: self.bus.read(register, name, normalize=normalize) for name in motor_names}
+
     def get_stats(self) -> dict:
         """Get resilience statistics"""
         failed_motors = [name for name, info in self.motor_failures.items() 
@@ -17,6 +17,8 @@ Usage (Opt-in):
 
 from utils.motor_controller import MotorController
 from utils.resilient_motor_bus import ResilientMotorBus
+from utils import motor_events
+from utils.motor_events import ERROR, INFO, WARNING
 import time
 
 
@@ -85,7 +87,10 @@ class ResilientMotorController(MotorController):
                     # Clear failure flag if this motor was previously failing
                     if idx in self._logged_failures:
                         self._logged_failures.discard(idx)
-                        print(f"[RESILIENT] ✅ Motor {idx+1} ({name}) recovered")
+                        motor_events.record(
+                            INFO, "RESILIENT", "motor_recovered", "✅ Motor {index} ({motor}) recovered",
+                            index=idx + 1, motor=name,
+                        )
                 else:
                     # Failed - use fallback
                     self._handle_motor_read_failure(idx, name, "Returned None")
@@ -100,7 +105,7 @@ class ResilientMotorController(MotorController):
         
         # Only return empty if ALL motors failed and we have no history
         if failed_count == 6 and all(p is None for p in self._last_known_positions):
-            print(f"[RESILIENT] ❌ All motors failed to read with no position history")
+            motor_events.record(ERROR, "RESILIENT", "all_reads_failed", "❌ All motors failed to read with no position history")
             return []
         
         return positions
@@ -110,7 +115,10 @@ class ResilientMotorController(MotorController):
         # Only log the first failure, not subsequent ones
         if idx not in self._logged_failures:
             self._logged_failures.add(idx)
-            print(f"[RESILIENT] ⚠️ Motor {idx+1} ({name}) failed: {error}")
+            motor_events.record(
+                WARNING, "RESILIENT", "motor_read_failed", "⚠️ Motor {index} ({motor}) failed: {error}",
+                index=idx + 1, motor=name, error=error,
+            )
     
     def _get_fallback_position(self, idx: int, name: str) -> int:
         """Get fallback position for a failed motor"""
@@ -119,7 +127,10 @@ class ResilientMotorController(MotorController):
             return self._last_known_positions[idx]
         else:
             # Never successfully read this motor - use 0 as safe default
-            print(f"[RESILIENT] ⚠️ Motor {idx+1} ({name}) has no position history, using 0")
+            motor_events.record(
+                WARNING, "RESILIENT", "motor_no_history", "⚠️ Motor {index} ({motor}) has no position history, using 0",
+                index=idx + 1, motor=name,
+            )
             return 0
     
     def disconnect(self):
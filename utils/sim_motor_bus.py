@@ -0,0 +1,409 @@
+"""
+Simulated Feetech STS3215 bus for running motor code without hardware.
+
+``HomePos.create_motor_bus`` returns a :class:`SimulatedFeetechBus` for ports
+of the form ``sim://<name>[?option=value&...]``, so ``MotorController``,
+``ResilientMotorBus``, ``MotorHandle`` telemetry and the execution strategies
+run unchanged against it.  Options in the query string override the
+:class:`SimBusProfile` defaults the first time a port is opened, e.g.
+``sim://arm1?baudrate=115200&error_rate=0.02``.
+
+Each port maps to one :class:`SimulatedArm` (the "physical" servos), which
+outlives individual connections the way a real arm keeps its pose while the
+controller disconnects and reconnects.  The model covers what matters for
+timing work:
+
+- every transaction holds the arm's serial lock and sleeps for the bytes on
+  the wire at the configured baud rate plus a fixed USB/servo turnaround;
+- injected errors cost a status-packet timeout before raising the same
+  ``[TxRxResult] Incorrect status packet!`` text lerobot produces;
+- servos follow a trapezoidal profile limited by ``Goal_Velocity``
+  (steps/s) and ``Acceleration`` (100 steps/s² per unit, 0 = unlimited).
+
+Bus usage is accumulated in :attr:`SimulatedArm.stats` (transactions, bytes,
+time the line was busy) and goal writes are timestamped in
+:attr:`SimulatedArm.goal_writes`, so tests can report occupancy and command
+timing.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, fields, replace
+from typing import Deque, Dict, Iterable, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+SIM_PORT_PREFIX = "sim://"
+
+# STS3215 registers used by this project: name -> size in bytes
+REGISTER_SIZES = {
+    "Torque_Enable": 1,
+    "Acceleration": 1,
+    "Goal_Position": 2,
+    "Goal_Velocity": 2,
+    "Lock": 1,
+    "Present_Position": 2,
+    "Present_Velocity": 2,
+    "Present_Load": 2,
+    "Present_Voltage": 1,
+    "Present_Temperature": 1,
+    "Moving": 1,
+    "Present_Current": 2,
+}
+
+# Feetech protocol framing: FF FF ID LEN INSTR ... CHECKSUM
+_WRITE_OVERHEAD_BYTES = 7   # + data bytes
+_READ_REQUEST_BYTES = 8
+_STATUS_OVERHEAD_BYTES = 6  # + data bytes for reads
+_BITS_PER_BYTE = 10         # 8N1
+
+POSITION_MIN = 0
+POSITION_MAX = 4095
+MAX_VELOCITY = 3400         # steps/s at 12 V with Goal_Velocity = 0
+ACCELERATION_UNIT = 100.0   # steps/s² per Acceleration register unit
+_STEP_S = 0.002             # integration step for the motion model
+
+
+@dataclass(frozen=True)
+class SimBusProfile:
+    """Electrical and timing characteristics of a simulated bus."""
+
+    baudrate: int = 1_000_000
+    turnaround_s: float = 0.0005       # USB latency + servo return delay per transaction
+    error_rate: float = 0.0            # probability that a transaction fails
+    error_timeout_s: float = 0.01      # line time lost to a failed transaction
+    error_message: str = "[TxRxResult] Incorrect status packet!"
+    tracking_error: int = 0            # steady-state position error in steps
+    seed: Optional[int] = None
+
+    @classmethod
+    def from_query(cls, query: str, base: Optional["SimBusProfile"] = None) -> "SimBusProfile":
+        base = base or cls()
+        types = {field.name: field.type for field in fields(cls)}
+        overrides = {}
+        for key, value in parse_qsl(query):
+            if key not in types:
+                raise ValueError(f"Unknown simulated bus option: {key}")
+            if key == "error_message":
+                overrides[key] = value
+            elif key == "seed":
+                overrides[key] = int(value)
+            elif "int" in str(types[key]):
+                overrides[key] = int(float(value))
+            else:
+                overrides[key] = float(value)
+        return replace(base, **overrides)
+
+    def line_time(self, byte_count: int) -> float:
+        return byte_count * _BITS_PER_BYTE / float(self.baudrate)
+
+
+@dataclass
+class BusStats:
+    transactions: int = 0
+    reads: int = 0
+    writes: int = 0
+    errors: int = 0
+    bytes_on_wire: int = 0
+    busy_s: float = 0.0
+    since: float = 0.0
+
+    def occupancy(self, now: Optional[float] = None) -> float:
+        """Fraction of wall time since :attr:`since` that the line was busy."""
+        elapsed = (now if now is not None else time.perf_counter()) - self.since
+        return self.busy_s / elapsed if elapsed > 0 else 0.0
+
+
+class SimulatedServo:
+    """Single STS3215 with a velocity/acceleration-limited motion profile."""
+
+    def __init__(self, servo_id: int, position: int = 2048, tracking_error: int = 0):
+        self.id = servo_id
+        self.registers: Dict[str, int] = {
+            "Torque_Enable": 0,
+            "Acceleration": 0,
+            "Goal_Position": position,
+            "Goal_Velocity": 0,
+            "Lock": 0,
+            "Present_Temperature": 35,
+            "Present_Voltage": 120,
+        }
+        self.position = float(position)
+        self.velocity = 0.0
+        self.tracking_error = tracking_error
+        self._updated = time.perf_counter()
+
+    def _target(self) -> float:
+        goal = float(self.registers["Goal_Position"])
+        if self.tracking_error:
+            # Real servos stop a few steps short on the side they approach from
+            goal -= math.copysign(self.tracking_error, goal - self.position) if goal != self.position else 0.0
+        return goal
+
+    def advance(self, now: float) -> None:
+        dt_total = now - self._updated
+        self._updated = now
+        if dt_total <= 0:
+            return
+        if not self.registers["Torque_Enable"]:
+            self.velocity = 0.0
+            return
+
+        target = self._target()
+        vmax = float(self.registers["Goal_Velocity"] or MAX_VELOCITY)
+        accel_units = self.registers["Acceleration"]
+        accel = accel_units * ACCELERATION_UNIT if accel_units else math.inf
+
+        while dt_total > 0:
+            remaining = target - self.position
+            if abs(remaining) < 0.5 and abs(self.velocity) < 1.0:
+                self.position = target
+                self.velocity = 0.0
+                return
+            dt = min(_STEP_S, dt_total)
+            dt_total -= dt
+            direction = math.copysign(1.0, remaining)
+            if math.isinf(accel):
+                desired = direction * vmax
+                self.velocity = desired
+            else:
+                # Brake early enough to stop on the target
+                desired = direction * min(vmax, math.sqrt(2.0 * accel * abs(remaining)))
+                delta = desired - self.velocity
+                self.velocity += max(-accel * dt, min(accel * dt, delta))
+            step = self.velocity * dt
+            if abs(step) >= abs(remaining) and math.copysign(1.0, step) == direction:
+                self.position = target
+                self.velocity = 0.0
+                return
+            self.position += step
+
+    def read(self, register: str) -> int:
+        if register == "Present_Position":
+            return int(round(min(POSITION_MAX, max(POSITION_MIN, self.position))))
+        if register == "Present_Velocity":
+            return int(round(self.velocity))
+        if register == "Moving":
+            return int(abs(self.velocity) >= 1.0)
+        if register == "Present_Load":
+            return int(min(1000, abs(self.velocity) / 4.0))
+        if register == "Present_Current":
+            return int(min(500, abs(self.velocity) / 20.0))
+        return int(self.registers.get(register, 0))
+
+    def write(self, register: str, value: int) -> None:
+        value = int(value)
+        if register == "Goal_Position":
+            value = min(POSITION_MAX, max(POSITION_MIN, value))
+        elif register == "Torque_Enable" and value and not self.registers["Torque_Enable"]:
+            # Enabling torque latches the current pose as the goal
+            self.registers["Goal_Position"] = int(round(self.position))
+        self.registers[register] = value
+
+
+class SimulatedArm:
+    """Physical state and shared serial line behind one ``sim://`` port."""
+
+    def __init__(self, port: str, motor_names: Sequence[str], profile: Optional[SimBusProfile] = None,
+                 positions: Optional[Sequence[int]] = None):
+        self.port = port
+        self.profile = profile or SimBusProfile()
+        self.motor_names = list(motor_names)
+        positions = list(positions) if positions is not None else [2048] * len(self.motor_names)
+        self.servos = {
+            name: SimulatedServo(idx, positions[idx - 1], self.profile.tracking_error)
+            for idx, name in enumerate(self.motor_names, start=1)
+        }
+        self.stats = BusStats(since=time.perf_counter())
+        # (perf_counter, motor, value) for every accepted Goal_Position write
+        self.goal_writes: Deque[Tuple[float, str, int]] = deque(maxlen=4096)
+        self._line = threading.Lock()
+        self._rng = random.Random(self.profile.seed)
+
+    def reset_stats(self) -> None:
+        with self._line:
+            self.stats = BusStats(since=time.perf_counter())
+
+    def positions(self) -> list[int]:
+        now = time.perf_counter()
+        with self._line:
+            for servo in self.servos.values():
+                servo.advance(now)
+            return [servo.read("Present_Position") for servo in self.servos.values()]
+
+    def transact(self, kind: str, register: str, motor_name: str, value: Optional[int] = None) -> Optional[int]:
+        """One request/status exchange with a single servo."""
+        result = self.exchange(kind, register, {motor_name: value})
+        return result[motor_name] if kind == "read" else None
+
+    def exchange(self, kind: str, register: str, targets: Dict[str, Optional[int]]) -> Dict[str, int]:
+        """
+        One packet on the line: ``read``/``write`` address one servo, ``sync_read``
+        and ``sync_write`` address all of ``targets`` (sync writes get no status reply).
+        """
+        if register not in REGISTER_SIZES:
+            raise KeyError(f"Unknown register '{register}'")
+        servos = []
+        for motor_name in targets:
+            servo = self.servos.get(motor_name)
+            if servo is None:
+                raise KeyError(f"Unknown motor '{motor_name}'")
+            servos.append((motor_name, servo))
+
+        size = REGISTER_SIZES[register]
+        count = len(servos)
+        if kind == "read":
+            wire_bytes = _READ_REQUEST_BYTES + _STATUS_OVERHEAD_BYTES + size
+        elif kind == "write":
+            wire_bytes = _WRITE_OVERHEAD_BYTES + size + _STATUS_OVERHEAD_BYTES
+        elif kind == "sync_read":
+            wire_bytes = _READ_REQUEST_BYTES + count + count * (_STATUS_OVERHEAD_BYTES + size)
+        elif kind == "sync_write":
+            wire_bytes = _READ_REQUEST_BYTES + count * (1 + size)
+        else:
+            raise ValueError(f"Unknown transaction kind '{kind}'")
+
+        profile = self.profile
+        with self._line:
+            failed = profile.error_rate > 0 and self._rng.random() < profile.error_rate
+            duration = profile.error_timeout_s if failed else profile.line_time(wire_bytes) + profile.turnaround_s
+            _sleep(duration)
+            stats = self.stats
+            stats.transactions += 1
+            stats.bytes_on_wire += wire_bytes
+            stats.busy_s += duration
+            if failed:
+                stats.errors += 1
+                verb = "read" if kind.endswith("read") else "write"
+                raise ConnectionError(
+                    f"Failed to {verb} '{register}' on id_={servos[0][1].id} after 1 tries. {profile.error_message}"
+                )
+            now = time.perf_counter()
+            if kind.endswith("read"):
+                stats.reads += 1
+                result = {}
+                for motor_name, servo in servos:
+                    servo.advance(now)
+                    result[motor_name] = servo.read(register)
+                return result
+            stats.writes += 1
+            for motor_name, servo in servos:
+                servo.advance(now)
+                servo.write(register, targets[motor_name])
+                if register == "Goal_Position":
+                    self.goal_writes.append((now, motor_name, int(targets[motor_name])))
+            return {}
+
+
+def _sleep(duration: float) -> None:
+    """``time.sleep`` overshoots sub-millisecond waits badly; spin for the tail."""
+    deadline = time.perf_counter() + duration
+    if duration > 0.002:
+        time.sleep(duration - 0.001)
+    while time.perf_counter() < deadline:
+        pass
+
+
+class SimulatedFeetechBus:
+    """Connection to a :class:`SimulatedArm` with the ``FeetechMotorsBus`` calls this project uses."""
+
+    def __init__(self, port: str, motors: Optional[Iterable[str]] = None):
+        self.port = port
+        self.arm = simulated_arm(port, motor_names=motors)
+        self.motors = list(self.arm.motor_names)
+        self.is_connected = False
+
+    def connect(self) -> None:
+        if self.is_connected:
+            raise RuntimeError(f"{self.port} is already connected")
+        self.is_connected = True
+
+    def disconnect(self, disable_torque: bool = False) -> None:
+        if disable_torque and self.is_connected:
+            for name in self.motors:
+                self.write("Torque_Enable", name, 0, normalize=False)
+        self.is_connected = False
+
+    def _check_connected(self) -> None:
+        if not self.is_connected:
+            raise ConnectionError(f"{self.port} is not connected")
+
+    def read(self, register: str, motor: str, normalize: bool = True) -> int:
+        self._check_connected()
+        return self.arm.transact("read", register, motor)
+
+    def write(self, register: str, motor: str, value, normalize: bool = True) -> None:
+        self._check_connected()
+        self.arm.transact("write", register, motor, int(value))
+
+    def sync_read(self, register: str, motors: Optional[Iterable[str]] = None, normalize: bool = True) -> Dict[str, int]:
+        self._check_connected()
+        return self.arm.exchange("sync_read", register, dict.fromkeys(motors or self.motors))
+
+    def sync_write(self, register: str, values: Dict[str, int], normalize: bool = True) -> None:
+        self._check_connected()
+        self.arm.exchange("sync_write", register, {name: int(value) for name, value in values.items()})
+
+
+_arms: Dict[str, SimulatedArm] = {}
+_arms_lock = threading.Lock()
+
+
+def is_simulated_port(port) -> bool:
+    return isinstance(port, str) and port.startswith(SIM_PORT_PREFIX)
+
+
+def simulated_arm(
+    port: str,
+    profile: Optional[SimBusProfile] = None,
+    motor_names: Optional[Iterable[str]] = None,
+    positions: Optional[Sequence[int]] = None,
+) -> SimulatedArm:
+    """
+    Arm behind ``port``, created on first use.
+
+    Passing ``profile``/``positions`` replaces any existing arm on that port,
+    which is how tests set up a scenario before handing the port to
+    ``MotorController``.
+    """
+    base_port = port.split("?", 1)[0]
+    with _arms_lock:
+        arm = _arms.get(base_port)
+        if arm is None or profile is not None or positions is not None:
+            if motor_names is None:
+                from HomePos import MOTOR_NAMES  # Local import: HomePos imports this module lazily
+                motor_names = MOTOR_NAMES
+            if profile is None:
+                profile = SimBusProfile.from_query(urlsplit(port).query)
+            arm = SimulatedArm(base_port, list(motor_names), profile, positions)
+            _arms[base_port] = arm
+        return arm
+
+
+def reset_simulated_arms() -> None:
+    with _arms_lock:
+        _arms.clear()
+
+
+def create_simulated_bus(port: str, motor_names: Optional[Iterable[str]] = None) -> SimulatedFeetechBus:
+    bus = SimulatedFeetechBus(port, motor_names)
+    bus.connect()
+    return bus
+
+
+__all__ = [
+    "SIM_PORT_PREFIX",
+    "BusStats",
+    "SimBusProfile",
+    "SimulatedArm",
+    "SimulatedFeetechBus",
+    "SimulatedServo",
+    "create_simulated_bus",
+    "is_simulated_port",
+    "reset_simulated_arms",
+    "simulated_arm",
+]
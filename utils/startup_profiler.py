@@ -0,0 +1,282 @@
+"""Opt-in start-up profiler: import times, constructor phases and a budget.
+
+Enable it for ``app.py``, ``vision_app.py`` or the vision daemon with either
+
+* ``--profile-startup`` on the command line, or
+* ``NICEBOT_PROFILE_STARTUP=1`` in the environment.
+
+While active, every module executed through the import system is timed
+(cumulative time including its own imports, and self time excluding them).
+Constructor/phase timings come from :mod:`utils.startup_timing`.  When the
+entry point reaches its "ready" point (first paint for the GUIs, main loop
+for the daemon) a JSON report is written to
+``runtime/startup_profile/<app>.json`` and the cold-start time is checked
+against the budget in ``config/startup_budget.json``.
+
+``NICEBOT_PROFILE_EXIT=1`` makes the entry point exit right after writing the
+report, which is what ``tools/check_startup_budget.py`` uses.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+from utils.startup_timing import startup_timer
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_REPORT_DIR = ROOT / "runtime" / "startup_profile"
+DEFAULT_BUDGET_PATH = ROOT / "config" / "startup_budget.json"
+
+PROFILE_FLAG = "--profile-startup"
+PROFILE_ENV = "NICEBOT_PROFILE_STARTUP"
+PROFILE_EXIT_ENV = "NICEBOT_PROFILE_EXIT"
+BUDGET_ENV = "NICEBOT_STARTUP_BUDGET_MS"
+
+_TRUTHY = {"1", "true", "yes", "on"}
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in _TRUTHY
+
+
+def profiling_requested(argv: Optional[Sequence[str]] = None) -> bool:
+    """True if the profiler was requested via flag or environment."""
+    argv = sys.argv[1:] if argv is None else argv
+    return _env_flag(PROFILE_ENV) or PROFILE_FLAG in argv
+
+
+def exit_after_report() -> bool:
+    return _env_flag(PROFILE_EXIT_ENV)
+
+
+class _TimedLoader:
+    """Loader wrapper that reports ``exec_module`` time to the profiler."""
+
+    def __init__(self, loader, profiler: "ImportProfiler") -> None:
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        name = module.__name__
+        self._profiler._enter(name)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit(name)
+            # Hand the real loader back so introspection (resources, reload) is unaffected
+            if getattr(module, "__loader__", None) is self:
+                module.__loader__ = self._loader
+            spec = getattr(module, "__spec__", None)
+            if spec is not None and spec.loader is self:
+                spec.loader = self._loader
+
+    def __getattr__(self, attr: str):
+        return getattr(self._loader, attr)
+
+
+class _TimingFinder:
+    """Meta path entry that delegates to the real finders and wraps their loaders."""
+
+    def __init__(self, profiler: "ImportProfiler") -> None:
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find_spec = getattr(finder, "find_spec", None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        loader = spec.loader
+        if loader is not None and hasattr(loader, "exec_module") and not isinstance(loader, _TimedLoader):
+            spec.loader = _TimedLoader(loader, self._profiler)
+        return spec
+
+
+class ImportProfiler:
+    """Per-module cumulative/self import times (main thread only)."""
+
+    def __init__(self) -> None:
+        self._finder = _TimingFinder(self)
+        self._stack: List[List] = []  # [name, start, child_seconds]
+        self._records: Dict[str, Dict[str, float]] = {}
+        self._thread_id = threading.get_ident()
+        self.installed = False
+
+    def install(self) -> None:
+        if not self.installed:
+            sys.meta_path.insert(0, self._finder)
+            self.installed = True
+
+    def uninstall(self) -> None:
+        if self.installed:
+            try:
+                sys.meta_path.remove(self._finder)
+            except ValueError:
+                pass
+            self.installed = False
+
+    def _enter(self, name: str) -> None:
+        if threading.get_ident() != self._thread_id:
+            return
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def _exit(self, name: str) -> None:
+        if threading.get_ident() != self._thread_id or not self._stack or self._stack[-1][0] != name:
+            return
+        _, start, child = self._stack.pop()
+        cumulative = time.perf_counter() - start
+        if self._stack:
+            self._stack[-1][2] += cumulative
+        self._records[name] = {
+            "cumulative_ms": round(cumulative * 1000.0, 3),
+            "self_ms": round((cumulative - child) * 1000.0, 3),
+            "start_ms": round((start - startup_timer.origin) * 1000.0, 3),
+        }
+
+    def records(self) -> List[Dict[str, object]]:
+        rows = [{"module": name, **data} for name, data in self._records.items()]
+        rows.sort(key=lambda row: row["cumulative_ms"], reverse=True)
+        return rows
+
+
+def load_budget(app_name: str, path: Path = DEFAULT_BUDGET_PATH) -> Dict[str, float]:
+    """Budget for ``app_name``: ``{"cold_start_ms": ..., "max_module_ms": ...}``."""
+    budget: Dict[str, float] = {}
+    try:
+        with open(path, "r") as handle:
+            data = json.load(handle) or {}
+        budget.update(data.get("default", {}) or {})
+        budget.update(data.get(app_name, {}) or {})
+    except FileNotFoundError:
+        pass
+    except Exception as exc:
+        print(f"[STARTUP][WARN] Could not read startup budget {path}: {exc}")
+    override = os.environ.get(BUDGET_ENV)
+    if override:
+        try:
+            budget["cold_start_ms"] = float(override)
+        except ValueError:
+            print(f"[STARTUP][WARN] Ignoring invalid {BUDGET_ENV}={override!r}")
+    return budget
+
+
+def check_budget(report: Dict[str, object], budget: Dict[str, float]) -> List[str]:
+    """Return human-readable budget violations for a profile report."""
+    violations: List[str] = []
+    cold_start_budget = budget.get("cold_start_ms")
+    cold_start = float(report.get("cold_start_ms", 0.0))
+    if cold_start_budget and cold_start > cold_start_budget:
+        violations.append(f"cold start {cold_start:.0f} ms exceeds budget {cold_start_budget:.0f} ms")
+
+    module_budget = budget.get("max_module_ms")
+    if module_budget:
+        for row in report.get("imports", []):
+            # Self time, so a slow child is not charged to every parent as well
+            if row["self_ms"] > module_budget:
+                violations.append(
+                    f"import {row['module']} took {row['self_ms']:.0f} ms (budget {module_budget:.0f} ms)"
+                )
+    return violations
+
+
+class StartupProfiler:
+    """Ties the import profiler, phase timer and budget check together."""
+
+    def __init__(self, app_name: str, report_dir: Path = DEFAULT_REPORT_DIR, budget_path: Path = DEFAULT_BUDGET_PATH):
+        self.app_name = app_name
+        self.report_dir = Path(report_dir)
+        self.budget_path = Path(budget_path)
+        self.imports = ImportProfiler()
+        self.report: Optional[Dict[str, object]] = None
+
+    def start(self) -> "StartupProfiler":
+        self.imports.install()
+        return self
+
+    def build_report(self, ready_mark: str) -> Dict[str, object]:
+        timing = startup_timer.as_dict()
+        cold_start = timing["marks"].get(ready_mark, round(startup_timer.elapsed() * 1000.0, 2))
+        imports = self.imports.records()
+        return {
+            "app": self.app_name,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "ready_mark": ready_mark,
+            "cold_start_ms": cold_start,
+            "import_total_ms": round(sum(row["self_ms"] for row in imports), 2),
+            "imports": imports,
+            "phases": timing["phases"],
+            "marks": timing["marks"],
+        }
+
+    def finish(self, ready_mark: str) -> Dict[str, object]:
+        """Stop profiling, write the JSON report and check the budget."""
+        if self.report is not None:
+            return self.report
+        startup_timer.mark(ready_mark)
+        self.imports.uninstall()
+
+        report = self.build_report(ready_mark)
+        budget = load_budget(self.app_name, self.budget_path)
+        violations = check_budget(report, budget)
+        report["budget"] = budget
+        report["violations"] = violations
+        report["over_budget"] = bool(violations)
+
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+        path = self.report_dir / f"{self.app_name}.json"
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as handle:
+            json.dump(report, handle, indent=2)
+        os.replace(tmp_path, path)
+        report["path"] = str(path)
+        self.report = report
+
+        top = ", ".join(f"{row['module']} {row['cumulative_ms']:.0f}ms" for row in report["imports"][:5])
+        print(f"[STARTUP] {self.app_name}: ready in {report['cold_start_ms']:.0f} ms "
+              f"(imports {report['import_total_ms']:.0f} ms) -> {path}")
+        if top:
+            print(f"[STARTUP] Slowest imports: {top}")
+        for violation in violations:
+            print(f"[STARTUP][WARN] Budget exceeded: {violation}")
+        return report
+
+
+_active: Optional[StartupProfiler] = None
+
+
+def install_if_requested(app_name: str, argv: Optional[Sequence[str]] = None) -> Optional[StartupProfiler]:
+    """Start profiling when requested; call before the entry point's heavy imports."""
+    global _active
+    if _active is None and profiling_requested(argv):
+        _active = StartupProfiler(app_name).start()
+    return _active
+
+
+def active_profiler() -> Optional[StartupProfiler]:
+    return _active
+
+
+def finish_if_active(ready_mark: str, on_exit: Optional[Callable[[int], None]] = None) -> Optional[Dict[str, object]]:
+    """Write the report if profiling; optionally exit when ``NICEBOT_PROFILE_EXIT`` is set."""
+    if _active is None:
+        return None
+    report = _active.finish(ready_mark)
+    if on_exit is not None and exit_after_report():
+        on_exit(1 if report.get("over_budget") else 0)
+    return report
@@ -0,0 +1,107 @@
+"""Wall-clock breakdown of application start-up phases.
+
+Usage::
+
+    from utils.startup_timing import startup_timer
+
+    with startup_timer.phase("main_window"):
+        window = MainWindow()
+    startup_timer.mark("first_paint")
+    startup_timer.report()
+
+Phases may be nested or overlap (e.g. device discovery running on a worker
+thread while tabs are built); each is reported with its own start offset and
+duration relative to process start.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+
+from utils.safe_print import safe_print
+
+
+@dataclass
+class StartupPhase:
+    name: str
+    start: float
+    end: Optional[float] = None
+
+    @property
+    def duration(self) -> float:
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+
+class StartupTimer:
+    """Collects named phases and point-in-time marks during start-up."""
+
+    def __init__(self) -> None:
+        self.origin = time.perf_counter()
+        self._phases: List[StartupPhase] = []
+        self._marks: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.reported = False
+
+    def begin(self, name: str) -> StartupPhase:
+        phase = StartupPhase(name, time.perf_counter())
+        with self._lock:
+            self._phases.append(phase)
+        return phase
+
+    def end(self, phase: StartupPhase) -> None:
+        phase.end = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[StartupPhase]:
+        phase = self.begin(name)
+        try:
+            yield phase
+        finally:
+            self.end(phase)
+
+    def mark(self, name: str) -> None:
+        """Record a milestone (first mark wins)."""
+        with self._lock:
+            self._marks.setdefault(name, time.perf_counter())
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.origin
+
+    def as_dict(self) -> Dict[str, object]:
+        with self._lock:
+            phases = list(self._phases)
+            marks = dict(self._marks)
+        return {
+            "phases": [
+                {
+                    "name": phase.name,
+                    "start_ms": round((phase.start - self.origin) * 1000.0, 2),
+                    "duration_ms": round(phase.duration * 1000.0, 2),
+                    "finished": phase.end is not None,
+                }
+                for phase in phases
+            ],
+            "marks": {name: round((ts - self.origin) * 1000.0, 2) for name, ts in marks.items()},
+        }
+
+    def report(self, title: str = "Startup timing") -> str:
+        data = self.as_dict()
+        lines = [f"=== {title} ==="]
+        for phase in data["phases"]:
+            suffix = "" if phase["finished"] else " (running)"
+            lines.append(
+                f"  {phase['name']:<28} +{phase['start_ms']:>8.1f} ms  {phase['duration_ms']:>8.1f} ms{suffix}"
+            )
+        for name, offset in data["marks"].items():
+            lines.append(f"  {name:<28} @{offset:>8.1f} ms")
+        text = "\n".join(lines)
+        safe_print(text, flush=True)
+        self.reported = True
+        return text
+
+
+startup_timer = StartupTimer()
@@ -0,0 +1,153 @@
+"""
+Speed-scaled, limit-aware timing for recorded joint paths.
+
+Live recordings store joint positions with the time each was captured.
+Playing one back at a different speed used to mean dividing the timestamps by
+the speed and scaling ``Goal_Velocity`` by the same factor, even where that
+asked a joint for more than it can do, so the arm lagged and then rushed to
+catch up.  :class:`TrajectoryRetimer` instead time-scales the recording: the
+recorded time ``tau`` is the path parameter and each segment gets a playback
+speed ``sigma = dtau/dt`` (1.0 = as recorded), TOPP-style:
+
+1. ``sigma`` is capped by the requested scale, by each joint's velocity limit
+   (``|dq/dtau| * sigma <= v_max``) and by the recorded curvature at both ends
+   of the segment (``|d2q/dtau2| * sigma**2 <= a_max / 2``);
+2. a forward and a backward pass limit how fast ``sigma**2`` may change along
+   the path so that speeding up or slowing down uses at most the other half of
+   each joint's acceleration budget, starting from the entry speed (at rest by
+   default) and ending at rest.
+
+The arm already followed the recording at its own pace, so the limits only
+ever hold back speeding up: ``sigma`` never drops below ``min(scale, 1)``,
+and playback at or below 100% keeps the recorded timing exactly (sampling
+jitter in a recording would otherwise look like curvature and slow it down).
+
+Both passes are O(n), a faster request never produces a slower schedule, and
+re-planning the rest of a long recording takes milliseconds, so playback
+re-runs it whenever the speed slider moves, entering at the speed of the
+segment just sent (:meth:`TrajectoryRetimer.schedule`).
+
+Limits come from ``config["control"]["joint_limits"]`` (steps/s and
+steps/s², scalar or one value per joint)::
+
+    "joint_limits": {"velocity": 3000, "acceleration": [15000, 15000, 15000, 20000, 20000, 20000]}
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_VELOCITY_LIMIT = 3000.0  # steps/s, STS3215 at 12 V leaves some headroom below ~3400
+DEFAULT_ACCELERATION_LIMIT = 20000.0  # steps/s², Acceleration register 200
+MIN_SEGMENT_S = 0.001
+
+
+def _per_joint(value, joints: int, default: float) -> Tuple[float, ...]:
+    if value is None:
+        return (default,) * joints
+    if isinstance(value, (int, float)):
+        return (float(value),) * joints
+    values = [float(v) for v in value][:joints]
+    return tuple(values + [default] * (joints - len(values)))
+
+
+@dataclass(frozen=True)
+class JointLimits:
+    """Per-joint velocity (steps/s) and acceleration (steps/s²) limits."""
+
+    velocity: Tuple[float, ...]
+    acceleration: Tuple[float, ...]
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, object]], joints: int = 6) -> "JointLimits":
+        control = (config or {}).get("control", {}) or {}
+        limits = control.get("joint_limits", {}) or {}
+        return cls(
+            velocity=_per_joint(limits.get("velocity"), joints, DEFAULT_VELOCITY_LIMIT),
+            acceleration=_per_joint(limits.get("acceleration"), joints, DEFAULT_ACCELERATION_LIMIT),
+        )
+
+
+class TrajectoryRetimer:
+    """Time scaling of one recorded path; re-plannable mid-playback."""
+
+    def __init__(self, positions: Sequence[Sequence[float]], timestamps: Sequence[float], limits: JointLimits):
+        if len(positions) != len(timestamps):
+            raise ValueError("positions and timestamps must have the same length")
+        self.limits = limits
+        self.joints = len(positions[0]) if positions else 0
+        # Segment k goes from point k to point k + 1
+        self.deltas = [
+            [float(b) - float(a) for a, b in zip(positions[k], positions[k + 1])]
+            for k in range(len(positions) - 1)
+        ]
+        self.recorded = [max(float(timestamps[k + 1]) - float(timestamps[k]), MIN_SEGMENT_S)
+                         for k in range(len(self.deltas))]
+        # Joint velocity along the path (steps per recorded second)
+        self.rates = [[d / dtau for d in delta] for delta, dtau in zip(self.deltas, self.recorded)]
+        self._velocity_caps = [self._cap(rate, limits.velocity, 1.0) for rate in self.rates]
+        # Half of each joint's acceleration budget goes to path curvature...
+        curvature_caps = [math.inf] * len(self.rates)
+        for k in range(1, len(self.rates)):
+            span = (self.recorded[k - 1] + self.recorded[k]) / 2.0
+            curvature = [(b - a) / span for a, b in zip(self.rates[k - 1], self.rates[k])]
+            cap = self._cap(curvature, limits.acceleration, 0.5) ** 0.5
+            curvature_caps[k - 1] = min(curvature_caps[k - 1], cap)
+            curvature_caps[k] = min(curvature_caps[k], cap)
+        self._speed_caps = [min(v, c) for v, c in zip(self._velocity_caps, curvature_caps)]
+        # ...and the other half to changing the playback speed:
+        # d(sigma^2)/dtau <= 2 * ramp
+        self._ramps = [self._cap(rate, limits.acceleration, 0.5) for rate in self.rates]
+
+    @classmethod
+    def from_recording(cls, recorded_data: Sequence[Dict[str, object]], limits: JointLimits) -> "TrajectoryRetimer":
+        return cls([point["positions"] for point in recorded_data],
+                   [point["timestamp"] for point in recorded_data], limits)
+
+    @staticmethod
+    def _cap(values: Sequence[float], limits: Sequence[float], share: float) -> float:
+        """Largest factor ``c`` with ``|value_j| * c <= share * limit_j`` for every joint."""
+        return min((share * limit / abs(value) for value, limit in zip(values, limits) if value), default=math.inf)
+
+    def speeds(self, scale: float, start: int = 0, entry_speed: float = 0.0) -> List[float]:
+        """Playback speed (recorded seconds per second) for segments ``start..``."""
+        scale = max(scale, 1e-3)
+        floor = min(scale, 1.0)
+        caps = [min(scale, max(cap, floor)) for cap in self._speed_caps[start:]]
+        if not caps:
+            return []
+        squared = []
+        previous = max(entry_speed, 0.0) ** 2
+        for offset, cap in enumerate(caps):
+            k = start + offset
+            previous = min(cap * cap, previous + 2.0 * self._ramps[k] * self.recorded[k])
+            squared.append(previous)
+        following = 0.0  # Come to rest after the last point
+        for offset in range(len(squared) - 1, -1, -1):
+            k = start + offset
+            following = min(squared[offset], following + 2.0 * self._ramps[k] * self.recorded[k])
+            squared[offset] = following
+        return [max(value, floor * floor) ** 0.5 for value in squared]
+
+    def durations(self, scale: float, start: int = 0, entry_speed: float = 0.0) -> List[float]:
+        """Wall-clock durations for segments ``start..`` at ``scale`` x recorded speed."""
+        return [self.recorded[start + offset] / speed
+                for offset, speed in enumerate(self.speeds(scale, start, entry_speed))]
+
+    def segment_velocity(self, segment: int, duration: float) -> List[float]:
+        """Joint velocities (steps/s) while crossing ``segment`` in ``duration`` seconds."""
+        duration = max(duration, MIN_SEGMENT_S)
+        return [d / duration for d in self.deltas[segment]]
+
+    def schedule(self, scale: float, start: int = 0, start_time: float = 0.0, entry_speed: float = 0.0) -> List[float]:
+        """Send times for points ``start..`` (point ``start`` at ``start_time``).
+
+        ``entry_speed`` is the playback speed the arm is at when it reaches
+        point ``start`` (0 = at rest).
+        """
+        times = [start_time]
+        for duration in self.durations(scale, start, entry_speed):
+            times.append(times[-1] + duration)
+        return times
@@ -0,0 +1,82 @@
+"""Rate-limited delivery of worker status, progress and log signals to the UI."""
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
+
+from utils.event_coalescer import EventCoalescer
+
+
+class WorkerEventBus(QObject):
+    """
+    Coalesces worker signals and re-emits them on the GUI thread at a fixed rate.
+
+    ``attach(worker)`` connects the worker's ``status_update``,
+    ``progress_update`` and ``log_message`` signals with a direct connection,
+    so emitting them only posts into an :class:`EventCoalescer` on the worker
+    thread.  A GUI-thread timer drains it every ``interval_ms`` and emits at
+    most one ``status_changed``, one ``progress_changed`` and one
+    ``logs_ready`` batch per tick.  Low-rate signals (completion, sequence
+    steps, vision state) should stay connected to the UI directly; their
+    handlers call :meth:`flush` first so earlier output is not reordered.
+    """
+
+    status_changed = Signal(str)
+    progress_changed = Signal(int, int)
+    logs_ready = Signal(list)  # [(level, message), ...] in emission order
+
+    def __init__(self, interval_ms: int = 100, max_pending_logs: int = 500, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._coalescer = EventCoalescer(max_pending_logs)
+        self._workers: List[QObject] = []
+        self._timer = QTimer(self)
+        self._timer.setInterval(max(1, int(interval_ms)))
+        self._timer.timeout.connect(self._on_tick)
+
+    def attach(self, worker: QObject) -> None:
+        if worker is None or worker in self._workers:
+            return
+        worker.status_update.connect(self._coalescer.post_status, Qt.DirectConnection)
+        worker.progress_update.connect(self._coalescer.post_progress, Qt.DirectConnection)
+        worker.log_message.connect(self._coalescer.post_log, Qt.DirectConnection)
+        self._workers.append(worker)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def detach(self, worker: QObject) -> None:
+        """Stop listening to ``worker``; anything it already posted is still delivered."""
+        if worker not in self._workers:
+            return
+        self._workers.remove(worker)
+        for signal, slot in (
+            (worker.status_update, self._coalescer.post_status),
+            (worker.progress_update, self._coalescer.post_progress),
+            (worker.log_message, self._coalescer.post_log),
+        ):
+            try:
+                signal.disconnect(slot)
+            except (RuntimeError, TypeError):
+                pass
+
+    def flush(self) -> None:
+        """Deliver everything pending right now (GUI thread only)."""
+        events = self._coalescer.drain()
+        if events.logs:
+            if events.dropped_logs:
+                events.logs.insert(0, ("warning", f"{events.dropped_logs} log lines were skipped to keep the display responsive."))
+            self.logs_ready.emit(events.logs)
+        if events.progress is not None:
+            self.progress_changed.emit(*events.progress)
+        if events.status is not None:
+            self.status_changed.emit(events.status)
+
+    def clear(self) -> None:
+        """Discard pending updates without delivering them."""
+        self._coalescer.clear()
+
+    def _on_tick(self) -> None:
+        self.flush()
+        if not self._workers and not self._coalescer.pending:
+            self._timer.stop()
@@ -7,6 +7,12 @@ import argparse
 import sys
 from typing import Optional
 
+from utils.startup_timing import startup_timer
+from utils.startup_profiler import finish_if_active, install_if_requested
+
+install_if_requested("vision_app")
+
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QApplication
 
 try:
@@ -45,14 +51,18 @@ class VisionApp(VisionDesignerWindow):
 def main():
     parser = argparse.ArgumentParser(description="Vision trigger designer")
     parser.add_argument("--vision", action="store_true", help="Legacy flag (ignored)")
+    parser.add_argument("--profile-startup", action="store_true", help="Write a startup timing report")
     args = parser.parse_args()  # noqa: F841 - kept for CLI compatibility
 
-    app = QApplication.instance() or QApplication(sys.argv)
-    app.setStyle("Fusion")
-    configure_app_palette(app)
+    with startup_timer.phase("qt_application"):
+        app = QApplication.instance() or QApplication(sys.argv)
+        app.setStyle("Fusion")
+        configure_app_palette(app)
 
-    window = VisionApp(standalone=True)
+    with startup_timer.phase("main_window"):
+        window = VisionApp(standalone=True)
     window.show()
+    QTimer.singleShot(0, lambda: finish_if_active("first_paint", on_exit=app.exit))
 
     return app.exec()
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import argparse
 import gc
 import os
 import signal
@@ -10,6 +11,12 @@ import time
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from utils.startup_timing import startup_timer
+from utils.startup_profiler import exit_after_report, finish_if_active, install_if_requested
+
+# Must run before the heavy imports below to see them
+install_if_requested("vision_daemon", sys.argv[1:] if __name__ == "__main__" else ())
+
 import cv2
 import numpy as np
 import psutil
@@ -19,14 +26,18 @@ from utils.camera_backend import open_capture
 from utils.logging_utils import log_exception
 
 try:  # pragma: no cover - support running as package or script
+    from .detectors.change import SceneChangeDetector
     from .detectors.presence import PresenceDetector
-    from .ipc import IPCManager
+    from .ipc import DAEMON_EXIT_MEMORY_EXCEEDED, IPCManager
+    from .scheduler import TriggerScheduler
     from .time_utils import get_timezone, now_iso
     from .trigger_rules import TriggerEvaluator
     from .triggers_manager import TriggersManager
 except ImportError:  # pragma: no cover
+    from vision_triggers.detectors.change import SceneChangeDetector
     from vision_triggers.detectors.presence import PresenceDetector
-    from vision_triggers.ipc import IPCManager
+    from vision_triggers.ipc import DAEMON_EXIT_MEMORY_EXCEEDED, IPCManager
+    from vision_triggers.scheduler import TriggerScheduler
     from vision_triggers.time_utils import get_timezone, now_iso
     from vision_triggers.trigger_rules import TriggerEvaluator
     from vision_triggers.triggers_manager import TriggersManager
@@ -83,16 +94,19 @@ class VirtualCamera:
 class VisionDaemon:
     """Main vision daemon process"""
     
-    def __init__(self, config_path: Path, runtime_dir: Path):
+    def __init__(self, config_path: Path, runtime_dir: Path, supervised: bool = False):
         """
         Initialize vision daemon
         
         Args:
             config_path: Path to vision_config.yaml
             runtime_dir: Path to runtime directory
+            supervised: Running under the watchdog; keep robot state and
+                pending events across restarts
         """
         self.config_path = config_path
         self.runtime_dir = runtime_dir
+        self.supervised = supervised
         
         # Load configuration
         self.config = self._load_config()
@@ -113,8 +127,10 @@ class VisionDaemon:
         # State
         self.running = False
         self.stop_requested = False
+        self.exit_code = 0
         self.current_fps = self.config['performance']['idle_fps']
         self.last_detection_time = None
+        self.last_change_time = None
         
         # Memory management
         self.frames_processed = 0
@@ -122,10 +138,37 @@ class VisionDaemon:
         self.process = psutil.Process(os.getpid())
         self.max_memory_mb = self.config['memory']['max_memory_mb']
         self.cleanup_interval = self.config['memory']['cleanup_interval_detections']
+        self.last_cleanup_detections = 0
+        
+        # Heartbeat for the watchdog (several beats per hang timeout)
+        hang_timeout = self.config.get('watchdog', {}).get('hang_timeout_seconds', 60)
+        self.heartbeat_interval = min(10.0, max(1.0, hang_timeout / 6.0))
+        self.last_heartbeat = float("-inf")
+        self.last_loop_latency = 0.0
+        
+        # Scheduled (seeded) background resets
+        reset_hours = self.config['memory'].get('reset_background_every_hours') or 0
+        self.background_reset_interval = float(reset_hours) * 3600.0
+        self.last_background_reset = time.monotonic()
         
         # Active triggers cache
         self.active_triggers = {}
         
+        # Per-trigger deadline scheduling (honours check_interval_seconds)
+        max_fps = self.config['performance'].get('max_fps') or 0
+        self.scheduler = TriggerScheduler(min_interval=(1.0 / max_fps) if max_fps > 0 else 0.0)
+        self.state_poll_seconds = 1.0
+        self._gated = True
+        
+        # Scene-change probe in front of full MOG2 detection
+        self.change_detector = None
+        self.probe_interval = 0.0
+        self.max_quiet_seconds = 60.0
+        self.next_probe_time = 0.0
+        self.last_full_detection = float('-inf')
+        self.quiet_skips = 0
+        self._init_change_detector()
+        
         print(f"[DAEMON] Initialized (PID: {os.getpid()})")
     
     def _load_config(self) -> Dict:
@@ -158,7 +201,9 @@ class VisionDaemon:
                     'learning_rate': 0.001,
                     'var_threshold': 16,
                     'detect_shadows': False,
-                    'history': 50
+                    'history': 50,
+                    'snapshots': True,
+                    'snapshot_interval_seconds': 300
                 }
             },
             'performance': {
@@ -167,13 +212,23 @@ class VisionDaemon:
                 'max_fps': 10.0,
                 'adaptive_framerate': True,
                 'slow_until_first_detection': True,
-                'return_to_slow_after_seconds': 30
+                'return_to_slow_after_seconds': 30,
+                'change_detection': {
+                    'enabled': True,
+                    'probe_fps': 2.0,
+                    'thumbnail': [64, 48],
+                    'pixel_threshold': 12,
+                    'on_fraction': 0.01,
+                    'off_fraction': 0.004,
+                    'max_quiet_seconds': 60
+                }
             },
             'memory': {
                 'max_memory_mb': 512,
                 'frame_buffer_size': 3,
                 'cleanup_interval_detections': 100,
-                'force_gc': True
+                'force_gc': True,
+                'reset_background_every_hours': 4
             }
         }
     
@@ -182,8 +237,8 @@ class VisionDaemon:
         try:
             print("[DAEMON] Initializing components...")
             
-            # Initialize IPC
-            self.ipc.initialize()
+            # Initialize IPC (a supervised restart keeps the sequencer's state)
+            self.ipc.initialize(preserve_state=self.supervised)
             self.ipc.write_daemon_pid(os.getpid())
             
             # Initialize camera
@@ -200,7 +255,9 @@ class VisionDaemon:
                 var_threshold=bg_cfg.get('var_threshold', 16),
                 detect_shadows=bg_cfg.get('detect_shadows', False),
                 stability_frames=detection_cfg.get('stability_frames', 2),
-                history=bg_cfg.get('history', 50)
+                history=bg_cfg.get('history', 50),
+                snapshot_path=self._background_snapshot_path(),
+                snapshot_interval_seconds=bg_cfg.get('snapshot_interval_seconds', 300)
             )
             
             if not self.detector.initialize():
@@ -221,6 +278,33 @@ class VisionDaemon:
             print(f"[DAEMON] Initialization error: {exc}")
             return False
     
+    def _init_change_detector(self):
+        """Create the scene-change probe if adaptive frame rate wants it"""
+        perf_cfg = self.config['performance']
+        change_cfg = perf_cfg.get('change_detection', {})
+        if not perf_cfg.get('adaptive_framerate') or not change_cfg.get('enabled', False):
+            return
+        
+        width, height = change_cfg.get('thumbnail', [64, 48])
+        self.change_detector = SceneChangeDetector(
+            size=(width, height),
+            pixel_threshold=change_cfg.get('pixel_threshold', 12),
+            on_fraction=change_cfg.get('on_fraction', 0.01),
+            off_fraction=change_cfg.get('off_fraction', 0.004)
+        )
+        self.probe_interval = 1.0 / max(float(change_cfg.get('probe_fps', 2.0)), 1e-3)
+        self.max_quiet_seconds = float(change_cfg.get('max_quiet_seconds', 60))
+    
+    def _background_snapshot_path(self) -> Optional[Path]:
+        """Snapshot file for the configured camera (None when disabled)"""
+        bg_cfg = self.config['detection'].get('background', {})
+        if not bg_cfg.get('snapshots', True):
+            return None
+        cam_cfg = self.config.get('camera', {})
+        camera_key = ''.join(c if c.isalnum() else '_' for c in str(self.camera_index))
+        name = f"camera_{camera_key}_{cam_cfg.get('width', 0)}x{cam_cfg.get('height', 0)}.npz"
+        return self.runtime_dir / "vision_background" / name
+    
     def _init_camera(self) -> bool:
         """Initialize camera (real or virtual fallback)."""
         try:
@@ -274,28 +358,58 @@ class VisionDaemon:
                 if trigger_data:
                     trigger_id = trigger_data['trigger_id']
                     self.active_triggers[trigger_id] = trigger_data
+                    self.evaluator.compile_trigger(trigger_data)
+                    self.scheduler.add(trigger_id, self._trigger_interval(trigger_data), time.monotonic())
             
             print(f"[DAEMON] Loaded {len(self.active_triggers)} active triggers")
             
             for trigger_id, data in self.active_triggers.items():
-                print(f"  - {data['name']} ({data['type']})")
+                interval = self._trigger_interval(data)
+                print(f"  - {data['name']} ({data['type']}, every {interval:.2f}s)")
         
         except Exception as exc:
             log_exception("VisionDaemon: error loading triggers", exc)
             print(f"[DAEMON] Error loading triggers: {exc}")
     
+    def _trigger_interval(self, trigger_data: Dict) -> float:
+        """Resolve how often a trigger should be evaluated (seconds)"""
+        frame_interval = 1.0 / max(self.current_fps, 1e-3)
+        try:
+            interval = float(trigger_data.get('check_interval_seconds') or 0)
+        except (TypeError, ValueError):
+            interval = 0.0
+        if interval <= 0:
+            return frame_interval
+        
+        # While the adaptive frame rate is boosted, slow triggers follow it
+        if self.current_fps > self.config['performance']['idle_fps']:
+            interval = min(interval, frame_interval)
+        return interval
+    
+    def _refresh_trigger_intervals(self):
+        """Re-apply intervals after the frame rate changes"""
+        now = time.monotonic()
+        for trigger_id, trigger_data in self.active_triggers.items():
+            self.scheduler.set_interval(trigger_id, self._trigger_interval(trigger_data), now)
+    
     def run(self):
         """Main daemon loop"""
-        if not self.initialize():
+        with startup_timer.phase("daemon_initialize"):
+            initialized = self.initialize()
+        if not initialized:
             print("[DAEMON] ✗ Initialization failed, exiting")
             return 1
         
         self.running = True
         print("[DAEMON] ✓ Starting main loop")
+        profile = finish_if_active("loop_ready")
+        if profile is not None and exit_after_report():
+            self.stop_requested = True
+            self.exit_code = 1 if profile.get("over_budget") else 0
         
         try:
             while self.running and not self.stop_requested:
-                loop_start = time.time()
+                self._write_heartbeat()
                 
                 # Check robot state
                 robot_state = self.ipc.read_robot_state()
@@ -307,34 +421,71 @@ class VisionDaemon:
                 if robot_state['state'] != 'home' or not robot_state.get('accepting_triggers', False):
                     # Write idle status
                     self.ipc.write_vision_event("idle", None, None)
+                    self._gated = True
                     time.sleep(1.0)
                     continue
                 
+                now = time.monotonic()
+                if self._gated:
+                    # Evaluate everything straight away once gating lifts
+                    self.scheduler.reschedule_all(now)
+                    self._gated = False
+                
+                # Skip capture entirely until a trigger or the change probe is due
+                wait = self._time_until_work(now)
+                if wait is None:
+                    time.sleep(self.state_poll_seconds)
+                    continue
+                if wait > 0:
+                    time.sleep(min(wait, self.state_poll_seconds))
+                    continue
+                
+                loop_start = time.monotonic()
+                
                 # Capture frame
                 frame = self._capture_frame()
                 if frame is None:
                     print("[DAEMON] Failed to capture frame")
+                    self.scheduler.reschedule_all(time.monotonic(), delay=1.0)
                     time.sleep(1.0)
                     continue
+                self.frames_processed += 1
                 
-                # Process each active trigger
-                for trigger_id, trigger_data in self.active_triggers.items():
+                # Cheap change probe decides whether full detection is worthwhile
+                if self.change_detector is not None and now >= self.next_probe_time:
+                    self._probe_scene(frame, now)
+                
+                # Process each due trigger
+                due_ids = self.scheduler.pop_due(now)
+                quiet = self._scene_quiet(now)
+                for trigger_id in due_ids:
+                    trigger_data = self.active_triggers.get(trigger_id)
+                    if trigger_data is None:
+                        continue
+                    if quiet:
+                        # Nothing moved since the last full pass; skip MOG2
+                        self.scheduler.mark_run(trigger_id, now, 0.0)
+                        self.quiet_skips += 1
+                        continue
+                    started = time.monotonic()
                     self._process_trigger(frame, trigger_data)
+                    self.scheduler.mark_run(trigger_id, started, time.monotonic() - started)
+                if due_ids and not quiet:
+                    self.last_full_detection = now
                 
-                self.frames_processed += 1
+                if self.config['performance']['adaptive_framerate']:
+                    self._adjust_framerate(detected=False)
                 
                 # Memory management
-                if self.detections_processed % self.cleanup_interval == 0:
+                if self.detections_processed - self.last_cleanup_detections >= self.cleanup_interval:
+                    self.last_cleanup_detections = self.detections_processed
                     self._cleanup_memory()
+                self._maybe_reset_background()
                 
-                # Adaptive frame rate sleep
-                loop_duration = time.time() - loop_start
-                sleep_time = max(0, (1.0 / self.current_fps) - loop_duration)
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
+                self.last_loop_latency = time.monotonic() - loop_start
             
             print("[DAEMON] Main loop stopped")
-            return 0
+            return self.exit_code
         
         except Exception as exc:
             log_exception("VisionDaemon: fatal error in main loop", exc, stack=True)
@@ -344,6 +495,35 @@ class VisionDaemon:
         finally:
             self.cleanup()
     
+    def _time_until_work(self, now: float) -> Optional[float]:
+        """Seconds until the next trigger deadline or change probe"""
+        wait = self.scheduler.time_until_due(now)
+        if self.change_detector is not None and self.active_triggers:
+            probe_wait = max(0.0, self.next_probe_time - now)
+            wait = probe_wait if wait is None else min(wait, probe_wait)
+        return wait
+    
+    def _probe_scene(self, frame: np.ndarray, now: float):
+        """Run the thumbnail change probe and escalate on scene change"""
+        self.next_probe_time = now + self.probe_interval
+        if not self.change_detector.update(frame):
+            return
+        
+        self.last_change_time = time.time()
+        if self.current_fps < self.config['performance']['active_fps']:
+            # Something moved: boost the frame rate and evaluate right away
+            self._adjust_framerate(detected=True)
+            self.scheduler.reschedule_all(now)
+    
+    def _scene_active(self) -> bool:
+        return self.current_fps > self.config['performance']['idle_fps']
+    
+    def _scene_quiet(self, now: float) -> bool:
+        """True when idle, nothing changed, and the model was refreshed recently"""
+        if self.change_detector is None or self._scene_active() or self.change_detector.changed:
+            return False
+        return now - self.last_full_detection < self.max_quiet_seconds
+    
     def _capture_frame(self) -> Optional[np.ndarray]:
         """Capture a frame from camera"""
         try:
@@ -406,15 +586,22 @@ class VisionDaemon:
         """Adjust frame rate based on detection activity"""
         perf_cfg = self.config['performance']
         
+        previous_fps = self.current_fps
+        
         if detected:
             # Speed up after detection
             self.current_fps = perf_cfg['active_fps']
         else:
-            # Check if we should slow down
-            if self.last_detection_time:
-                elapsed = time.time() - self.last_detection_time
+            # Check if we should slow down (hold while the scene is still changing)
+            activity = [t for t in (self.last_detection_time, self.last_change_time) if t]
+            still_changing = self.change_detector is not None and self.change_detector.changed
+            if activity and not still_changing:
+                elapsed = time.time() - max(activity)
                 if elapsed > perf_cfg['return_to_slow_after_seconds']:
                     self.current_fps = perf_cfg['idle_fps']
+        
+        if self.current_fps != previous_fps:
+            self._refresh_trigger_intervals()
     
     def _cleanup_memory(self):
         """Periodic memory cleanup"""
@@ -431,19 +618,66 @@ class VisionDaemon:
             if memory_mb > self.max_memory_mb:
                 print(f"[DAEMON] ⚠ Memory limit exceeded: {memory_mb:.1f}MB / {self.max_memory_mb}MB")
                 print("[DAEMON] Requesting restart...")
+                self.exit_code = DAEMON_EXIT_MEMORY_EXCEEDED
                 self.stop_requested = True
             
-            # Log stats periodically
-            if self.frames_processed % 100 == 0:
-                print(f"[DAEMON] Stats: {self.frames_processed} frames, "
-                      f"{self.detections_processed} detections, "
-                      f"{memory_mb:.1f}MB memory, "
-                      f"{self.current_fps:.2f} FPS")
+            # Log stats on each cleanup pass
+            print(f"[DAEMON] Stats: {self.frames_processed} frames, "
+                  f"{self.detections_processed} detections, "
+                  f"{self.quiet_skips} quiet skips, "
+                  f"{memory_mb:.1f}MB memory, "
+                  f"{self.current_fps:.2f} FPS")
+            self._report_duty_cycles()
         
         except Exception as exc:
             log_exception("VisionDaemon: memory cleanup error", exc)
             print(f"[DAEMON] Memory cleanup error: {exc}")
     
+    def _maybe_reset_background(self):
+        """Periodic background reset (reset_background_every_hours)"""
+        if self.background_reset_interval <= 0 or not self.detector:
+            return
+        if time.monotonic() - self.last_background_reset < self.background_reset_interval:
+            return
+        self.last_background_reset = time.monotonic()
+        self.detector.reset(seeded=True)
+    
+    def _write_heartbeat(self):
+        """Publish a liveness heartbeat (throttled) for the watchdog"""
+        now = time.monotonic()
+        if now - self.last_heartbeat < self.heartbeat_interval:
+            return
+        self.last_heartbeat = now
+        try:
+            memory_mb = self.process.memory_info().rss / (1024 * 1024)
+        except Exception:
+            memory_mb = None
+        self.ipc.write_heartbeat(
+            os.getpid(),
+            loop_latency=self.last_loop_latency,
+            memory_mb=memory_mb,
+            frames_processed=self.frames_processed,
+        )
+    
+    def _report_duty_cycles(self):
+        """Log how busy each trigger keeps the daemon"""
+        stats = self.scheduler.get_stats(time.monotonic())
+        for trigger_id, entry in stats.items():
+            name = self.active_triggers.get(trigger_id, {}).get('name', trigger_id)
+            print(f"[DAEMON]   {name}: every {entry['interval']:.2f}s, "
+                  f"{entry['runs']} runs, duty {entry['duty_cycle'] * 100:.3f}%")
+    
+    def get_stats(self) -> Dict:
+        """Get daemon statistics including per-trigger duty cycles"""
+        return {
+            "frames_processed": self.frames_processed,
+            "detections_processed": self.detections_processed,
+            "current_fps": self.current_fps,
+            "quiet_skips": self.quiet_skips,
+            "change_detector": self.change_detector.get_stats() if self.change_detector else None,
+            "triggers": self.scheduler.get_stats(time.monotonic()),
+        }
+    
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals"""
         print(f"\n[DAEMON] Received signal {signum}, shutting down...")
@@ -464,8 +698,8 @@ class VisionDaemon:
             if self.detector:
                 self.detector.cleanup()
             
-            # Cleanup IPC
-            self.ipc.cleanup()
+            # Cleanup IPC (pending events survive a supervised restart)
+            self.ipc.cleanup(preserve_events=self.supervised)
             
             print("[DAEMON] ✓ Cleanup complete")
         
@@ -480,23 +714,35 @@ class VisionDaemon:
         self.running = False
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Main entry point"""
+    base_dir = Path(__file__).parent.parent
+    parser = argparse.ArgumentParser(description="Vision triggers daemon")
+    parser.add_argument("--config", type=Path, default=base_dir / "config" / "vision_config.yaml")
+    parser.add_argument("--runtime-dir", type=Path, default=base_dir / "runtime")
+    parser.add_argument(
+        "--supervised",
+        action="store_true",
+        help="Started by the watchdog: preserve robot state and pending events",
+    )
+    parser.add_argument("--profile-startup", action="store_true", help="Write a startup timing report")
+    args = parser.parse_args(argv)
+    
     print("=" * 60)
     print("Vision Triggers Daemon")
     print("=" * 60)
     print()
     
     # Get paths
-    base_dir = Path(__file__).parent.parent
-    config_path = base_dir / "config" / "vision_config.yaml"
-    runtime_dir = base_dir / "runtime"
+    config_path = args.config
+    runtime_dir = args.runtime_dir
     
     # Ensure runtime dir exists
     runtime_dir.mkdir(parents=True, exist_ok=True)
     
     # Create and run daemon
-    daemon = VisionDaemon(config_path, runtime_dir)
+    with startup_timer.phase("daemon_constructor"):
+        daemon = VisionDaemon(config_path, runtime_dir, supervised=args.supervised)
     exit_code = daemon.run()
     
     print()
@@ -0,0 +1,95 @@
+"""
+Scene Change Detector - Cheap frame differencing on a tiny luma thumbnail
+
+Used by the daemon as a high-rate probe in front of the presence detector:
+- Downsample each probe frame to a small grayscale thumbnail (64×48)
+- Compare against the previous thumbnail
+- Report "changed" with hysteresis so full MOG2 detection only runs when
+  something in the scene actually moves
+"""
+
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+class SceneChangeDetector:
+    """Frame-difference change detector with on/off hysteresis"""
+
+    def __init__(
+        self,
+        size: Tuple[int, int] = (64, 48),
+        pixel_threshold: int = 12,
+        on_fraction: float = 0.01,
+        off_fraction: float = 0.004
+    ):
+        """
+        Initialize change detector
+
+        Args:
+            size: Thumbnail (width, height)
+            pixel_threshold: Luma difference that counts a pixel as changed
+            on_fraction: Changed-pixel fraction that switches to "changed"
+            off_fraction: Fraction below which the scene counts as quiet again
+        """
+        self.size = (int(size[0]), int(size[1]))
+        self.pixel_threshold = pixel_threshold
+        self.on_fraction = on_fraction
+        self.off_fraction = min(off_fraction, on_fraction)
+
+        self.previous: Optional[np.ndarray] = None
+        self.changed = False
+        self.last_fraction = 0.0
+        self.frames_processed = 0
+        self.change_events = 0
+
+    def _thumbnail(self, frame: np.ndarray) -> np.ndarray:
+        # Shrink first so the colour conversion only touches a few pixels
+        small = cv2.resize(frame, self.size, interpolation=cv2.INTER_AREA)
+        if small.ndim == 3:
+            small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        return small
+
+    def update(self, frame: np.ndarray) -> bool:
+        """
+        Feed a frame and return whether the scene is currently changing
+
+        Args:
+            frame: Input BGR (or grayscale) image
+
+        Returns:
+            True while the scene is considered changing
+        """
+        thumb = self._thumbnail(frame)
+        self.frames_processed += 1
+
+        if self.previous is None or self.previous.shape != thumb.shape:
+            self.previous = thumb
+            return self.changed
+
+        diff = cv2.absdiff(thumb, self.previous)
+        self.previous = thumb
+        self.last_fraction = float(np.count_nonzero(diff > self.pixel_threshold)) / diff.size
+
+        if not self.changed and self.last_fraction >= self.on_fraction:
+            self.changed = True
+            self.change_events += 1
+        elif self.changed and self.last_fraction < self.off_fraction:
+            self.changed = False
+        return self.changed
+
+    def reset(self):
+        """Forget the reference thumbnail"""
+        self.previous = None
+        self.changed = False
+        self.last_fraction = 0.0
+
+    def get_stats(self) -> dict:
+        """Get change detector statistics"""
+        return {
+            "frames_processed": self.frames_processed,
+            "change_events": self.change_events,
+            "changed": self.changed,
+            "last_fraction": round(self.last_fraction, 4),
+        }
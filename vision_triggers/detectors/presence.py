@@ -8,8 +8,10 @@ Perfect for:
 - Works well with static backgrounds (MDF, white acrylic)
 """
 
+import time
 import cv2
 import numpy as np
+from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 from collections import deque
 
@@ -36,7 +38,9 @@ class PresenceDetector(BaseDetector):
         var_threshold: int = 16,
         detect_shadows: bool = False,
         stability_frames: int = 2,
-        history: int = 50
+        history: int = 50,
+        snapshot_path: Optional[Path] = None,
+        snapshot_interval_seconds: float = 300.0
     ):
         """
         Initialize presence detector
@@ -48,6 +52,10 @@ class PresenceDetector(BaseDetector):
             detect_shadows: Enable shadow detection (slower)
             stability_frames: Frames required to confirm stability
             history: Background model history size
+            snapshot_path: Where to persist the background model (.npz);
+                None disables snapshots
+            snapshot_interval_seconds: Seconds between snapshots (0 = only
+                on cleanup)
         """
         super().__init__()
         self.min_blob_area = min_blob_area
@@ -66,30 +74,144 @@ class PresenceDetector(BaseDetector):
         # Frame buffer for stability checking
         self.frame_buffer = deque(maxlen=stability_frames)
         
+        # Background snapshots (warm start after restart/reset)
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.snapshot_interval_seconds = snapshot_interval_seconds
+        self.last_snapshot_time = time.monotonic()
+        self._pending_seed: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._last_frame: Optional[np.ndarray] = None
+        self._last_fg_mask: Optional[np.ndarray] = None
+        
         # Statistics
         self.frames_processed = 0
         self.last_detection_count = 0
+        self.seeded = False
+    
+    def _create_subtractor(self):
+        """Create a fresh MOG2 background model"""
+        subtractor = cv2.createBackgroundSubtractorMOG2(
+            history=self.history,
+            varThreshold=self.var_threshold,
+            detectShadows=self.detect_shadows
+        )
+        
+        # Set learning rate
+        subtractor.setBackgroundRatio(self.learning_rate)
+        return subtractor
     
     def initialize(self) -> bool:
-        """Initialize background subtractor"""
+        """Initialize background subtractor (seeded from snapshot if available)"""
         try:
-            self.bg_subtractor = cv2.createBackgroundSubtractorMOG2(
-                history=self.history,
-                varThreshold=self.var_threshold,
-                detectShadows=self.detect_shadows
-            )
-            
-            # Set learning rate
-            self.bg_subtractor.setBackgroundRatio(self.learning_rate)
+            self.bg_subtractor = self._create_subtractor()
+            self.seeded = False
+            self._pending_seed = self.load_snapshot()
             
             self.initialized = True
-            print("[PRESENCE] ✓ Detector initialized")
+            print("[PRESENCE] ✓ Detector initialized"
+                  + (" (warm start from snapshot)" if self._pending_seed else ""))
             return True
         
         except Exception as exc:
             log_exception("PresenceDetector: initialization error", exc)
             return False
     
+    # ------------------------------------------------------------------
+    # Background snapshots
+    
+    def _estimate_variance(self, background: np.ndarray) -> np.ndarray:
+        """Estimate per-pixel background variance from the latest frame"""
+        height, width = background.shape[:2]
+        if self._last_frame is None or self._last_frame.shape[:2] != (height, width):
+            return np.full((height, width), 16.0, dtype=np.float32)
+        
+        diff = self._last_frame.astype(np.float32) - background.astype(np.float32)
+        sq = np.mean(diff * diff, axis=2) if diff.ndim == 3 else diff * diff
+        if self._last_fg_mask is not None and self._last_fg_mask.shape == sq.shape:
+            # Foreground pixels say nothing about background noise
+            bg_pixels = self._last_fg_mask == 0
+            fill = float(np.median(sq[bg_pixels])) if bg_pixels.any() else 16.0
+            sq = np.where(bg_pixels, sq, fill)
+        return cv2.blur(sq.astype(np.float32), (15, 15))
+    
+    def save_snapshot(self) -> bool:
+        """Persist the current background image and variance estimate"""
+        if not self.snapshot_path or self.bg_subtractor is None or self.frames_processed == 0:
+            return False
+        try:
+            background = self.bg_subtractor.getBackgroundImage()
+            if background is None:
+                return False
+            variance = self._estimate_variance(background)
+            
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.snapshot_path.with_name(f".{self.snapshot_path.stem}.tmp.npz")
+            np.savez_compressed(
+                temp_path,
+                background=background,
+                variance=variance.astype(np.float16),
+                timestamp=np.float64(time.time()),
+            )
+            temp_path.replace(self.snapshot_path)
+            self.last_snapshot_time = time.monotonic()
+            return True
+        except Exception as exc:
+            log_exception("PresenceDetector: failed to save background snapshot", exc, level="warning")
+            return False
+    
+    def load_snapshot(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Load a persisted background snapshot, if any"""
+        if not self.snapshot_path or not self.snapshot_path.exists():
+            return None
+        try:
+            with np.load(self.snapshot_path) as data:
+                background = data["background"]
+                variance = data["variance"].astype(np.float32)
+            if background.shape[:2] != variance.shape[:2]:
+                return None
+            return background, variance
+        except Exception as exc:
+            log_exception("PresenceDetector: failed to load background snapshot", exc, level="warning")
+            return None
+    
+    def _seed_model(self, background: np.ndarray, variance: np.ndarray, frames: Optional[int] = None):
+        """
+        Seed a fresh MOG2 model from a background image and variance map
+        
+        MOG2 cannot import its internal state, so the model is trained on
+        synthetic frames: the background plus noise drawn from the stored
+        per-pixel variance. This converges in a handful of frames instead of
+        ``history`` real frames.
+        """
+        frames = frames or max(3, min(self.history, 10))
+        rng = np.random.default_rng(0)
+        sigma = np.sqrt(np.maximum(variance, 0.0))
+        if background.ndim == 3:
+            sigma = sigma[:, :, None]
+        base = background.astype(np.float32)
+        
+        self.bg_subtractor.apply(background, learningRate=1.0)
+        for i in range(frames):
+            noisy = base + rng.standard_normal(base.shape, dtype=np.float32) * sigma
+            sample = np.clip(noisy, 0, 255).astype(np.uint8)
+            self.bg_subtractor.apply(sample, learningRate=1.0 / (i + 2))
+        self.seeded = True
+    
+    def _apply_pending_seed(self, frame: np.ndarray):
+        """Seed the model on the first frame if the snapshot matches it"""
+        background, variance = self._pending_seed
+        self._pending_seed = None
+        if background.shape != frame.shape:
+            print("[PRESENCE] Snapshot size mismatch, learning background from scratch")
+            return
+        self._seed_model(background, variance)
+        print("[PRESENCE] ✓ Background model seeded from snapshot")
+    
+    def _maybe_snapshot(self):
+        if not self.snapshot_path or self.snapshot_interval_seconds <= 0:
+            return
+        if time.monotonic() - self.last_snapshot_time >= self.snapshot_interval_seconds:
+            self.save_snapshot()
+    
     def detect(self, frame: np.ndarray, zones: List[Dict]) -> List[DetectionResult]:
         """
         Detect objects in zones
@@ -108,8 +230,13 @@ class PresenceDetector(BaseDetector):
         results = []
         
         try:
+            if self._pending_seed is not None:
+                self._apply_pending_seed(frame)
+            
             # Apply background subtraction
             fg_mask = self.bg_subtractor.apply(frame, learningRate=self.learning_rate)
+            self._last_frame = frame
+            self._last_fg_mask = fg_mask
             
             # Morphological operations to clean up noise
             fg_mask = cv2.morphologyEx(fg_mask, cv2.MORPH_OPEN, self.morph_kernel)
@@ -164,6 +291,7 @@ class PresenceDetector(BaseDetector):
                 results.append(result)
             
             self.last_detection_count = len(all_boxes)
+            self._maybe_snapshot()
             
         except Exception as exc:
             log_exception("PresenceDetector: detection error", exc, level="warning")
@@ -225,24 +353,37 @@ class PresenceDetector(BaseDetector):
         
         return True
     
-    def reset(self):
-        """Reset background model and buffers"""
+    def reset(self, seeded: bool = True):
+        """
+        Reset background model and buffers
+        
+        Args:
+            seeded: Seed the new model from the current background so
+                detection stays reliable straight after the reset
+        """
         if self.bg_subtractor:
+            seed = None
+            if seeded and self.frames_processed > 0:
+                background = self.bg_subtractor.getBackgroundImage()
+                if background is not None:
+                    seed = (background, self._estimate_variance(background))
+            
             # Recreate background subtractor
-            self.bg_subtractor = cv2.createBackgroundSubtractorMOG2(
-                history=self.history,
-                varThreshold=self.var_threshold,
-                detectShadows=self.detect_shadows
-            )
-            self.bg_subtractor.setBackgroundRatio(self.learning_rate)
+            self.bg_subtractor = self._create_subtractor()
+            self.seeded = False
+            if seed is not None:
+                self._seed_model(*seed)
         
         self.frame_buffer.clear()
         self.frames_processed = 0
-        print("[PRESENCE] Background model reset")
+        print("[PRESENCE] Background model reset" + (" (seeded)" if self.seeded else ""))
     
     def cleanup(self):
         """Cleanup resources"""
+        self.save_snapshot()
         self.bg_subtractor = None
+        self._last_frame = None
+        self._last_fg_mask = None
         self.frame_buffer.clear()
         self.initialized = False
         print("[PRESENCE] Detector cleaned up")
@@ -253,7 +394,8 @@ class PresenceDetector(BaseDetector):
             "frames_processed": self.frames_processed,
             "last_detection_count": self.last_detection_count,
             "buffer_size": len(self.frame_buffer),
-            "initialized": self.initialized
+            "initialized": self.initialized,
+            "seeded": self.seeded
         }
 
 
@@ -17,6 +17,9 @@ if os.name == "posix":  # pragma: no cover - platform dependent
 else:  # pragma: no cover - platform dependent
     fcntl = None
 
+# Daemon exit code signalling a self-requested restart (memory limit hit)
+DAEMON_EXIT_MEMORY_EXCEEDED = 3
+
 
 class IPCManager:
     """Manage IPC state files for vision daemon communication"""
@@ -26,6 +29,7 @@ class IPCManager:
         self.robot_state_file = runtime_dir / "robot_state.json"
         self.vision_events_file = runtime_dir / "vision_events.json"
         self.daemon_pid_file = runtime_dir / "vision_daemon.pid"
+        self.heartbeat_file = runtime_dir / "vision_heartbeat.json"
         self.timezone = get_timezone(timezone_name)
         
         # Ensure runtime directory exists
@@ -244,29 +248,79 @@ class IPCManager:
             log_exception("IPC: daemon running check failed", exc, level="warning")
             return False
     
+    # Daemon Heartbeat (Daemon → Watchdog)
+    
+    def write_heartbeat(
+        self,
+        pid: int,
+        loop_latency: float = 0.0,
+        memory_mb: Optional[float] = None,
+        frames_processed: int = 0
+    ) -> bool:
+        """
+        Write daemon liveness heartbeat for the watchdog
+        
+        ``monotonic`` is what the watchdog compares against (it shares the
+        host's monotonic clock); ``timestamp`` is wall time for humans.
+        
+        Args:
+            pid: Daemon process ID
+            loop_latency: Duration of the last main-loop iteration (seconds)
+            memory_mb: Resident memory of the daemon, if known
+            frames_processed: Frames processed since daemon start
+        """
+        data = {
+            "pid": pid,
+            "timestamp": time.time(),
+            "monotonic": time.monotonic(),
+            "loop_latency": loop_latency,
+            "memory_mb": memory_mb,
+            "frames_processed": frames_processed,
+        }
+        return self._write_json_atomic(self.heartbeat_file, data, "heartbeat")
+    
+    def read_heartbeat(self) -> Optional[Dict]:
+        """Read the most recent daemon heartbeat"""
+        return self._read_json(self.heartbeat_file, "heartbeat")
+    
+    def clear_heartbeat(self) -> bool:
+        """Clear daemon heartbeat file"""
+        return self._clear_file(self.heartbeat_file, "heartbeat")
+    
     # Utility Methods
     
-    def initialize(self) -> bool:
-        """Initialize IPC system (create initial state files)"""
+    def initialize(self, preserve_state: bool = False) -> bool:
+        """
+        Initialize IPC system (create initial state files)
+        
+        Args:
+            preserve_state: Keep the existing robot state and any pending
+                vision event (used when the watchdog restarts the daemon)
+        """
         try:
-            self.write_robot_state(
-                state="home",
-                moving=False,
-                accepting_triggers=False,
-            )
-            self.clear_vision_event()
+            if not preserve_state or not self.robot_state_file.exists():
+                self.write_robot_state(
+                    state="home",
+                    moving=False,
+                    accepting_triggers=False,
+                )
+            if not preserve_state:
+                self.clear_vision_event()
             self.clear_daemon_pid()
+            self.clear_heartbeat()
             print("[IPC] ✓ Initialized IPC system")
             return True
         except Exception as exc:
             log_exception("IPC: initialization failed", exc)
             return False
     
-    def cleanup(self) -> bool:
+    def cleanup(self, preserve_events: bool = False) -> bool:
         """Cleanup IPC files"""
         try:
-            self.clear_vision_event()
+            if not preserve_events:
+                self.clear_vision_event()
             self.clear_daemon_pid()
+            self.clear_heartbeat()
             print("[IPC] ✓ Cleaned up IPC files")
             return True
         except Exception as exc:
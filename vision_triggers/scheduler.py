@@ -0,0 +1,186 @@
+"""
+Trigger Scheduler - Deadline-based scheduling of trigger evaluations
+
+Each active trigger carries a ``check_interval_seconds``. Instead of
+evaluating every trigger on every frame, the daemon keeps a min-heap of
+next-due times and only captures a frame when at least one trigger is due.
+
+The scheduler also tracks how much wall time each trigger spends being
+evaluated so per-trigger duty cycles can be reported.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+
+@dataclass
+class TriggerSchedule:
+    """Scheduling state for a single trigger"""
+    trigger_id: str
+    interval: float
+    next_due: float
+    registered_at: float
+    runs: int = 0
+    busy_seconds: float = 0.0
+    last_run: Optional[float] = None
+
+    def duty_cycle(self, now: float) -> float:
+        """Fraction of wall time spent evaluating this trigger"""
+        elapsed = now - self.registered_at
+        if elapsed <= 0:
+            return 0.0
+        return min(1.0, self.busy_seconds / elapsed)
+
+
+class TriggerScheduler:
+    """Min-heap of trigger deadlines keyed by trigger ID"""
+
+    def __init__(self, min_interval: float = 0.0):
+        """
+        Initialize scheduler
+
+        Args:
+            min_interval: Lower bound applied to every interval (e.g. 1 / max_fps)
+        """
+        self.min_interval = max(0.0, float(min_interval))
+        self._schedules: Dict[str, TriggerSchedule] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._schedules)
+
+    def __contains__(self, trigger_id: str) -> bool:
+        return trigger_id in self._schedules
+
+    def _clamp(self, interval: float) -> float:
+        try:
+            interval = float(interval)
+        except (TypeError, ValueError):
+            interval = self.min_interval
+        return max(self.min_interval, interval)
+
+    def _push(self, schedule: TriggerSchedule):
+        heapq.heappush(self._heap, (schedule.next_due, next(self._counter), schedule.trigger_id))
+
+    def add(self, trigger_id: str, interval: float, now: float, due_now: bool = True):
+        """
+        Register (or re-register) a trigger
+
+        Args:
+            trigger_id: Trigger identifier
+            interval: Desired check interval in seconds
+            now: Current monotonic time
+            due_now: Evaluate on the next tick instead of after one interval
+        """
+        interval = self._clamp(interval)
+        schedule = TriggerSchedule(
+            trigger_id=trigger_id,
+            interval=interval,
+            next_due=now if due_now else now + interval,
+            registered_at=now,
+        )
+        self._schedules[trigger_id] = schedule
+        self._push(schedule)
+
+    def remove(self, trigger_id: str):
+        """Stop scheduling a trigger (stale heap entries are skipped lazily)"""
+        self._schedules.pop(trigger_id, None)
+
+    def clear(self):
+        """Remove all triggers"""
+        self._schedules.clear()
+        self._heap.clear()
+
+    def set_interval(self, trigger_id: str, interval: float, now: float):
+        """Change a trigger's interval, measured from its last run"""
+        schedule = self._schedules.get(trigger_id)
+        if not schedule:
+            return
+        interval = self._clamp(interval)
+        if interval == schedule.interval:
+            return
+        schedule.interval = interval
+        base = schedule.last_run if schedule.last_run is not None else now
+        schedule.next_due = max(now, base + interval)
+        self._push(schedule)
+
+    def _prune(self):
+        """Drop heap entries that no longer match a live schedule"""
+        while self._heap:
+            due, _, trigger_id = self._heap[0]
+            schedule = self._schedules.get(trigger_id)
+            if schedule is not None and schedule.next_due == due:
+                return
+            heapq.heappop(self._heap)
+
+    def next_due(self) -> Optional[float]:
+        """Return the earliest deadline, or None if nothing is scheduled"""
+        self._prune()
+        if not self._heap:
+            return None
+        return self._heap[0][0]
+
+    def time_until_due(self, now: float) -> Optional[float]:
+        """Seconds until the next trigger is due (0 if overdue)"""
+        due = self.next_due()
+        if due is None:
+            return None
+        return max(0.0, due - now)
+
+    def pop_due(self, now: float) -> List[str]:
+        """Return IDs of all triggers whose deadline has passed"""
+        due_ids: List[str] = []
+        while True:
+            self._prune()
+            if not self._heap or self._heap[0][0] > now:
+                break
+            _, _, trigger_id = heapq.heappop(self._heap)
+            if trigger_id not in due_ids:
+                due_ids.append(trigger_id)
+        return due_ids
+
+    def mark_run(self, trigger_id: str, started: float, duration: float):
+        """
+        Record an evaluation and schedule the next deadline
+
+        Deadlines advance by whole intervals so the cadence does not drift;
+        if the daemon fell behind, the next run is one interval from now.
+        """
+        schedule = self._schedules.get(trigger_id)
+        if not schedule:
+            return
+        schedule.runs += 1
+        schedule.busy_seconds += max(0.0, duration)
+        schedule.last_run = started
+
+        finished = started + max(0.0, duration)
+        next_due = schedule.next_due + schedule.interval
+        if next_due <= finished:
+            next_due = finished + schedule.interval
+        schedule.next_due = next_due
+        self._push(schedule)
+
+    def reschedule_all(self, now: float, delay: float = 0.0):
+        """Make every trigger due after ``delay`` seconds (e.g. when gating lifts)"""
+        self._heap.clear()
+        for schedule in self._schedules.values():
+            schedule.next_due = now + max(0.0, delay)
+            self._push(schedule)
+
+    def get_stats(self, now: float) -> Dict[str, Dict]:
+        """Per-trigger run counts, intervals and duty cycles"""
+        stats = {}
+        for trigger_id, schedule in self._schedules.items():
+            stats[trigger_id] = {
+                "interval": schedule.interval,
+                "runs": schedule.runs,
+                "busy_seconds": round(schedule.busy_seconds, 4),
+                "duty_cycle": round(schedule.duty_cycle(now), 6),
+                "next_due_in": round(max(0.0, schedule.next_due - now), 3),
+            }
+        return stats
@@ -6,10 +6,15 @@ Supports:
 - Count-based triggers (N objects in zone)
 - Multi-zone logic (AND/OR combinations)
 - Cumulative counting
+
+Triggers are compiled once into a CompiledTrigger evaluation plan. Per
+frame the plan only looks up zone results by ID and compares counts; the
+human-readable reason and the detail payload are built lazily, which the
+daemon only does when a trigger fires.
 """
 
-from typing import List, Dict, Optional
-from dataclasses import dataclass
+import operator as _operator
+from typing import Callable, List, Dict, Optional, Tuple
 
 try:
     from .detectors.base import DetectionResult
@@ -17,23 +22,262 @@ except ImportError:
     from detectors.base import DetectionResult
 
 
-@dataclass
+_OPERATORS: Dict[str, Callable[[float, float], bool]] = {
+    ">=": _operator.ge,
+    "<=": _operator.le,
+    "==": _operator.eq,
+    ">": _operator.gt,
+    "<": _operator.lt,
+}
+
+
 class TriggerEvaluation:
-    """Result of trigger condition evaluation"""
-    triggered: bool
-    reason: str
-    details: Dict
+    """Result of trigger condition evaluation
+    
+    ``reason`` and ``details`` may be produced lazily by the plan that
+    created the evaluation, from the zone results captured with it; every
+    evaluation is a new object, so it stays valid after later frames.
+    """
+    
+    __slots__ = ("triggered", "_reason", "_details", "_plan", "_state")
+    
+    def __init__(self, triggered: bool, reason: Optional[str] = None, details: Optional[Dict] = None):
+        self.triggered = triggered
+        self._reason = reason
+        self._details = details
+        self._plan = None
+        self._state = None
+    
+    def _materialize(self):
+        if self._plan is not None:
+            self._reason, self._details = self._plan.describe(self.triggered, *self._state)
+            self._plan = None
+            self._state = None
+    
+    @property
+    def reason(self) -> str:
+        if self._reason is None:
+            self._materialize()
+        return self._reason or ""
+    
+    @property
+    def details(self) -> Dict:
+        if self._details is None:
+            self._materialize()
+        return self._details if self._details is not None else {}
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, TriggerEvaluation):
+            return NotImplemented
+        return (self.triggered, self.reason, self.details) == (other.triggered, other.reason, other.details)
     
     def __repr__(self) -> str:
         return f"TriggerEvaluation(triggered={self.triggered}, reason='{self.reason}')"
 
 
+class CompiledTrigger:
+    """Evaluation plan compiled once from trigger data"""
+    
+    __slots__ = (
+        "trigger_id", "trigger_type", "zone_ids", "thresholds", "logic",
+        "operator", "compare", "target", "cumulative", "error", "source",
+    )
+    
+    def __init__(self, trigger_data: Dict):
+        self.source = trigger_data
+        self.trigger_id = trigger_data.get("trigger_id")
+        self.trigger_type = trigger_data.get("type")
+        rules = (trigger_data.get("conditions") or {}).get("rules", {}) or {}
+        
+        self.zone_ids: Tuple = ()
+        self.thresholds: Tuple = ()
+        self.logic = "AND"
+        self.operator = ">="
+        self.compare = _operator.ge
+        self.target = 0
+        self.cumulative = False
+        self.error: Optional[str] = None
+        
+        if self.trigger_type == "presence":
+            self.zone_ids = (rules.get("zone"),)
+            self.thresholds = (rules.get("min_objects", 1),)
+        elif self.trigger_type == "count":
+            self.zone_ids = (rules.get("zone"),)
+            self.target = rules.get("count", 10)
+            self.operator = rules.get("operator", ">=")
+            self.compare = _OPERATORS.get(self.operator, lambda _value, _target: False)
+            self.cumulative = bool(rules.get("cumulative", False)) and bool(self.trigger_id)
+        elif self.trigger_type == "multi_zone":
+            zone_rules = rules.get("zones", []) or []
+            self.zone_ids = tuple(rule.get("zone") for rule in zone_rules)
+            self.thresholds = tuple(rule.get("min_objects", 1) for rule in zone_rules)
+            self.logic = rules.get("logic", "AND")
+            if not zone_rules:
+                self.error = "No zone rules specified"
+            elif self.logic not in ("AND", "OR"):
+                self.error = f"Invalid logic operator: {self.logic}"
+        else:
+            self.error = f"Unknown trigger type: {self.trigger_type}"
+    
+    def evaluate(self, zone_index: Dict[str, DetectionResult], evaluator: "TriggerEvaluator") -> TriggerEvaluation:
+        """Evaluate against detection results indexed by zone ID"""
+        evaluation = TriggerEvaluation(False)
+        evaluation._plan = self
+        
+        if self.error is not None:
+            evaluation._state = ((), (), 0)
+            return evaluation
+        
+        results = tuple(zone_index.get(zone_id) for zone_id in self.zone_ids)
+        counts = tuple(
+            result.metadata.get("object_count", 0) if result is not None else 0 for result in results
+        )
+        count_checked = 0
+        
+        if self.trigger_type == "presence":
+            triggered = results[0] is not None and counts[0] >= self.thresholds[0]
+        elif self.trigger_type == "count":
+            if results[0] is None:
+                triggered = False
+            else:
+                count = counts[0]
+                if self.cumulative:
+                    total = evaluator.cumulative_counts.get(self.trigger_id, 0)
+                    if count > 0:
+                        total += count
+                    evaluator.cumulative_counts[self.trigger_id] = total
+                    count = total
+                count_checked = count
+                triggered = self.compare(count, self.target)
+        else:
+            satisfied = (
+                result is not None and count >= threshold
+                for result, count, threshold in zip(results, counts, self.thresholds)
+            )
+            triggered = all(satisfied) if self.logic == "AND" else any(satisfied)
+        
+        evaluation.triggered = triggered
+        evaluation._state = (results, counts, count_checked)
+        return evaluation
+    
+    def describe(
+        self,
+        triggered: bool,
+        results: Tuple[Optional[DetectionResult], ...],
+        counts: Tuple[int, ...],
+        count_checked: int,
+    ) -> Tuple[str, Dict]:
+        """Build the reason text and detail payload for one evaluation's zone results"""
+        if self.error is not None:
+            details = {} if self.trigger_type == "multi_zone" else {"trigger_type": self.trigger_type}
+            return self.error, details
+        
+        if self.trigger_type in ("presence", "count"):
+            zone_id = self.zone_ids[0]
+            result = results[0]
+            if result is None:
+                suffix = " in detection results" if self.trigger_type == "presence" else ""
+                return f"Zone {zone_id} not found{suffix}", {"zone_id": zone_id}
+            
+            zone_name = result.metadata.get("zone_name", "unknown")
+            if self.trigger_type == "presence":
+                min_objects = self.thresholds[0]
+                object_count = counts[0]
+                return (
+                    f"{'Found' if triggered else 'Need'} {min_objects} object(s), got {object_count}",
+                    {
+                        "zone_id": zone_id,
+                        "zone_name": zone_name,
+                        "object_count": object_count,
+                        "min_objects": min_objects,
+                        "boxes": result.boxes,
+                        "confidence": result.confidence
+                    }
+                )
+            
+            count_to_check = count_checked
+            return (
+                f"Count {count_to_check} {self.operator} {self.target}: {triggered}",
+                {
+                    "zone_id": zone_id,
+                    "zone_name": zone_name,
+                    "current_count": counts[0],
+                    "cumulative_count": count_to_check if self.cumulative else None,
+                    "target_count": self.target,
+                    "operator": self.operator,
+                    "boxes": result.boxes
+                }
+            )
+        
+        zone_results = []
+        for zone_id, result, count, min_objects in zip(self.zone_ids, results, counts, self.thresholds):
+            if result is not None:
+                zone_results.append({
+                    "zone_id": zone_id,
+                    "zone_name": result.metadata.get("zone_name", "unknown"),
+                    "satisfied": count >= min_objects,
+                    "object_count": count,
+                    "min_objects": min_objects
+                })
+            else:
+                zone_results.append({
+                    "zone_id": zone_id,
+                    "satisfied": False,
+                    "object_count": 0,
+                    "min_objects": min_objects,
+                    "error": "Zone not found"
+                })
+        
+        if self.logic == "AND":
+            reason = "All zones satisfied" if triggered else "Not all zones satisfied"
+        else:
+            reason = "At least one zone satisfied" if triggered else "No zones satisfied"
+        return reason, {
+            "logic": self.logic,
+            "zone_results": zone_results,
+            "total_zones": len(self.zone_ids),
+            "satisfied_count": sum(1 for zr in zone_results if zr["satisfied"])
+        }
+
+
 class TriggerEvaluator:
     """Evaluate trigger conditions based on detection results"""
     
     def __init__(self):
         # Cumulative counters for count-based triggers
         self.cumulative_counts = {}
+        
+        # Compiled plans keyed by trigger ID
+        self._plans: Dict[str, CompiledTrigger] = {}
+    
+    def compile_trigger(self, trigger_data: Dict) -> CompiledTrigger:
+        """Compile (or fetch the cached) evaluation plan for a trigger"""
+        trigger_id = trigger_data.get("trigger_id")
+        plan = self._plans.get(trigger_id) if trigger_id else None
+        if plan is not None and plan.source is trigger_data:
+            return plan
+        
+        plan = CompiledTrigger(trigger_data)
+        if trigger_id:
+            self._plans[trigger_id] = plan
+        return plan
+    
+    def forget_trigger(self, trigger_id: str):
+        """Drop the compiled plan and counters for a trigger"""
+        self._plans.pop(trigger_id, None)
+        self.cumulative_counts.pop(trigger_id, None)
+    
+    @staticmethod
+    def _index_results(detection_results: List[DetectionResult]) -> Dict[str, DetectionResult]:
+        """Index detection results by zone ID (first result wins)
+
+        Built fresh per call: there is one result per zone, and a cached
+        index could not tell when a caller reuses and mutates the same list.
+        """
+        index: Dict[str, DetectionResult] = {}
+        for result in detection_results:
+            index.setdefault(result.metadata.get("zone_id"), result)
+        return index
     
     def evaluate_presence(
         self,
@@ -52,35 +296,11 @@ class TriggerEvaluator:
         Returns:
             TriggerEvaluation with result
         """
-        # Find result for this zone
-        zone_result = None
-        for result in detection_results:
-            if result.metadata.get("zone_id") == zone_id:
-                zone_result = result
-                break
-        
-        if not zone_result:
-            return TriggerEvaluation(
-                triggered=False,
-                reason=f"Zone {zone_id} not found in detection results",
-                details={"zone_id": zone_id}
-            )
-        
-        object_count = zone_result.metadata.get("object_count", 0)
-        triggered = object_count >= min_objects
-        
-        return TriggerEvaluation(
-            triggered=triggered,
-            reason=f"{'Found' if triggered else 'Need'} {min_objects} object(s), got {object_count}",
-            details={
-                "zone_id": zone_id,
-                "zone_name": zone_result.metadata.get("zone_name", "unknown"),
-                "object_count": object_count,
-                "min_objects": min_objects,
-                "boxes": zone_result.boxes,
-                "confidence": zone_result.confidence
-            }
-        )
+        plan = CompiledTrigger({
+            "type": "presence",
+            "conditions": {"rules": {"zone": zone_id, "min_objects": min_objects}},
+        })
+        return plan.evaluate(self._index_results(detection_results), self)
     
     def evaluate_count(
         self,
@@ -105,51 +325,14 @@ class TriggerEvaluator:
         Returns:
             TriggerEvaluation with result
         """
-        # Find zone result
-        zone_result = None
-        for result in detection_results:
-            if result.metadata.get("zone_id") == zone_id:
-                zone_result = result
-                break
-        
-        if not zone_result:
-            return TriggerEvaluation(
-                triggered=False,
-                reason=f"Zone {zone_id} not found",
-                details={"zone_id": zone_id}
-            )
-        
-        current_count = zone_result.metadata.get("object_count", 0)
-        
-        # Handle cumulative counting
-        if cumulative and trigger_id:
-            if trigger_id not in self.cumulative_counts:
-                self.cumulative_counts[trigger_id] = 0
-            
-            # Add current count to cumulative
-            if current_count > 0:
-                self.cumulative_counts[trigger_id] += current_count
-            
-            count_to_check = self.cumulative_counts[trigger_id]
-        else:
-            count_to_check = current_count
-        
-        # Evaluate operator
-        triggered = self._compare(count_to_check, target_count, operator)
-        
-        return TriggerEvaluation(
-            triggered=triggered,
-            reason=f"Count {count_to_check} {operator} {target_count}: {triggered}",
-            details={
-                "zone_id": zone_id,
-                "zone_name": zone_result.metadata.get("zone_name", "unknown"),
-                "current_count": current_count,
-                "cumulative_count": count_to_check if cumulative else None,
-                "target_count": target_count,
-                "operator": operator,
-                "boxes": zone_result.boxes
-            }
-        )
+        plan = CompiledTrigger({
+            "trigger_id": trigger_id,
+            "type": "count",
+            "conditions": {"rules": {
+                "zone": zone_id, "count": target_count, "operator": operator, "cumulative": cumulative,
+            }},
+        })
+        return plan.evaluate(self._index_results(detection_results), self)
     
     def evaluate_multi_zone(
         self,
@@ -168,69 +351,11 @@ class TriggerEvaluator:
         Returns:
             TriggerEvaluation with result
         """
-        if not zone_rules:
-            return TriggerEvaluation(
-                triggered=False,
-                reason="No zone rules specified",
-                details={}
-            )
-        
-        # Evaluate each zone rule
-        zone_results = []
-        for rule in zone_rules:
-            zone_id = rule.get("zone")
-            min_objects = rule.get("min_objects", 1)
-            
-            # Find zone result
-            zone_result = None
-            for result in detection_results:
-                if result.metadata.get("zone_id") == zone_id:
-                    zone_result = result
-                    break
-            
-            if zone_result:
-                object_count = zone_result.metadata.get("object_count", 0)
-                satisfied = object_count >= min_objects
-                zone_results.append({
-                    "zone_id": zone_id,
-                    "zone_name": zone_result.metadata.get("zone_name", "unknown"),
-                    "satisfied": satisfied,
-                    "object_count": object_count,
-                    "min_objects": min_objects
-                })
-            else:
-                zone_results.append({
-                    "zone_id": zone_id,
-                    "satisfied": False,
-                    "object_count": 0,
-                    "min_objects": min_objects,
-                    "error": "Zone not found"
-                })
-        
-        # Apply logic
-        if logic == "AND":
-            triggered = all(zr["satisfied"] for zr in zone_results)
-            reason = "All zones satisfied" if triggered else "Not all zones satisfied"
-        elif logic == "OR":
-            triggered = any(zr["satisfied"] for zr in zone_results)
-            reason = "At least one zone satisfied" if triggered else "No zones satisfied"
-        else:
-            return TriggerEvaluation(
-                triggered=False,
-                reason=f"Invalid logic operator: {logic}",
-                details={}
-            )
-        
-        return TriggerEvaluation(
-            triggered=triggered,
-            reason=reason,
-            details={
-                "logic": logic,
-                "zone_results": zone_results,
-                "total_zones": len(zone_rules),
-                "satisfied_count": sum(1 for zr in zone_results if zr["satisfied"])
-            }
-        )
+        plan = CompiledTrigger({
+            "type": "multi_zone",
+            "conditions": {"rules": {"zones": zone_rules, "logic": logic}},
+        })
+        return plan.evaluate(self._index_results(detection_results), self)
     
     def evaluate_trigger(
         self,
@@ -247,64 +372,8 @@ class TriggerEvaluator:
         Returns:
             TriggerEvaluation with result
         """
-        trigger_type = trigger_data.get("type")
-        conditions = trigger_data.get("conditions", {})
-        
-        if trigger_type == "presence":
-            # Presence-based trigger
-            rules = conditions.get("rules", {})
-            zone_id = rules.get("zone")
-            min_objects = rules.get("min_objects", 1)
-            
-            return self.evaluate_presence(detection_results, zone_id, min_objects)
-        
-        elif trigger_type == "count":
-            # Count-based trigger
-            rules = conditions.get("rules", {})
-            zone_id = rules.get("zone")
-            target_count = rules.get("count", 10)
-            operator = rules.get("operator", ">=")
-            cumulative = rules.get("cumulative", False)
-            trigger_id = trigger_data.get("trigger_id")
-            
-            return self.evaluate_count(
-                detection_results,
-                zone_id,
-                target_count,
-                operator,
-                cumulative,
-                trigger_id
-            )
-        
-        elif trigger_type == "multi_zone":
-            # Multi-zone trigger
-            rules = conditions.get("rules", {})
-            zone_rules = rules.get("zones", [])
-            logic = rules.get("logic", "AND")
-            
-            return self.evaluate_multi_zone(detection_results, zone_rules, logic)
-        
-        else:
-            return TriggerEvaluation(
-                triggered=False,
-                reason=f"Unknown trigger type: {trigger_type}",
-                details={"trigger_type": trigger_type}
-            )
-    
-    def _compare(self, value: float, target: float, operator: str) -> bool:
-        """Compare values with operator"""
-        if operator == ">=":
-            return value >= target
-        elif operator == "<=":
-            return value <= target
-        elif operator == "==":
-            return value == target
-        elif operator == ">":
-            return value > target
-        elif operator == "<":
-            return value < target
-        else:
-            return False
+        plan = self.compile_trigger(trigger_data)
+        return plan.evaluate(self._index_results(detection_results), self)
     
     def reset_cumulative_count(self, trigger_id: str):
         """Reset cumulative count for a trigger"""
@@ -0,0 +1,287 @@
+"""
+Vision Watchdog - Supervise the vision daemon and restart it when unhealthy
+
+Implements the ``watchdog`` section of the vision config:
+- Starts the daemon as a child process (``--supervised``)
+- Reads the daemon heartbeat (monotonic timestamp, loop latency, RSS)
+  every ``check_interval_seconds``
+- Restarts a hung daemon (stale heartbeat or a loop slower than
+  ``hang_timeout_seconds``) when ``restart_on_hang`` is set
+- Restarts a daemon that exceeded ``memory.max_memory_mb`` when
+  ``restart_on_memory_exceed`` is set
+- Backs off exponentially and gives up after ``max_restart_attempts``
+
+Supervised daemons keep the robot state and any pending vision event when
+they restart, so the sequencer does not see a gap.
+
+This is how the daemon should be launched; launch.sh starts it next to the
+app when NICEBOT_VISION_DAEMON=1 is set.
+
+Usage:
+    python -m vision_triggers.watchdog [--config config/vision_config.yaml]
+"""
+
+from __future__ import annotations
+
+import argparse
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import psutil
+import yaml
+
+from utils.logging_utils import log_exception, log_message
+
+try:  # pragma: no cover - support running as package or script
+    from .ipc import DAEMON_EXIT_MEMORY_EXCEEDED, IPCManager
+except ImportError:  # pragma: no cover
+    from vision_triggers.ipc import DAEMON_EXIT_MEMORY_EXCEEDED, IPCManager
+
+
+DEFAULT_WATCHDOG_CONFIG = {
+    'enabled': True,
+    'check_interval_seconds': 30,
+    'restart_on_hang': True,
+    'restart_on_memory_exceed': True,
+    'max_restart_attempts': 3,
+    'notify_on_restart': True,
+    'hang_timeout_seconds': 60,
+}
+
+
+class VisionWatchdog:
+    """Supervisor process for the vision daemon"""
+
+    # Maximum delay between restart attempts
+    MAX_BACKOFF_SECONDS = 120.0
+    # A daemon that stays healthy this long resets the attempt counter
+    STABLE_AFTER_SECONDS = 600.0
+    # Grace period for the daemon to exit after SIGTERM
+    TERMINATE_TIMEOUT_SECONDS = 10.0
+
+    def __init__(self, config_path: Path, runtime_dir: Path):
+        """
+        Initialize watchdog
+
+        Args:
+            config_path: Path to vision_config.yaml (shared with the daemon)
+            runtime_dir: Path to runtime directory
+        """
+        self.config_path = config_path
+        self.runtime_dir = runtime_dir
+        self.config = self._load_config()
+
+        watchdog_cfg = dict(DEFAULT_WATCHDOG_CONFIG)
+        watchdog_cfg.update(self.config.get('watchdog') or {})
+        self.enabled = bool(watchdog_cfg['enabled'])
+        self.check_interval = max(1.0, float(watchdog_cfg['check_interval_seconds']))
+        self.restart_on_hang = bool(watchdog_cfg['restart_on_hang'])
+        self.restart_on_memory_exceed = bool(watchdog_cfg['restart_on_memory_exceed'])
+        self.max_restart_attempts = int(watchdog_cfg['max_restart_attempts'])
+        self.notify_on_restart = bool(watchdog_cfg['notify_on_restart'])
+        self.hang_timeout = float(watchdog_cfg['hang_timeout_seconds'])
+        self.max_memory_mb = float((self.config.get('memory') or {}).get('max_memory_mb', 512))
+
+        self.ipc = IPCManager(runtime_dir, timezone_name=self.config.get('timezone'))
+        self.process: Optional[subprocess.Popen] = None
+        self.started_at = 0.0
+        self.restart_attempts = 0
+        self.total_restarts = 0
+        self.last_restart_reason: Optional[str] = None
+        self.stop_requested = False
+
+    def _load_config(self) -> Dict:
+        """Load configuration from YAML"""
+        try:
+            with open(self.config_path, 'r') as f:
+                return yaml.safe_load(f) or {}
+        except Exception as exc:
+            log_exception("VisionWatchdog: failed to load config", exc)
+            return {}
+
+    def _daemon_command(self) -> List[str]:
+        return [
+            sys.executable,
+            "-m",
+            "vision_triggers.daemon",
+            "--config",
+            str(self.config_path),
+            "--runtime-dir",
+            str(self.runtime_dir),
+            "--supervised",
+        ]
+
+    # ------------------------------------------------------------------
+    # Child process management
+
+    def _start_daemon(self):
+        project_root = Path(__file__).resolve().parent.parent
+        self.ipc.clear_heartbeat()
+        self.process = subprocess.Popen(self._daemon_command(), cwd=str(project_root))
+        self.started_at = time.monotonic()
+        print(f"[WATCHDOG] ✓ Daemon started (PID: {self.process.pid})")
+
+    def _stop_daemon(self):
+        if not self.process or self.process.poll() is not None:
+            return
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=self.TERMINATE_TIMEOUT_SECONDS)
+        except subprocess.TimeoutExpired:
+            print("[WATCHDOG] Daemon ignored SIGTERM, killing")
+            self.process.kill()
+            self.process.wait()
+
+    def _backoff_delay(self) -> float:
+        return min(self.MAX_BACKOFF_SECONDS, 2.0 ** max(0, self.restart_attempts - 1))
+
+    # ------------------------------------------------------------------
+    # Health checks
+
+    def check_health(self) -> Optional[str]:
+        """
+        Inspect the daemon and return a restart reason, or None if healthy
+
+        Returns:
+            Reason string when the daemon should be restarted
+        """
+        if not self.process:
+            return "not started"
+
+        exit_code = self.process.poll()
+        if exit_code is not None:
+            if exit_code == DAEMON_EXIT_MEMORY_EXCEEDED:
+                return "memory exceeded" if self.restart_on_memory_exceed else None
+            return f"exited with code {exit_code}" if exit_code != 0 else None
+
+        now = time.monotonic()
+        heartbeat = self.ipc.read_heartbeat()
+        if heartbeat and heartbeat.get('pid') != self.process.pid:
+            heartbeat = None  # Stale beat from a previous daemon
+        if self.restart_on_hang:
+            # Monotonic clock: wall-clock steps (NTP, RTC sync on boot) must not look like a hang
+            last_beat = (heartbeat or {}).get('monotonic') or self.started_at
+            if now - last_beat > self.hang_timeout:
+                return f"no heartbeat for {now - last_beat:.0f}s"
+            latency = (heartbeat or {}).get('loop_latency') or 0.0
+            if latency > self.hang_timeout:
+                return f"loop latency {latency:.1f}s"
+
+        if self.restart_on_memory_exceed:
+            memory_mb = None
+            try:
+                memory_mb = psutil.Process(self.process.pid).memory_info().rss / (1024 * 1024)
+            except Exception:
+                memory_mb = (heartbeat or {}).get('memory_mb')
+            if memory_mb and memory_mb > self.max_memory_mb:
+                return f"memory {memory_mb:.0f}MB > {self.max_memory_mb:.0f}MB"
+
+        if self.restart_attempts and now - self.started_at > self.STABLE_AFTER_SECONDS:
+            self.restart_attempts = 0
+        return None
+
+    def _restart(self, reason: str) -> bool:
+        """Restart the daemon with backoff; returns False once attempts run out"""
+        if self.restart_attempts >= self.max_restart_attempts:
+            print(f"[WATCHDOG] ✗ Giving up after {self.restart_attempts} restart attempts ({reason})")
+            log_message(f"Vision watchdog gave up: {reason}", level="error")
+            return False
+
+        self.restart_attempts += 1
+        self.total_restarts += 1
+        self.last_restart_reason = reason
+        delay = self._backoff_delay()
+
+        print(f"[WATCHDOG] ⚠ Restarting daemon ({reason}), attempt "
+              f"{self.restart_attempts}/{self.max_restart_attempts} in {delay:.0f}s")
+        if self.notify_on_restart:
+            log_message(f"Vision daemon restarting: {reason}", level="warning")
+
+        self._stop_daemon()
+        self._sleep(delay)
+        if self.stop_requested:
+            return False
+        self._start_daemon()
+        return True
+
+    def _sleep(self, seconds: float):
+        """Sleep in short slices so signals are handled promptly"""
+        deadline = time.monotonic() + seconds
+        while not self.stop_requested:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(0.5, remaining))
+
+    # ------------------------------------------------------------------
+    # Main loop
+
+    def run(self) -> int:
+        """Supervise the daemon until stopped or out of restart attempts"""
+        signal.signal(signal.SIGINT, self._signal_handler)
+        signal.signal(signal.SIGTERM, self._signal_handler)
+
+        self._start_daemon()
+        if not self.enabled:
+            print("[WATCHDOG] Watchdog disabled in config; running daemon unsupervised")
+            return self.process.wait()
+
+        exit_code = 0
+        try:
+            while not self.stop_requested:
+                self._sleep(self.check_interval)
+                if self.stop_requested:
+                    break
+
+                reason = self.check_health()
+                if reason is None:
+                    if self.process and self.process.poll() is not None:
+                        print(f"[WATCHDOG] Daemon exited ({self.process.returncode}), stopping")
+                        break
+                    continue
+
+                if not self._restart(reason):
+                    exit_code = 1
+                    break
+        finally:
+            self._stop_daemon()
+            self.ipc.cleanup()
+
+        return exit_code
+
+    def _signal_handler(self, signum, frame):
+        print(f"\n[WATCHDOG] Received signal {signum}, shutting down...")
+        self.stop_requested = True
+
+    def get_status(self) -> Dict:
+        """Get watchdog status"""
+        return {
+            "daemon_pid": self.process.pid if self.process else None,
+            "running": bool(self.process and self.process.poll() is None),
+            "restart_attempts": self.restart_attempts,
+            "total_restarts": self.total_restarts,
+            "last_restart_reason": self.last_restart_reason,
+        }
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main entry point"""
+    base_dir = Path(__file__).parent.parent
+    parser = argparse.ArgumentParser(description="Vision daemon watchdog")
+    parser.add_argument("--config", type=Path, default=base_dir / "config" / "vision_config.yaml")
+    parser.add_argument("--runtime-dir", type=Path, default=base_dir / "runtime")
+    args = parser.parse_args(argv)
+
+    args.runtime_dir.mkdir(parents=True, exist_ok=True)
+    watchdog = VisionWatchdog(args.config.resolve(), args.runtime_dir.resolve())
+    exit_code = watchdog.run()
+    print(f"[WATCHDOG] Exited with code {exit_code}")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
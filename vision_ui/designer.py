@@ -11,7 +11,6 @@ import json
 import sys
 import time
 import uuid
-from contextlib import nullcontext
 from copy import deepcopy
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
@@ -22,7 +21,7 @@ from pathlib import Path
 import cv2
 import numpy as np
 from PySide6.QtCore import QPointF, QRectF, Qt, QTimer, Signal
-from PySide6.QtGui import QColor, QFont, QGuiApplication, QImage, QPainter, QPen, QPolygonF
+from PySide6.QtGui import QColor, QFont, QGuiApplication, QPainter, QPen, QPolygonF
 from PySide6.QtWidgets import (
     QApplication,
     QAbstractItemView,
@@ -47,6 +46,8 @@ from PySide6.QtWidgets import (
 )
 
 from utils.camera_backend import open_capture
+from utils.camera_support import list_video_devices, video_device_index
+from utils.preview_renderer import OverlayCache, PreviewRenderer
 
 try:  # Optional dependency used to coordinate shared camera ownership
     from utils.camera_hub import CameraStreamHub
@@ -126,16 +127,6 @@ def _clamp(value: float, lo: float = 0.0, hi: float = 1.0) -> float:
     return max(lo, min(hi, value))
 
 
-def _to_qimage(frame: np.ndarray) -> QImage:
-    """Convert BGR OpenCV frame to QImage."""
-    if frame is None:
-        return QImage()
-    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    h, w, ch = rgb.shape
-    bytes_per_line = ch * w
-    return QImage(rgb.data, w, h, bytes_per_line, QImage.Format_RGB888).copy()
-
-
 def _normalized_polygon_to_pixels(polygon: List[Tuple[float, float]], width: int, height: int) -> np.ndarray:
     """Convert a normalized polygon to integer pixel coordinates."""
     if not polygon:
@@ -179,142 +170,143 @@ class CameraSource:
 
 
 class CameraStream:
-    """Manage a camera or virtual feed."""
+    """Manage a camera or virtual feed.
+
+    Configured cameras are read from the shared :class:`CameraStreamHub`, so
+    the dashboard and running vision steps keep their feeds while the
+    designer is open. Only unconfigured devices get a private capture.
+    """
 
     def __init__(self, system_cameras: Optional[Dict[str, Dict]] = None):
         self.cap: Optional[cv2.VideoCapture] = None
         self.active_source: Optional[CameraSource] = None
         self._virtual_tick = 0
         self.system_cameras = system_cameras or {}
-        self._hub_pause_ctx = None
-        self._hub_pause_active = False
-
-    def _pause_hub_for_preview(self) -> None:
-        if not CameraStreamHub or self._hub_pause_ctx:
-            return
-        ctx = CameraStreamHub.paused()
-        token = ctx.__enter__()
-        if token:
-            self._hub_pause_ctx = ctx
-            self._hub_pause_active = True
-        else:
-            ctx.__exit__(None, None, None)
+        self._hub_camera: Optional[str] = None
 
-    def _resume_hub_if_needed(self) -> None:
-        if not self._hub_pause_ctx:
-            self._hub_pause_active = False
-            return
-        try:
-            self._hub_pause_ctx.__exit__(None, None, None)
-        finally:
-            self._hub_pause_ctx = None
-            self._hub_pause_active = False
+    def _hub(self):
+        """Return the shared hub, creating it for configured cameras if needed."""
+        if not CameraStreamHub:
+            return None
+        hub = CameraStreamHub.peek()
+        if hub is None and self.system_cameras:
+            try:
+                hub = CameraStreamHub.instance({"cameras": self.system_cameras})
+            except Exception as exc:
+                print(f"[VISION][WARN] Camera hub unavailable: {exc}")
+                return None
+        return hub
+
+    def _configured_key_for(self, target) -> Optional[str]:
+        """Map a device index/path to the configured camera that owns it."""
+        target_index = video_device_index(target)
+        for key, cam_cfg in self.system_cameras.items():
+            configured = cam_cfg.get("index_or_path", cam_cfg.get("index", 0))
+            if configured == target:
+                return key
+            if target_index is not None and video_device_index(configured) == target_index:
+                return key
+        return None
 
-    def list_sources(self, max_devices: int = 5) -> List[CameraSource]:
+    def list_sources(self, max_devices: int = 5, refresh: bool = False) -> List[CameraSource]:
+        """List cameras without opening them (sysfs listing is cached)."""
         sources: List[CameraSource] = []
+        devices = list_video_devices(refresh=refresh)
+        present = {dev["index"] for dev in devices} if devices is not None else None
+
+        # First, prefer cameras that were configured in the shared settings file.
+        for key, cam_cfg in self.system_cameras.items():
+            label = cam_cfg.get("label") or cam_cfg.get("name") or key.replace("_", " ").title()
+            index_or_path = cam_cfg.get("index_or_path", cam_cfg.get("index", 0))
+            index: Optional[int] = None
+            path: Optional[str] = None
+
+            if isinstance(index_or_path, int):
+                index = index_or_path
+            else:
+                path = str(index_or_path)
 
-        pause_ctx = CameraStreamHub.paused() if CameraStreamHub else nullcontext()
-        with pause_ctx:
-            # First, prefer cameras that were configured in the shared settings file.
-            for key, cam_cfg in self.system_cameras.items():
-                label = cam_cfg.get("label") or cam_cfg.get("name") or key.replace("_", " ").title()
-                index_or_path = cam_cfg.get("index_or_path", cam_cfg.get("index", 0))
-                index: Optional[int] = None
-                path: Optional[str] = None
-                capture = None
-                available = False
-
-                try:
-                    backend_hint = cam_cfg.get("backend")
-                    if isinstance(index_or_path, int):
-                        index = index_or_path
-                        _, capture = open_capture(index, preferred_backend=backend_hint)
-                    else:
-                        path = str(index_or_path)
-                        _, capture = open_capture(path, preferred_backend=backend_hint)
-                    available = bool(capture and capture.isOpened())
-                except Exception:
-                    available = False
-                finally:
-                    if capture:
-                        capture.release()
-
-                if not available:
-                    offline_label = f"{label} (offline)"
-                else:
-                    offline_label = label
-
-                sources.append(
-                    CameraSource(
-                        source_id=f"system:{key}",
-                        label=offline_label,
-                        kind="system",
-                        index=index,
-                        available=available,
-                        config_key=key,
-                        path=path,
-                    )
+            device_index = video_device_index(index_or_path)
+            if device_index is None or present is None:
+                # Pipelines/URLs (or no sysfs listing): let the hub report failures.
+                available = True
+            else:
+                available = device_index in present
+
+            sources.append(
+                CameraSource(
+                    source_id=f"system:{key}",
+                    label=label if available else f"{label} (offline)",
+                    kind="system",
+                    index=index,
+                    available=available,
+                    config_key=key,
+                    path=path,
                 )
+            )
 
-            # Also include a small set of direct device indices for ad-hoc testing.
-            system_name = platform.system()
-            for idx in range(max_devices):
-                source_id = f"camera:{idx}"
-                if any(src.source_id == source_id for src in sources):
-                    continue
-
-                label = f"Camera {idx}"
-                available = False
-                capture = None
-
-                try:
-                    _, capture = open_capture(idx)
-
-                    available = bool(capture and capture.isOpened())
-                except Exception:
-                    available = False
-                finally:
-                    if capture:
-                        capture.release()
-
-                if not available:
-                    label = f"{label} (offline)"
+        # Also include unconfigured device nodes for ad-hoc testing.
+        if devices is not None:
+            candidates = [(dev["index"], dev.get("name")) for dev in devices]
+        else:
+            candidates = [(idx, None) for idx in range(max_devices)]
 
-                sources.append(CameraSource(source_id, label, "camera", index=idx, available=available))
+        for idx, name in candidates:
+            source_id = f"camera:{idx}"
+            if any(src.source_id == source_id for src in sources):
+                continue
+            if self._configured_key_for(idx):
+                continue
+            label = f"Camera {idx}" + (f" ({name})" if name else "")
+            sources.append(CameraSource(source_id, label, "camera", index=idx, available=True))
 
         # Add demo virtual feed
         sources.append(CameraSource("virtual:demo", "Demo Feed", "virtual", index=-1, available=True))
         return sources
 
+    def _fallback_to_virtual(self):
+        self.active_source = CameraSource("virtual:demo", "Demo Feed", "virtual", index=-1, available=True)
+
+    def _release_hub_camera(self):
+        if self._hub_camera:
+            hub = self._hub()
+            if hub is not None:
+                hub.unsubscribe(self._hub_camera, preview=False)
+        self._hub_camera = None
+
     def open(self, source: CameraSource):
         if self.cap:
             self.cap.release()
             self.cap = None
+        self._release_hub_camera()
 
         self.active_source = source
         self._virtual_tick = 0
-        self._resume_hub_if_needed()
-
-        if source.kind in ("camera", "system"):
-            self._pause_hub_for_preview()
-            if not source.available:
-                self.cap = None
-                self._resume_hub_if_needed()
-                self.active_source = CameraSource("virtual:demo", "Demo Feed", "virtual", index=-1, available=True)
-                return
 
-            capture_target = source.path if source.path is not None else source.index
-            _, cap = open_capture(capture_target)
-            if not cap or not cap.isOpened():
-                self.cap = None
-                self._resume_hub_if_needed()
-                print("[VISION][WARN] Camera %s unavailable. Falling back to demo feed." % (capture_target,))
-                self.active_source = CameraSource("virtual:demo", "Demo Feed", "virtual", index=-1, available=True)
-            else:
-                self.cap = cap
+        if source.kind not in ("camera", "system"):
             return
 
-        self._resume_hub_if_needed()
+        if not source.available:
+            self._fallback_to_virtual()
+            return
+
+        capture_target = source.path if source.path is not None else source.index
+        hub_key = source.config_key or self._configured_key_for(capture_target)
+        hub = self._hub() if hub_key else None
+        if hub is not None and hub.subscribe(hub_key, preview=False) is not None:
+            # Subscribe to the shared stream instead of stealing the device
+            self._hub_camera = hub_key
+            return
+
+        _, cap = open_capture(capture_target)
+        if not cap or not cap.isOpened():
+            if cap:
+                cap.release()
+            self.cap = None
+            print("[VISION][WARN] Camera %s unavailable. Falling back to demo feed." % (capture_target,))
+            self._fallback_to_virtual()
+        else:
+            self.cap = cap
 
     def read(self) -> Optional[np.ndarray]:
         if not self.active_source:
@@ -323,6 +315,13 @@ class CameraStream:
         if self.active_source.kind == "virtual":
             return self._generate_virtual_frame()
 
+        if self._hub_camera:
+            hub = self._hub()
+            stream = hub.get_stream(self._hub_camera) if hub else None
+            # The hub swaps in new arrays rather than writing in place,
+            # so the latest frame can be shared without a copy.
+            return stream.get_frame(preview=False, copy=False) if stream else None
+
         if not self.cap:
             return None
 
@@ -336,7 +335,7 @@ class CameraStream:
             self.cap.release()
         self.cap = None
         self.active_source = None
-        self._resume_hub_if_needed()
+        self._release_hub_camera()
 
     # ------------------------------------------------------------------
     # Virtual feed
@@ -373,9 +372,11 @@ class CameraCanvas(QWidget):
         self.setMinimumSize(700, 460)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
-        self._frame_image: Optional[QImage] = None
+        self._frame: Optional[np.ndarray] = None
         self._frame_rect = QRectF()
         self._frame_size = (640, 480)
+        self._renderer = PreviewRenderer()
+        self._zone_layer = OverlayCache()
 
         self._zones: Dict[str, Dict] = {}
         self._active_zone_id: Optional[str] = None
@@ -386,9 +387,10 @@ class CameraCanvas(QWidget):
         self._was_dragging = False
 
     # Public API -------------------------------------------------------
-    def set_frame(self, frame_image: QImage, frame_size: Tuple[int, int]):
-        self._frame_image = frame_image
-        self._frame_size = frame_size
+    def set_frame(self, frame: Optional[np.ndarray]):
+        self._frame = frame
+        if frame is not None:
+            self._frame_size = (frame.shape[1], frame.shape[0])
         self.update()
 
     def set_zones(self, zones: List[Dict], active_zone_id: Optional[str]):
@@ -458,7 +460,7 @@ class CameraCanvas(QWidget):
         painter = QPainter(self)
         painter.fillRect(self.rect(), QColor("#111111"))
 
-        if self._frame_image is None or self._frame_image.isNull():
+        if self._frame is None:
             painter.setPen(Qt.NoPen)
             painter.setBrush(QColor("#333333"))
             painter.drawRoundedRect(self.rect().adjusted(10, 10, -10, -10), 12, 12)
@@ -467,45 +469,31 @@ class CameraCanvas(QWidget):
             painter.drawText(self.rect(), Qt.AlignCenter, "Camera feed unavailable")
             return
 
-        # Preserve aspect ratio when drawing frame
-        frame_size = self._frame_image.size()
-        frame_rect = QRectF(self.rect()).adjusted(8, 8, -8, -8)
-        frame_rect = self._scaled_rect(frame_size.width(), frame_size.height(), frame_rect)
+        # Preserve aspect ratio; the renderer scales to the exact pixel size
+        frame_w, frame_h = self._frame_size
+        bounds = QRectF(self.rect()).adjusted(8, 8, -8, -8)
+        fitted = self._scaled_rect(frame_w, frame_h, bounds)
+        frame_rect = QRectF(round(fitted.left()), round(fitted.top()), int(fitted.width()), int(fitted.height()))
         self._frame_rect = frame_rect
 
-        painter.drawImage(frame_rect, self._frame_image)
+        image = self._renderer.render(self._frame, (int(frame_rect.width()), int(frame_rect.height())))
+        painter.drawImage(frame_rect.topLeft(), image)
+
+        # Zone fills/borders come from a cached layer; only the text is live
+        layer = self._zone_layer.get(
+            self._zone_layer_key(),
+            (int(frame_rect.width()), int(frame_rect.height())),
+            self._paint_zone_layer,
+        )
+        painter.drawImage(frame_rect.topLeft(), layer)
 
-        # Draw zones
         for zone_id, zone in self._zones.items():
             polygon = zone.get("polygon", [])
             if not polygon:
                 continue
-            widget_points = [self._frame_to_widget(pt) for pt in polygon]
-            poly = QPolygonF(widget_points)
-
-            is_active = zone_id == self._active_zone_id
+            poly = QPolygonF([self._frame_to_widget(pt) for pt in polygon])
             is_triggered = zone.get("detection", {}).get("triggered", False)
-
-            if is_triggered:
-                base_color = QColor("#2ECC71")  # Green when active
-            else:
-                base_color = QColor("#F44336")  # Red when inactive
-
-            fill_color = QColor(base_color)
-            fill_color.setAlpha(80 if is_active else 45)
-            border_color = QColor(base_color)
-            border_color.setAlpha(255 if is_active else 180)
-
-            painter.setBrush(fill_color)
-            painter.setPen(QPen(border_color, 3 if is_active else 2, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
-            painter.drawPolygon(poly)
-
-            # Draw vertices for active zone
-            if is_active:
-                painter.setBrush(QColor("#FFFFFF"))
-                painter.setPen(QPen(border_color, 2))
-                for wpt in widget_points:
-                    painter.drawEllipse(wpt, 6, 6)
+            base_color = self._zone_color(is_triggered)
 
             # Zone info text inside polygon (no background box, inverted color for contrast)
             info_rect = poly.boundingRect().adjusted(10, 10, -10, -10)
@@ -558,6 +546,53 @@ class CameraCanvas(QWidget):
             for idx in range(len(widget_points) - 1):
                 painter.drawLine(widget_points[idx], widget_points[idx + 1])
 
+    @staticmethod
+    def _zone_color(triggered: bool) -> QColor:
+        # Green when active, red when inactive
+        return QColor("#2ECC71") if triggered else QColor("#F44336")
+
+    def _zone_layer_key(self) -> tuple:
+        return (
+            self._active_zone_id,
+            tuple(
+                (
+                    zone_id,
+                    tuple(tuple(pt) for pt in zone.get("polygon", [])),
+                    bool(zone.get("detection", {}).get("triggered", False)),
+                )
+                for zone_id, zone in self._zones.items()
+            ),
+        )
+
+    def _paint_zone_layer(self, painter: QPainter):
+        """Draw zone fills, borders and handles in frame-local coordinates."""
+        origin = self._frame_rect.topLeft()
+        for zone_id, zone in self._zones.items():
+            polygon = zone.get("polygon", [])
+            if not polygon:
+                continue
+            widget_points = [self._frame_to_widget(pt) - origin for pt in polygon]
+            poly = QPolygonF(widget_points)
+
+            is_active = zone_id == self._active_zone_id
+            base_color = self._zone_color(zone.get("detection", {}).get("triggered", False))
+
+            fill_color = QColor(base_color)
+            fill_color.setAlpha(80 if is_active else 45)
+            border_color = QColor(base_color)
+            border_color.setAlpha(255 if is_active else 180)
+
+            painter.setBrush(fill_color)
+            painter.setPen(QPen(border_color, 3 if is_active else 2, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
+            painter.drawPolygon(poly)
+
+            # Draw vertices for active zone
+            if is_active:
+                painter.setBrush(QColor("#FFFFFF"))
+                painter.setPen(QPen(border_color, 2))
+                for wpt in widget_points:
+                    painter.drawEllipse(wpt, 6, 6)
+
     def _scaled_rect(self, width: int, height: int, bounds: QRectF) -> QRectF:
         if width <= 0 or height <= 0:
             return QRectF(bounds)
@@ -1568,7 +1603,7 @@ class VisionDesignerWidget(QWidget):
             self._update_state("watching", {"message": "Watching for triggers"})
 
     def _rescan_cameras(self):
-        self.available_sources = self.camera_stream.list_sources()
+        self.available_sources = self.camera_stream.list_sources(refresh=True)
         current_source = self._config["camera"].get("source_id", "camera:0")
 
         self._populate_camera_combo()
@@ -1582,7 +1617,7 @@ class VisionDesignerWidget(QWidget):
         frame = self.camera_stream.read()
         if frame is None:
             self._last_frame = None
-            self.canvas.set_frame(QImage(), (0, 0))
+            self.canvas.set_frame(None)
             self.detection_status.setText("Waiting for camera...")
             self.metric_label.setText("Metric: N/A")
             self._update_state("watching", {"message": "Waiting for camera feed"})
@@ -1656,7 +1691,7 @@ class VisionDesignerWidget(QWidget):
         else:
             self.metric_label.setText("Metric: N/A")
 
-        self.canvas.set_frame(_to_qimage(frame), (width, height))
+        self.canvas.set_frame(frame)
         self.canvas.set_zones(zones, self.active_zone_id)
         self.detection_status.setText(message)
 